@@ -0,0 +1,6 @@
+"""Performance benchmarks for the deck building pipeline.
+
+Benchmarks are plain modules runnable with ``python -m``, e.g.
+``python -m langlearn.benchmarks.csv_ingestion``. The pipeline benchmark
+(``langlearn.benchmarks.pipeline``) also compares against a stored baseline.
+"""
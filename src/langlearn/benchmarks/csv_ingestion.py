@@ -0,0 +1,133 @@
+"""Benchmark CSV ingestion: per-row csv.DictReader versus columnar pandas reads.
+
+Times three ways of turning a verb conjugation CSV into records:
+
+- ``dictreader``: the former per-row path (csv.DictReader, one dict per row,
+  column lookup per row) kept here as the baseline
+- ``parse-only``: ``read_csv_frame`` alone, i.e. the columnar parse cost
+- ``vectorized``: ``RecordMapper.load_records_from_csv`` end to end
+
+Runs against ``languages/german/default/verbs_unified.csv`` and a synthetic
+file made by repeating its rows (1M rows by default)::
+
+    python -m langlearn.benchmarks.csv_ingestion
+    python -m langlearn.benchmarks.csv_ingestion --rows 200000 --repeat 3
+"""
+
+import argparse
+import csv
+import logging
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from langlearn.languages.german.services.record_mapper import (
+    RecordMapper,
+    read_csv_frame,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_CSV = PROJECT_ROOT / "languages" / "german" / "default" / "verbs_unified.csv"
+RECORD_TYPE = "verb_conjugation"
+
+
+def load_with_dictreader(mapper: RecordMapper, csv_path: Path) -> list[Any]:
+    """Baseline: build a dict per row and map it to a record."""
+    with open(csv_path, encoding="utf-8") as f:
+        return [
+            mapper.map_csv_row_to_record(RECORD_TYPE, row) for row in csv.DictReader(f)
+        ]
+
+
+def write_synthetic_csv(source: Path, target: Path, rows: int) -> None:
+    """Write a CSV with the source header and its data rows repeated.
+
+    Args:
+        source: CSV file whose rows are repeated
+        target: File to write
+        rows: Number of data rows to write
+    """
+    with open(source, encoding="utf-8") as f:
+        header, *body = f.read().splitlines()
+    body = [line for line in body if line.strip()]
+    full, remainder = divmod(rows, len(body))
+    with open(target, "w", encoding="utf-8") as f:
+        f.write(header + "\n")
+        chunk = "\n".join(body) + "\n"
+        for _ in range(full):
+            f.write(chunk)
+        if remainder:
+            f.write("\n".join(body[:remainder]) + "\n")
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> tuple[float, object]:
+    """Run func repeat times and return the fastest time and last result."""
+    best = float("inf")
+    result: object = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(csv_path: Path, repeat: int) -> dict[str, float]:
+    """Time each ingestion strategy on one file.
+
+    Args:
+        csv_path: Verb conjugation CSV to load
+        repeat: Runs per strategy; the fastest is reported
+
+    Returns:
+        dict: Strategy name to seconds
+    """
+    mapper = RecordMapper()
+    baseline, baseline_records = best_of(
+        repeat, lambda: load_with_dictreader(mapper, csv_path)
+    )
+    parse_only, _ = best_of(repeat, lambda: read_csv_frame(csv_path))
+    vectorized, records = best_of(
+        repeat, lambda: mapper.load_records_from_csv(csv_path, RECORD_TYPE)
+    )
+    if records != baseline_records:
+        raise AssertionError(f"Strategies produced different records for {csv_path}")
+    return {"dictreader": baseline, "parse-only": parse_only, "vectorized": vectorized}
+
+
+def report(label: str, rows: int, timings: dict[str, float]) -> None:
+    """Print one result table."""
+    print(f"\n{label} ({rows:,} rows)")
+    baseline = timings["dictreader"]
+    for name, seconds in timings.items():
+        rate = rows / seconds if seconds else float("inf")
+        print(
+            f"  {name:<11} {seconds * 1000:10.1f} ms  {rate:12,.0f} rows/s  "
+            f"{baseline / seconds:5.2f}x"
+        )
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", type=Path, default=DEFAULT_CSV)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    # Per-row debug/info logging would dominate the measurement
+    logging.disable(logging.INFO)
+
+    with open(args.csv, encoding="utf-8") as f:
+        source_rows = sum(1 for _ in csv.DictReader(f))
+    report(args.csv.name, source_rows, run(args.csv, args.repeat))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        synthetic = Path(temp_dir) / "verbs_synthetic.csv"
+        write_synthetic_csv(args.csv, synthetic, args.rows)
+        report("synthetic", args.rows, run(synthetic, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
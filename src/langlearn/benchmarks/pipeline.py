@@ -0,0 +1,422 @@
+"""Benchmark the full deck pipeline and compare it against a stored baseline.
+
+Runs ``load_data → enrich_media → build_cards → export_deck`` for real decks
+and for synthetic decks scaled from one of them, with the local media
+stand-ins (``infrastructure/services/local_providers.py``) instead of Polly,
+Pexels and Anthropic. Every dataset is built in a scratch project root with
+empty media directories, so enrichment generates all media each run and the
+repository's media is never touched.
+
+Per phase the runner records wall time and the peak of Python allocations
+(tracemalloc). Results can be written as a baseline JSON file; later runs
+compare against it and exit non-zero on regressions beyond the tolerance::
+
+    python -m langlearn.benchmarks.pipeline --write-baseline
+    python -m langlearn.benchmarks.pipeline --scales 10 100 --latency 0.01
+    python -m langlearn.benchmarks.pipeline --baseline my_baseline.json
+    python -m langlearn.benchmarks.pipeline --backend null --no-memory
+
+``--backend memory`` or ``--backend null`` builds without an Anki
+collection, so the build phase measures card assembly alone and export is
+skipped; compare such runs with each other, not with the default baseline.
+
+Scaled datasets repeat every CSV row and append the copy number to the
+first column, so copies are distinct words with their own media.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from langlearn.core.deck import DeckSpec, SharedServices
+from langlearn.core.deck.builder import DECK_BACKENDS
+from langlearn.infrastructure.services.local_providers import (
+    LocalProviderConfig,
+    LocalProviders,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_BASELINE = PROJECT_ROOT / "benchmarks" / "pipeline_baseline.json"
+DEFAULT_DECKS = ("german/a1", "german/a1.1", "german/default")
+DEFAULT_SCALE_SOURCE = "german/a1"
+DEFAULT_SCALES = (10, 100)
+PHASES = ("load", "enrich", "build", "export")
+
+# Free-text columns a scaled copy changes, so it gets its own media
+SCALED_COLUMNS = frozenset(
+    {
+        "word",
+        "noun",
+        "verb",
+        "infinitive",
+        "phrase",
+        "preposition",
+        "pronoun",
+        "example",
+        "example1",
+        "example2",
+        "beispiel_nom",
+        "beispiel_akk",
+        "beispiel_dat",
+        "beispiel_gen",
+    }
+)
+
+# Differences below these floors are noise, whatever the relative change
+MIN_SECONDS_DELTA = 0.05
+MIN_MEMORY_DELTA = 1024 * 1024
+
+
+@dataclass
+class PipelineBenchmarkResult:
+    """Timings and peak memory of one dataset's pipeline run."""
+
+    dataset: str
+    records: int = 0
+    cards: int = 0
+    timings: dict[str, float] = field(default_factory=dict)
+    peak_memory: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_seconds(self) -> float:
+        """Return the summed phase time."""
+        return sum(self.timings.values())
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A metric that got worse than the baseline allows."""
+
+    dataset: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Return current divided by baseline."""
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def write_scaled_deck(source: Path, target: Path, scale: int) -> None:
+    """Write every CSV of a deck with its rows repeated scale times.
+
+    Copy n > 0 of a row gets `` n`` appended to its first column, so each
+    copy is a different word with its own audio and image.
+
+    Args:
+        source: Deck directory with CSV files
+        target: Directory to write the scaled CSV files to
+        scale: Copies of each row
+    """
+    target.mkdir(parents=True, exist_ok=True)
+    for csv_path in sorted(source.glob("*.csv")):
+        with open(csv_path, encoding="utf-8", newline="") as f:
+            header, *rows = [row for row in csv.reader(f) if row]
+        with open(target / csv_path.name, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            scaled = [i for i, name in enumerate(header) if name in SCALED_COLUMNS]
+            for copy in range(scale):
+                for row in rows:
+                    if copy:
+                        row = [
+                            f"{value} {copy}" if i in scaled and value else value
+                            for i, value in enumerate(row)
+                        ]
+                    writer.writerow(row)
+
+
+def prepare_datasets(
+    scratch_root: Path,
+    decks: Sequence[str],
+    scale_source: str,
+    scales: Sequence[int],
+) -> list[tuple[str, DeckSpec]]:
+    """Copy the benchmark decks into a scratch project root.
+
+    Args:
+        scratch_root: Project root the datasets are written under
+        decks: Real decks as ``language/deck``
+        scale_source: Deck the synthetic datasets are scaled from
+        scales: Scale factors for synthetic datasets
+
+    Returns:
+        (dataset name, spec) pairs in run order
+    """
+    datasets: list[tuple[str, DeckSpec]] = []
+    for key in decks:
+        spec = DeckSpec.parse(key)
+        source = PROJECT_ROOT / "languages" / spec.language / spec.deck
+        write_scaled_deck(source, scratch_root / "languages" / key, 1)
+        datasets.append((key, spec))
+    source_spec = DeckSpec.parse(scale_source)
+    source = PROJECT_ROOT / "languages" / source_spec.language / source_spec.deck
+    for scale in scales:
+        spec = DeckSpec(source_spec.language, f"{source_spec.deck}x{scale}")
+        write_scaled_deck(
+            source, scratch_root / "languages" / spec.language / spec.deck, scale
+        )
+        datasets.append((f"{scale_source}x{scale}", spec))
+    return datasets
+
+
+@contextmanager
+def _measure(
+    result: PipelineBenchmarkResult, phase: str, trace_memory: bool
+) -> Iterator[None]:
+    """Record wall time and peak traced memory of a phase."""
+    if trace_memory:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    yield
+    result.timings[phase] = time.perf_counter() - start
+    if trace_memory:
+        result.peak_memory[phase] = tracemalloc.get_traced_memory()[1] - baseline
+
+
+def run_pipeline(
+    services: SharedServices,
+    dataset: str,
+    spec: DeckSpec,
+    output_dir: Path,
+    trace_memory: bool = True,
+) -> PipelineBenchmarkResult:
+    """Build one dataset, measuring each phase.
+
+    Args:
+        services: Services wired to the local providers
+        dataset: Name the result is reported under
+        spec: Deck under the services' project root
+        output_dir: Directory the package is exported to
+        trace_memory: Record peak allocations per phase; tracing slows
+            allocation-heavy phases down
+
+    Returns:
+        PipelineBenchmarkResult for the dataset
+    """
+    result = PipelineBenchmarkResult(dataset)
+    with services.create_builder(spec) as builder:
+        with _measure(result, "load", trace_memory):
+            loaded = builder.load_data(services.data_dir(spec))
+        with _measure(result, "enrich", trace_memory):
+            for _ in builder.enrich_media():
+                pass
+        with _measure(result, "build", trace_memory):
+            built = builder.build_cards()
+        with _measure(result, "export", trace_memory):
+            builder.export_deck(output_dir / f"{spec.language}_{spec.deck}.apkg")
+    result.records = loaded.total_records
+    result.cards = len(built.cards)
+    return result
+
+
+def run_benchmarks(
+    decks: Sequence[str] = DEFAULT_DECKS,
+    scale_source: str = DEFAULT_SCALE_SOURCE,
+    scales: Sequence[int] = DEFAULT_SCALES,
+    config: LocalProviderConfig | None = None,
+    trace_memory: bool = True,
+    repeat: int = 1,
+    backend: str = "anki",
+) -> list[PipelineBenchmarkResult]:
+    """Run the pipeline benchmark on every dataset.
+
+    Args:
+        decks: Real decks as ``language/deck``
+        scale_source: Deck the synthetic datasets are scaled from
+        scales: Scale factors for synthetic datasets
+        config: Latency and throttling of the local providers
+        trace_memory: Record peak allocations per phase
+        repeat: Runs per dataset, each with cold media directories; the
+            fastest run is reported
+        backend: Deck backend of the builders; see DeckBuilderAPI
+
+    Returns:
+        One result per dataset
+    """
+    results: list[PipelineBenchmarkResult] = []
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for attempt in range(repeat):
+                scratch_root = Path(temp_dir) / f"run{attempt}"
+                datasets = prepare_datasets(scratch_root, decks, scale_source, scales)
+                with LocalProviders(config) as providers:
+                    # Politeness delay between Pexels calls is not ours to measure
+                    providers.pexels_service.request_delay = 0
+                    for index, (dataset, spec) in enumerate(datasets):
+                        # Fresh services per dataset: a shared media index
+                        # would hand one dataset's media to the next
+                        services = SharedServices(
+                            scratch_root,
+                            pexels_service=providers.pexels_service,
+                            polly_client=providers.polly_client,
+                            backend=backend,
+                        )
+                        result = run_pipeline(
+                            services, dataset, spec, scratch_root, trace_memory
+                        )
+                        if attempt == 0:
+                            results.append(result)
+                        elif result.total_seconds < results[index].total_seconds:
+                            results[index] = result
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return results
+
+
+def save_baseline(results: Sequence[PipelineBenchmarkResult], path: Path) -> None:
+    """Write results as a baseline JSON file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"datasets": {result.dataset: asdict(result) for result in results}}
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", "utf-8")
+
+
+def load_baseline(path: Path) -> dict[str, PipelineBenchmarkResult]:
+    """Read a baseline JSON file, keyed by dataset."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {
+        name: PipelineBenchmarkResult(**entry)
+        for name, entry in data["datasets"].items()
+    }
+
+
+def _regressed(baseline: float, current: float, tolerance: float, floor: float) -> bool:
+    """Return True if current exceeds baseline by the tolerance and the floor."""
+    return current > baseline * (1 + tolerance) and current - baseline > floor
+
+
+def find_regressions(
+    results: Sequence[PipelineBenchmarkResult],
+    baseline: dict[str, PipelineBenchmarkResult],
+    tolerance: float = 0.25,
+) -> list[Regression]:
+    """Compare results with a baseline.
+
+    A phase regresses if its time or peak memory exceeds the baseline by more
+    than the tolerance and by more than a noise floor. Datasets and phases
+    missing from the baseline are not compared.
+
+    Args:
+        results: Current results
+        baseline: Baseline results keyed by dataset
+        tolerance: Allowed relative increase, e.g. 0.25 for 25%
+
+    Returns:
+        Regressions in result order
+    """
+    regressions: list[Regression] = []
+    for result in results:
+        reference = baseline.get(result.dataset)
+        if reference is None:
+            continue
+        for phase, seconds in result.timings.items():
+            before = reference.timings.get(phase)
+            if before is not None and _regressed(
+                before, seconds, tolerance, MIN_SECONDS_DELTA
+            ):
+                regressions.append(
+                    Regression(result.dataset, f"{phase} seconds", before, seconds)
+                )
+        for phase, peak in result.peak_memory.items():
+            before_peak = reference.peak_memory.get(phase)
+            if before_peak is not None and _regressed(
+                before_peak, peak, tolerance, MIN_MEMORY_DELTA
+            ):
+                regressions.append(
+                    Regression(result.dataset, f"{phase} peak bytes", before_peak, peak)
+                )
+    return regressions
+
+
+def report(
+    results: Sequence[PipelineBenchmarkResult],
+    baseline: dict[str, PipelineBenchmarkResult],
+) -> None:
+    """Print phase timings, total time relative to the baseline and peak memory."""
+    print(
+        f"\n{'dataset':<22} {'records':>8} {'cards':>7} "
+        + " ".join(f"{phase:>8}" for phase in PHASES)
+        + f" {'total':>9} {'vs base':>8} {'peak MiB':>9}"
+    )
+    for result in results:
+        reference = baseline.get(result.dataset)
+        ratio = (
+            f"{result.total_seconds / reference.total_seconds:.2f}x"
+            if reference is not None and reference.total_seconds
+            else "-"
+        )
+        peak = max(result.peak_memory.values(), default=0) / (1024 * 1024)
+        print(
+            f"{result.dataset:<22} {result.records:8} {result.cards:7} "
+            + " ".join(f"{result.timings.get(phase, 0.0):8.2f}" for phase in PHASES)
+            + f" {result.total_seconds:9.2f} {ratio:>8} {peak:9.1f}"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command line entry point; returns the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--decks", nargs="*", default=list(DEFAULT_DECKS))
+    parser.add_argument("--scale-source", default=DEFAULT_SCALE_SOURCE)
+    parser.add_argument("--scales", nargs="*", type=int, default=list(DEFAULT_SCALES))
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--write-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--backend", choices=DECK_BACKENDS, default="anki")
+    args = parser.parse_args(argv)
+
+    # Per-record logging would dominate the measurement
+    logging.disable(logging.INFO)
+
+    results = run_benchmarks(
+        decks=args.decks,
+        scale_source=args.scale_source,
+        scales=args.scales,
+        config=LocalProviderConfig(latency_seconds=args.latency),
+        trace_memory=not args.no_memory,
+        repeat=max(1, args.repeat),
+        backend=args.backend,
+    )
+    baseline = load_baseline(args.baseline) if args.baseline.exists() else {}
+    report(results, baseline)
+
+    if args.write_baseline:
+        save_baseline(results, args.baseline)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+    if not baseline:
+        print(f"\nNo baseline at {args.baseline}; run with --write-baseline")
+        return 0
+
+    regressions = find_regressions(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.dataset} {regression.metric}: "
+            f"{regression.baseline:,.2f} -> {regression.current:,.2f} "
+            f"({regression.ratio:.2f}x)"
+        )
+    if regressions:
+        return 1
+    print(f"\nNo regressions beyond {args.tolerance:.0%} of the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""Benchmark the default scratch collection against the fast scratch mode.
+
+Builds one dataset repeatedly with each kind of throwaway Anki collection:
+
+- ``disk``: the default, a temp directory with Anki's durable SQLite settings
+- ``fast``: ``fast_scratch``, a RAM-backed directory (``/dev/shm`` where it
+  exists) with synchronous writes off and an in-memory rollback journal
+
+and times the two phases that work on the collection: ``build`` (note
+insertion, including copying media into the collection's media folder) and
+``export`` (writing the .apkg). Media is generated once with the local
+providers before timing, so every run finds the same files on disk and
+enrichment is not measured::
+
+    python -m langlearn.benchmarks.scratch_collection
+    python -m langlearn.benchmarks.scratch_collection --scale 20 --repeat 5
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from langlearn.benchmarks.pipeline import DEFAULT_SCALE_SOURCE, prepare_datasets
+from langlearn.core.deck import DeckSpec, SharedServices
+from langlearn.infrastructure.backends.anki_backend import ram_scratch_dir
+from langlearn.infrastructure.services.local_providers import LocalProviders
+
+DEFAULT_SCALE = 5
+MODES = {"disk": False, "fast": True}
+
+
+@dataclass
+class ScratchBenchmarkResult:
+    """Fastest build and export times of one scratch collection mode."""
+
+    mode: str
+    location: str
+    cards: int = 0
+    build_seconds: float = float("inf")
+    export_seconds: float = float("inf")
+
+    @property
+    def total_seconds(self) -> float:
+        """Return build plus export time."""
+        return self.build_seconds + self.export_seconds
+
+
+def build_once(
+    services: SharedServices, spec: DeckSpec, output: Path
+) -> tuple[int, float, float]:
+    """Build and export a deck, timing the collection phases.
+
+    Args:
+        services: Services wired to the local providers and a scratch mode
+        spec: Deck under the services' project root
+        output: Package to export to
+
+    Returns:
+        Cards built, build seconds and export seconds
+    """
+    with services.create_builder(spec) as builder:
+        builder.load_data(services.data_dir(spec))
+        for _ in builder.enrich_media():
+            pass
+        start = time.perf_counter()
+        built = builder.build_cards()
+        build_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        builder.export_deck(output)
+        export_seconds = time.perf_counter() - start
+    return len(built.cards), build_seconds, export_seconds
+
+
+def run_benchmark(
+    scale_source: str = DEFAULT_SCALE_SOURCE,
+    scale: int = DEFAULT_SCALE,
+    repeat: int = 3,
+) -> list[ScratchBenchmarkResult]:
+    """Time both scratch collection modes on a scaled dataset.
+
+    Args:
+        scale_source: Deck the dataset is scaled from, as ``language/deck``
+        scale: Copies of each row of the source deck
+        repeat: Timed runs per mode, alternating modes; the fastest is kept
+
+    Returns:
+        One result per mode
+    """
+    locations = {"disk": tempfile.gettempdir(), "fast": ram_scratch_dir()}
+    results = {
+        mode: ScratchBenchmarkResult(mode, locations[mode] or tempfile.gettempdir())
+        for mode in MODES
+    }
+    with tempfile.TemporaryDirectory() as temp_dir:
+        scratch_root = Path(temp_dir)
+        ((_, spec),) = prepare_datasets(scratch_root, (), scale_source, (scale,))
+        with LocalProviders() as providers:
+            providers.pexels_service.request_delay = 0
+            services = {
+                mode: SharedServices(
+                    scratch_root,
+                    pexels_service=providers.pexels_service,
+                    polly_client=providers.polly_client,
+                    fast_scratch=fast_scratch,
+                )
+                for mode, fast_scratch in MODES.items()
+            }
+            # Generate the media once; timed runs only read it
+            build_once(services["disk"], spec, scratch_root / "warmup.apkg")
+            for _ in range(repeat):
+                for mode in MODES:
+                    cards, build_seconds, export_seconds = build_once(
+                        services[mode], spec, scratch_root / f"{mode}.apkg"
+                    )
+                    result = results[mode]
+                    result.cards = cards
+                    result.build_seconds = min(result.build_seconds, build_seconds)
+                    result.export_seconds = min(result.export_seconds, export_seconds)
+    return list(results.values())
+
+
+def report(results: Sequence[ScratchBenchmarkResult]) -> None:
+    """Print each mode's timings and its speedup over the disk mode."""
+    disk = next(result for result in results if result.mode == "disk")
+    print(
+        f"\n{'mode':<6} {'location':<14} {'cards':>6} {'build':>8} "
+        f"{'export':>8} {'total':>8} {'speedup':>8}"
+    )
+    for result in results:
+        print(
+            f"{result.mode:<6} {result.location:<14} {result.cards:6} "
+            f"{result.build_seconds:8.3f} {result.export_seconds:8.3f} "
+            f"{result.total_seconds:8.3f} "
+            f"{disk.total_seconds / result.total_seconds:7.2f}x"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command line entry point; returns the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale-source", default=DEFAULT_SCALE_SOURCE)
+    parser.add_argument("--scale", type=int, default=DEFAULT_SCALE)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    # Per-record logging would dominate the measurement
+    logging.disable(logging.INFO)
+
+    report(
+        run_benchmark(
+            scale_source=args.scale_source,
+            scale=max(1, args.scale),
+            repeat=max(1, args.repeat),
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,11 +5,26 @@ Anki decks with clear phases, read access to intermediate work, and observable
 progress tracking.
 """
 
+# Multi-deck batch builds
+from .batch import (
+    BatchBuildResult,
+    BatchDeckBuilder,
+    DeckBuildResult,
+    DeckSpec,
+    SharedServices,
+    discover_decks,
+    load_manifest,
+)
+
 # Core API
 from .builder import DeckBuilderAPI
 
+# Resumable enrichment
+from .checkpoint import EnrichmentCheckpoint
+
 # Data types for structured access to pipeline state
 from .data_types import (
+    BuildPlan,
     BuiltCards,
     Card,
     CardPreview,
@@ -18,25 +33,53 @@ from .data_types import (
     LoadedData,
     MediaFile,
     PipelineSummary,
+    ServicePlan,
 )
 
+# Media warming without building
+from .media_warm import MediaWarmer, MediaWarmResult
+
 # Phase management
 from .phases import InvalidPhaseError, Phase
 
 # Progress reporting
 from .progress import EnrichmentProgress
 
+# Parallel sharded builds
+from .sharding import ShardedDeckBuilder, ShardResult, ShardTask, plan_shards
+
+# Rebuild on change
+from .watch import ChangeSet, DeckWatcher
+
 __all__ = [
+    "BatchBuildResult",
+    "BatchDeckBuilder",
+    "BuildPlan",
     "BuiltCards",
     "Card",
     "CardPreview",
+    "ChangeSet",
+    "DeckBuildResult",
     "DeckBuilderAPI",
+    "DeckSpec",
+    "DeckWatcher",
     "EnrichedData",
+    "EnrichmentCheckpoint",
     "EnrichmentProgress",
     "ExportResult",
     "InvalidPhaseError",
     "LoadedData",
     "MediaFile",
+    "MediaWarmResult",
+    "MediaWarmer",
     "Phase",
     "PipelineSummary",
+    "ServicePlan",
+    "ShardResult",
+    "ShardTask",
+    "ShardedDeckBuilder",
+    "SharedServices",
+    "discover_decks",
+    "load_manifest",
+    "plan_shards",
 ]
@@ -0,0 +1,547 @@
+"""Build many decks in one process with shared services and caches.
+
+A ``DeckBuilderAPI`` normally creates its own Polly client, Pexels session,
+template cache and media lookups. ``BatchDeckBuilder`` builds a list of
+language/deck pairs with one ``SharedServices`` instance instead, so clients
+are created once, templates are loaded once per language, Anthropic image
+queries are cached across decks and media generated for one deck is reused by
+sibling decks of the same language.
+
+Example:
+    ```python
+    batch = BatchDeckBuilder(project_root, output_dir, workers=4)
+    result = batch.build(discover_decks(project_root / "languages"))
+    for deck in result.results:
+        print(deck.spec.key, deck.total_seconds)
+    ```
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from langlearn.exceptions import TemplateError
+from langlearn.infrastructure.services import get_anthropic_service
+from langlearn.infrastructure.services.audio_processor import (
+    AudioProcessingConfig,
+    find_ffmpeg,
+)
+from langlearn.infrastructure.services.audio_service import AudioService
+from langlearn.infrastructure.services.image_processor import ImageProcessingConfig
+from langlearn.infrastructure.services.image_service import PexelsService
+from langlearn.infrastructure.services.media_index import MediaIndex
+from langlearn.infrastructure.services.resilience import CallPolicy, ProviderGuard
+from langlearn.infrastructure.services.template_service import TemplateService
+from langlearn.languages.registry import LanguageRegistry
+
+from .builder import EXPORT_SUFFIXES, DeckBuilderAPI
+from .data_types import EnrichedData
+
+if TYPE_CHECKING:
+    from mypy_boto3_polly.client import PollyClient
+
+logger = logging.getLogger(__name__)
+
+# In run order; "images" and "audio" only run when post-processing is enabled
+PHASES = ("load", "enrich", "images", "audio", "build", "export")
+
+
+@dataclass(frozen=True)
+class DeckSpec:
+    """A language/deck pair to build."""
+
+    language: str
+    deck: str
+
+    @property
+    def key(self) -> str:
+        """Return the ``language/deck`` form used in manifests."""
+        return f"{self.language}/{self.deck}"
+
+    @property
+    def deck_name(self) -> str:
+        """Return the Anki deck name, matching the single-deck command."""
+        return f"{self.language.title()} {self.deck.title()} Vocabulary"
+
+    @property
+    def output_filename(self) -> str:
+        """Return the .apkg filename, matching the single-deck command."""
+        return f"LangLearn_{self.language.capitalize()}_{self.deck}.apkg"
+
+    @property
+    def collection_filename(self) -> str:
+        """Return the filename of the deck's persistent working collection."""
+        return f"LangLearn_{self.language.capitalize()}_{self.deck}.anki2"
+
+    @property
+    def checkpoint_filename(self) -> str:
+        """Return the filename of the deck's enrichment checkpoint."""
+        return f"LangLearn_{self.language.capitalize()}_{self.deck}.jsonl"
+
+    @property
+    def media_queue_filename(self) -> str:
+        """Return the filename of the deck's deferred media queue."""
+        return f"LangLearn_{self.language.capitalize()}_{self.deck}.sqlite3"
+
+    @classmethod
+    def parse(cls, text: str) -> "DeckSpec":
+        """Parse ``language/deck`` (or ``language deck``), lowercased.
+
+        Args:
+            text: Manifest entry
+
+        Returns:
+            DeckSpec for the entry
+
+        Raises:
+            ValueError: If the entry is not a language/deck pair
+        """
+        parts = text.replace("/", " ").split()
+        if len(parts) != 2:
+            raise ValueError(f"Expected 'language/deck', got: {text!r}")
+        return cls(language=parts[0].lower(), deck=parts[1].lower())
+
+
+@dataclass
+class DeckBuildResult:
+    """Outcome and per-phase timings of one deck build."""
+
+    spec: DeckSpec
+    output_path: Path | None = None
+    records: int = 0
+    cards: int = 0
+    timings: dict[str, float] = field(default_factory=dict)
+    image_bytes_saved: int = 0
+    audio_bytes_saved: int = 0
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Return True if the deck was exported."""
+        return self.error is None
+
+    @property
+    def total_seconds(self) -> float:
+        """Return the summed phase timings."""
+        return sum(self.timings.values())
+
+
+@dataclass
+class BatchBuildResult:
+    """Per-deck results plus aggregate figures for a batch."""
+
+    results: list[DeckBuildResult]
+    wall_seconds: float
+    reused_media_files: int = 0
+
+    @property
+    def succeeded(self) -> list[DeckBuildResult]:
+        """Return results of decks that were exported."""
+        return [result for result in self.results if result.succeeded]
+
+    @property
+    def failed(self) -> list[DeckBuildResult]:
+        """Return results of decks that failed."""
+        return [result for result in self.results if not result.succeeded]
+
+    @property
+    def total_cards(self) -> int:
+        """Return the number of cards exported across all decks."""
+        return sum(result.cards for result in self.results)
+
+    def phase_totals(self) -> dict[str, float]:
+        """Return seconds spent in each phase, summed over decks."""
+        return {
+            phase: sum(result.timings.get(phase, 0.0) for result in self.results)
+            for phase in PHASES
+        }
+
+
+class SharedServices:
+    """Clients and caches shared by every deck built in one process.
+
+    - one Polly client, reused by each deck's AudioService
+    - one PexelsService (and its HTTP session)
+    - one TemplateService per language, so templates load once
+    - one MediaIndex per language, so decks reuse each other's media
+    - one ProviderGuard per provider, so an outage seen by one deck opens
+      the circuit for every deck
+    - the process-wide AnthropicService with its image query cache
+
+    All accessors are thread-safe.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        pexels_service: PexelsService | None = None,
+        polly_client: "PollyClient | None" = None,
+        call_policy: CallPolicy | None = None,
+        fast_scratch: bool = False,
+        backend: str = "anki",
+    ) -> None:
+        """Initialize SharedServices.
+
+        Args:
+            project_root: Root containing the ``languages/`` data directories
+            pexels_service: Optional PexelsService to share; created on first
+                use otherwise
+            polly_client: Optional Polly client for every deck's AudioService;
+                created with the first AudioService otherwise
+            call_policy: Circuit breaker, deadline and hedging settings for
+                the Polly and Pexels calls of services created here
+            fast_scratch: Builders from create_builder use a RAM-backed,
+                non-durable scratch collection
+            backend: Backend of builders from create_builder; "tsv" or
+                "jsonl" export text files instead of packages, "memory" or
+                "null" skip the Anki collection for profiling and dry runs
+        """
+        self._project_root = project_root
+        self._pexels_service = pexels_service
+        self._polly_client = polly_client
+        self._audio_services: dict[DeckSpec, AudioService] = {}
+        self._template_services: dict[str, TemplateService] = {}
+        self._media_indexes: dict[str, MediaIndex] = {}
+        self._fast_scratch = fast_scratch
+        self._backend = backend
+        self._guards = {
+            provider: ProviderGuard(provider, call_policy)
+            for provider in ("polly", "pexels")
+        }
+        self._lock = threading.RLock()
+
+    @property
+    def project_root(self) -> Path:
+        """Return the root containing the ``languages/`` data directories."""
+        return self._project_root
+
+    def output_path(self, output_dir: Path, spec: DeckSpec) -> Path:
+        """Return the deck's export path, with the suffix of the backend."""
+        filename = spec.output_filename.removesuffix(".apkg")
+        return output_dir / f"{filename}{EXPORT_SUFFIXES[self._backend]}"
+
+    def data_dir(self, spec: DeckSpec) -> Path:
+        """Return the data directory of a deck."""
+        return self._project_root / "languages" / spec.language / spec.deck
+
+    def guard(self, provider: str) -> ProviderGuard:
+        """Return the guard shared by the services of a provider.
+
+        Args:
+            provider: "polly" or "pexels"
+        """
+        return self._guards[provider]
+
+    def pexels_service(self) -> PexelsService:
+        """Return the shared PexelsService."""
+        with self._lock:
+            if self._pexels_service is None:
+                self._pexels_service = PexelsService(guard=self._guards["pexels"])
+            return self._pexels_service
+
+    def audio_service(self, spec: DeckSpec) -> AudioService:
+        """Return the AudioService for a deck, sharing one Polly client.
+
+        Args:
+            spec: Deck whose audio directory the service writes to
+
+        Returns:
+            AudioService for the deck
+        """
+        with self._lock:
+            if spec not in self._audio_services:
+                tts_config = LanguageRegistry.get(spec.language).get_tts_config()
+                self._audio_services[spec] = AudioService(
+                    output_dir=str(self.data_dir(spec) / "audio"),
+                    voice_id=tts_config.voice_id,
+                    language_code=tts_config.language_code,
+                    engine=tts_config.engine,
+                    client=self._polly_client,
+                    guard=self._guards["polly"],
+                )
+                self._polly_client = self._audio_services[spec].client
+            return self._audio_services[spec]
+
+    def template_service(self, language: str) -> TemplateService:
+        """Return the TemplateService for a language."""
+        with self._lock:
+            if language not in self._template_services:
+                language_impl = LanguageRegistry.get(language)
+                self._template_services[language] = TemplateService(
+                    language_impl.get_template_directory(),
+                    language_impl.get_template_filename,
+                )
+            return self._template_services[language]
+
+    def media_index(self, language: str) -> MediaIndex:
+        """Return the MediaIndex for a language."""
+        with self._lock:
+            if language not in self._media_indexes:
+                self._media_indexes[language] = MediaIndex()
+            return self._media_indexes[language]
+
+    def warm(self, specs: Iterable[DeckSpec]) -> None:
+        """Create services, load templates and index media ahead of builds.
+
+        Args:
+            specs: Decks that will be built
+        """
+        for spec in specs:
+            self.audio_service(spec)
+            template_service = self.template_service(spec.language)
+            for record_type in LanguageRegistry.get(
+                spec.language
+            ).get_supported_record_types():
+                try:
+                    template_service.get_template(record_type)
+                except (OSError, TemplateError):
+                    # Not every record type has a template of the same name
+                    logger.debug(f"No {spec.language} template for {record_type}")
+            media_index = self.media_index(spec.language)
+            media_index.add_directory(self.data_dir(spec) / "audio")
+            media_index.add_directory(self.data_dir(spec) / "images")
+        self.pexels_service()
+        get_anthropic_service()
+
+    @property
+    def reused_media_files(self) -> int:
+        """Return files copied between decks instead of generated."""
+        with self._lock:
+            return sum(index.reused_count for index in self._media_indexes.values())
+
+    def create_builder(self, spec: DeckSpec) -> DeckBuilderAPI:
+        """Create a DeckBuilderAPI wired to the shared services.
+
+        Args:
+            spec: Deck to build
+
+        Returns:
+            DeckBuilderAPI in INITIALIZED phase
+        """
+        return DeckBuilderAPI(
+            deck_name=spec.deck_name,
+            language=spec.language,
+            deck_type=spec.deck,
+            audio_service=self.audio_service(spec),
+            pexels_service=self.pexels_service(),
+            template_service=self.template_service(spec.language),
+            media_index=self.media_index(spec.language),
+            project_root=self._project_root,
+            fast_scratch=self._fast_scratch,
+            backend=self._backend,
+        )
+
+
+def discover_decks(languages_root: Path) -> list[DeckSpec]:
+    """Find every deck directory under ``languages/`` for registered languages.
+
+    Args:
+        languages_root: The ``languages/`` directory
+
+    Returns:
+        Deck specs sorted by language then deck
+    """
+    available = set(LanguageRegistry.list_available())
+    specs: list[DeckSpec] = []
+    for language_dir in sorted(languages_root.iterdir()):
+        if not language_dir.is_dir() or language_dir.name not in available:
+            continue
+        for deck_dir in sorted(language_dir.iterdir()):
+            if deck_dir.is_dir() and any(deck_dir.glob("*.csv")):
+                specs.append(DeckSpec(language_dir.name, deck_dir.name))
+    return specs
+
+
+def load_manifest(manifest_path: Path) -> list[DeckSpec]:
+    """Read a manifest with one ``language/deck`` entry per line.
+
+    Blank lines and ``#`` comments are ignored.
+
+    Args:
+        manifest_path: Manifest file
+
+    Returns:
+        Deck specs in file order, without duplicates
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    specs: list[DeckSpec] = []
+    lines = manifest_path.read_text(encoding="utf-8").splitlines()
+    for line_number, line in enumerate(lines, start=1):
+        entry = line.split("#", 1)[0].strip()
+        if not entry:
+            continue
+        try:
+            spec = DeckSpec.parse(entry)
+        except ValueError as e:
+            raise ValueError(f"{manifest_path}:{line_number}: {e}") from e
+        if spec not in specs:
+            specs.append(spec)
+    return specs
+
+
+class BatchDeckBuilder:
+    """Build several decks with shared services, serially or in a thread pool.
+
+    Deck builds are dominated by network calls (Polly, Pexels, Anthropic), so
+    workers are threads: they overlap that I/O while sharing clients and
+    caches, which worker processes could not.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        output_dir: Path,
+        services: SharedServices | None = None,
+        workers: int = 1,
+        image_config: ImageProcessingConfig | None = None,
+        audio_config: AudioProcessingConfig | None = None,
+    ) -> None:
+        """Initialize BatchDeckBuilder.
+
+        Args:
+            project_root: Root containing the ``languages/`` data directories
+            output_dir: Directory the .apkg files are written to
+            services: Shared services; created for project_root if omitted
+            workers: Number of decks built at once
+            image_config: Shrink each deck's images with this configuration
+                after enrichment; None leaves images as downloaded
+            audio_config: Post-process each deck's audio with this
+                configuration after enrichment; None leaves clips as synthesized
+
+        Raises:
+            ConfigurationError: If audio_config is set and ffmpeg is missing
+        """
+        self._output_dir = output_dir
+        self._services = services or SharedServices(project_root)
+        self._workers = max(1, workers)
+        self._image_config = image_config
+        self._audio_config = audio_config
+        if audio_config is not None:
+            find_ffmpeg()  # Fail before any deck is built
+
+    @property
+    def services(self) -> SharedServices:
+        """Return the services shared by all builds."""
+        return self._services
+
+    def build(self, specs: Iterable[DeckSpec]) -> BatchBuildResult:
+        """Build every deck, continuing past failures.
+
+        Args:
+            specs: Decks to build
+
+        Returns:
+            BatchBuildResult with results in the order of specs
+        """
+        spec_list = list(specs)
+        start = time.perf_counter()
+        if self._workers == 1 or len(spec_list) <= 1:
+            results = [self.build_deck(spec) for spec in spec_list]
+        else:
+            with ThreadPoolExecutor(max_workers=self._workers) as executor:
+                results = list(executor.map(self.build_deck, spec_list))
+        wall_seconds = time.perf_counter() - start
+
+        batch_result = BatchBuildResult(
+            results=results,
+            wall_seconds=wall_seconds,
+            reused_media_files=self._services.reused_media_files,
+        )
+        logger.info(
+            f"Batch built {len(batch_result.succeeded)}/{len(results)} decks "
+            f"in {wall_seconds:.2f}s"
+        )
+        return batch_result
+
+    def build_deck(
+        self, spec: DeckSpec, output_path: Path | None = None
+    ) -> DeckBuildResult:
+        """Run the full pipeline for one deck, recording phase timings.
+
+        Errors are captured in the result rather than raised, so one bad deck
+        does not stop a batch.
+
+        Args:
+            spec: Deck to build
+            output_path: .apkg path; defaults to the deck's file in output_dir
+
+        Returns:
+            DeckBuildResult for the deck
+        """
+        try:
+            with self._services.create_builder(spec) as builder:
+                return self.run_pipeline(builder, spec, output_path)
+        except Exception as e:
+            logger.error(f"Failed to build {spec.key} during init: {e}")
+            return DeckBuildResult(spec=spec, error=f"init: {e}")
+
+    def run_pipeline(
+        self,
+        builder: DeckBuilderAPI,
+        spec: DeckSpec,
+        output_path: Path | None = None,
+        previous: Mapping[str, EnrichedData] | None = None,
+    ) -> DeckBuildResult:
+        """Run load, enrich, build and export on a fresh builder.
+
+        Args:
+            builder: DeckBuilderAPI in INITIALIZED phase
+            spec: Deck being built
+            output_path: .apkg path; defaults to the deck's file in output_dir
+            previous: Enriched data of an earlier build, reused for unchanged
+                records (see DeckBuilderAPI.enrich_media)
+
+        Returns:
+            DeckBuildResult, with the failing phase in error if any
+        """
+        result = DeckBuildResult(spec=spec)
+        output_path = output_path or self._services.output_path(self._output_dir, spec)
+        phase = "load"
+        try:
+            start = time.perf_counter()
+            loaded = builder.load_data(self._services.data_dir(spec))
+            result.records = loaded.total_records
+            result.timings[phase] = time.perf_counter() - start
+
+            phase = "enrich"
+            start = time.perf_counter()
+            for _ in builder.enrich_media(previous=previous):
+                pass
+            result.timings[phase] = time.perf_counter() - start
+
+            if self._image_config is not None:
+                phase = "images"
+                start = time.perf_counter()
+                report = builder.optimize_images(self._image_config)
+                result.image_bytes_saved = report.bytes_saved
+                result.timings[phase] = time.perf_counter() - start
+
+            if self._audio_config is not None:
+                phase = "audio"
+                start = time.perf_counter()
+                report = builder.process_audio(self._audio_config)
+                result.audio_bytes_saved = report.bytes_saved
+                result.timings[phase] = time.perf_counter() - start
+
+            phase = "build"
+            start = time.perf_counter()
+            builder.build_cards()
+            result.timings[phase] = time.perf_counter() - start
+
+            phase = "export"
+            start = time.perf_counter()
+            export_result = builder.export_deck(output_path)
+            result.timings[phase] = time.perf_counter() - start
+            result.cards = export_result.cards_exported
+            result.output_path = export_result.output_path
+        except Exception as e:
+            logger.error(f"Failed to build {spec.key} during {phase}: {e}")
+            result.error = f"{phase}: {e}"
+        return result
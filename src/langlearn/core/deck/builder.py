@@ -2,18 +2,44 @@
 
 import logging
 import logging.handlers
-from collections.abc import Iterator
+import os
+from collections.abc import Hashable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, TypeVar
 
-from langlearn.core.records import BaseRecord
-from langlearn.infrastructure.backends.anki_backend import AnkiBackend
+from langlearn.core.records import BaseRecord, ColumnarRecordStore
+from langlearn.exceptions import ConfigurationError
+from langlearn.infrastructure.backends import (
+    AnkiBackend,
+    DeckBackend,
+    InMemoryBackend,
+    NullBackend,
+    TextExportBackend,
+)
+from langlearn.infrastructure.backends.text_backend import TEXT_FORMATS
 from langlearn.infrastructure.managers.deck_manager import DeckManager
 from langlearn.infrastructure.managers.media_manager import MediaManager
 from langlearn.infrastructure.services import get_anthropic_service
+from langlearn.infrastructure.services.audio_processor import (
+    AudioProcessingConfig,
+    AudioProcessor,
+)
 from langlearn.infrastructure.services.audio_service import AudioService
+from langlearn.infrastructure.services.image_processor import (
+    ImageProcessingConfig,
+    ImageProcessor,
+)
 from langlearn.infrastructure.services.image_service import PexelsService
+from langlearn.infrastructure.services.media_enricher import StandardMediaEnricher
 from langlearn.infrastructure.services.media_file_registrar import MediaFileRegistrar
+from langlearn.infrastructure.services.media_index import MediaIndex
+from langlearn.infrastructure.services.media_processing import MediaProcessingReport
+from langlearn.infrastructure.services.media_queue import (
+    BackfillReport,
+    MediaBackfillWorker,
+    MediaJobQueue,
+)
 from langlearn.infrastructure.services.media_service import (
     MediaGenerationConfig,
     MediaService,
@@ -21,7 +47,9 @@ from langlearn.infrastructure.services.media_service import (
 from langlearn.infrastructure.services.template_service import TemplateService
 from langlearn.languages.registry import LanguageRegistry
 
+from .checkpoint import EnrichmentCheckpoint, checkpoint_key
 from .data_types import (
+    BuildPlan,
     BuiltCards,
     Card,
     CardPreview,
@@ -31,6 +59,7 @@ from .data_types import (
     LoadedData,
     MediaFile,
     PipelineSummary,
+    ServicePlan,
     ValidationError,
 )
 from .phases import InvalidPhaseError, Phase
@@ -59,6 +88,44 @@ logger.propagate = False  # Don't propagate to root logger (prevents console out
 
 T = TypeVar("T")
 
+# Rough seconds per request, used to project the wall time of a build plan
+DEFAULT_REQUEST_SECONDS = {"polly": 0.4, "anthropic": 1.0, "pexels": 0.6}
+
+# Backends a builder can add its notes to, with the suffix of their export;
+# "memory" and "null" write nothing
+EXPORT_SUFFIXES = {
+    "anki": ".apkg",
+    "memory": ".apkg",
+    "null": ".apkg",
+    "tsv": ".tsv",
+    "jsonl": ".jsonl",
+}
+DECK_BACKENDS = tuple(EXPORT_SUFFIXES)
+
+
+def _record_key(record: BaseRecord) -> Hashable | None:
+    """Return a hashable key identifying a record by class and field values."""
+    key = (type(record), tuple(record.as_mapping().values()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _media_by_record(
+    enriched: EnrichedData | None,
+) -> dict[Hashable | None, dict[str, Any]]:
+    """Index earlier enrichment results by record key for reuse."""
+    if enriched is None:
+        return {}
+    lookup: dict[Hashable | None, dict[str, Any]] = {}
+    for record, media_data in zip(enriched.records, enriched.media_data, strict=False):
+        key = _record_key(record)
+        if key is not None:
+            lookup.setdefault(key, media_data)
+    return lookup
+
 
 class DeckBuilderAPI:
     """Observable phase-based deck builder for language learning.
@@ -102,6 +169,15 @@ class DeckBuilderAPI:
         deck_type: str = "default",
         audio_service: AudioService | None = None,
         pexels_service: PexelsService | None = None,
+        template_service: TemplateService | None = None,
+        media_index: MediaIndex | None = None,
+        collection_path: str | Path | None = None,
+        project_root: Path | None = None,
+        checkpoint_path: str | Path | None = None,
+        resume: bool = False,
+        media_queue: MediaJobQueue | None = None,
+        fast_scratch: bool = False,
+        backend: str = "anki",
     ):
         """Initialize the deck builder API.
 
@@ -111,7 +187,50 @@ class DeckBuilderAPI:
             deck_type: Deck type within the language (e.g., "default", "business")
             audio_service: Optional AudioService for dependency injection
             pexels_service: Optional PexelsService for dependency injection
+            template_service: Optional TemplateService for the language, so
+                several builders share one template cache
+            media_index: Optional index of media from other decks of the
+                language; matching files are copied instead of generated
+            collection_path: Optional persistent Anki collection for the deck.
+                Rebuilds upsert notes by stable GUID, so only changed notes
+                are written and learners keep their review history on
+                re-import.
+            project_root: Root containing the ``languages/`` media
+                directories; defaults to the repository root
+            checkpoint_path: Optional JSON Lines file that enrichment appends
+                each record's media data to as soon as it is enriched
+            resume: Reuse the media data already in checkpoint_path and only
+                enrich the remaining records, continuing an interrupted build
+            media_queue: Optional queue for deferred media. Enrichment then
+                uses only the media that exists and queues the rest, so the
+                deck can be exported at once; see backfill_media
+            fast_scratch: Build in a RAM-backed scratch collection with
+                SQLite durability turned off; it is discarded after export
+                anyway. Cannot be combined with collection_path.
+            backend: Where built notes go: "anki" for an Anki collection,
+                "tsv" or "jsonl" to stream them to a text file (see
+                TextExportBackend), "memory" to keep them in an
+                InMemoryBackend, or "null" to discard them. The last two
+                skip SQLite and media copying and export no package, for
+                profiling card assembly and for dry runs.
+
+        Raises:
+            ConfigurationError: If resume is set without a checkpoint_path,
+                fast_scratch with a collection_path, or the backend is
+                unknown or combined with Anki-only options
         """
+        if resume and checkpoint_path is None:
+            raise ConfigurationError("resume requires a checkpoint_path")
+        if backend not in DECK_BACKENDS:
+            raise ConfigurationError(
+                f"Unknown backend {backend!r}; expected one of {DECK_BACKENDS}"
+            )
+        if backend != "anki" and (collection_path is not None or fast_scratch):
+            raise ConfigurationError(
+                f"The {backend} backend cannot be combined with collection_path "
+                f"or fast_scratch"
+            )
+
         self._deck_name = deck_name
         self._language = language
         self._deck_type = deck_type
@@ -122,6 +241,10 @@ class DeckBuilderAPI:
         self._enriched_data: dict[str, EnrichedData] = {}
         self._built_cards: BuiltCards | None = None
         self._export_result: ExportResult | None = None
+        self._checkpoint = (
+            EnrichmentCheckpoint(checkpoint_path) if checkpoint_path else None
+        )
+        self._resume = resume
 
         # Initialize services - same logic as old DeckBuilder but cleaner
         self._language_impl = LanguageRegistry.get(language)
@@ -131,17 +254,25 @@ class DeckBuilderAPI:
         self._record_mapper = record_mapper_class()
 
         # Initialize template service
-        template_dir = self._language_impl.get_template_directory()
-        template_resolver = self._language_impl.get_template_filename
-        self._template_service = TemplateService(template_dir, template_resolver)
+        if template_service is not None:
+            self._template_service = template_service
+        else:
+            template_dir = self._language_impl.get_template_directory()
+            template_resolver = self._language_impl.get_template_filename
+            self._template_service = TemplateService(template_dir, template_resolver)
 
         # Initialize CardBuilder service
         card_builder_class = self._language_impl.get_card_builder()
         self._card_builder = card_builder_class(template_service=self._template_service)
 
         # Initialize dependencies for media service
-        project_root = Path(__file__).parent.parent.parent.parent.parent
+        if project_root is None:
+            project_root = Path(__file__).parent.parent.parent.parent.parent
         language_deck_data_dir = project_root / "languages" / language / deck_type
+        self._audio_dir = language_deck_data_dir / "audio"
+        self._images_dir = language_deck_data_dir / "images"
+        self._media_processing: dict[str, MediaProcessingReport] = {}
+        self._processed_media_dir = project_root / "output" / "processed_media"
 
         # Use provided services or create defaults
         if audio_service is not None:
@@ -170,11 +301,22 @@ class DeckBuilderAPI:
         )
 
         # Initialize backend
-        self._backend = AnkiBackend(
-            deck_name=deck_name,
-            media_service=self._media_service,
-            language=self._language_impl,
-        )
+        self._persistent_collection = collection_path is not None
+        self._backend: DeckBackend
+        if backend == "memory":
+            self._backend = InMemoryBackend(deck_name)
+        elif backend == "null":
+            self._backend = NullBackend(deck_name)
+        elif backend in TEXT_FORMATS:
+            self._backend = TextExportBackend(deck_name, text_format=backend)
+        else:
+            self._backend = AnkiBackend(
+                deck_name=deck_name,
+                media_service=self._media_service,
+                language=self._language_impl,
+                collection_path=collection_path,
+                fast_scratch=fast_scratch,
+            )
 
         # Initialize managers
         self._deck_manager = DeckManager(self._backend)
@@ -187,8 +329,14 @@ class DeckBuilderAPI:
         )
 
         # Initialize language-specific MediaEnricher
+        self._media_queue = media_queue
         if self._media_service:
             anthropic_service = get_anthropic_service()
+            self._media_services = (
+                actual_audio_service,
+                actual_pexels_service,
+                anthropic_service,
+            )
             self._media_enricher = self._language_impl.create_media_enricher(
                 audio_service=actual_audio_service,
                 pexels_service=actual_pexels_service,
@@ -196,6 +344,16 @@ class DeckBuilderAPI:
                 audio_base_path=language_deck_data_dir / "audio",
                 image_base_path=language_deck_data_dir / "images",
             )
+            if media_index is not None and isinstance(
+                self._media_enricher, StandardMediaEnricher
+            ):
+                self._media_enricher.use_media_index(media_index)
+            if media_queue is not None:
+                if not isinstance(self._media_enricher, StandardMediaEnricher):
+                    raise ConfigurationError(
+                        f"Deferred media is not supported for {language}"
+                    )
+                self._media_enricher.defer_to(media_queue)
         else:
             self._media_enricher = None  # type: ignore[assignment]
 
@@ -217,6 +375,15 @@ class DeckBuilderAPI:
                 f"currently in {self._phase.value}"
             )
 
+    def _anki_backend(self) -> AnkiBackend:
+        """Return the Anki backend for operations on the collection itself."""
+        if not isinstance(self._backend, AnkiBackend):
+            raise ConfigurationError(
+                f"Operation requires the anki backend, not "
+                f"{type(self._backend).__name__}"
+            )
+        return self._backend
+
     def _batch_records(
         self, records: list[BaseRecord], batch_size: int
     ) -> Iterator[list[BaseRecord]]:
@@ -226,11 +393,29 @@ class DeckBuilderAPI:
 
     # --- Data Loading Phase ---
 
-    def load_data(self, data_dir: str | Path) -> LoadedData:
+    def load_data(
+        self,
+        data_dir: str | Path,
+        max_workers: int | None = None,
+        use_processes: bool = False,
+        record_types: Sequence[str] | None = None,
+    ) -> LoadedData:
         """Load and validate vocabulary data with full observability.
 
+        CSV files are independent, so they are parsed concurrently. Results
+        are merged in the language's CSV mapping order, so records come out in
+        the same order as a serial load and load time is bounded by the
+        largest file rather than the sum.
+
         Args:
             data_dir: Directory containing CSV data files
+            max_workers: Number of files parsed at once; defaults to one per
+                file, capped at the CPU count. 1 loads serially.
+            use_processes: Parse in worker processes instead of threads, so
+                record construction is not serialized by the GIL. Pays off
+                for large files; the record mapper must be picklable.
+            record_types: Only read the CSV files of these record types, or
+                None for every file
 
         Returns:
             LoadedData with records grouped by type, validation errors, etc.
@@ -245,18 +430,38 @@ class DeckBuilderAPI:
         # Load data using language-specific mapping
         csv_to_record_type = self._language_impl.get_csv_to_record_type_mapping()
 
+        csv_files: list[tuple[Path, str]] = []
         for filename, record_type in csv_to_record_type.items():
+            if record_types is not None and record_type not in record_types:
+                continue
             file_path = data_dir / filename
             if file_path.exists():
-                logger.info(f"Loading {record_type} data from {file_path}")
-                records = self._record_mapper.load_records_from_csv(
-                    file_path, record_type
-                )
-                self._loaded_records.extend(records)
-                logger.info(f"Loaded {len(records)} {record_type} records")
+                csv_files.append((file_path, record_type))
             else:
                 logger.debug(f"Data file not found: {file_path}")
 
+        workers = max_workers or min(len(csv_files), os.cpu_count() or 1)
+        load_csv = self._record_mapper.load_records_from_csv
+        if workers <= 1 or len(csv_files) <= 1:
+            results = [load_csv(path, record_type) for path, record_type in csv_files]
+        else:
+            executor_class = (
+                ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+            )
+            with executor_class(max_workers=workers) as executor:
+                # map() yields in submission order, keeping the merge deterministic
+                results = list(
+                    executor.map(
+                        load_csv,
+                        [path for path, _ in csv_files],
+                        [record_type for _, record_type in csv_files],
+                    )
+                )
+
+        for (file_path, record_type), records in zip(csv_files, results, strict=True):
+            self._loaded_records.extend(records)
+            logger.info(f"Loaded {len(records)} {record_type} records from {file_path}")
+
         # Group records by type for observability
         records_by_type: dict[str, list[BaseRecord]] = {}
         validation_errors: list[ValidationError] = []
@@ -302,18 +507,47 @@ class DeckBuilderAPI:
             raise InvalidPhaseError(f"No data loaded. Current phase: {self._phase}")
         return self._loaded_data.records_by_type.get(record_type, [])
 
+    def get_columnar_records(self, record_type: str) -> ColumnarRecordStore | None:
+        """Read API: Get a columnar snapshot of one record type.
+
+        The store supports vectorized filtering, grouping, de-duplication and
+        empty-field checks over large decks. It is built from the loaded
+        records on each call, so media fields assigned later are not reflected.
+
+        Args:
+            record_type: Type of records to retrieve
+
+        Returns:
+            ColumnarRecordStore for the record type, or None if none were loaded
+
+        Raises:
+            InvalidPhaseError: If no data has been loaded
+        """
+        records = self.get_records_by_type(record_type)
+        if not records:
+            return None
+        return ColumnarRecordStore.from_records(records)
+
     # --- Media Enrichment Phase ---
 
     def enrich_media(
         self,
         record_types: list[str] | None = None,
         batch_size: int = 10,
+        previous: Mapping[str, EnrichedData] | None = None,
     ) -> Iterator[EnrichmentProgress]:
         """Enrich records with media, yielding progress.
 
         Args:
             record_types: Specific record types to enrich, or None for all
             batch_size: Number of records to process in each batch
+            previous: Enriched data from an earlier build of the deck. Records
+                equal to one enriched there reuse its media data, so only new
+                or edited records reach the media enricher.
+
+        With a checkpoint_path, every enriched record is checkpointed as it
+        completes, except records with media deferred to the media queue;
+        with resume, checkpointed records are reused as well.
 
         Yields:
             EnrichmentProgress for each batch processed
@@ -331,6 +565,12 @@ class DeckBuilderAPI:
         )
         logger.info(f"Enriching media for record types: {record_types_to_process}")
 
+        checkpointed: dict[str, dict[str, dict[str, Any]]] = {}
+        if self._checkpoint is not None:
+            if self._resume:
+                checkpointed = self._checkpoint.load()
+            self._checkpoint.open(resume=self._resume)
+
         for record_type in record_types_to_process:
             records = self._loaded_data.records_by_type.get(record_type, [])
             if not records:
@@ -353,13 +593,30 @@ class DeckBuilderAPI:
 
                 record_dicts = []
                 domain_models = []
+                pending_records = []
                 skipped_indices = []
+                reused: dict[int, dict[str, Any]] = {}
+                previous_media = _media_by_record(
+                    previous.get(record_type) if previous else None
+                )
+                resumed_media = checkpointed.get(record_type, {})
 
                 for i, rec in enumerate(records):
+                    cached = previous_media.get(_record_key(rec))
+                    if not cached and resumed_media:
+                        cached = resumed_media.get(checkpoint_key(rec))
+                        if cached and not self._media_complete(
+                            rec, cached, record_to_model_factory
+                        ):
+                            cached = None
+                    if cached:
+                        reused[i] = dict(cached)
+                        continue
                     try:
                         domain_model = record_to_model_factory.create_domain_model(rec)
                         record_dicts.append(rec.to_dict())
                         domain_models.append(domain_model)
+                        pending_records.append(rec)
                     except ValueError as e:
                         logger.warning(f"No domain model for {type(rec).__name__}: {e}")
                         skipped_indices.append(i)
@@ -372,10 +629,20 @@ class DeckBuilderAPI:
                         # Use the media enricher to enrich records
                         for i, domain_model in enumerate(domain_models):
                             try:
+                                missing = self._missing_media_count()
                                 media_data = self._media_enricher.enrich_with_media(
                                     domain_model
                                 )
                                 record_dicts[i].update(media_data)
+                                # A record with deferred or failed media is
+                                # enriched again by the next build
+                                if (
+                                    self._checkpoint is not None
+                                    and self._missing_media_count() == missing
+                                ):
+                                    self._checkpoint.record(
+                                        record_type, pending_records[i], record_dicts[i]
+                                    )
                             except Exception as e:
                                 logger.error(f"Failed to enrich record {i}: {e}")
                         enriched_list = record_dicts
@@ -387,7 +654,9 @@ class DeckBuilderAPI:
                 all_media_data: list[dict[str, Any]] = []
                 enriched_idx = 0
                 for i in range(len(records)):
-                    if i in skipped_indices:
+                    if i in reused:
+                        all_media_data.append(reused[i])
+                    elif i in skipped_indices:
                         all_media_data.append({})
                     else:
                         if enriched_idx < len(enriched_list):
@@ -398,6 +667,11 @@ class DeckBuilderAPI:
 
                 media_data_list = all_media_data
                 enriched_records = records
+                if reused:
+                    logger.info(
+                        f"Reused media data for {len(reused)} unchanged "
+                        f"{record_type} records"
+                    )
             else:
                 # No media enrichment available
                 media_data_list = [{}] * len(records)
@@ -425,6 +699,8 @@ class DeckBuilderAPI:
                 enrichment_errors=errors,
             )
 
+        if self._checkpoint is not None:
+            self._checkpoint.close()
         self._phase = Phase.MEDIA_ENRICHED
         total_enriched = sum(len(data.records) for data in self._enriched_data.values())
         logger.info(
@@ -432,6 +708,129 @@ class DeckBuilderAPI:
             f"across {len(self._enriched_data)} types"
         )
 
+    def backfill_media(
+        self, workers: int = 1, max_jobs: int | None = None
+    ) -> BackfillReport:
+        """Generate the media queued by deferred builds of this deck.
+
+        Can run in any phase, e.g. from a separate process while builds
+        continue; the next build finds the generated files on disk.
+
+        Args:
+            workers: Jobs processed concurrently
+            max_jobs: Stop after this many attempts in total
+
+        Returns:
+            BackfillReport of the jobs processed
+
+        Raises:
+            ConfigurationError: If the builder has no media queue
+        """
+        if self._media_queue is None:
+            raise ConfigurationError("backfill_media requires a media_queue")
+        audio_service, pexels_service, anthropic_service = self._media_services
+        worker = MediaBackfillWorker(
+            self._media_queue, audio_service, pexels_service, anthropic_service
+        )
+        return worker.drain(workers=workers, max_jobs=max_jobs)
+
+    def plan_build(
+        self,
+        record_types: list[str] | None = None,
+        concurrency: int = 1,
+        request_seconds: Mapping[str, float] | None = None,
+    ) -> BuildPlan:
+        """Estimate the external work enrich_media would trigger, as a dry run.
+
+        Walks the loaded records and their domain models, checks each media
+        file against disk, the media index and the Anthropic query cache, and
+        counts hits and misses per service. No service is called and no file
+        is written.
+
+        Args:
+            record_types: Specific record types to plan, or None for all
+            concurrency: Requests in flight at once, for the projected time
+            request_seconds: Seconds per request by service; missing entries
+                use DEFAULT_REQUEST_SECONDS. Pexels requests are also no
+                faster than the service's request_delay.
+
+        Returns:
+            BuildPlan with per-service counts and projected wall time
+
+        Raises:
+            InvalidPhaseError: If not in DATA_LOADED phase
+            ConfigurationError: If the language's enricher cannot plan
+        """
+        self._require_phase(Phase.DATA_LOADED)
+        if not isinstance(self._media_enricher, StandardMediaEnricher):
+            raise ConfigurationError(
+                f"Build planning is not supported for {self._language}"
+            )
+        if concurrency < 1:
+            raise ConfigurationError(f"concurrency must be positive, got {concurrency}")
+
+        services = {
+            name: ServicePlan(name) for name in ("polly", "anthropic", "pexels")
+        }
+        factory = self._language_impl.get_card_processor().get_record_to_model_factory()
+        records_by_type = self._loaded_data.records_by_type if self._loaded_data else {}
+        seen: set[Path] = set()
+        records = 0
+        skipped = 0
+        for record_type in record_types or list(records_by_type):
+            for record in records_by_type.get(record_type, []):
+                records += 1
+                try:
+                    planned = self._media_enricher.plan_media(
+                        factory.create_domain_model(record)
+                    )
+                except Exception as e:
+                    logger.debug(f"Cannot plan {type(record).__name__}: {e}")
+                    skipped += 1
+                    continue
+                for media in planned:
+                    if media.target in seen:
+                        continue
+                    seen.add(media.target)
+                    service = services["polly" if media.kind == "audio" else "pexels"]
+                    if media.available:
+                        service.cache_hits += 1
+                        continue
+                    service.cache_misses += 1
+                    service.characters += media.characters
+                    if media.needs_query:
+                        anthropic = services["anthropic"]
+                        if media.query_cached:
+                            anthropic.cache_hits += 1
+                        else:
+                            anthropic.cache_misses += 1
+
+        # One Polly and one Anthropic request per miss; Pexels searches, then
+        # downloads the chosen photo
+        for name, service_plan in services.items():
+            service_plan.requests = service_plan.cache_misses * (
+                2 if name == "pexels" else 1
+            )
+        seconds = {**DEFAULT_REQUEST_SECONDS, **(request_seconds or {})}
+        pexels_delay = self._media_services[1].request_delay
+        seconds["pexels"] = max(seconds["pexels"], pexels_delay)
+        estimated = sum(
+            service_plan.requests * seconds[name]
+            for name, service_plan in services.items()
+        )
+        plan = BuildPlan(
+            records=records,
+            services=services,
+            concurrency=concurrency,
+            estimated_seconds=estimated / concurrency,
+            skipped_records=skipped,
+        )
+        logger.info(
+            f"Planned build of {records} records: {plan.requests} requests, "
+            f"about {plan.estimated_seconds:.1f}s"
+        )
+        return plan
+
     def get_enriched_data(
         self, record_type: str | None = None
     ) -> dict[str, EnrichedData]:
@@ -455,6 +854,93 @@ class DeckBuilderAPI:
             files.extend(enriched.media_files_created)
         return files
 
+    def _missing_media_count(self) -> int:
+        """Return the media files the enricher deferred or failed so far."""
+        if isinstance(self._media_enricher, StandardMediaEnricher):
+            return (
+                self._media_enricher.deferred_count + self._media_enricher.failed_count
+            )
+        return 0
+
+    def _media_complete(
+        self, record: BaseRecord, media_data: dict[str, Any], factory: Any
+    ) -> bool:
+        """Check checkpointed media data against the record's expected media.
+
+        Entries written before failures were tracked may lack media; they
+        are enriched again instead of reused.
+        """
+        if not isinstance(self._media_enricher, StandardMediaEnricher):
+            return True
+        try:
+            domain_model = factory.create_domain_model(record)
+        except ValueError:
+            return True
+        return self._media_enricher.media_complete(domain_model, media_data)
+
+    def optimize_images(
+        self,
+        config: ImageProcessingConfig | None = None,
+        max_workers: int | None = None,
+    ) -> MediaProcessingReport:
+        """Shrink the deck's images before they are packaged.
+
+        Resized, metadata-free and re-encoded copies are written to
+        ``output/processed_media`` in a process pool and packaged instead of
+        the deck's images, which stay untouched. Images processed by an
+        earlier run with the same configuration are reused.
+
+        Args:
+            config: Target size and encoding, or None for the defaults
+            max_workers: Worker processes; defaults to the CPU count
+
+        Returns:
+            MediaProcessingReport including bytes saved
+
+        Raises:
+            InvalidPhaseError: If not in MEDIA_ENRICHED phase
+        """
+        self._require_phase(Phase.MEDIA_ENRICHED)
+        processor = ImageProcessor(config, max_workers=max_workers)
+        report = processor.process_directory(
+            self._images_dir, self._processed_media_dir / "images"
+        )
+        self._media_file_registrar.use_processed_media(report.outputs)
+        self._media_processing["images"] = report
+        return report
+
+    def process_audio(
+        self,
+        config: AudioProcessingConfig | None = None,
+        max_workers: int | None = None,
+    ) -> MediaProcessingReport:
+        """Trim, loudness-normalize and re-encode the deck's audio clips.
+
+        Processed copies are written to ``output/processed_media`` by
+        parallel ffmpeg processes and packaged instead of the deck's clips,
+        which stay untouched. Clips processed by an earlier run with the
+        same configuration are reused.
+
+        Args:
+            config: Processing targets, or None for the defaults
+            max_workers: Concurrent ffmpeg processes
+
+        Returns:
+            MediaProcessingReport including bytes saved and seconds spent
+
+        Raises:
+            InvalidPhaseError: If not in MEDIA_ENRICHED phase
+            ConfigurationError: If ffmpeg is not installed
+        """
+        self._require_phase(Phase.MEDIA_ENRICHED)
+        processor = AudioProcessor(config, max_workers=max_workers)
+        report = processor.process_directory(
+            self._audio_dir, self._processed_media_dir / "audio"
+        )
+        self._media_file_registrar.use_processed_media(report.outputs)
+        self._media_processing["audio"] = report
+        return report
+
     # --- Card Building Phase ---
 
     def build_cards(
@@ -524,7 +1010,10 @@ class DeckBuilderAPI:
                         else:
                             note_type_id = created_note_types[note_type.name]
 
-                        # Add note to backend
+                        # Reference renamed processed images, then add the note
+                        field_values = self._media_file_registrar.rewrite_references(
+                            field_values
+                        )
                         self._backend.add_note(
                             note_type_id, field_values, skip_media_processing=True
                         )
@@ -602,6 +1091,9 @@ class DeckBuilderAPI:
         )
 
         if not preview_only:
+            if record_types is None and self._persistent_collection:
+                # Full build: drop notes whose records no longer exist
+                self._anki_backend().remove_stale_notes()
             self._phase = Phase.CARDS_BUILT
 
         logger.info(f"Built {len(all_cards)} cards across {len(cards_by_type)} types")
@@ -710,6 +1202,70 @@ class DeckBuilderAPI:
         )
         return self._export_result
 
+    # --- Sharded Builds ---
+
+    def save_collection(self, path: str | Path) -> None:
+        """Save the built collection for merging into another builder.
+
+        Args:
+            path: Destination .anki2 file
+
+        Raises:
+            InvalidPhaseError: If not in CARDS_BUILT phase
+            ConfigurationError: If the builder does not use the anki backend
+        """
+        self._require_phase(Phase.CARDS_BUILT)
+        self._anki_backend().save_collection(str(path))
+
+    def merge_shards(
+        self,
+        collection_paths: Sequence[str | Path],
+        shard_cards: Sequence[BuiltCards],
+    ) -> BuiltCards:
+        """Merge collections built by shard builders into this builder.
+
+        Shards are merged in the given order, so the same shards always give
+        the same deck. Enrichment and card building happened in the shards,
+        so this advances straight to CARDS_BUILT and export_deck() writes the
+        combined deck.
+
+        Args:
+            collection_paths: .anki2 files written by save_collection()
+            shard_cards: BuiltCards of each shard, in the same order
+
+        Returns:
+            BuiltCards combining all shards
+
+        Raises:
+            InvalidPhaseError: If not in DATA_LOADED phase
+            ConfigurationError: If the builder does not use the anki backend
+        """
+        self._require_phase(Phase.DATA_LOADED)
+
+        backend = self._anki_backend()
+        for path in collection_paths:
+            backend.merge_collection(str(path))
+
+        merged = BuiltCards(
+            cards=[], cards_by_type={}, template_usage={}, build_errors=[]
+        )
+        for built in shard_cards:
+            merged.cards.extend(built.cards)
+            for record_type, cards in built.cards_by_type.items():
+                merged.cards_by_type.setdefault(record_type, []).extend(cards)
+            for template, count in built.template_usage.items():
+                merged.template_usage[template] = (
+                    merged.template_usage.get(template, 0) + count
+                )
+            merged.build_errors.extend(built.build_errors)
+
+        self._built_cards = merged
+        self._phase = Phase.CARDS_BUILT
+        logger.info(
+            f"Merged {len(collection_paths)} shards with {len(merged.cards)} cards"
+        )
+        return merged
+
     # --- Query APIs ---
 
     def get_current_phase(self) -> Phase:
@@ -792,6 +1348,12 @@ class DeckBuilderAPI:
         if self._media_service:
             stats.update(self._media_manager.get_detailed_stats())
 
+        if self._media_processing:
+            stats["media_processing"] = {
+                media_type: report.as_stats()
+                for media_type, report in self._media_processing.items()
+            }
+
         return stats
 
     def get_subdeck_info(self) -> dict[str, Any]:
@@ -807,6 +1369,11 @@ class DeckBuilderAPI:
         """Get the deck name."""
         return self._deck_name
 
+    @property
+    def backend(self) -> DeckBackend:
+        """Get the backend the built notes are added to."""
+        return self._backend
+
     # --- Context Manager Support ---
 
     def __enter__(self) -> "DeckBuilderAPI":
@@ -815,5 +1382,11 @@ class DeckBuilderAPI:
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Context manager exit with cleanup."""
-        # Cleanup is handled by individual services
-        pass
+        # Cleanup is handled by individual services; a persistent collection
+        # is closed so it is saved and can be opened by the next build
+        if self._checkpoint is not None:
+            self._checkpoint.close()
+        if self._persistent_collection:
+            self._anki_backend().close()
+        elif isinstance(self._backend, TextExportBackend):
+            self._backend.close()
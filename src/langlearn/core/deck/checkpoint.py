@@ -0,0 +1,160 @@
+"""Checkpoint media enrichment results so an interrupted build can resume.
+
+Enrichment is the slow phase of a cold build: every record goes through
+Polly, Anthropic and Pexels. ``EnrichmentCheckpoint`` appends each record's
+media data to a JSON Lines file as soon as the record is enriched, so a
+build that dies midway (throttling, an outage, a laptop going to sleep)
+loses at most the record in flight. A resumed build reuses every
+checkpointed record and only enriches the rest.
+
+Records are identified by a digest of their class and field values, so an
+edited record is enriched again rather than matched to stale media.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any
+
+from langlearn.core.records import BaseRecord
+
+logger = logging.getLogger(__name__)
+
+
+def checkpoint_key(record: BaseRecord) -> str:
+    """Return a stable key for a record, independent of the process.
+
+    Args:
+        record: Record to identify
+
+    Returns:
+        Hex digest of the record class and field values
+    """
+    payload = json.dumps(
+        [type(record).__name__, list(record.as_mapping().values())],
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EnrichmentCheckpoint:
+    """Append-only JSON Lines log of enriched media data per record.
+
+    Each line holds ``{"type": record_type, "key": ..., "media": {...}}``.
+    Lines are flushed as they are written; a line cut short by a crash is
+    skipped on load.
+
+    Example:
+        ```python
+        with EnrichmentCheckpoint(path) as checkpoint:
+            done = checkpoint.load()
+            checkpoint.record("noun", record, media_data)
+        ```
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the checkpoint.
+
+        Args:
+            path: JSON Lines file to read and append to
+        """
+        self._path = Path(path)
+        self._file: IO[str] | None = None
+        self._written = 0
+
+    @property
+    def path(self) -> Path:
+        """Return the checkpoint file path."""
+        return self._path
+
+    @property
+    def written(self) -> int:
+        """Return the number of records written since opening."""
+        return self._written
+
+    def load(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Read checkpointed media data.
+
+        Returns:
+            Media data by record type and record key; later lines win.
+            Empty if the file does not exist.
+        """
+        entries: dict[str, dict[str, dict[str, Any]]] = {}
+        if not self._path.exists():
+            return entries
+        skipped = 0
+        with open(self._path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    record_type, key, media = (
+                        entry["type"],
+                        entry["key"],
+                        entry["media"],
+                    )
+                except (ValueError, KeyError, TypeError):
+                    skipped += 1
+                    continue
+                entries.setdefault(record_type, {})[key] = media
+        if skipped:
+            logger.warning(f"Skipped {skipped} unreadable lines in {self._path}")
+        total = sum(len(media) for media in entries.values())
+        logger.info(f"Loaded {total} checkpointed records from {self._path}")
+        return entries
+
+    def open(self, resume: bool = False) -> None:
+        """Open the file for writing.
+
+        Args:
+            resume: Append to an existing checkpoint instead of starting over
+        """
+        self.close()
+        self._file = self._open_file(resume)
+        self._written = 0
+
+    def _open_file(self, append: bool) -> IO[str]:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        return open(self._path, "a" if append else "w", encoding="utf-8")
+
+    def record(
+        self, record_type: str, record: BaseRecord, media_data: dict[str, Any]
+    ) -> None:
+        """Append one record's media data and flush it to disk.
+
+        Args:
+            record_type: Record type the record was loaded as
+            record: The enriched record
+            media_data: Media data produced for the record
+        """
+        if self._file is None:
+            self._file = self._open_file(append=True)
+        entry = {
+            "type": record_type,
+            "key": checkpoint_key(record),
+            "media": media_data,
+        }
+        self._file.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+        self._written += 1
+
+    def close(self) -> None:
+        """Close the file if it is open."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "EnrichmentCheckpoint":
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Context manager exit; closes the file."""
+        self.close()
@@ -104,6 +104,33 @@ class ExportResult:
     cards_exported: int
 
 
+@dataclass
+class ServicePlan:
+    """Expected use of one external service by a build."""
+
+    service: str
+    cache_hits: int = 0
+    cache_misses: int = 0
+    requests: int = 0
+    characters: int = 0  # Billed characters, for Polly
+
+
+@dataclass
+class BuildPlan:
+    """Dry-run estimate of the external work a build will trigger."""
+
+    records: int
+    services: dict[str, ServicePlan]  # "polly", "anthropic", "pexels"
+    concurrency: int
+    estimated_seconds: float
+    skipped_records: int = 0
+
+    @property
+    def requests(self) -> int:
+        """Return the estimated number of API requests across services."""
+        return sum(plan.requests for plan in self.services.values())
+
+
 @dataclass
 class PipelineSummary:
     """Summary of entire pipeline state."""
@@ -0,0 +1,173 @@
+"""Fill a deck's media store ahead of builds, without building the deck.
+
+``MediaWarmer`` loads a deck's CSV files, turns the records into domain
+models and asks the language's media enricher which audio segments and
+images are missing. Instead of generating them one record at a time, it
+queues them in the deck's ``MediaJobQueue`` (the one used by deferred
+builds) and drains the queue with concurrent workers. No Anki collection is
+created, so warming can run on a schedule and interactive builds then find
+every file on disk.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from langlearn.core.records import BaseRecord
+from langlearn.exceptions import ConfigurationError
+from langlearn.infrastructure.services import get_anthropic_service
+from langlearn.infrastructure.services.media_enricher import StandardMediaEnricher
+from langlearn.infrastructure.services.media_queue import (
+    BackfillReport,
+    MediaBackfillWorker,
+    MediaJobQueue,
+)
+from langlearn.languages.registry import LanguageRegistry
+
+from .batch import DeckSpec, SharedServices
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MediaWarmResult:
+    """Outcome of warming one deck's media."""
+
+    spec: DeckSpec
+    records: int = 0
+    queued: int = 0
+    backfill: BackfillReport | None = None
+    seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Return True if the queue was drained without failed jobs."""
+        return self.error is None and (
+            self.backfill is None or self.backfill.failed == 0
+        )
+
+
+class MediaWarmer:
+    """Generate the missing media of decks through their media queues.
+
+    Example:
+        ```python
+        warmer = MediaWarmer(SharedServices(project_root), queue_dir)
+        result = warmer.warm(DeckSpec("german", "a1"), workers=8)
+        print(f"{result.backfill.done} files generated")
+        ```
+    """
+
+    def __init__(self, services: SharedServices, queue_dir: Path) -> None:
+        """Initialize the warmer.
+
+        Args:
+            services: Services shared with builds in this process
+            queue_dir: Directory of the per-deck media queue databases
+        """
+        self._services = services
+        self._queue_dir = queue_dir
+
+    def queue(self, spec: DeckSpec) -> MediaJobQueue:
+        """Return the media queue of a deck."""
+        return MediaJobQueue(self._queue_dir / spec.media_queue_filename)
+
+    def load_records(self, spec: DeckSpec) -> list[BaseRecord]:
+        """Load a deck's records with the language's record mapper.
+
+        Args:
+            spec: Deck to load
+
+        Returns:
+            Records of every CSV file present, in CSV mapping order
+        """
+        language_impl = LanguageRegistry.get(spec.language)
+        record_mapper = language_impl.get_record_mapper()()
+        data_dir = self._services.data_dir(spec)
+        records: list[BaseRecord] = []
+        for (
+            filename,
+            record_type,
+        ) in language_impl.get_csv_to_record_type_mapping().items():
+            path = data_dir / filename
+            if path.exists():
+                records.extend(record_mapper.load_records_from_csv(path, record_type))
+        return records
+
+    def plan(self, spec: DeckSpec, queue: MediaJobQueue) -> tuple[int, int]:
+        """Queue every audio segment and image the deck is missing.
+
+        Args:
+            spec: Deck to plan
+            queue: Queue for the jobs
+
+        Returns:
+            Number of records and of newly queued jobs
+        """
+        language_impl = LanguageRegistry.get(spec.language)
+        data_dir = self._services.data_dir(spec)
+        audio_service = self._services.audio_service(spec)
+        pexels_service = self._services.pexels_service()
+        enricher = language_impl.create_media_enricher(
+            audio_service=audio_service,
+            pexels_service=pexels_service,
+            anthropic_service=get_anthropic_service(),
+            audio_base_path=data_dir / "audio",
+            image_base_path=data_dir / "images",
+        )
+        if not isinstance(enricher, StandardMediaEnricher):
+            raise ConfigurationError(
+                f"Media warming is not supported for {spec.language}"
+            )
+        enricher.use_media_index(self._services.media_index(spec.language))
+        enricher.defer_to(queue)
+
+        factory = language_impl.get_card_processor().get_record_to_model_factory()
+        pending_before = queue.counts()["pending"]
+        records = self.load_records(spec)
+        for record in records:
+            try:
+                domain_model = factory.create_domain_model(record)
+            except ValueError as e:
+                logger.debug(f"No domain model for {type(record).__name__}: {e}")
+                continue
+            enricher.enrich_with_media(domain_model)
+        queued = queue.counts()["pending"] - pending_before
+        logger.info(f"Queued {queued} media jobs for {spec.key}")
+        return len(records), queued
+
+    def warm(
+        self, spec: DeckSpec, workers: int = 4, max_jobs: int | None = None
+    ) -> MediaWarmResult:
+        """Queue a deck's missing media and generate it.
+
+        Errors are captured in the result rather than raised, so one bad
+        deck does not stop warming the others.
+
+        Args:
+            spec: Deck to warm
+            workers: Jobs generated concurrently
+            max_jobs: Stop after this many attempts
+
+        Returns:
+            MediaWarmResult for the deck
+        """
+        result = MediaWarmResult(spec=spec)
+        start = time.perf_counter()
+        try:
+            queue = self.queue(spec)
+            result.records, result.queued = self.plan(spec, queue)
+            worker = MediaBackfillWorker(
+                queue,
+                self._services.audio_service(spec),
+                self._services.pexels_service(),
+                get_anthropic_service(),
+            )
+            result.backfill = worker.drain(workers=workers, max_jobs=max_jobs)
+        except Exception as e:
+            logger.error(f"Failed to warm media for {spec.key}: {e}")
+            result.error = str(e)
+        result.seconds = time.perf_counter() - start
+        return result
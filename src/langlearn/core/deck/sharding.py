@@ -0,0 +1,261 @@
+"""Build one large deck in parallel shards and merge them into one .apkg.
+
+A ``DeckBuilderAPI`` builds every note into a single Anki collection, so card
+building is serial. ``ShardedDeckBuilder`` partitions the deck's record types
+across worker processes instead. Each worker enriches and builds its record
+types into a partial collection; the parent then merges the partial
+collections in shard order and exports one ``.apkg``.
+
+Shards never split a record type. Every record type has its own subdeck, and
+notes get GUIDs derived from subdeck, note type and the note type's identity
+fields (see ``stable_guid``), so a sharded build produces the same notes with
+the same GUIDs as an unsharded one, whatever the shard count.
+
+Example:
+    ```python
+    builder = ShardedDeckBuilder(DeckSpec("german", "a1"), project_root, shards=4)
+    result = builder.build(output_dir / "LangLearn_German_a1.apkg")
+    print(result.timings)
+    ```
+"""
+
+import logging
+import tempfile
+import time
+from collections.abc import Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from langlearn.infrastructure.services.resilience import CallPolicy
+
+from .batch import DeckBuildResult, DeckSpec, SharedServices
+from .data_types import BuiltCards
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ShardTask:
+    """Record types one worker builds into its own collection."""
+
+    spec: DeckSpec
+    index: int
+    record_types: tuple[str, ...]
+    project_root: Path
+    work_dir: Path
+    call_policy: CallPolicy | None = None
+    fast_scratch: bool = False
+
+    @property
+    def data_dir(self) -> Path:
+        """Return the directory holding the deck's CSV files."""
+        return self.project_root / "languages" / self.spec.language / self.spec.deck
+
+    @property
+    def collection_path(self) -> Path:
+        """Return the .anki2 file the shard is saved to."""
+        return self.work_dir / f"shard-{self.index:03d}.anki2"
+
+
+@dataclass
+class ShardResult:
+    """Built cards and timings of one shard."""
+
+    task: ShardTask
+    built_cards: BuiltCards
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+def plan_shards(counts_by_type: Mapping[str, int], shards: int) -> list[list[str]]:
+    """Partition record types into shards of similar record counts.
+
+    Record types are assigned largest first to the shard with the fewest
+    records so far, ties going to the lowest shard index. Within a shard,
+    record types keep their order in counts_by_type. The plan depends only on
+    the counts, so rebuilding the same data gives the same shards.
+
+    Args:
+        counts_by_type: Number of records per record type, in load order
+        shards: Maximum number of shards
+
+    Returns:
+        Non-empty lists of record types, one per shard
+
+    Raises:
+        ValueError: If shards is less than 1
+    """
+    if shards < 1:
+        raise ValueError(f"shards must be at least 1, got {shards}")
+
+    order = {record_type: i for i, record_type in enumerate(counts_by_type)}
+    loads = [0] * shards
+    assigned: list[list[str]] = [[] for _ in range(shards)]
+    by_size = sorted(counts_by_type, key=lambda t: (-counts_by_type[t], order[t]))
+    for record_type in by_size:
+        target = min(range(shards), key=lambda i: (loads[i], i))
+        assigned[target].append(record_type)
+        loads[target] += counts_by_type[record_type]
+
+    return [sorted(types, key=order.__getitem__) for types in assigned if types]
+
+
+def build_shard(task: ShardTask) -> ShardResult:
+    """Load, enrich and build one shard's record types and save its collection.
+
+    Runs in a worker process, so it creates its own builder and services,
+    protected by the task's call policy and on scratch storage if the task
+    asks for it.
+
+    Args:
+        task: Shard to build
+
+    Returns:
+        ShardResult with the shard's built cards
+    """
+    timings: dict[str, float] = {}
+    record_types = list(task.record_types)
+    services = SharedServices(
+        task.project_root,
+        call_policy=task.call_policy,
+        fast_scratch=task.fast_scratch,
+    )
+    with services.create_builder(task.spec) as builder:
+        start = time.perf_counter()
+        builder.load_data(task.data_dir, max_workers=1, record_types=record_types)
+        timings["load"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in builder.enrich_media(record_types=record_types):
+            pass
+        timings["enrich"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        built_cards = builder.build_cards(record_types=record_types)
+        builder.save_collection(task.collection_path)
+        timings["build"] = time.perf_counter() - start
+
+    return ShardResult(task=task, built_cards=built_cards, timings=timings)
+
+
+class ShardedDeckBuilder:
+    """Build one deck across several workers and merge the shards."""
+
+    def __init__(
+        self,
+        spec: DeckSpec,
+        project_root: Path,
+        shards: int,
+        use_processes: bool = True,
+        call_policy: CallPolicy | None = None,
+        fast_scratch: bool = False,
+    ) -> None:
+        """Initialize ShardedDeckBuilder.
+
+        Args:
+            spec: Deck to build
+            project_root: Root containing the ``languages/`` data directories
+            shards: Maximum number of shards built at once
+            use_processes: Build shards in worker processes; threads are
+                cheaper to start but serialize card building on the GIL
+            call_policy: Circuit breaker, deadline and hedging settings for
+                the Polly and Pexels calls of every shard
+            fast_scratch: Build the shards and the merged deck in RAM-backed,
+                non-durable scratch collections
+        """
+        if shards < 1:
+            raise ValueError(f"shards must be at least 1, got {shards}")
+        self._spec = spec
+        self._project_root = project_root
+        self._services = SharedServices(
+            project_root, call_policy=call_policy, fast_scratch=fast_scratch
+        )
+        self._data_dir = self._services.data_dir(spec)
+        self._shards = shards
+        self._use_processes = use_processes
+        self._call_policy = call_policy
+        self._fast_scratch = fast_scratch
+        self.shard_results: list[ShardResult] = []
+
+    def build(self, output_path: Path) -> DeckBuildResult:
+        """Build all shards in parallel, merge them and export the deck.
+
+        Args:
+            output_path: .apkg file to write
+
+        Returns:
+            DeckBuildResult with load, shards, merge and export timings; the
+            failing stage is named in error if any
+        """
+        result = DeckBuildResult(spec=self._spec)
+        self.shard_results = []
+        stage = "load"
+        try:
+            with (
+                self._services.create_builder(self._spec) as builder,
+                tempfile.TemporaryDirectory(prefix="langlearn_shards_") as work_dir,
+            ):
+                start = time.perf_counter()
+                loaded = builder.load_data(self._data_dir)
+                result.records = loaded.total_records
+                plan = plan_shards(
+                    {
+                        record_type: len(records)
+                        for record_type, records in loaded.records_by_type.items()
+                    },
+                    self._shards,
+                )
+                tasks = [
+                    ShardTask(
+                        spec=self._spec,
+                        index=index,
+                        record_types=tuple(record_types),
+                        project_root=self._project_root,
+                        work_dir=Path(work_dir),
+                        call_policy=self._call_policy,
+                        fast_scratch=self._fast_scratch,
+                    )
+                    for index, record_types in enumerate(plan)
+                ]
+                result.timings[stage] = time.perf_counter() - start
+
+                stage = "shards"
+                start = time.perf_counter()
+                self.shard_results = self._build_shards(tasks)
+                result.timings[stage] = time.perf_counter() - start
+
+                stage = "merge"
+                start = time.perf_counter()
+                builder.merge_shards(
+                    [shard.task.collection_path for shard in self.shard_results],
+                    [shard.built_cards for shard in self.shard_results],
+                )
+                result.timings[stage] = time.perf_counter() - start
+
+                stage = "export"
+                start = time.perf_counter()
+                export_result = builder.export_deck(output_path)
+                result.timings[stage] = time.perf_counter() - start
+                result.cards = export_result.cards_exported
+                result.output_path = export_result.output_path
+        except Exception as e:
+            logger.error(f"Failed to build {self._spec.key} during {stage}: {e}")
+            result.error = f"{stage}: {e}"
+        return result
+
+    def _build_shards(self, tasks: list[ShardTask]) -> list[ShardResult]:
+        """Build shards concurrently, returning results in shard order."""
+        logger.info(
+            f"Building {self._spec.key} in {len(tasks)} shards: "
+            + "; ".join(", ".join(task.record_types) for task in tasks)
+        )
+        if len(tasks) <= 1:
+            return [build_shard(task) for task in tasks]
+
+        executor: Executor = (
+            ProcessPoolExecutor(max_workers=len(tasks))
+            if self._use_processes
+            else ThreadPoolExecutor(max_workers=len(tasks))
+        )
+        with executor:
+            return list(executor.map(build_shard, tasks))
@@ -0,0 +1,212 @@
+"""Watch a deck's CSV data and templates and rebuild on change.
+
+``DeckWatcher`` polls file modification times, so it needs no extra
+dependency. Each change is mapped to what it affects:
+
+- a CSV file maps to its record type through the language's CSV mapping;
+  the next build reuses media data for every record that did not change, so
+  only new or edited rows reach Polly, Anthropic and Pexels
+- a template file maps to the card types that load it; only those entries of
+  the shared TemplateService cache are dropped
+
+Cards are rebuilt and exported in full on every change because the .apkg is a
+single collection; that work is local and fast compared to enrichment.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from langlearn.infrastructure.services.audio_processor import AudioProcessingConfig
+from langlearn.infrastructure.services.image_processor import ImageProcessingConfig
+from langlearn.languages.registry import LanguageRegistry
+
+from .batch import BatchDeckBuilder, DeckBuildResult, DeckSpec, SharedServices
+from .data_types import EnrichedData
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ChangeSet:
+    """Files changed since the last poll and what they affect."""
+
+    csv_files: list[Path] = field(default_factory=list)
+    template_files: list[Path] = field(default_factory=list)
+    record_types: set[str] = field(default_factory=set)
+    card_types: set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        """Return True if anything changed."""
+        return bool(self.csv_files or self.template_files)
+
+
+class DeckWatcher:
+    """Rebuild one deck whenever its data or templates change.
+
+    Example:
+        ```python
+        watcher = DeckWatcher(DeckSpec("german", "a1"), services, apkg_path)
+        watcher.run(on_build=lambda changes, result: print(result.timings))
+        ```
+    """
+
+    def __init__(
+        self,
+        spec: DeckSpec,
+        services: SharedServices,
+        output_path: Path,
+        interval: float = 1.0,
+        image_config: ImageProcessingConfig | None = None,
+        audio_config: AudioProcessingConfig | None = None,
+    ) -> None:
+        """Initialize DeckWatcher.
+
+        Args:
+            spec: Deck to watch and rebuild
+            services: Shared services; its TemplateService cache is
+                invalidated per card type
+            output_path: .apkg file written by every build
+            interval: Seconds between polls
+            image_config: Shrink the deck's images with this configuration
+                on every build; None leaves images as downloaded
+            audio_config: Post-process the deck's audio with this
+                configuration on every build; None leaves clips as synthesized
+
+        Raises:
+            ConfigurationError: If audio_config is set and ffmpeg is missing
+        """
+        self._spec = spec
+        self._services = services
+        self._output_path = output_path
+        self._batch = BatchDeckBuilder(
+            services.project_root,
+            output_path.parent,
+            services,
+            image_config=image_config,
+            audio_config=audio_config,
+        )
+        self._interval = interval
+        language = LanguageRegistry.get(spec.language)
+        self._csv_record_types = language.get_csv_to_record_type_mapping()
+        self._data_dir = services.data_dir(spec)
+        self._template_dir = language.get_template_directory()
+        self._mtimes = self._scan()
+        self._enriched: dict[str, EnrichedData] = {}
+
+    @property
+    def watched_directories(self) -> tuple[Path, Path]:
+        """Return the data and template directories being watched."""
+        return self._data_dir, self._template_dir
+
+    def _scan(self) -> dict[Path, int]:
+        """Return modification times of watched files."""
+        files = [
+            *self._data_dir.glob("*.csv"),
+            *(path for path in self._template_dir.iterdir() if path.is_file()),
+        ]
+        mtimes = {}
+        for path in files:
+            try:
+                mtimes[path] = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue  # Removed between listing and stat (editor swap files)
+        return mtimes
+
+    def poll(self) -> ChangeSet:
+        """Compare modification times with the last poll.
+
+        Returns:
+            ChangeSet of added, edited and removed files
+        """
+        current = self._scan()
+        changed = {
+            path
+            for path in current.keys() | self._mtimes.keys()
+            if current.get(path) != self._mtimes.get(path)
+        }
+        self._mtimes = current
+
+        changes = ChangeSet()
+        template_service = self._services.template_service(self._spec.language)
+        for path in sorted(changed):
+            if path.parent == self._data_dir:
+                changes.csv_files.append(path)
+                record_type = self._csv_record_types.get(path.name)
+                if record_type is not None:
+                    changes.record_types.add(record_type)
+            else:
+                changes.template_files.append(path)
+                changes.card_types.update(
+                    template_service.card_types_for_file(path.name)
+                )
+        return changes
+
+    def apply(self, changes: ChangeSet) -> None:
+        """Invalidate cached state affected by a change set.
+
+        Args:
+            changes: Result of poll()
+        """
+        template_service = self._services.template_service(self._spec.language)
+        unmapped_template = any(
+            not template_service.card_types_for_file(path.name)
+            for path in changes.template_files
+        )
+        if unmapped_template:
+            # A file no card type claims (e.g. shared CSS): reload everything
+            template_service.clear_cache()
+        for card_type in changes.card_types:
+            template_service.invalidate(card_type)
+
+    def rebuild(self) -> DeckBuildResult:
+        """Build the deck, reusing media data from the previous build.
+
+        Returns:
+            DeckBuildResult of this build
+        """
+        try:
+            with self._services.create_builder(self._spec) as builder:
+                result = self._batch.run_pipeline(
+                    builder, self._spec, self._output_path, self._enriched
+                )
+                if result.succeeded:
+                    self._enriched = builder.get_enriched_data()
+                return result
+        except Exception as e:
+            logger.error(f"Failed to rebuild {self._spec.key}: {e}")
+            return DeckBuildResult(spec=self._spec, error=f"init: {e}")
+
+    def run(
+        self,
+        on_build: Callable[[ChangeSet, DeckBuildResult], None] | None = None,
+        max_builds: int | None = None,
+    ) -> None:
+        """Build once, then rebuild after each change until interrupted.
+
+        Args:
+            on_build: Called with the triggering changes and the result
+            max_builds: Stop after this many builds, including the first
+        """
+        builds = 0
+        changes = ChangeSet()
+        while True:
+            result = self.rebuild()
+            builds += 1
+            if on_build is not None:
+                on_build(changes, result)
+            if max_builds is not None and builds >= max_builds:
+                return
+
+            changes = self.poll()
+            while not changes:
+                time.sleep(self._interval)
+                changes = self.poll()
+            logger.info(
+                f"Detected changes in {self._spec.key}: "
+                f"record types {sorted(changes.record_types)}, "
+                f"card types {sorted(changes.card_types)}"
+            )
+            self.apply(changes)
@@ -0,0 +1,239 @@
+"""Run PipelineTasks as a dependency graph on a thread or process pool.
+
+``Pipeline`` runs its tasks as a chain, one after the other. A deck build is
+not a chain: enrichment of nouns does not wait for enrichment of verbs, only
+card building waits for both. ``TaskGraph`` runs tasks that declare their
+dependencies and starts every task as soon as its dependencies are done, so
+independent branches run concurrently.
+
+Inputs are wired from dependencies:
+
+- a task without dependencies receives the graph's initial input
+- a task with one dependency receives that task's output
+- a task with several dependencies receives ``{name: output}`` for them
+
+Each task records its wall time in its ``PipelineTaskState``; see
+``TaskGraph.timings``.
+
+Quick start
+-----------
+>>> from langlearn.core.pipeline.pipeline import (
+...     ReverseStringTask, ToUpperCaseTask,
+... )
+>>> graph = TaskGraph()
+>>> graph = graph.add("upper", ToUpperCaseTask())
+>>> graph = graph.add("reverse", ReverseStringTask())
+>>> graph = graph.add("both", JoinTask(), depends_on=["upper", "reverse"])
+>>> graph.run("abc")["both"]
+'cba|ABC'
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Literal
+
+from .pipeline import PipelineTask
+
+logger = logging.getLogger(__name__)
+
+ExecutorKind = Literal["thread", "process"]
+
+
+def _run_task(task: PipelineTask[Any, Any]) -> PipelineTask[Any, Any]:
+    """Run a task and return it, carrying output and state.
+
+    Module-level so process pools can pickle it; a worker process returns a
+    copy of the task, which replaces the original in the graph.
+    """
+    task.run()
+    return task
+
+
+class JoinTask(PipelineTask[Mapping[str, Any], str]):
+    """Join the outputs of several dependencies with ``|`` in name order.
+
+    Example
+    -------
+    >>> task = JoinTask()
+    >>> task.input = {"b": "2", "a": "1"}
+    >>> task.run()
+    >>> task.output
+    '1|2'
+    """
+
+    def _run(self) -> None:
+        values = self.input or {}
+        self.output = "|".join(str(values[name]) for name in sorted(values))
+
+
+class TaskGraph:
+    """A set of named PipelineTasks with dependencies between them.
+
+    Example
+    -------
+    >>> from langlearn.core.pipeline.pipeline import ToUpperCaseTask
+    >>> graph = TaskGraph().add("upper", ToUpperCaseTask())
+    >>> graph.run("hi")
+    {'upper': 'HI'}
+    >>> graph.timings()["upper"] >= 0
+    True
+    """
+
+    __slots__ = (
+        "__dependencies",
+        "__tasks",
+    )
+
+    def __init__(self) -> None:
+        self.__tasks: dict[str, PipelineTask[Any, Any]] = {}
+        self.__dependencies: dict[str, tuple[str, ...]] = {}
+
+    def __str__(self) -> str:
+        return f"TaskGraph(tasks={list(self.__tasks)})"
+
+    def add(
+        self,
+        name: str,
+        task: PipelineTask[Any, Any],
+        depends_on: Sequence[str] = (),
+    ) -> TaskGraph:
+        """Add a task that runs once the named tasks have completed.
+
+        Parameters
+        ----------
+        name : str
+            Unique name of the task in this graph.
+        task : PipelineTask
+            The task; its input is wired from its dependencies.
+        depends_on : Sequence[str]
+            Names of tasks whose outputs this task consumes. They must have
+            been added already, which also rules out cycles.
+
+        Returns
+        -------
+        TaskGraph
+            This graph, for chaining.
+
+        Raises
+        ------
+        ValueError
+            If the name is taken or a dependency is unknown.
+        """
+        if name in self.__tasks:
+            raise ValueError(f"Duplicate task name: {name}")
+        unknown = [dep for dep in depends_on if dep not in self.__tasks]
+        if unknown:
+            raise ValueError(f"Task {name} depends on unknown tasks: {unknown}")
+        self.__tasks[name] = task
+        self.__dependencies[name] = tuple(depends_on)
+        return self
+
+    @property
+    def tasks(self) -> Mapping[str, PipelineTask[Any, Any]]:
+        """Tasks by name; after a process-pool run, the returned copies."""
+        return dict(self.__tasks)
+
+    def dependencies(self, name: str) -> tuple[str, ...]:
+        """Names of the tasks a task depends on."""
+        return self.__dependencies[name]
+
+    def timings(self) -> dict[str, float]:
+        """Wall time of every completed task, by name."""
+        return {
+            name: task.wall_seconds
+            for name, task in self.__tasks.items()
+            if task.wall_seconds is not None
+        }
+
+    def _input_for(self, name: str, initial: Any, outputs: dict[str, Any]) -> Any:
+        """Return the input a task receives from its dependencies."""
+        dependencies = self.__dependencies[name]
+        if not dependencies:
+            return initial
+        if len(dependencies) == 1:
+            return outputs[dependencies[0]]
+        return {dep: outputs[dep] for dep in dependencies}
+
+    def run(
+        self,
+        initial: Any = None,
+        executor: ExecutorKind | Executor = "thread",
+        max_workers: int | None = None,
+    ) -> dict[str, Any]:
+        """Run every task, each as soon as its dependencies are done.
+
+        Parameters
+        ----------
+        initial : Any
+            Input of the tasks without dependencies.
+        executor : {"thread", "process"} or Executor
+            Pool to run tasks on. Threads suit I/O-bound tasks; processes
+            suit CPU-bound ones but need picklable tasks and values. A
+            given Executor is used as is and not shut down.
+        max_workers : Optional[int]
+            Pool size when the pool is created here.
+
+        Returns
+        -------
+        dict[str, Any]
+            Output of every task, by name.
+
+        Raises
+        ------
+        Exception
+            The first task failure; tasks not yet started are cancelled.
+        """
+        logger.info("Running task graph with %s tasks", len(self.__tasks))
+        if isinstance(executor, Executor):
+            return self._run_on(executor, initial)
+        pool: Executor = (
+            ProcessPoolExecutor(max_workers=max_workers)
+            if executor == "process"
+            else ThreadPoolExecutor(max_workers=max_workers)
+        )
+        with pool:
+            return self._run_on(pool, initial)
+
+    def _run_on(self, pool: Executor, initial: Any) -> dict[str, Any]:
+        """Schedule the graph on a pool."""
+        outputs: dict[str, Any] = {}
+        waiting = {name: set(deps) for name, deps in self.__dependencies.items()}
+        running: dict[Future[PipelineTask[Any, Any]], str] = {}
+
+        def submit_ready() -> None:
+            for name in [name for name, deps in waiting.items() if not deps]:
+                del waiting[name]
+                task = self.__tasks[name]
+                task.input = self._input_for(name, initial, outputs)
+                running[pool.submit(_run_task, task)] = name
+
+        submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    task = future.result()
+                except BaseException:
+                    for pending in running:
+                        pending.cancel()
+                    logger.error("Task %s failed; cancelling the graph", name)
+                    raise
+                self.__tasks[name] = task
+                outputs[name] = task.output
+                for deps in waiting.values():
+                    deps.discard(name)
+            submit_ready()
+
+        logger.info("Completed task graph with %s tasks", len(outputs))
+        return outputs
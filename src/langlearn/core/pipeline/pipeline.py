@@ -27,6 +27,7 @@ from __future__ import annotations
 
 import abc
 import logging
+import time
 from typing import Any, TypeVar, cast
 
 ValueT = TypeVar("ValueT")
@@ -78,21 +79,25 @@ class PipelineObject[ValueT]:
 
 
 class PipelineTaskState:
-    """Lifecycle state and debug logging for a PipelineTask.
+    """Lifecycle state, wall time and debug logging for a PipelineTask.
 
-    Tracks whether a task has completed and emits debug logs at start/finish.
-    Users of the public API typically do not need to interact with this class
-    directly.
+    Tracks whether a task has completed, how long its last run took, and
+    emits debug logs at start/finish. Users of the public API typically do
+    not need to interact with this class directly.
     """
 
     __slots__ = (
         "__is_completed",
         "__logger",
+        "__started_at",
+        "__wall_seconds",
     )
 
     def __init__(self) -> None:
         self.__logger = logging.getLogger(__name__)
         self.__is_completed = False
+        self.__started_at: float | None = None
+        self.__wall_seconds: float | None = None
 
     @property
     def is_completed(self) -> bool:
@@ -103,13 +108,26 @@ class PipelineTaskState:
         self.__logger.debug("Setting is_completed to %s", value)
         self.__is_completed = value
 
+    @property
+    def wall_seconds(self) -> float | None:
+        """Wall time of the last completed run, ``None`` until one completes."""
+        return self.__wall_seconds
+
     def start(self, message: str) -> None:
         self.is_completed = False
+        self.__wall_seconds = None
+        self.__started_at = time.perf_counter()
         self.__logger.debug("Starting task with input: %s", message)
 
     def complete(self, message: str) -> None:
+        if self.__started_at is not None:
+            self.__wall_seconds = time.perf_counter() - self.__started_at
         self.is_completed = True
-        self.__logger.debug("Completed task with output: %s", message)
+        self.__logger.debug(
+            "Completed task in %.3fs with output: %s",
+            self.__wall_seconds or 0.0,
+            message,
+        )
 
 
 class PipelineTask[InT, OutT](abc.ABC):
@@ -217,6 +235,17 @@ class PipelineTask[InT, OutT](abc.ABC):
         """Check if the task has been provided an input value."""
         return self._input is not None
 
+    @property
+    def wall_seconds(self) -> float | None:
+        """Wall time of the last successful ``run``.
+
+        Returns
+        -------
+        Optional[float]
+            Seconds spent in ``run``, or ``None`` until it has completed.
+        """
+        return self._state.wall_seconds
+
 
 class ReverseStringTask(PipelineTask[str, str]):
     """Reverse the input string.
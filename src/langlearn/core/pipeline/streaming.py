@@ -0,0 +1,363 @@
+"""Streaming tasks that pass items through bounded queues.
+
+``PipelineTask`` holds one input and one output value, so every stage must
+materialize its whole result before the next can start. A ``StreamTask``
+instead consumes an iterable of items and yields items as it goes.
+``StreamingPipeline`` runs each stage in its own thread, connected by
+bounded queues: a stage that gets ahead blocks until the stage after it
+catches up. Loading, enriching, building and writing can then overlap, and
+memory stays flat however large the deck is.
+
+Quick start
+-----------
+>>> pipe: StreamingPipeline[str] = StreamingPipeline(max_queue_size=2)
+>>> batches = pipe.add_task(MapTask(str.upper)).add_task(BatchTask(2))
+>>> list(batches.stream(["a", "b", "c"]))
+[['A', 'B'], ['C']]
+"""
+
+from __future__ import annotations
+
+import abc
+import logging
+import queue
+import threading
+from collections.abc import Callable, Generator, Iterable, Iterator
+from typing import Any, TypeVar, cast
+
+from .pipeline import PipelineTaskState
+
+ValueT = TypeVar("ValueT")
+InT = TypeVar("InT")
+OutT = TypeVar("OutT")
+
+DEFAULT_QUEUE_SIZE = 64
+
+# How often blocked queue operations wake up to check for cancellation
+_POLL_SECONDS = 0.05
+
+_END = object()
+
+
+class _CancelledError(Exception):
+    """Raised inside a stage thread once the pipeline has been cancelled."""
+
+
+def _put(target: queue.Queue[Any], item: Any, stop: threading.Event) -> None:
+    """Put an item, blocking while the queue is full, until cancelled."""
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=_POLL_SECONDS)
+            return
+        except queue.Full:
+            continue
+    raise _CancelledError
+
+
+def _drain(source: queue.Queue[Any], stop: threading.Event) -> Iterator[Any]:
+    """Yield items from a queue up to the end marker, until cancelled."""
+    while not stop.is_set():
+        try:
+            item = source.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            continue
+        if item is _END:
+            return
+        yield item
+    raise _CancelledError
+
+
+class StreamTask[InT, OutT](abc.ABC):
+    """Abstract base class for a stage that transforms a stream of items.
+
+    Subclasses implement ``_stream``, a generator over the input items. A
+    task may yield fewer or more items than it receives.
+
+    Generic Parameters
+    ------------------
+    InT
+        Type of the items consumed by this task.
+    OutT
+        Type of the items produced by this task.
+    """
+
+    __slots__ = (
+        "_items_in",
+        "_items_out",
+        "_logger",
+        "_state",
+    )
+
+    def __init__(self) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._state = PipelineTaskState()
+        self._items_in = 0
+        self._items_out = 0
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(in={self._items_in}, out={self._items_out})"
+
+    def stream(self, items: Iterable[InT]) -> Iterator[OutT]:
+        """Transform items lazily, counting them and recording wall time.
+
+        Parameters
+        ----------
+        items : Iterable[InT]
+            The input items.
+
+        Returns
+        -------
+        Iterator[OutT]
+            The output items, produced as the input is consumed.
+        """
+        self._items_in = 0
+        self._items_out = 0
+        self._state.start(self.__class__.__name__)
+        for item in self._stream(self._count(items)):
+            self._items_out += 1
+            yield item
+        self._state.complete(str(self))
+
+    def _count(self, items: Iterable[InT]) -> Iterator[InT]:
+        for item in items:
+            self._items_in += 1
+            yield item
+
+    @abc.abstractmethod
+    def _stream(self, items: Iterable[InT]) -> Iterator[OutT]:
+        """Yield the output items for the given input items."""
+        raise NotImplementedError
+
+    @property
+    def items_in(self) -> int:
+        """Number of items consumed by the current or last run."""
+        return self._items_in
+
+    @property
+    def items_out(self) -> int:
+        """Number of items produced by the current or last run."""
+        return self._items_out
+
+    def is_completed(self) -> bool:
+        """Whether the task consumed its whole input in the last run."""
+        return self._state.is_completed
+
+    @property
+    def wall_seconds(self) -> float | None:
+        """Wall time of the last completed run, including time spent blocked."""
+        return self._state.wall_seconds
+
+
+class MapTask(StreamTask[InT, OutT]):
+    """Apply a function to every item.
+
+    Example
+    -------
+    >>> list(MapTask(len).stream(["ab", "c"]))
+    [2, 1]
+    """
+
+    __slots__ = ("_function",)
+
+    def __init__(self, function: Callable[[InT], OutT]) -> None:
+        super().__init__()
+        self._function = function
+
+    def _stream(self, items: Iterable[InT]) -> Iterator[OutT]:
+        for item in items:
+            yield self._function(item)
+
+
+class BatchTask(StreamTask[InT, list[InT]]):
+    """Group items into lists of at most ``size`` items.
+
+    Useful in front of a stage that writes in bulk.
+
+    Example
+    -------
+    >>> list(BatchTask(2).stream([1, 2, 3]))
+    [[1, 2], [3]]
+    """
+
+    __slots__ = ("_size",)
+
+    def __init__(self, size: int) -> None:
+        super().__init__()
+        if size < 1:
+            raise ValueError(f"Batch size must be positive, got {size}")
+        self._size = size
+
+    def _stream(self, items: Iterable[InT]) -> Iterator[list[InT]]:
+        batch: list[InT] = []
+        for item in items:
+            batch.append(item)
+            if len(batch) == self._size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+class StreamingPipeline[ValueT]:
+    """A sequence of StreamTasks running concurrently over bounded queues.
+
+    Each task runs in its own thread and reads from the queue its
+    predecessor writes to. The first failure, in the source or any task,
+    cancels the other stages and is raised to the consumer.
+
+    Example
+    -------
+    >>> pipe: StreamingPipeline[str] = StreamingPipeline()
+    >>> lengths = pipe.add_task(MapTask(len))
+    >>> lengths.run(["ab", "c"], sink=print)
+    2
+    1
+    2
+
+    Notes
+    -----
+    At most ``max_queue_size`` items wait between two stages, so a slow
+    consumer holds back the source instead of letting items pile up.
+    """
+
+    __slots__ = (
+        "__logger",
+        "__max_queue_size",
+        "__tasks",
+    )
+
+    def __init__(self, max_queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        if max_queue_size < 1:
+            raise ValueError(f"Queue size must be positive, got {max_queue_size}")
+        self.__max_queue_size = max_queue_size
+        self.__tasks: list[StreamTask[Any, Any]] = []
+        self.__logger = logging.getLogger(__name__)
+
+    def __str__(self) -> str:
+        return (
+            f"StreamingPipeline(tasks={len(self.__tasks)}, "
+            f"max_queue_size={self.__max_queue_size})"
+        )
+
+    def add_task(self, task: StreamTask[ValueT, OutT]) -> StreamingPipeline[OutT]:
+        """Append a task and refine the pipeline's item type.
+
+        Parameters
+        ----------
+        task : StreamTask[ValueT, OutT]
+            The task to append. Its input type must match the current item
+            type of the pipeline.
+
+        Returns
+        -------
+        StreamingPipeline[OutT]
+            The same pipeline instance with its item type refined to OutT.
+        """
+        self.__tasks.append(cast("StreamTask[Any, Any]", task))
+        return cast("StreamingPipeline[OutT]", self)
+
+    @property
+    def tasks(self) -> list[StreamTask[Any, Any]]:
+        """The tasks in order."""
+        return list(self.__tasks)
+
+    def stream(self, source: Iterable[Any]) -> Generator[ValueT]:
+        """Run the stages over a source and yield the final items.
+
+        Stages start when iteration starts. Closing the iterator early
+        cancels the stages and waits for their threads to finish.
+
+        Parameters
+        ----------
+        source : Iterable[Any]
+            Items for the first task; read lazily in a feeder thread.
+
+        Returns
+        -------
+        Generator[ValueT]
+            Output items of the last task, in order.
+
+        Raises
+        ------
+        Exception
+            The first failure of the source or of a task.
+        """
+        self.__logger.info(
+            "Streaming pipeline with %s tasks, queue size %s",
+            len(self.__tasks),
+            self.__max_queue_size,
+        )
+        stop = threading.Event()
+        errors: list[BaseException] = []
+        queues: list[queue.Queue[Any]] = [
+            queue.Queue(maxsize=self.__max_queue_size)
+            for _ in range(len(self.__tasks) + 1)
+        ]
+
+        def feed(items: Iterable[Any], target: queue.Queue[Any]) -> None:
+            try:
+                for item in items:
+                    _put(target, item, stop)
+                _put(target, _END, stop)
+            except _CancelledError:
+                pass
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+
+        threads = [
+            threading.Thread(
+                target=feed, args=(source, queues[0]), name="stream-source"
+            )
+        ]
+        for index, task in enumerate(self.__tasks):
+            items = task.stream(_drain(queues[index], stop))
+            threads.append(
+                threading.Thread(
+                    target=feed,
+                    args=(items, queues[index + 1]),
+                    name=f"stream-{task.__class__.__name__}",
+                )
+            )
+
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        try:
+            yield from _drain(queues[-1], stop)
+        except _CancelledError:
+            pass
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+        if errors:
+            self.__logger.error("Streaming pipeline failed: %s", errors[0])
+            raise errors[0]
+        self.__logger.info("Completed streaming pipeline")
+
+    def run(
+        self,
+        source: Iterable[Any],
+        sink: Callable[[ValueT], object] | None = None,
+    ) -> int:
+        """Run the stages to completion, handing each final item to a sink.
+
+        Parameters
+        ----------
+        source : Iterable[Any]
+            Items for the first task.
+        sink : Optional[Callable[[ValueT], object]]
+            Called with every output item; items are discarded without one.
+
+        Returns
+        -------
+        int
+            Number of items that reached the sink.
+        """
+        count = 0
+        for item in self.stream(source):
+            if sink is not None:
+                sink(item)
+            count += 1
+        return count
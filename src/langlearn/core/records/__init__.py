@@ -1,5 +1,13 @@
 """Core record infrastructure for language-agnostic data processing."""
 
-from .base_record import BaseRecord, RecordClassProtocol, RecordType
+from .base_record import BaseRecord, RecordClassProtocol, RecordType, RecordView
+from .columnar import ColumnarRecordStore, RecordRowView
 
-__all__ = ["BaseRecord", "RecordClassProtocol", "RecordType"]
+__all__ = [
+    "BaseRecord",
+    "ColumnarRecordStore",
+    "RecordClassProtocol",
+    "RecordRowView",
+    "RecordType",
+    "RecordView",
+]
@@ -5,8 +5,10 @@ eliminating metaclass conflicts while preserving the exact same interface.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, fields
 from enum import Enum
+from functools import cache
 from typing import Any, ClassVar, Protocol
 
 
@@ -47,7 +49,50 @@ class RecordClassProtocol(Protocol):
         ...
 
 
-@dataclass
+@cache
+def _record_field_names(record_class: type["BaseRecord"]) -> tuple[str, ...]:
+    """Return the dataclass field names of a record class, computed once."""
+    return tuple(f.name for f in fields(record_class))
+
+
+class RecordView(Mapping[str, Any]):
+    """Read-only mapping over a record's fields without copying them.
+
+    Lookups read the record's attributes directly, so the view always reflects
+    the current values (including media fields set during enrichment) and
+    costs a single small object instead of a fresh dictionary per call.
+    """
+
+    __slots__ = ("_keys", "_record")
+
+    def __init__(self, record: "BaseRecord") -> None:
+        """Create a view over the given record.
+
+        Args:
+            record: Record whose dataclass fields are exposed
+        """
+        self._record = record
+        self._keys = _record_field_names(type(record))
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self._record, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __repr__(self) -> str:
+        return f"RecordView({self._record!r})"
+
+
+@dataclass(slots=True)
 class BaseRecord(ABC):
     """Abstract base class for all record types.
 
@@ -56,6 +101,9 @@ class BaseRecord(ABC):
     - Abstract methods that subclasses must implement
     - Common field validation patterns
     - Strict field checking (no extra fields allowed by dataclasses)
+
+    Subclasses are declared with ``@dataclass(slots=True)`` so instances carry
+    no per-object ``__dict__``; large decks hold one record per CSV row.
     """
 
     # Class-level configuration
@@ -117,6 +165,17 @@ class BaseRecord(ABC):
             dict: Dictionary representation suitable for MediaEnricher
         """
 
+    def as_mapping(self) -> Mapping[str, Any]:
+        """Return a read-only, zero-copy mapping view of the record fields.
+
+        Prefer this over to_dict() for read-only access; to_dict() allocates a
+        new dictionary on every call.
+
+        Returns:
+            Mapping[str, Any]: Live view keyed by dataclass field name
+        """
+        return RecordView(self)
+
     @classmethod
     @abstractmethod
     def get_expected_field_count(cls) -> int:
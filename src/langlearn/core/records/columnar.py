@@ -0,0 +1,437 @@
+"""Column-oriented storage for large collections of records.
+
+Lists of record objects are convenient for card building but make filtering,
+grouping, de-duplication and validation of large decks a per-object Python
+loop. ``ColumnarRecordStore`` keeps the records of a single type as pandas
+columns instead: repeated strings (articles, tenses, classifications, ...) are
+dictionary-encoded as categoricals, and the bulk operations run as vectorized
+column operations. Row views expose individual rows through the read side of
+the ``BaseRecord`` API, and ``materialize()`` converts back to record objects
+when code needs real instances.
+"""
+
+import inspect
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import MISSING, fields
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .base_record import BaseRecord, _record_field_names
+
+
+def _encode_column(values: pd.Series) -> pd.Series:
+    """Dictionary-encode string columns; leave other columns untouched.
+
+    Args:
+        values: Column values
+
+    Returns:
+        pd.Series: Categorical series for all-string columns, otherwise the
+        input values with their inferred dtype
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values
+    if pd.api.types.infer_dtype(values, skipna=False) == "string":
+        return values.astype("category")
+    return values
+
+
+def _to_python(value: Any) -> Any:
+    """Convert NumPy scalars (e.g. ``numpy.bool_``) to native Python values."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class RecordRowView(Mapping[str, Any]):
+    """Row handle exposing one stored record through the BaseRecord read API.
+
+    Field values are read from the store's columns on access. Class-level
+    record methods (``get_record_type``, ``get_field_names``,
+    ``get_subdeck_name``, ...) are delegated to the record class. Instance
+    behaviour beyond field access (validation, media helpers) requires a real
+    record, available via ``materialize()``.
+    """
+
+    __slots__ = ("_index", "_store")
+
+    def __init__(self, store: "ColumnarRecordStore", index: int) -> None:
+        """Create a view over one row of a store.
+
+        Args:
+            store: Store holding the row
+            index: Row position within the store
+        """
+        self._store = store
+        self._index = index
+
+    @property
+    def index(self) -> int:
+        """Row position within the owning store."""
+        return self._index
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        store = self._store
+        if name in store.columns:
+            return store.value(self._index, name)
+        record_class = store.record_class
+        attribute = inspect.getattr_static(record_class, name, None)
+        if isinstance(attribute, classmethod | staticmethod):
+            return getattr(record_class, name)
+        raise AttributeError(
+            f"{type(self).__name__} for {record_class.__name__} has no "
+            f"attribute {name!r}; call materialize() for full record behaviour"
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._store.columns:
+            raise KeyError(key)
+        return self._store.value(self._index, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.columns)
+
+    def __len__(self) -> int:
+        return len(self._store.columns)
+
+    def __repr__(self) -> str:
+        return (
+            f"RecordRowView({self._store.record_class.__name__}, index={self._index})"
+        )
+
+    def as_mapping(self) -> Mapping[str, Any]:
+        """Return the row itself; it is already a read-only field mapping."""
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """Copy the row into a dictionary keyed by record field name.
+
+        Returns:
+            dict: Field values for this row
+        """
+        return dict(self)
+
+    def materialize(self) -> BaseRecord:
+        """Build a full record instance for this row.
+
+        Returns:
+            BaseRecord: Record constructed (and validated) from the row values
+        """
+        return self._store.record_class(**self.to_dict())
+
+
+class ColumnarRecordStore:
+    """Stores the records of one record type as dictionary-encoded columns.
+
+    Columns follow the record class's dataclass fields. All-string columns are
+    stored as pandas categoricals, so each distinct value is held once and
+    comparisons run over integer codes. Operations that select rows return a
+    new store and never modify the original.
+    """
+
+    __slots__ = ("_columns", "_frame", "_record_class")
+
+    def __init__(self, record_class: type[BaseRecord], frame: pd.DataFrame) -> None:
+        """Wrap a frame whose columns are named after the record fields.
+
+        Args:
+            record_class: Record class the rows belong to
+            frame: Frame with one column per dataclass field of record_class
+
+        Raises:
+            ValueError: If the frame lacks any of the record's fields
+        """
+        columns = _record_field_names(record_class)
+        missing = [name for name in columns if name not in frame.columns]
+        if missing:
+            raise ValueError(
+                f"{record_class.__name__} store is missing columns: {missing}"
+            )
+        self._record_class = record_class
+        self._columns = columns
+        self._frame = frame.loc[:, list(columns)].reset_index(drop=True)
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Sequence[BaseRecord],
+        record_class: type[BaseRecord] | None = None,
+    ) -> "ColumnarRecordStore":
+        """Build a store from record instances of a single type.
+
+        Args:
+            records: Records to store
+            record_class: Record class; inferred from the first record if omitted
+
+        Returns:
+            ColumnarRecordStore: Store holding the records' field values
+
+        Raises:
+            ValueError: If the class cannot be inferred or records are mixed
+        """
+        if record_class is None:
+            if not records:
+                raise ValueError("record_class is required for an empty store")
+            record_class = type(records[0])
+
+        mixed = {type(r).__name__ for r in records if type(r) is not record_class}
+        if mixed:
+            raise ValueError(
+                f"Cannot store {sorted(mixed)} records in a "
+                f"{record_class.__name__} store"
+            )
+
+        columns = _record_field_names(record_class)
+        frame = pd.DataFrame(
+            {
+                name: _encode_column(
+                    pd.Series([getattr(r, name) for r in records], dtype=object)
+                )
+                for name in columns
+            },
+            index=pd.RangeIndex(len(records)),
+        )
+        return cls(record_class, frame)
+
+    @classmethod
+    def from_frame(
+        cls, record_class: type[BaseRecord], frame: pd.DataFrame
+    ) -> "ColumnarRecordStore":
+        """Build a store from a frame, e.g. one read straight from a CSV file.
+
+        Columns for fields with defaults (such as media fields) may be absent
+        and are filled with the field default. No per-row validation runs;
+        use ``find_empty()`` for vectorized checks and ``materialize()`` for
+        full record validation.
+
+        Args:
+            record_class: Record class the rows belong to
+            frame: Frame with columns named after the record fields
+
+        Returns:
+            ColumnarRecordStore: Store over the encoded columns
+
+        Raises:
+            ValueError: If a required field has no column
+        """
+        data: dict[str, pd.Series] = {}
+        for field in fields(record_class):
+            if field.name in frame.columns:
+                data[field.name] = _encode_column(frame[field.name])
+            elif field.default is not MISSING:
+                data[field.name] = _encode_column(
+                    pd.Series([field.default] * len(frame), dtype=object)
+                )
+            else:
+                raise ValueError(
+                    f"{record_class.__name__} requires column '{field.name}'"
+                )
+        return cls(record_class, pd.DataFrame(data, index=frame.index))
+
+    # --- Introspection ---
+
+    @property
+    def record_class(self) -> type[BaseRecord]:
+        """Record class of the stored rows."""
+        return self._record_class
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """Column names, in dataclass field order."""
+        return self._columns
+
+    def __len__(self) -> int:
+        return len(self._frame)
+
+    def __iter__(self) -> Iterator[RecordRowView]:
+        return (RecordRowView(self, i) for i in range(len(self._frame)))
+
+    def __getitem__(self, index: int) -> RecordRowView:
+        if not -len(self._frame) <= index < len(self._frame):
+            raise IndexError(f"Row {index} out of range for {len(self)} rows")
+        return RecordRowView(self, index % len(self._frame))
+
+    def column(self, name: str) -> pd.Series:
+        """Return a column for vectorized inspection.
+
+        Args:
+            name: Field name
+
+        Returns:
+            pd.Series: Column values (categorical for string fields)
+        """
+        return self._frame[name]
+
+    def value(self, index: int, name: str) -> Any:
+        """Return a single field value as a native Python object.
+
+        Args:
+            index: Row position
+            name: Field name
+
+        Returns:
+            The stored value
+        """
+        return _to_python(self._frame[name].iat[index])
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return a copy of the underlying frame."""
+        return self._frame.copy()
+
+    def materialize(self) -> list[BaseRecord]:
+        """Convert every row back into a record instance.
+
+        Records are constructed through the record class, so the usual
+        ``validate()`` checks run for each row.
+
+        Returns:
+            list[BaseRecord]: One record per row, in store order
+        """
+        names = self._columns
+        columns = [self._frame[name].tolist() for name in names]
+        return [
+            self._record_class(**dict(zip(names, values, strict=True)))
+            for values in zip(*columns, strict=True)
+        ]
+
+    # --- Vectorized operations ---
+
+    def take(self, indices: Iterable[int] | np.ndarray) -> "ColumnarRecordStore":
+        """Return a store with the given rows, in the given order.
+
+        Args:
+            indices: Row positions to keep
+
+        Returns:
+            ColumnarRecordStore: New store with the selected rows
+        """
+        if not isinstance(indices, np.ndarray):
+            indices = list(indices)
+        positions = np.asarray(indices, dtype=np.intp)
+        return ColumnarRecordStore(self._record_class, self._frame.iloc[positions])
+
+    def where(self, mask: np.ndarray | pd.Series) -> "ColumnarRecordStore":
+        """Return a store with the rows where a boolean mask is true.
+
+        Args:
+            mask: Boolean array with one entry per row
+
+        Returns:
+            ColumnarRecordStore: New store with the selected rows
+        """
+        return self.take(np.flatnonzero(np.asarray(mask, dtype=bool)))
+
+    def filter(self, **criteria: Any) -> "ColumnarRecordStore":
+        """Return rows whose fields equal all given values.
+
+        Example:
+            ``store.filter(tense="present", auxiliary="sein")``
+
+        Args:
+            **criteria: Field name to required value
+
+        Returns:
+            ColumnarRecordStore: New store with the matching rows
+
+        Raises:
+            KeyError: If a criterion names an unknown field
+        """
+        mask = np.ones(len(self._frame), dtype=bool)
+        for name, expected in criteria.items():
+            if name not in self._columns:
+                raise KeyError(name)
+            mask &= (self._frame[name] == expected).to_numpy(dtype=bool)
+        return self.where(mask)
+
+    def dedupe(self, subset: Sequence[str] | None = None) -> "ColumnarRecordStore":
+        """Drop duplicate rows, keeping the first occurrence.
+
+        Args:
+            subset: Fields that identify a duplicate; all fields if omitted
+
+        Returns:
+            ColumnarRecordStore: New store without duplicates
+        """
+        keys = list(subset) if subset is not None else None
+        duplicated = self._frame.duplicated(subset=keys, keep="first")
+        return self.where(~duplicated.to_numpy(dtype=bool))
+
+    def group_indices(self, name: str) -> dict[Any, np.ndarray]:
+        """Group row positions by the value of one field.
+
+        Groups appear in first-occurrence order, e.g. verb conjugation rows
+        grouped by infinitive.
+
+        Args:
+            name: Field to group by
+
+        Returns:
+            dict: Field value to array of row positions; rows where the field
+            is None belong to no group
+        """
+        codes, uniques = pd.factorize(self._frame[name], sort=False)
+        if len(uniques) == 0:
+            # Empty store, or every value missing
+            return {}
+        present = np.flatnonzero(codes >= 0)
+        present_codes = codes[present]
+        # A stable sort by code keeps rows of each group in store order
+        ordered = present[np.argsort(present_codes, kind="stable")]
+        bounds = np.cumsum(np.bincount(present_codes, minlength=len(uniques)))[:-1]
+        return {
+            _to_python(key): positions
+            for key, positions in zip(uniques, np.split(ordered, bounds), strict=True)
+        }
+
+    def group_by(self, name: str) -> dict[Any, "ColumnarRecordStore"]:
+        """Split the store into one store per distinct value of a field.
+
+        Args:
+            name: Field to group by
+
+        Returns:
+            dict: Field value to store holding that group's rows
+        """
+        return {
+            key: self.take(positions)
+            for key, positions in self.group_indices(name).items()
+        }
+
+    def find_empty(self, names: Sequence[str] | None = None) -> np.ndarray:
+        """Find rows where any of the given fields is missing or blank.
+
+        Args:
+            names: Fields to check; defaults to the record's required fields
+                (dataclass fields without a default)
+
+        Returns:
+            np.ndarray: Sorted row positions failing the check
+        """
+        if names is None:
+            names = [
+                field.name
+                for field in fields(self._record_class)
+                if field.default is MISSING and field.default_factory is MISSING
+            ]
+
+        empty = np.zeros(len(self._frame), dtype=bool)
+        for name in names:
+            column = self._frame[name]
+            missing = column.isna().to_numpy(dtype=bool, copy=True)
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                # Evaluate once per distinct value, then broadcast via the codes
+                blank_categories = np.asarray(
+                    [str(value).strip() == "" for value in column.cat.categories],
+                    dtype=bool,
+                )
+                codes = column.cat.codes.to_numpy()
+                if len(blank_categories):
+                    missing |= blank_categories[np.where(codes >= 0, codes, 0)] & (
+                        codes >= 0
+                    )
+            empty |= missing
+        return np.flatnonzero(empty)
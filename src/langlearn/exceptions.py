@@ -72,6 +72,28 @@ class ServiceUnavailableError(ServiceError):
     pass
 
 
+class CircuitOpenError(ServiceUnavailableError):
+    """Call rejected because the provider's circuit breaker is open.
+
+    Raised when:
+        - A provider failed repeatedly and calls are failing fast
+        - A half-open circuit already has a probe call in flight
+    """
+
+    pass
+
+
+class DeadlineExceededError(ServiceUnavailableError):
+    """Provider call did not finish within its deadline.
+
+    Raised when:
+        - No attempt of a call answered before the deadline
+        - The remaining budget cannot cover the next retry backoff
+    """
+
+    pass
+
+
 class RateLimitError(ServiceError):
     """API rate limit exceeded.
 
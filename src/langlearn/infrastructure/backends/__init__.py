@@ -2,11 +2,17 @@
 
 from .anki_backend import AnkiBackend
 from .base import CardTemplate, DeckBackend, MediaFile, NoteType
+from .memory_backend import InMemoryBackend, NullBackend, RecordedNote
+from .text_backend import TextExportBackend
 
 __all__ = [
     "AnkiBackend",
     "CardTemplate",
     "DeckBackend",
+    "InMemoryBackend",
     "MediaFile",
     "NoteType",
+    "NullBackend",
+    "RecordedNote",
+    "TextExportBackend",
 ]
@@ -1,5 +1,6 @@
 """Official Anki library backend implementation for deck generation."""
 
+import copy
 import hashlib
 import logging
 import os
@@ -13,10 +14,12 @@ from typing import Any
 from anki.collection import Collection
 from anki.decks import DeckId
 from anki.models import NotetypeId
+from anki.utils import base91
 
 from langlearn.core.protocols.language_protocol import Language
 from langlearn.exceptions import (
     CardGenerationError,
+    ConfigurationError,
     DataProcessingError,
     MediaGenerationError,
 )
@@ -31,6 +34,91 @@ from .base import DeckBackend, MediaFile, NoteType
 
 logger = logging.getLogger(__name__)
 
+# Fast scratch collections live here when the system has this RAM-backed
+# tmpfs (Linux); elsewhere they fall back to the default temp directory
+RAM_SCRATCH_DIR = Path("/dev/shm")
+
+# SQLite settings for a collection that is thrown away after export: no
+# fsync and an in-memory rollback journal. A crash can corrupt the file,
+# which a scratch build never reopens.
+FAST_SCRATCH_PRAGMAS = (
+    "pragma synchronous = off",
+    "pragma journal_mode = memory",
+    "pragma temp_store = memory",
+)
+
+
+def ram_scratch_dir() -> str | None:
+    """Return a writable RAM-backed directory for scratch collections.
+
+    Returns:
+        The directory, or None if the system has none
+    """
+    if RAM_SCRATCH_DIR.is_dir() and os.access(RAM_SCRATCH_DIR, os.W_OK | os.X_OK):
+        return str(RAM_SCRATCH_DIR)
+    return None
+
+
+def stable_guid(*parts: str) -> str:
+    """Return a base91 note GUID derived from identifying strings.
+
+    The same parts give the same GUID in every build, so notes keep their
+    identity across rebuilds and across shards of one build.
+
+    Args:
+        *parts: Strings identifying the note
+
+    Returns:
+        GUID in Anki's base91 format
+    """
+    digest = hashlib.sha256("\x1f".join(parts).encode("utf-8")).digest()
+    return base91(int.from_bytes(digest[:8], "big"))
+
+
+class NoteGuids:
+    """Stable GUIDs for the notes of one build.
+
+    A note is keyed by its deck, note type and identity values. Notes
+    repeating an identity, such as two rows for the same word and meaning,
+    are numbered within that identity, so reordering other rows never moves
+    their GUIDs.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no GUIDs issued."""
+        self._occurrences: dict[tuple[str, ...], int] = {}
+        self._issued: set[str] = set()
+
+    def next(self, deck: str, note_type_name: str, identity: list[str]) -> str:
+        """Return the GUID of the next note with this identity.
+
+        Args:
+            deck: Full name of the note's deck
+            note_type_name: Name of the note's note type
+            identity: Values of the note type's identity fields
+
+        Returns:
+            GUID in Anki's base91 format
+
+        Raises:
+            ValueError: If the GUID was already issued in this build
+        """
+        key = (deck, note_type_name, *identity)
+        occurrence = self._occurrences.get(key, 0)
+        self._occurrences[key] = occurrence + 1
+        if occurrence:
+            logger.warning(
+                f"Duplicate note identity {identity} in {note_type_name}; "
+                f"numbering it {occurrence}"
+            )
+            guid = stable_guid(*key, str(occurrence))
+        else:
+            guid = stable_guid(*key)
+        if guid in self._issued:
+            raise ValueError(f"GUID {guid} issued twice, for {key}")
+        self._issued.add(guid)
+        return guid
+
 
 class AnkiBackend(DeckBackend):
     """Deck backend using the official Anki library.
@@ -45,6 +133,8 @@ class AnkiBackend(DeckBackend):
         media_service: MediaService,
         language: Language,
         description: str = "",
+        collection_path: str | Path | None = None,
+        fast_scratch: bool = False,
     ) -> None:
         """Initialize the official Anki backend.
 
@@ -53,20 +143,50 @@ class AnkiBackend(DeckBackend):
             media_service: Required MediaService for media generation
             language: Language implementation for domain model creation
             description: Optional description for the deck
+            collection_path: Optional persistent working collection. When
+                given, the collection is kept between builds and notes are
+                upserted by GUID instead of always added; see remove_stale_notes().
+                By default a throwaway collection is created in a temp directory.
+            fast_scratch: Put the throwaway collection and its media folder
+                on a RAM-backed filesystem where available and turn off
+                SQLite durability for it. Only for collections discarded
+                after export.
+
+        Raises:
+            ConfigurationError: If fast_scratch is combined with collection_path
         """
         super().__init__(deck_name, description)
         self._language = language
+        self._persistent = collection_path is not None
+        self._fast_scratch = fast_scratch
 
-        # Create temporary collection file
-        self._temp_dir = tempfile.mkdtemp()
-        self._collection_path = os.path.join(self._temp_dir, "collection.anki2")
+        if collection_path is not None:
+            if fast_scratch:
+                raise ConfigurationError(
+                    "fast_scratch cannot be used with a persistent collection"
+                )
+            Path(collection_path).parent.mkdir(parents=True, exist_ok=True)
+            self._temp_dir: str | None = None
+            self._collection_path = str(collection_path)
+        else:
+            # Create temporary collection file
+            self._temp_dir = tempfile.mkdtemp(
+                dir=ram_scratch_dir() if fast_scratch else None
+            )
+            self._collection_path = os.path.join(self._temp_dir, "collection.anki2")
 
         # Initialize Anki collection
-        self._collection = Collection(self._collection_path)
+        self._collection = self._open_collection()
 
-        # Create the main deck
-        main_deck_id = self._collection.decks.add_normal_deck_with_name(deck_name).id
-        self._main_deck_id: DeckId = DeckId(main_deck_id)
+        # Create the main deck, or reuse it in a persistent collection
+        existing_deck_id = (
+            self._collection.decks.id_for_name(deck_name) if self._persistent else None
+        )
+        if existing_deck_id is None:
+            existing_deck_id = DeckId(
+                self._collection.decks.add_normal_deck_with_name(deck_name).id
+            )
+        self._main_deck_id: DeckId = existing_deck_id
         self._deck_id: DeckId = self._main_deck_id
 
         # Track subdecks and current deck
@@ -76,6 +196,18 @@ class AnkiBackend(DeckBackend):
         # Track note types
         self._note_type_map: dict[str, NotetypeId] = {}
         self._next_note_type_id = 1
+        self._note_types: dict[str, NoteType] = {}
+
+        self._guids = NoteGuids()
+
+        # Notes already in a persistent collection, by GUID, and the notes
+        # added or updated by this build
+        self._existing_notes: dict[str, int] = {}
+        if self._persistent and self._collection.db is not None:
+            for guid, note_id in self._collection.db.all("SELECT guid, id FROM notes"):
+                self._existing_notes[guid] = note_id
+        self._touched_notes: set[int] = set()
+        self._upsert_stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
 
         # Project root and media directories
         self._project_root = Path(
@@ -124,10 +256,34 @@ class AnkiBackend(DeckBackend):
         """Backward compatibility property for tests."""
         return self._media_service._pexels_service
 
+    @property
+    def is_persistent(self) -> bool:
+        """Return True if the collection is kept between builds."""
+        return self._persistent
+
+    @property
+    def is_fast_scratch(self) -> bool:
+        """Return True if the collection is a non-durable scratch collection."""
+        return self._fast_scratch
+
+    def _open_collection(self) -> Collection:
+        """Open the working collection, relaxing durability in fast mode."""
+        collection = Collection(self._collection_path)
+        if self._fast_scratch and collection.db is not None:
+            for pragma in FAST_SCRATCH_PRAGMAS:
+                collection.db.execute(pragma)
+        return collection
+
+    def close(self) -> None:
+        """Close the collection, saving a persistent one to disk."""
+        if self._collection.db is not None:
+            self._collection.close()
+
     def __del__(self) -> None:
         """Clean up temporary files."""
-        if hasattr(self, "_temp_dir") and os.path.exists(self._temp_dir):
-            shutil.rmtree(self._temp_dir, ignore_errors=True)
+        temp_dir = getattr(self, "_temp_dir", None)
+        if temp_dir and os.path.exists(temp_dir):
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
     def create_note_type(self, note_type: NoteType) -> str:
         """Create a note type and return its ID.
@@ -138,6 +294,15 @@ class AnkiBackend(DeckBackend):
         Returns:
             Unique identifier for the created note type
         """
+        if self._persistent:
+            existing_id = self._reuse_note_type(note_type)
+            if existing_id is not None:
+                our_id = str(self._next_note_type_id)
+                self._note_type_map[our_id] = existing_id
+                self._note_types[our_id] = note_type
+                self._next_note_type_id += 1
+                return our_id
+
         # Create Anki note type
         notetype = self._collection.models.new(note_type.name)
 
@@ -164,10 +329,61 @@ class AnkiBackend(DeckBackend):
         # Map our ID to Anki's ID
         our_id = str(self._next_note_type_id)
         self._note_type_map[our_id] = NotetypeId(actual_notetype_id)
+        self._note_types[our_id] = note_type
         self._next_note_type_id += 1
 
         return our_id
 
+    def _reuse_note_type(self, note_type: NoteType) -> NotetypeId | None:
+        """Return a persistent collection's note type with the same name.
+
+        Templates and CSS are updated in place, so existing notes and their
+        review history are kept. A note type whose fields or template names
+        changed is removed with its notes; the notes are re-added under the
+        new note type with the same GUIDs.
+        """
+        existing_id = self._collection.models.id_for_name(note_type.name)
+        if existing_id is None:
+            return None
+        existing = self._collection.models.get(NotetypeId(existing_id))
+        if existing is None:
+            return None
+
+        field_names = [field["name"] for field in existing["flds"]]
+        template_names = [template["name"] for template in existing["tmpls"]]
+        if field_names != list(note_type.fields) or template_names != [
+            template.name for template in note_type.templates
+        ]:
+            logger.warning(
+                f"Note type {note_type.name} changed structure; recreating it"
+            )
+            note_ids = self._collection.models.nids(NotetypeId(existing_id))
+            self._collection.models.remove(NotetypeId(existing_id))
+            self._existing_notes = {
+                guid: note_id
+                for guid, note_id in self._existing_notes.items()
+                if note_id not in note_ids
+            }
+            return None
+
+        changed = False
+        for card_template, template in zip(
+            existing["tmpls"], note_type.templates, strict=True
+        ):
+            if (card_template["qfmt"], card_template["afmt"]) != (
+                template.front_html,
+                template.back_html,
+            ):
+                card_template["qfmt"] = template.front_html
+                card_template["afmt"] = template.back_html
+                changed = True
+        if note_type.templates and existing["css"] != note_type.templates[0].css:
+            existing["css"] = note_type.templates[0].css
+            changed = True
+        if changed:
+            self._collection.models.update_dict(existing)
+        return NotetypeId(existing_id)
+
     def create_subdeck(self, full_deck_name: str) -> DeckId:
         """Create a subdeck and return its ID.
 
@@ -178,6 +394,14 @@ class AnkiBackend(DeckBackend):
             DeckId of the created subdeck
         """
         if full_deck_name not in self._subdeck_map:
+            existing_id = (
+                self._collection.decks.id_for_name(full_deck_name)
+                if self._persistent
+                else None
+            )
+            if existing_id is not None:
+                self._subdeck_map[full_deck_name] = DeckId(existing_id)
+                return self._subdeck_map[full_deck_name]
             subdeck_id = self._collection.decks.add_normal_deck_with_name(
                 full_deck_name
             ).id
@@ -269,10 +493,170 @@ class AnkiBackend(DeckBackend):
         if tags:
             note.tags = tags
 
+        # Note types merged from shards use their first field as identity
+        note_type = self._note_types.get(note_type_id)
+        identity = note_type.identity(fields) if note_type else fields[:1]
+        note.guid = self._guids.next(
+            self._current_subdeck_name or self.deck_name,
+            str(notetype["name"]),
+            identity,
+        )
+        if note.guid in self._existing_notes:
+            return self._update_note(self._existing_notes[note.guid], note)
+
         self._collection.add_note(note, self._deck_id)
+        self._touched_notes.add(int(note.id))
+        self._upsert_stats["added"] += 1
 
         return int(note.id)
 
+    def _update_note(self, note_id: int, built: Any) -> int:
+        """Bring a persistent collection's note in line with a rebuilt one.
+
+        Only notes whose note type, fields, tags or deck changed are written;
+        unchanged notes are left alone, so their modification time and
+        review history are untouched.
+        """
+        existing = self._collection.get_note(note_id)  # type: ignore[arg-type]
+        self._touched_notes.add(note_id)
+        if existing.mid != built.mid:
+            # Note type recreated under a new id: replace the note
+            self._collection.remove_notes([existing.id])
+            self._collection.add_note(built, self._deck_id)
+            self._touched_notes.add(int(built.id))
+            self._upsert_stats["updated"] += 1
+            return int(built.id)
+
+        changed = False
+        if list(existing.fields) != list(built.fields) or list(existing.tags) != list(
+            built.tags
+        ):
+            existing.fields = list(built.fields)
+            existing.tags = list(built.tags)
+            self._collection.update_note(existing)
+            changed = True
+        card_ids = [card.id for card in existing.cards() if card.did != self._deck_id]
+        if card_ids:
+            self._collection.set_deck(card_ids, self._deck_id)
+            changed = True
+
+        self._upsert_stats["updated" if changed else "unchanged"] += 1
+        return note_id
+
+    def remove_stale_notes(self) -> int:
+        """Remove notes of a persistent collection not rebuilt this time.
+
+        Call after a full build so notes of deleted records disappear from
+        the next export.
+
+        Returns:
+            Number of notes removed
+        """
+        stale = [
+            note_id
+            for note_id in self._existing_notes.values()
+            if note_id not in self._touched_notes
+        ]
+        if stale:
+            self._collection.remove_notes(stale)  # type: ignore[arg-type]
+        self._upsert_stats["removed"] += len(stale)
+        logger.info(f"Upsert: {self._upsert_stats}")
+        return len(stale)
+
+    def save_collection(self, target_path: str) -> None:
+        """Copy the collection file and its media folder to target_path.
+
+        The copy holds the notes, note types, subdecks and media built so far
+        and can be combined with others through merge_collection().
+
+        Args:
+            target_path: Destination .anki2 file; media goes to the sibling
+                ``.media`` folder as Anki expects
+        """
+        media_dir = Path(self._collection.media.dir())
+        self._collection.close()
+        try:
+            shutil.copy2(self._collection_path, target_path)
+            if media_dir.is_dir():
+                shutil.copytree(
+                    media_dir,
+                    Path(target_path).with_suffix(".media"),
+                    dirs_exist_ok=True,
+                )
+        finally:
+            self._collection = self._open_collection()
+
+    def merge_collection(self, source_path: str) -> int:
+        """Copy notes, note types, subdecks and media from another collection.
+
+        Note types and subdecks are matched by name, so partial collections
+        built from the same templates share them. Notes keep their GUIDs and
+        are added in their order within the source.
+
+        Args:
+            source_path: .anki2 file written by save_collection()
+
+        Returns:
+            Number of notes merged
+        """
+        source = Collection(source_path)
+        try:
+            merged = 0
+            for source_note_id in sorted(source.find_notes("")):
+                source_note = source.get_note(source_note_id)
+                source_notetype = source.models.get(source_note.mid)
+                if source_notetype is None:
+                    raise CardGenerationError(
+                        f"Note type {source_note.mid} missing in {source_path}"
+                    )
+                notetype = self._collection.models.get(
+                    self._merged_note_type_id(source_notetype)
+                )
+                if notetype is None:
+                    raise CardGenerationError(
+                        f"Note type {source_notetype['name']} was not merged"
+                    )
+
+                deck_name = source.decks.name(source_note.cards()[0].did)
+                if deck_name == self.deck_name:
+                    deck_id = self._main_deck_id
+                else:
+                    deck_id = self.create_subdeck(deck_name)
+
+                note = self._collection.new_note(notetype)
+                note.fields = list(source_note.fields)
+                note.tags = list(source_note.tags)
+                note.guid = source_note.guid
+                self._collection.add_note(note, deck_id)
+                merged += 1
+
+            media_dir = Path(source.media.dir())
+            media_paths = sorted(media_dir.iterdir()) if media_dir.is_dir() else []
+        finally:
+            source.close()
+
+        for media_path in media_paths:
+            if media_path.is_file():
+                self.add_media_file(str(media_path))
+        logger.info(f"Merged {merged} notes from {source_path}")
+        return merged
+
+    def _merged_note_type_id(self, source_notetype: dict[str, Any]) -> NotetypeId:
+        """Return this collection's note type matching a source one by name."""
+        name = source_notetype["name"]
+        existing = self._collection.models.id_for_name(name)
+        if existing is not None:
+            return NotetypeId(existing)
+
+        notetype = copy.deepcopy(source_notetype)
+        notetype["id"] = 0
+        actual_notetype_id = self._collection.models.add_dict(notetype).id
+        self._note_type_map[str(self._next_note_type_id)] = NotetypeId(
+            actual_notetype_id
+        )
+        self._next_note_type_id += 1
+        return NotetypeId(actual_notetype_id)
+
     def _process_fields_with_media(
         self, note_type_input: str, fields: list[str]
     ) -> list[str]:
@@ -512,6 +896,9 @@ class AnkiBackend(DeckBackend):
             "media_files_count": len(self._media_files),
         }
 
+        if self._persistent:
+            stats["upsert_stats"] = self._upsert_stats.copy()
+
         # Add media generation statistics
         stats["media_generation_stats"] = self._media_generation_stats.copy()
         stats["media_generation_stats"]["total_media_generated"] = (
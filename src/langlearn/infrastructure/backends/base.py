@@ -16,7 +16,7 @@ deck backends rather than extending them.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, TypeVar
 
 T = TypeVar("T")
@@ -66,6 +66,26 @@ class NoteType:
     templates: list[CardTemplate]
     """List of card templates for this note type."""
 
+    identity_fields: list[str] = field(default_factory=list)
+    """Fields whose values identify a note; empty means the first field."""
+
+    def identity(self, values: list[str]) -> list[str]:
+        """Return the values identifying a note of this type.
+
+        Args:
+            values: The note's field values, in field order
+
+        Returns:
+            Values of the identity fields, or the first value if none are set
+        """
+        if not self.identity_fields:
+            return values[:1]
+        positions = {name: index for index, name in enumerate(self.fields)}
+        return [
+            values[positions[name]] if positions[name] < len(values) else ""
+            for name in self.identity_fields
+        ]
+
 
 class DeckBackend(ABC):
     """Abstract base class for deck generation backends."""
@@ -0,0 +1,233 @@
+"""In-memory and null deck backends for profiling and dry runs.
+
+Building with ``AnkiBackend`` always pays for the Anki collection: SQLite
+writes for every note and a copy of every media file into the collection's
+media folder. These backends keep the same ``DeckBackend`` interface without
+that work, so card assembly can be measured on its own and very large dry
+runs stay cheap:
+
+- ``InMemoryBackend`` records note types, notes and media references in
+  compact structures that tests and profiling scripts can inspect
+- ``NullBackend`` only counts what it is given
+
+Neither writes a package; ``export_deck`` only logs.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .base import DeckBackend, MediaFile, NoteType
+
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSIONS = frozenset({".mp3"})
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png"})
+
+
+def media_reference(file_path: str, media_type: str = "") -> str:
+    """Return the card field reference of a media file.
+
+    Uses the same rules as ``AnkiBackend.add_media_file``: audio is wrapped
+    in ``[sound:]``, images are referenced by filename.
+
+    Args:
+        file_path: Path to the media file
+        media_type: 'audio', 'image', or '' to infer from the extension
+
+    Returns:
+        Reference string for card content
+
+    Raises:
+        ValueError: If the media type is unknown or cannot be inferred
+    """
+    path = Path(file_path)
+    if media_type == "":
+        suffix = path.suffix.lower()
+        if suffix in AUDIO_EXTENSIONS:
+            media_type = "audio"
+        elif suffix in IMAGE_EXTENSIONS:
+            media_type = "image"
+        else:
+            raise ValueError(
+                f"Cannot infer media type from extension: {suffix} "
+                f"for file: {file_path}"
+            )
+    if media_type == "audio":
+        return f"[sound:{path.name}]"
+    if media_type == "image":
+        return path.name
+    raise ValueError(f"Unknown media type: '{media_type}' for file: {file_path}")
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedNote:
+    """A note kept by InMemoryBackend."""
+
+    note_type_id: str
+    fields: tuple[str, ...]
+    tags: tuple[str, ...]
+    deck: str
+
+
+class InMemoryBackend(DeckBackend):
+    """Deck backend that keeps notes and media references in memory.
+
+    Note types are deduplicated by name, notes are stored as tuples and
+    media files are recorded once per path without being copied.
+
+    Example:
+        ```python
+        backend = InMemoryBackend("German A1")
+        note_type_id = backend.create_note_type(note_type)
+        backend.add_note(note_type_id, ["Haus", "house"])
+        assert backend.notes[0].fields == ("Haus", "house")
+        ```
+    """
+
+    def __init__(self, deck_name: str, description: str = "") -> None:
+        """Initialize an empty in-memory deck.
+
+        Args:
+            deck_name: Name of the deck to create
+            description: Optional description for the deck
+        """
+        super().__init__(deck_name, description)
+        self._note_types: dict[str, NoteType] = {}
+        self._note_type_ids: dict[str, str] = {}
+        self._notes: list[RecordedNote] = []
+        self._media_by_path: dict[str, MediaFile] = {}
+        self._current_deck = deck_name
+
+    @property
+    def note_types(self) -> dict[str, NoteType]:
+        """Return the note types by ID."""
+        return dict(self._note_types)
+
+    @property
+    def notes(self) -> list[RecordedNote]:
+        """Return the notes in insertion order."""
+        return list(self._notes)
+
+    def create_note_type(self, note_type: NoteType) -> str:
+        """Record a note type; a name seen before returns its existing ID."""
+        note_type_id = self._note_type_ids.get(note_type.name)
+        if note_type_id is None:
+            note_type_id = str(len(self._note_types) + 1)
+            self._note_type_ids[note_type.name] = note_type_id
+            self._note_types[note_type_id] = note_type
+        return note_type_id
+
+    def set_current_subdeck(self, full_deck_name: str | None) -> None:
+        """Record following notes under a subdeck, or the main deck if None."""
+        self._current_deck = full_deck_name or self.deck_name
+
+    def add_note(
+        self,
+        note_type_id: str,
+        fields: list[str],
+        tags: list[str] | None = None,
+        skip_media_processing: bool = False,
+    ) -> int:
+        """Record a note; fields are stored as given, without media processing.
+
+        Raises:
+            ValueError: If the note type was not created on this backend
+        """
+        if note_type_id not in self._note_types:
+            raise ValueError(f"Note type ID {note_type_id} not found")
+        self._notes.append(
+            RecordedNote(
+                note_type_id, tuple(fields), tuple(tags or ()), self._current_deck
+            )
+        )
+        return len(self._notes)
+
+    def add_media_file(self, file_path: str, media_type: str = "") -> MediaFile:
+        """Record a media file by reference; the file is not read or copied."""
+        media_file = self._media_by_path.get(file_path)
+        if media_file is None:
+            media_file = MediaFile(
+                path=file_path,
+                reference=media_reference(file_path, media_type),
+                media_type=media_type,
+            )
+            self._media_by_path[file_path] = media_file
+            self._media_files.append(media_file)
+        return media_file
+
+    def export_deck(self, output_path: str) -> None:
+        """Log the deck's size; nothing is written."""
+        logger.info(
+            f"In-memory deck {self.deck_name}: {len(self._notes)} notes and "
+            f"{len(self._media_files)} media files not exported to {output_path}"
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get deck statistics."""
+        return {
+            "deck_name": self.deck_name,
+            "note_types_count": len(self._note_types),
+            "notes_count": len(self._notes),
+            "media_files_count": len(self._media_files),
+        }
+
+
+class NullBackend(DeckBackend):
+    """Deck backend that discards everything and only counts calls.
+
+    Useful to measure card assembly alone: adding a note costs a counter
+    increment.
+    """
+
+    def __init__(self, deck_name: str, description: str = "") -> None:
+        """Initialize the backend.
+
+        Args:
+            deck_name: Name of the deck to create
+            description: Optional description for the deck
+        """
+        super().__init__(deck_name, description)
+        self._note_type_ids: dict[str, str] = {}
+        self._notes_count = 0
+        self._media_files_count = 0
+
+    def create_note_type(self, note_type: NoteType) -> str:
+        """Return an ID for the note type's name."""
+        return self._note_type_ids.setdefault(
+            note_type.name, str(len(self._note_type_ids) + 1)
+        )
+
+    def add_note(
+        self,
+        note_type_id: str,
+        fields: list[str],
+        tags: list[str] | None = None,
+        skip_media_processing: bool = False,
+    ) -> int:
+        """Count a note and discard it."""
+        self._notes_count += 1
+        return self._notes_count
+
+    def add_media_file(self, file_path: str, media_type: str = "") -> MediaFile:
+        """Count a media file and return its reference without keeping it."""
+        self._media_files_count += 1
+        return MediaFile(
+            path=file_path,
+            reference=media_reference(file_path, media_type),
+            media_type=media_type,
+        )
+
+    def export_deck(self, output_path: str) -> None:
+        """Do nothing; the null backend has no deck to write."""
+        logger.info(f"Null backend: {output_path} not written")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get deck statistics."""
+        return {
+            "deck_name": self.deck_name,
+            "note_types_count": len(self._note_type_ids),
+            "notes_count": self._notes_count,
+            "media_files_count": self._media_files_count,
+        }
@@ -0,0 +1,206 @@
+"""Deck backend streaming notes as TSV or JSON Lines instead of an .apkg.
+
+Building an Anki collection and running the package exporter dominates
+small builds, and CI validation or other tools only need the notes. This
+backend appends every note to a staging file as it is added, so memory stays
+flat however large the deck, and ``export_deck`` moves the file into place
+and hard-links the referenced media into the sibling ``.media`` folder
+(copying where a link is not possible).
+
+TSV output follows Anki's text import format: header lines declare the
+separator, HTML fields and the GUID, note type, deck and tags columns, and
+the note's fields follow in order. GUIDs are derived like the Anki backend's,
+so importing the TSV updates notes imported from an earlier .apkg of the
+same deck. JSON Lines output holds one object per note with its fields by
+name.
+"""
+
+import csv
+import json
+import logging
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, TextIO
+
+from langlearn.infrastructure.services.media_processing import link_or_copy
+
+from .anki_backend import NoteGuids
+from .base import DeckBackend, MediaFile, NoteType
+from .memory_backend import media_reference
+
+logger = logging.getLogger(__name__)
+
+TEXT_FORMATS = ("tsv", "jsonl")
+
+TSV_HEADER = (
+    "#separator:tab\n"
+    "#html:true\n"
+    "#guid column:1\n"
+    "#notetype column:2\n"
+    "#deck column:3\n"
+    "#tags column:4\n"
+)
+
+
+class TextExportBackend(DeckBackend):
+    """Deck backend writing notes incrementally as TSV or JSON Lines.
+
+    Example:
+        ```python
+        backend = TextExportBackend("German A1", text_format="jsonl")
+        note_type_id = backend.create_note_type(note_type)
+        backend.add_note(note_type_id, ["Haus", "house"])
+        backend.export_deck("output/german_a1.jsonl")
+        ```
+    """
+
+    def __init__(
+        self, deck_name: str, description: str = "", text_format: str = "tsv"
+    ) -> None:
+        """Initialize the backend and open its staging file.
+
+        Args:
+            deck_name: Name of the deck to create
+            description: Optional description for the deck
+            text_format: "tsv" for Anki's text import format or "jsonl"
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        if text_format not in TEXT_FORMATS:
+            raise ValueError(
+                f"Unknown text format {text_format!r}; expected one of {TEXT_FORMATS}"
+            )
+        super().__init__(deck_name, description)
+        self.text_format = text_format
+        self._note_types: dict[str, NoteType] = {}
+        self._note_type_ids: dict[str, str] = {}
+        self._current_deck = deck_name
+        self._guids = NoteGuids()
+        self._media_by_path: dict[str, MediaFile] = {}
+        self._notes_count = 0
+
+        self._staging_dir = tempfile.TemporaryDirectory(prefix="langlearn_text_")
+        self._staging_path = Path(self._staging_dir.name) / f"notes.{text_format}"
+        self._file: TextIO | None = self._staging_path.open(
+            "w", encoding="utf-8", newline=""
+        )
+        self._tsv_writer = csv.writer(self._file, delimiter="\t", lineterminator="\n")
+        if text_format == "tsv":
+            self._file.write(TSV_HEADER)
+
+    def create_note_type(self, note_type: NoteType) -> str:
+        """Record a note type; a name seen before returns its existing ID."""
+        note_type_id = self._note_type_ids.get(note_type.name)
+        if note_type_id is None:
+            note_type_id = str(len(self._note_types) + 1)
+            self._note_type_ids[note_type.name] = note_type_id
+            self._note_types[note_type_id] = note_type
+        return note_type_id
+
+    def set_current_subdeck(self, full_deck_name: str | None) -> None:
+        """Write following notes to a subdeck, or the main deck if None."""
+        self._current_deck = full_deck_name or self.deck_name
+
+    def add_note(
+        self,
+        note_type_id: str,
+        fields: list[str],
+        tags: list[str] | None = None,
+        skip_media_processing: bool = False,
+    ) -> int:
+        """Append a note to the staging file; fields are written as given.
+
+        As in an Anki collection, values beyond the note type's fields are
+        dropped and missing ones are left empty.
+
+        Raises:
+            ValueError: If the note type is unknown or the deck was already
+                exported
+        """
+        note_type = self._note_types.get(note_type_id)
+        if note_type is None:
+            raise ValueError(f"Note type ID {note_type_id} not found")
+        if self._file is None:
+            raise ValueError(f"Deck {self.deck_name} was already exported")
+
+        guid = self._guids.next(
+            self._current_deck, note_type.name, note_type.identity(fields)
+        )
+        field_count = len(note_type.fields)
+        values = [*fields[:field_count], *[""] * (field_count - len(fields))]
+        tag_list = tags or []
+        if self.text_format == "tsv":
+            self._tsv_writer.writerow(
+                [guid, note_type.name, self._current_deck, " ".join(tag_list), *values]
+            )
+        else:
+            record = {
+                "guid": guid,
+                "note_type": note_type.name,
+                "deck": self._current_deck,
+                "fields": dict(zip(note_type.fields, values, strict=True)),
+                "tags": tag_list,
+            }
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._notes_count += 1
+        return self._notes_count
+
+    def add_media_file(self, file_path: str, media_type: str = "") -> MediaFile:
+        """Record a media file to place next to the export."""
+        media_file = self._media_by_path.get(file_path)
+        if media_file is None:
+            media_file = MediaFile(
+                path=file_path,
+                reference=media_reference(file_path, media_type),
+                media_type=media_type,
+            )
+            self._media_by_path[file_path] = media_file
+            self._media_files.append(media_file)
+        return media_file
+
+    def export_deck(self, output_path: str) -> None:
+        """Move the notes to output_path and link the media beside it.
+
+        Media goes to the sibling ``.media`` folder, as for collections
+        saved by the Anki backend.
+
+        Raises:
+            ValueError: If the deck was already exported
+        """
+        if self._file is None:
+            raise ValueError(f"Deck {self.deck_name} was already exported")
+        self._file.close()
+        self._file = None
+
+        target = Path(output_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(self._staging_path, target)
+        if self._media_files:
+            media_dir = target.with_suffix(".media")
+            media_dir.mkdir(exist_ok=True)
+            for media_file in self._media_files:
+                source = Path(media_file.path)
+                link_or_copy(source, media_dir / source.name)
+        self._staging_dir.cleanup()
+        logger.info(
+            f"Exported {self._notes_count} notes as {self.text_format} to "
+            f"{target} with {len(self._media_files)} media files"
+        )
+
+    def close(self) -> None:
+        """Discard the staging file if the deck was not exported."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._staging_dir.cleanup()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get deck statistics."""
+        return {
+            "deck_name": self.deck_name,
+            "note_types_count": len(self._note_types),
+            "notes_count": self._notes_count,
+            "media_files_count": len(self._media_files),
+        }
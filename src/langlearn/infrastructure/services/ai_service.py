@@ -2,6 +2,7 @@
 
 import logging.handlers
 import os
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -79,6 +80,11 @@ class AnthropicService(ImageQueryGenerationProtocol):
             # In unit tests or with empty keys, client will be mocked (None)
             self.client = None
 
+        # Image queries keyed by context; the service is a process-wide
+        # singleton, so decks built in one process share the cache
+        self._image_query_cache: dict[str, str] = {}
+        self._cache_lock = threading.Lock()
+
         logger.debug(f"Initialized AnthropicService with model: {self.model}")
 
     def _generate_response(
@@ -160,6 +166,13 @@ class AnthropicService(ImageQueryGenerationProtocol):
         Returns:
             Search query string suitable for Pexels API.
         """
+        cache_key = str(context)
+        with self._cache_lock:
+            cached = self._image_query_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Using cached Pexels query: %s", cached)
+            return cached
+
         prompt = f"""You are a helpful assistant that generates search queries for \
 finding relevant images.
 
@@ -178,7 +191,25 @@ their images.
                 max_tokens=75,  # Increased slightly for context-based queries
                 temperature=0.3,  # Lower temperature for more consistent results
             )
-            return response.strip()
         except Exception as e:
             logger.error(f"Error generating Pexels query: {e}")
             raise
+
+        query = response.strip()
+        if query:
+            with self._cache_lock:
+                self._image_query_cache[cache_key] = query
+        return query
+
+    def has_cached_image_query(self, context: Any) -> bool:
+        """Return True if a query for this context is cached.
+
+        Lets a build planner tell which image queries will cost an API call.
+        """
+        with self._cache_lock:
+            return str(context) in self._image_query_cache
+
+    def clear_cache(self) -> None:
+        """Drop cached image queries."""
+        with self._cache_lock:
+            self._image_query_cache.clear()
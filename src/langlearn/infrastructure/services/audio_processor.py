@@ -0,0 +1,215 @@
+"""Post-process synthesized audio so clips are small and evenly loud.
+
+Polly MP3 streams are saved as delivered, with leading and trailing silence
+and loudness that varies between voices and sentence lengths. Across
+thousands of clips per deck that adds up. ``AudioProcessor`` writes a
+processed copy of each clip with ffmpeg:
+
+- leading and trailing silence is trimmed
+- loudness is normalized to a target (EBU R128 ``loudnorm``)
+- the clip is re-encoded as mono MP3 at a target bitrate, without metadata
+
+The deck's own clips are left untouched; copies go to a processed media
+cache keyed by content hash and configuration (see media_processing), so
+each clip is processed once per configuration, from the original. ffmpeg
+runs as a subprocess, so a thread pool keeps several encodes in flight.
+
+Example:
+    ```python
+    processor = AudioProcessor(AudioProcessingConfig(bitrate_kbps=48))
+    report = processor.process_directory(
+        Path("languages/german/default/audio"), Path("output/processed_media")
+    )
+    print(report.as_stats())
+    ```
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+
+from langlearn.exceptions import ConfigurationError, MediaGenerationError
+
+from .media_processing import (
+    MediaProcessingReport,
+    ProcessedMediaCache,
+    process_to_cache,
+    temporary_path,
+)
+
+logger = logging.getLogger(__name__)
+
+FFMPEG_TIMEOUT_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class AudioProcessingConfig:
+    """Trimming, loudness and encoding targets for processed clips."""
+
+    trim_silence: bool = True
+    silence_threshold_db: int = -50
+    loudness_lufs: float | None = -16.0
+    bitrate_kbps: int = 64
+    mono: bool = True
+    sample_rate: int | None = None
+
+    def __post_init__(self) -> None:
+        """Validate configuration values."""
+        if not 8 <= self.bitrate_kbps <= 320:
+            raise ConfigurationError(
+                f"bitrate_kbps must be between 8 and 320, got {self.bitrate_kbps}"
+            )
+        if self.loudness_lufs is not None and not -70 <= self.loudness_lufs <= -5:
+            raise ConfigurationError(
+                f"loudness_lufs must be between -70 and -5, got {self.loudness_lufs}"
+            )
+
+    def filters(self) -> str:
+        """Return the ffmpeg audio filter chain, empty if none applies."""
+        filters = []
+        if self.trim_silence:
+            # Trim the start, reverse, trim the (former) end, reverse back
+            trim = (
+                "silenceremove=start_periods=1:"
+                f"start_threshold={self.silence_threshold_db}dB"
+            )
+            filters += [trim, "areverse", trim, "areverse"]
+        if self.loudness_lufs is not None:
+            filters.append(f"loudnorm=I={self.loudness_lufs}:TP=-1.5:LRA=11")
+        return ",".join(filters)
+
+
+def find_ffmpeg() -> str:
+    """Return the ffmpeg executable.
+
+    Raises:
+        ConfigurationError: If ffmpeg is not on PATH
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise ConfigurationError(
+            "Audio post-processing requires ffmpeg on PATH "
+            "(e.g. 'brew install ffmpeg' or 'apt install ffmpeg')"
+        )
+    return ffmpeg
+
+
+def ffmpeg_command(
+    ffmpeg: str, source: Path, target: Path, config: AudioProcessingConfig
+) -> list[str]:
+    """Return the ffmpeg command processing source into target."""
+    command = [ffmpeg, "-hide_banner", "-loglevel", "error", "-y", "-i", str(source)]
+    filters = config.filters()
+    if filters:
+        command += ["-af", filters]
+    if config.mono:
+        command += ["-ac", "1"]
+    if config.sample_rate is not None:
+        command += ["-ar", str(config.sample_rate)]
+    command += [
+        "-map_metadata",
+        "-1",
+        "-codec:a",
+        "libmp3lame",
+        "-b:a",
+        f"{config.bitrate_kbps}k",
+        "-f",
+        "mp3",
+        str(target),
+    ]
+    return command
+
+
+def normalize_audio(
+    source: Path, target: Path, config: AudioProcessingConfig, ffmpeg: str
+) -> int:
+    """Write a trimmed, normalized and re-encoded copy of one clip.
+
+    Args:
+        source: MP3 file to read
+        target: Path of the processed copy
+        config: Processing targets
+        ffmpeg: ffmpeg executable
+
+    Returns:
+        Size of the processed copy in bytes
+
+    Raises:
+        MediaGenerationError: If ffmpeg fails
+    """
+    temp_path = temporary_path(target)
+    try:
+        subprocess.run(
+            ffmpeg_command(ffmpeg, source, temp_path, config),
+            capture_output=True,
+            check=True,
+            timeout=FFMPEG_TIMEOUT_SECONDS,
+        )
+    except subprocess.CalledProcessError as e:
+        temp_path.unlink(missing_ok=True)
+        stderr = e.stderr.decode(errors="replace").strip() if e.stderr else ""
+        raise MediaGenerationError(
+            f"ffmpeg failed for {source.name}: {stderr or e}"
+        ) from e
+    except (OSError, subprocess.TimeoutExpired) as e:
+        temp_path.unlink(missing_ok=True)
+        raise MediaGenerationError(f"ffmpeg failed for {source.name}: {e}") from e
+    os.replace(temp_path, target)
+    return target.stat().st_size
+
+
+class AudioProcessor:
+    """Post-process copies of a deck's audio clips in parallel."""
+
+    def __init__(
+        self,
+        config: AudioProcessingConfig | None = None,
+        max_workers: int | None = None,
+        ffmpeg: str | None = None,
+    ) -> None:
+        """Initialize AudioProcessor.
+
+        Args:
+            config: Processing targets; defaults to AudioProcessingConfig()
+            max_workers: Concurrent ffmpeg processes; defaults to the
+                executor's default
+            ffmpeg: ffmpeg executable; looked up on PATH if omitted
+
+        Raises:
+            ConfigurationError: If ffmpeg is not available
+        """
+        self.config = config or AudioProcessingConfig()
+        self._max_workers = max_workers
+        self._ffmpeg = ffmpeg or find_ffmpeg()
+
+    def process_directory(
+        self, directory: Path, cache_dir: Path
+    ) -> MediaProcessingReport:
+        """Process every MP3 clip in a directory into the cache.
+
+        Args:
+            directory: Audio directory of a deck
+            cache_dir: Processed media cache for audio
+
+        Returns:
+            MediaProcessingReport for the directory
+        """
+        if not directory.is_dir():
+            return MediaProcessingReport()
+        paths = sorted(path for path in directory.glob("*.mp3") if path.is_file())
+        report = process_to_cache(
+            paths,
+            ProcessedMediaCache(cache_dir, asdict(self.config), (".mp3",)),
+            partial(normalize_audio, config=self.config, ffmpeg=self._ffmpeg),
+            ThreadPoolExecutor(max_workers=self._max_workers),
+        )
+        logger.info(
+            f"Processed {len(report.processed)} audio clips from {directory} in "
+            f"{report.seconds:.2f}s, saved {report.bytes_saved} bytes"
+        )
+        return report
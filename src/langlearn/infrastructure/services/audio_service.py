@@ -3,11 +3,14 @@
 import hashlib
 import logging
 import logging.handlers
+import os
+import uuid
 from pathlib import Path
 from typing import TYPE_CHECKING, TypedDict
 
 import boto3
 from botocore.exceptions import (
+    BotoCoreError,
     ClientError,
     NoCredentialsError,
 )
@@ -20,6 +23,8 @@ from mypy_boto3_polly.literals import (
 )
 from mypy_boto3_polly.type_defs import SynthesizeSpeechOutputTypeDef
 
+from langlearn.infrastructure.services.resilience import ProviderGuard
+
 if TYPE_CHECKING:
     from mypy_boto3_polly.client import PollyClient
 
@@ -49,6 +54,39 @@ console_handler.setFormatter(
 )
 logger.addHandler(console_handler)
 
+# Polly streams are copied to disk in chunks of this size, so memory use per
+# in-flight request stays flat regardless of clip length
+AUDIO_CHUNK_SIZE = 64 * 1024
+
+
+def is_provider_failure(error: Exception) -> bool:
+    """Return True if an error means Polly itself is degraded.
+
+    Throttling and server errors count; other client errors (invalid SSML,
+    an unsupported voice) say nothing about the health of the service.
+    """
+    if isinstance(error, ClientError):
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        code = error.response.get("Error", {}).get("Code", "")
+        return "Throttl" in code or status is None or status >= 500
+    return True
+
+
+def close_audio_stream(response: SynthesizeSpeechOutputTypeDef) -> None:
+    """Close the audio stream of a Polly response that will not be read."""
+    response["AudioStream"].close()
+
+
+def looks_like_mp3(header: bytes) -> bool:
+    """Return True if the bytes start like an MP3 file.
+
+    Accepts an ID3v2 tag or an MPEG audio frame sync (11 set bits), which is
+    how Polly MP3 streams begin.
+    """
+    if header.startswith(b"ID3"):
+        return True
+    return len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0
+
 
 class PollyRequestParams(TypedDict):
     Text: str
@@ -74,6 +112,8 @@ class AudioService:
         language_code: LanguageCodeType = "de-DE",
         speech_rate: int = 75,
         engine: EngineType = "neural",
+        client: "PollyClient | None" = None,
+        guard: ProviderGuard | None = None,
     ) -> None:
         """Initialize the AudioService.
 
@@ -83,15 +123,20 @@ class AudioService:
             language_code: Language code (default: "de-DE")
             speech_rate: Speech rate in percentage (default: 75)
             engine: AWS Polly engine type (default: "neural")
+            client: Existing Polly client to reuse; services for several decks
+                can share one client instead of each creating their own
+            guard: Circuit breaker, deadline and hedging for Polly calls;
+                share one between services so they see the same outages
         """
         if TYPE_CHECKING:
             self.client: PollyClient
-        self.client = boto3.client("polly")
+        self.client = client if client is not None else boto3.client("polly")
         self.output_dir = Path(output_dir)
         self.voice_id = voice_id
         self.engine = engine
         self.language_code = language_code
         self.speech_rate = speech_rate
+        self.guard = guard or ProviderGuard("polly")
         self.output_dir.mkdir(exist_ok=True)
         logger.info(
             "AudioService initialized with voice_id=%s, language_code=%s, "
@@ -114,6 +159,8 @@ class AudioService:
         Raises:
             NoCredentialsError: If AWS credentials are not found
             ClientError: If there is an error with the AWS Polly service
+            CircuitOpenError: If the Polly circuit is open
+            DeadlineExceededError: If Polly did not answer within the deadline
             RuntimeError: If there is an error saving the audio file
         """
         logger.info("Generating audio for text: %s", text)
@@ -139,7 +186,11 @@ class AudioService:
             logger.debug("AWS Polly request parameters: %s", request_params)
 
             try:
-                response = self.client.synthesize_speech(**request_params)
+                response = self.guard.call(
+                    lambda: self.client.synthesize_speech(**request_params),
+                    is_failure=is_provider_failure,
+                    discard=close_audio_stream,
+                )
             except NoCredentialsError:
                 logger.error(
                     "AWS credentials not found. Please configure your AWS credentials."
@@ -160,7 +211,12 @@ class AudioService:
     def _save_audio_file(
         self, text: str, response: SynthesizeSpeechOutputTypeDef
     ) -> str | None:
-        """Save the audio stream to a file.
+        """Stream the audio to a file, replacing it only once complete.
+
+        The stream is copied in chunks to a temporary file next to the target
+        and moved into place after validation, so an interrupted or truncated
+        download never leaves a partial file that later runs would reuse.
+        Concurrent saves of the same text each use their own temporary file.
 
         Args:
             text: The original text (used for filename generation)
@@ -172,14 +228,29 @@ class AudioService:
         # Generate unique filename based on text content
         filename = f"{hashlib.md5(text.encode()).hexdigest()}.mp3"
         filepath = self.output_dir / filename
+        temp_path = self.output_dir / f".{filename}.{uuid.uuid4().hex}.part"
 
         try:
-            # Write the audio stream to a file
-            with open(filepath, "wb") as f:
-                audio_stream = response["AudioStream"]
-                f.write(audio_stream.read())
-            logger.info("Successfully saved audio file to: %s", filepath)
+            audio_stream = response["AudioStream"]
+            size = 0
+            header = b""
+            with open(temp_path, "wb") as f:
+                for chunk in iter(lambda: audio_stream.read(AUDIO_CHUNK_SIZE), b""):
+                    if len(header) < 4:
+                        header += chunk[: 4 - len(header)]
+                    f.write(chunk)
+                    size += len(chunk)
+            if size == 0:
+                raise ValueError("empty audio stream")
+            if not looks_like_mp3(header):
+                raise ValueError("audio stream is not MP3 data")
+            os.replace(temp_path, filepath)
+            logger.info(
+                "Successfully saved audio file to: %s (%d bytes)", filepath, size
+            )
             return str(filepath)
-        except OSError as e:
-            logger.error("Error saving audio file: %s", e)
+        except (OSError, ValueError, BotoCoreError) as e:
+            # BotoCoreError covers truncated and interrupted response streams
+            logger.error("Error saving audio file %s: %s", filepath, e)
+            temp_path.unlink(missing_ok=True)
             return None
@@ -5,8 +5,13 @@ import logging.handlers
 from pathlib import Path
 from typing import TypeVar
 
+import numpy as np
+
 from langlearn.core.records import BaseRecord
-from langlearn.languages.german.services.record_mapper import RecordMapper
+from langlearn.languages.german.services.record_mapper import (
+    RecordMapper,
+    read_csv_frame,
+)
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -117,49 +122,46 @@ class CSVService:
         records: list[BaseRecord] = []
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                # Start at 2 (header is row 1)
-                for row_num, row in enumerate(reader, start=2):
-                    try:
-                        # Clean row data (handle None values)
-                        cleaned_row = {k: v or "" for k, v in row.items()}
-
-                        # Check if row has sufficient non-empty data to be valid
-                        # For records to be meaningful, require minimum fields based
-                        # on record type
-                        required_field_count = self._get_minimum_required_fields(
-                            record_type
-                        )
-                        non_empty_fields = sum(
-                            1 for value in cleaned_row.values() if value.strip()
-                        )
-
-                        if non_empty_fields < required_field_count:
-                            logger.warning(
-                                "Skipping row %d: insufficient data (%d/%d fields)",
-                                row_num,
-                                non_empty_fields,
-                                required_field_count,
-                            )
-                            continue
-
-                        # Map CSV row to Record
-                        record = self._record_mapper.map_csv_row_to_record(
-                            record_type, cleaned_row
-                        )
-                        records.append(record)
-
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to create %s record from row %d in %s: %s",
-                            record_type,
-                            row_num,
-                            file_path,
-                            e,
-                        )
-                        # Continue processing other rows rather than failing completely
-                        continue
+            frame = read_csv_frame(file_path)
+
+            # Count non-empty cells per row as whole-column operations; a row
+            # needs a minimum number of them to make a meaningful record
+            required_field_count = self._get_minimum_required_fields(record_type)
+            non_empty_counts = np.zeros(len(frame), dtype=np.int64)
+            for column in frame.columns:
+                non_empty_counts += (
+                    frame[column].str.strip().ne("").to_numpy(dtype=bool)
+                )
+            sufficient = non_empty_counts >= required_field_count
+
+            for position in np.flatnonzero(~sufficient):
+                logger.warning(
+                    "Skipping row %d: insufficient data (%d/%d fields)",
+                    position + 2,
+                    non_empty_counts[position],
+                    required_field_count,
+                )
+
+            kept_rows = np.flatnonzero(sufficient)
+            field_rows = self._record_mapper.iter_csv_fields(
+                frame.iloc[kept_rows], record_type
+            )
+            # Row numbers start at 2 (header is row 1)
+            for row_num, fields in zip(kept_rows + 2, field_rows, strict=True):
+                try:
+                    records.append(
+                        self._record_mapper.map_fields_to_record(record_type, fields)
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Failed to create %s record from row %d in %s: %s",
+                        record_type,
+                        row_num,
+                        file_path,
+                        e,
+                    )
+                    # Continue processing other rows rather than failing completely
+                    continue
 
             logger.info(
                 "Successfully read %d %s records from %s",
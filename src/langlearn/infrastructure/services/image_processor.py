@@ -0,0 +1,197 @@
+"""Normalize downloaded images so decks stay small.
+
+Pexels ``medium`` images are written to disk as delivered and every one ends up
+in the ``.apkg``. ``ImageProcessor`` writes shrunk copies for packaging:
+images are resized to fit a maximum dimension, EXIF orientation is applied
+and metadata dropped, and the result is re-encoded as JPEG or WebP at a
+target quality.
+
+The deck's own images are left untouched; copies go to a processed media
+cache (see media_processing), so images are encoded once per configuration
+and never re-encoded from an earlier lossy output. A copy whose format does
+not match its extension is named after the format instead (``katze.png``
+becomes ``katze.jpg``), and ``MediaProcessingReport.outputs`` maps the names.
+Work is spread over a process pool.
+
+Example:
+    ```python
+    processor = ImageProcessor(ImageProcessingConfig(max_dimension=640))
+    report = processor.process_directory(
+        Path("languages/german/default/images"), Path("output/processed_media")
+    )
+    print(f"Saved {report.bytes_saved} bytes")
+    ```
+"""
+
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from typing import Literal
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from langlearn.exceptions import ConfigurationError, MediaGenerationError
+
+from .media_processing import (
+    MediaProcessingReport,
+    ProcessedMediaCache,
+    process_to_cache,
+    temporary_path,
+)
+
+logger = logging.getLogger(__name__)
+
+IMAGE_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+
+ImageFormat = Literal["JPEG", "WEBP"]
+
+# Extensions of each output format, the one given to renamed files first
+FORMAT_SUFFIXES: dict[str, tuple[str, ...]] = {
+    "JPEG": (".jpg", ".jpeg"),
+    "WEBP": (".webp",),
+}
+
+
+@dataclass(frozen=True)
+class ImageProcessingConfig:
+    """Target size and encoding of processed images."""
+
+    max_dimension: int = 800
+    quality: int = 80
+    image_format: ImageFormat = "JPEG"
+
+    def __post_init__(self) -> None:
+        """Validate configuration values."""
+        if self.max_dimension < 1:
+            raise ConfigurationError(
+                f"max_dimension must be positive, got {self.max_dimension}"
+            )
+        if not 1 <= self.quality <= 100:
+            raise ConfigurationError(
+                f"quality must be between 1 and 100, got {self.quality}"
+            )
+        if self.image_format not in ("JPEG", "WEBP"):
+            raise ConfigurationError(
+                f"image_format must be JPEG or WEBP, got {self.image_format}"
+            )
+
+
+def normalize_image(source: Path, target: Path, config: ImageProcessingConfig) -> int:
+    """Write a resized, stripped and re-encoded copy of one image.
+
+    Runs in worker processes, so it only takes picklable arguments. The copy
+    is written to a temporary file and moved to target, so readers never see
+    a partial file.
+
+    Args:
+        source: Image file to read
+        target: Path of the processed copy
+        config: Target size and encoding
+
+    Returns:
+        Size of the processed copy in bytes
+
+    Raises:
+        MediaGenerationError: If the source is not a readable image
+    """
+    temp_path = temporary_path(target)
+    try:
+        with Image.open(source) as original:
+            image = ImageOps.exif_transpose(original)
+            image.thumbnail((config.max_dimension, config.max_dimension))
+            if image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            # No exif/icc_profile arguments: metadata is dropped
+            image.save(
+                temp_path,
+                format=config.image_format,
+                quality=config.quality,
+                optimize=config.image_format == "JPEG",
+            )
+    except (OSError, UnidentifiedImageError) as e:
+        temp_path.unlink(missing_ok=True)
+        raise MediaGenerationError(f"Failed to process image {source}: {e}") from e
+    os.replace(temp_path, target)
+    return target.stat().st_size
+
+
+class ImageProcessor:
+    """Shrink copies of a deck's images in parallel, skipping cached ones."""
+
+    def __init__(
+        self,
+        config: ImageProcessingConfig | None = None,
+        max_workers: int | None = None,
+        use_processes: bool = True,
+    ) -> None:
+        """Initialize ImageProcessor.
+
+        Args:
+            config: Target size and encoding; defaults to ImageProcessingConfig()
+            max_workers: Worker count; defaults to the CPU count
+            use_processes: Encode in worker processes; Pillow releases the GIL
+                for most of the work, so threads are a cheaper alternative
+        """
+        self.config = config or ImageProcessingConfig()
+        self._max_workers = max_workers
+        self._use_processes = use_processes
+
+    def process_directory(
+        self, directory: Path, cache_dir: Path
+    ) -> MediaProcessingReport:
+        """Process every image in a directory.
+
+        Args:
+            directory: Image directory of a deck
+            cache_dir: Processed media cache for images
+
+        Returns:
+            MediaProcessingReport for the directory
+        """
+        if not directory.is_dir():
+            return MediaProcessingReport()
+        paths = sorted(
+            path
+            for path in directory.iterdir()
+            if path.is_file() and path.suffix.lower() in IMAGE_SUFFIXES
+        )
+        return self.process_files(paths, cache_dir)
+
+    def process_files(
+        self, paths: list[Path], cache_dir: Path
+    ) -> MediaProcessingReport:
+        """Process images into the cache, leaving the files themselves alone.
+
+        See media_processing.process_to_cache for how earlier runs and
+        duplicate downloads are reused.
+
+        Args:
+            paths: Image files to process
+            cache_dir: Processed media cache for images
+
+        Returns:
+            MediaProcessingReport with one result per path
+        """
+        executor: Executor = (
+            ProcessPoolExecutor(max_workers=self._max_workers)
+            if self._use_processes
+            else ThreadPoolExecutor(max_workers=self._max_workers)
+        )
+        report = process_to_cache(
+            paths,
+            ProcessedMediaCache(
+                cache_dir,
+                asdict(self.config),
+                FORMAT_SUFFIXES[self.config.image_format],
+            ),
+            partial(normalize_image, config=self.config),
+            executor,
+        )
+        logger.info(
+            f"Processed {len(report.processed)} images into {cache_dir}, "
+            f"saved {report.bytes_saved} bytes"
+        )
+        return report
@@ -12,6 +12,8 @@ import requests
 from requests.exceptions import HTTPError
 
 from langlearn.core.protocols.image_search_protocol import ImageSearchProtocol
+from langlearn.exceptions import CircuitOpenError, DeadlineExceededError
+from langlearn.infrastructure.services.resilience import Deadline, ProviderGuard
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -40,6 +42,24 @@ console_handler.setFormatter(
 logger.addHandler(console_handler)
 
 
+PEXELS_API_URL = "https://api.pexels.com/v1"
+
+# Seconds a single Pexels API request may take
+REQUEST_TIMEOUT = 15
+
+
+def is_provider_failure(error: Exception) -> bool:
+    """Return True if an error means Pexels itself is degraded.
+
+    Rate limiting and server errors count; other client errors (a bad
+    query, a 404) say nothing about the health of the API.
+    """
+    if isinstance(error, HTTPError) and error.response is not None:
+        status: int = error.response.status_code
+        return status == 429 or status >= 500
+    return True
+
+
 # Define valid size options as a type
 PhotoSize = Literal[
     "original",
@@ -85,12 +105,26 @@ class Photo(TypedDict):
 class PexelsService(ImageSearchProtocol):
     """Service for interacting with the Pexels API."""
 
-    def __init__(self) -> None:
-        """Initialize the PexelsService."""
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str = PEXELS_API_URL,
+        guard: ProviderGuard | None = None,
+    ) -> None:
+        """Initialize the PexelsService.
+
+        Args:
+            api_key: API key to use; looked up in the environment, then the
+                keyring, if omitted
+            base_url: API root; point it at a Pexels-compatible stand-in such
+                as LocalPexelsServer to run without the real API
+            guard: Circuit breaker, deadline and hedging for API requests;
+                a guard with the default CallPolicy is created if omitted
+        """
         import os
 
         # First check environment variables (for CI/CD), then fall back to keyring
-        self.api_key = os.environ.get("PEXELS_API_KEY")
+        self.api_key = api_key or os.environ.get("PEXELS_API_KEY")
         if self.api_key is None:  # Environment variable not set at all
             import keyring
 
@@ -103,11 +137,12 @@ class PexelsService(ImageSearchProtocol):
             raise ValueError(
                 "Pexels API key not found in environment variables or keyring"
             )
-        self.base_url = "https://api.pexels.com/v1"
+        self.base_url = base_url
         self.max_retries = 5  # Increased for bulk operations
         self.base_delay = 2  # Base delay in seconds for exponential backoff
         self.max_delay = 60  # Maximum delay cap
         self.request_delay = 1.0  # Minimum delay between requests to be API-friendly
+        self.guard = guard or ProviderGuard("pexels")
 
     def _get_headers(self) -> dict[str, str]:
         """Get headers for Pexels API requests.
@@ -147,9 +182,29 @@ class PexelsService(ImageSearchProtocol):
 
         return max(delay_with_jitter, 1)  # Minimum 1 second
 
+    def _get(
+        self, url: str, params: dict[str, Any], deadline: Deadline
+    ) -> requests.Response:
+        """Send one API request, raising HTTPError for error statuses."""
+        remaining = deadline.remaining()
+        response = requests.get(
+            url,
+            headers=self._get_headers(),
+            params=params,
+            timeout=REQUEST_TIMEOUT
+            if remaining is None
+            else min(REQUEST_TIMEOUT, remaining),
+        )
+        response.raise_for_status()
+        return response
+
     def _make_request(self, url: str, params: dict[str, Any]) -> requests.Response:
         """Make a request to the Pexels API with exponential backoff retry logic.
 
+        Every attempt goes through the service's guard, so an open circuit
+        fails the request at once, and retries stop when the next backoff
+        would overrun the call's deadline.
+
         Args:
             url: API endpoint URL
             params: Query parameters
@@ -159,22 +214,25 @@ class PexelsService(ImageSearchProtocol):
 
         Raises:
             HTTPError: If the request fails after all retries
+            CircuitOpenError: If the Pexels circuit is open
+            DeadlineExceededError: If the call's deadline passes
         """
+        deadline = self.guard.deadline()
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(
-                    url,
-                    headers=self._get_headers(),
-                    params=params,
-                    timeout=15,  # Increased timeout for stability
+                response = self.guard.call(
+                    lambda: self._get(url, params, deadline),
+                    deadline=deadline,
+                    is_failure=is_provider_failure,
                 )
-                response.raise_for_status()
 
                 # Add small delay after successful request to be API-friendly
                 if attempt == 0:  # Only delay on first successful attempt, not retries
                     time.sleep(self.request_delay)
 
                 return response
+            except (CircuitOpenError, DeadlineExceededError):
+                raise
             except HTTPError as e:
                 # Rate limit check
                 if e.response.status_code == 429 and attempt < self.max_retries - 1:
@@ -186,6 +244,7 @@ class PexelsService(ImageSearchProtocol):
 
                     # Calculate exponential backoff delay
                     delay = self._calculate_backoff_delay(attempt, retry_after)
+                    self._check_deadline(deadline, delay, e)
 
                     logger.warning(
                         "Rate limited. Using exponential backoff: waiting %d seconds "
@@ -202,6 +261,7 @@ class PexelsService(ImageSearchProtocol):
                 if attempt < self.max_retries - 1:
                     # Apply exponential backoff for other errors too
                     delay = self._calculate_backoff_delay(attempt)
+                    self._check_deadline(deadline, delay, e)
                     logger.warning(
                         "Request failed (%s). Retrying in %d seconds (attempt %d/%d)",
                         str(e),
@@ -215,6 +275,16 @@ class PexelsService(ImageSearchProtocol):
                 raise
         raise HTTPError("Failed to make request after all retries")
 
+    def _check_deadline(
+        self, deadline: Deadline, delay: float, error: Exception
+    ) -> None:
+        """Give up instead of backing off past the call's deadline."""
+        if not deadline.allows(delay):
+            raise DeadlineExceededError(
+                f"Pexels request failed ({error}) and a {delay}s backoff "
+                f"would pass the {deadline.seconds}s deadline"
+            ) from error
+
     def search_photos(self, query: str, per_page: int = 5) -> list[Photo]:
         """Search for photos on Pexels.
 
@@ -227,6 +297,7 @@ class PexelsService(ImageSearchProtocol):
 
         Raises:
             MediaGenerationError: If the search request fails
+            CircuitOpenError: If the Pexels circuit is open
         """
         try:
             response = self._make_request(
@@ -234,6 +305,8 @@ class PexelsService(ImageSearchProtocol):
                 {"query": query, "per_page": per_page},
             )
             return cast("list[Photo]", response.json()["photos"])
+        except CircuitOpenError:
+            raise
         except Exception as e:
             logger.error("Error searching Pexels: %s", str(e))
             # Re-raise with appropriate specific exception type
@@ -259,6 +332,7 @@ class PexelsService(ImageSearchProtocol):
 
         Raises:
             MediaGenerationError: If the download fails or no photos are found
+            CircuitOpenError: If the Pexels circuit is open
         """
         try:
             # Search for photos
@@ -291,6 +365,8 @@ class PexelsService(ImageSearchProtocol):
             )
             return True
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             logger.error("Error downloading image: %s", str(e))
             # Re-raise with appropriate specific exception type
@@ -312,6 +388,7 @@ class PexelsService(ImageSearchProtocol):
 
         Raises:
             MediaGenerationError: If the request fails or no photos are found
+            CircuitOpenError: If the Pexels circuit is open
         """
         try:
             photos: list[Photo] = self.search_photos(query, per_page=1)
@@ -324,6 +401,8 @@ class PexelsService(ImageSearchProtocol):
             photo: Photo = photos[0]
             url: str = photo["src"][size]
             return url
+        except CircuitOpenError:
+            raise
         except Exception as e:
             logger.error("Error getting image URL: %s", str(e))
             # Re-raise with appropriate specific exception type
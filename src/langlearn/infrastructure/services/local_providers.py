@@ -0,0 +1,504 @@
+"""Local stand-ins for Polly, Pexels and Anthropic.
+
+Enrichment talks to three paid services, so its performance cannot be
+measured without credentials, network access and noisy remote latency. The
+providers here behave like the real ones at the interfaces the services use,
+deterministically and on the local machine:
+
+- ``FakePollyClient`` answers ``synthesize_speech`` with MP3 bytes derived
+  from the request text
+- ``LocalPexelsServer`` serves the Pexels search API and generated JPEGs over
+  HTTP on localhost, so ``PexelsService`` runs unchanged, retries included
+- ``CannedAnthropicService`` answers prompts from a table of canned responses
+
+Each provider applies the latency and throttling of a ``LocalProviderConfig``,
+so concurrency, retry and caching strategies can be compared offline.
+``LocalProviders`` starts all three and wires them in for a build.
+
+Example:
+    ```python
+    with LocalProviders(LocalProviderConfig(latency_seconds=0.05)) as providers:
+        services = SharedServices(
+            project_root,
+            pexels_service=providers.pexels_service,
+            polly_client=providers.polly_client,
+        )
+        BatchDeckBuilder(project_root, output_dir, services=services).build(specs)
+    ```
+"""
+
+import hashlib
+import io
+import json
+import logging
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Self, cast
+from urllib.parse import parse_qs, urlsplit
+
+from botocore.exceptions import ClientError
+from PIL import Image
+
+from langlearn.exceptions import ConfigurationError
+
+from .ai_service import AnthropicService
+from .image_service import PexelsService
+from .service_container import set_anthropic_service
+
+if TYPE_CHECKING:
+    from mypy_boto3_polly.client import PollyClient
+
+logger = logging.getLogger(__name__)
+
+# MPEG-1 Layer III, 64 kbps, 16 kHz frame header
+MP3_FRAME_HEADER = b"\xff\xf3\x84\xc4"
+FAKE_AUDIO_BYTES_PER_CHARACTER = 256
+PHOTO_SIZES = (
+    "original",
+    "large2x",
+    "large",
+    "medium",
+    "small",
+    "portrait",
+    "landscape",
+    "tiny",
+)
+
+
+@dataclass(frozen=True)
+class LocalProviderConfig:
+    """Latency and throttling behaviour of the local providers."""
+
+    latency_seconds: float = 0.0
+    throttle_every: int = 0
+    rate_limit_per_second: float | None = None
+    image_size: int = 640
+    canned_responses: Mapping[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Validate configuration values."""
+        if self.latency_seconds < 0:
+            raise ConfigurationError(
+                f"latency_seconds must not be negative, got {self.latency_seconds}"
+            )
+        if self.throttle_every < 0:
+            raise ConfigurationError(
+                f"throttle_every must not be negative, got {self.throttle_every}"
+            )
+        if self.rate_limit_per_second is not None and self.rate_limit_per_second <= 0:
+            raise ConfigurationError(
+                "rate_limit_per_second must be positive, "
+                f"got {self.rate_limit_per_second}"
+            )
+        if self.image_size < 1:
+            raise ConfigurationError(
+                f"image_size must be positive, got {self.image_size}"
+            )
+
+
+class _RequestCounter:
+    """Count requests and decide which ones are throttled."""
+
+    def __init__(self, throttle_every: int) -> None:
+        self._throttle_every = throttle_every
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+
+    def next_is_throttled(self) -> bool:
+        """Count a request; return True if every-nth throttling rejects it."""
+        with self._lock:
+            self.requests += 1
+            if self._throttle_every and self.requests % self._throttle_every == 0:
+                self.throttled += 1
+                return True
+            return False
+
+    def count_throttled(self) -> None:
+        """Count a request rejected for another reason, e.g. a rate limit."""
+        with self._lock:
+            self.throttled += 1
+
+
+def fake_mp3_bytes(text: str) -> bytes:
+    """Return deterministic MP3-like bytes, longer for longer text.
+
+    The data starts with an MPEG frame header, so it passes the checks
+    AudioService applies to real Polly streams, but it is not playable audio.
+    """
+    size = max(1, len(text)) * FAKE_AUDIO_BYTES_PER_CHARACTER
+    digest = hashlib.sha256(text.encode()).digest()
+    body = digest * (size // len(digest) + 1)
+    return MP3_FRAME_HEADER + body[: size - len(MP3_FRAME_HEADER)]
+
+
+class FakePollyClient:
+    """Polly client stand-in answering ``synthesize_speech`` locally."""
+
+    def __init__(self, config: LocalProviderConfig | None = None) -> None:
+        """Initialize FakePollyClient.
+
+        Args:
+            config: Latency and throttling; defaults to LocalProviderConfig()
+        """
+        self.config = config or LocalProviderConfig()
+        self._counter = _RequestCounter(self.config.throttle_every)
+
+    @property
+    def requests(self) -> int:
+        """Return the number of synthesize_speech calls."""
+        return self._counter.requests
+
+    @property
+    def throttled(self) -> int:
+        """Return the number of calls rejected with a throttling error."""
+        return self._counter.throttled
+
+    def synthesize_speech(self, **params: Any) -> dict[str, Any]:
+        """Return a response shaped like Polly's for the request text.
+
+        Raises:
+            ClientError: ThrottlingException for throttled requests
+        """
+        time.sleep(self.config.latency_seconds)
+        if self._counter.next_is_throttled():
+            raise ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+                "SynthesizeSpeech",
+            )
+        text = str(params["Text"])
+        audio = fake_mp3_bytes(text)
+        return {
+            "AudioStream": io.BytesIO(audio),
+            "ContentType": "audio/mpeg",
+            "RequestCharacters": len(text),
+            "ResponseMetadata": {"HTTPStatusCode": 200},
+        }
+
+
+class _TokenBucket:
+    """Allow a steady request rate with bursts of up to one second's worth."""
+
+    def __init__(self, rate: float) -> None:
+        self._rate = rate
+        self._capacity = max(1.0, rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        """Take a token; return False if the rate is exceeded."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class LocalPexelsServer:
+    """Pexels-compatible HTTP server on localhost.
+
+    Serves ``GET /v1/search`` with photos whose ``src`` URLs point back at the
+    server, and ``GET /photos/<id>.jpg`` with a generated JPEG per photo id.
+    Requests over the rate limit, and every-nth throttled requests, get a 429
+    response with a ``Retry-After`` header, as the real API sends.
+    """
+
+    def __init__(self, config: LocalProviderConfig | None = None) -> None:
+        """Initialize LocalPexelsServer; call start() or use it as a context.
+
+        Args:
+            config: Latency, throttling and rate limit; defaults to
+                LocalProviderConfig()
+        """
+        self.config = config or LocalProviderConfig()
+        self._counter = _RequestCounter(self.config.throttle_every)
+        self._bucket = (
+            _TokenBucket(self.config.rate_limit_per_second)
+            if self.config.rate_limit_per_second is not None
+            else None
+        )
+        self._images: dict[int, bytes] = {}
+        self._images_lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def requests(self) -> int:
+        """Return the number of requests received."""
+        return self._counter.requests
+
+    @property
+    def throttled(self) -> int:
+        """Return the number of requests answered with 429."""
+        return self._counter.throttled
+
+    @property
+    def url(self) -> str:
+        """Return the server root URL.
+
+        Raises:
+            RuntimeError: If the server is not running
+        """
+        if self._server is None:
+            raise RuntimeError("LocalPexelsServer is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def base_url(self) -> str:
+        """Return the API root to pass to PexelsService."""
+        return f"{self.url}/v1"
+
+    def start(self) -> None:
+        """Serve requests on a free localhost port in a background thread."""
+        if self._server is not None:
+            return
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                server._handle(self)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug(format, *args)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="local-pexels", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Local Pexels server listening on {self.url}")
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> Self:
+        """Start the server."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def _handle(self, request: BaseHTTPRequestHandler) -> None:
+        """Answer one GET request."""
+        time.sleep(self.config.latency_seconds)
+        throttled = self._counter.next_is_throttled()
+        if throttled or (self._bucket is not None and not self._bucket.take()):
+            if not throttled:
+                self._counter.count_throttled()
+            self._send(request, HTTPStatus.TOO_MANY_REQUESTS, b"", "text/plain")
+            return
+
+        url = urlsplit(request.path)
+        if url.path == "/v1/search":
+            params = parse_qs(url.query)
+            query = params.get("query", [""])[0]
+            per_page = int(params.get("per_page", ["15"])[0])
+            body = json.dumps({"photos": self._photos(query, per_page)}).encode()
+            self._send(request, HTTPStatus.OK, body, "application/json")
+        elif url.path.startswith("/photos/") and url.path.endswith(".jpg"):
+            photo_id = url.path.removeprefix("/photos/").removesuffix(".jpg")
+            if not photo_id.isdigit():
+                self._send(request, HTTPStatus.NOT_FOUND, b"", "text/plain")
+                return
+            self._send(request, HTTPStatus.OK, self._image(int(photo_id)), "image/jpeg")
+        else:
+            self._send(request, HTTPStatus.NOT_FOUND, b"", "text/plain")
+
+    @staticmethod
+    def _send(
+        request: BaseHTTPRequestHandler,
+        status: HTTPStatus,
+        body: bytes,
+        content_type: str,
+    ) -> None:
+        """Write a complete response."""
+        request.send_response(status)
+        request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(body)))
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            request.send_header("Retry-After", "1")
+        request.end_headers()
+        request.wfile.write(body)
+
+    def _photos(self, query: str, per_page: int) -> list[dict[str, Any]]:
+        """Return deterministic search results for a query."""
+        photos = []
+        for rank in range(max(0, per_page)):
+            digest = hashlib.sha256(f"{query}\x1f{rank}".encode()).digest()
+            photo_id = int.from_bytes(digest[:4], "big")
+            image_url = f"{self.url}/photos/{photo_id}.jpg"
+            photos.append(
+                {
+                    "id": photo_id,
+                    "width": self.config.image_size,
+                    "height": self.config.image_size,
+                    "url": image_url,
+                    "photographer": "Local Provider",
+                    "photographer_url": self.url,
+                    "photographer_id": 0,
+                    "avg_color": f"#{digest[4:7].hex()}",
+                    "src": dict.fromkeys(PHOTO_SIZES, image_url),
+                    "liked": False,
+                    "alt": query,
+                }
+            )
+        return photos
+
+    def _image(self, photo_id: int) -> bytes:
+        """Return the JPEG for a photo id, generated once."""
+        with self._images_lock:
+            cached = self._images.get(photo_id)
+        if cached is not None:
+            return cached
+        color = photo_id.to_bytes(4, "big")[1:]
+        size = self.config.image_size
+        buffer = io.BytesIO()
+        Image.new("RGB", (size, size), (color[0], color[1], color[2])).save(
+            buffer, "JPEG", quality=85
+        )
+        data = buffer.getvalue()
+        with self._images_lock:
+            self._images[photo_id] = data
+        return data
+
+
+class CannedAnthropicService(AnthropicService):
+    """AnthropicService answering from canned responses instead of the API.
+
+    A prompt gets the response of the first canned key it contains, or a
+    deterministic query derived from the prompt. Image query caching works as
+    in the real service, so cache strategies can be measured too.
+    """
+
+    def __init__(self, config: LocalProviderConfig | None = None) -> None:
+        """Initialize CannedAnthropicService without API credentials.
+
+        Args:
+            config: Latency, throttling and canned responses; defaults to
+                LocalProviderConfig()
+        """
+        self.config = config or LocalProviderConfig()
+        self._counter = _RequestCounter(self.config.throttle_every)
+        self.api_key = None
+        self.model = "local-canned"
+        self.client = None
+        self._image_query_cache: dict[str, str] = {}
+        self._cache_lock = threading.Lock()
+
+    @property
+    def requests(self) -> int:
+        """Return the number of prompts answered or rejected."""
+        return self._counter.requests
+
+    def _generate_response(
+        self, prompt: str, max_tokens: int = 100, temperature: float = 0.7
+    ) -> str:
+        """Return the canned response for a prompt.
+
+        Raises:
+            RuntimeError: For throttled requests, as the API client would
+        """
+        time.sleep(self.config.latency_seconds)
+        if self._counter.next_is_throttled():
+            raise RuntimeError("Local Anthropic stand-in: rate limit exceeded")
+        for key, response in self.config.canned_responses.items():
+            if key in prompt:
+                return response
+        return f"local image {hashlib.sha256(prompt.encode()).hexdigest()[:8]}"
+
+
+class LocalProviders:
+    """Start the local providers and install them for a build.
+
+    On entry the Pexels server starts and the canned Anthropic service
+    replaces the process-wide one returned by get_anthropic_service; on exit
+    both are undone. Pass ``pexels_service`` and ``polly_client`` to the
+    builders, e.g. through SharedServices.
+    """
+
+    def __init__(self, config: LocalProviderConfig | None = None) -> None:
+        """Initialize LocalProviders.
+
+        Args:
+            config: Behaviour shared by all three providers
+        """
+        self.config = config or LocalProviderConfig()
+        self.polly = FakePollyClient(self.config)
+        self.pexels_server = LocalPexelsServer(self.config)
+        self.anthropic_service = CannedAnthropicService(self.config)
+        self._pexels_service: PexelsService | None = None
+        self._previous_anthropic: AnthropicService | None = None
+
+    @property
+    def polly_client(self) -> "PollyClient":
+        """Return the fake Polly client, typed for AudioService."""
+        return cast("PollyClient", self.polly)
+
+    @property
+    def pexels_service(self) -> PexelsService:
+        """Return a PexelsService talking to the local server.
+
+        Raises:
+            RuntimeError: If the providers are not started
+        """
+        if self._pexels_service is None:
+            raise RuntimeError("LocalProviders is not started")
+        return self._pexels_service
+
+    def stats(self) -> dict[str, int]:
+        """Return request and throttling counts per provider."""
+        return {
+            "polly_requests": self.polly.requests,
+            "polly_throttled": self.polly.throttled,
+            "pexels_requests": self.pexels_server.requests,
+            "pexels_throttled": self.pexels_server.throttled,
+            "anthropic_requests": self.anthropic_service.requests,
+        }
+
+    def __enter__(self) -> Self:
+        """Start the Pexels server and install the Anthropic stand-in."""
+        self.pexels_server.start()
+        self._pexels_service = PexelsService(
+            api_key="local", base_url=self.pexels_server.base_url
+        )
+        self._previous_anthropic = set_anthropic_service(self.anthropic_service)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Restore the Anthropic service and stop the Pexels server."""
+        set_anthropic_service(self._previous_anthropic)
+        self.pexels_server.stop()
+        self._pexels_service = None
@@ -10,6 +10,7 @@ from __future__ import annotations
 import hashlib
 import logging
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -18,10 +19,27 @@ from langlearn.core.protocols.media_generation_protocol import MediaGenerationCa
 from langlearn.infrastructure.services.ai_service import AnthropicService
 from langlearn.infrastructure.services.audio_service import AudioService
 from langlearn.infrastructure.services.image_service import PexelsService
+from langlearn.infrastructure.services.media_index import MediaIndex
+from langlearn.infrastructure.services.media_queue import (
+    DeferredImageQuery,
+    MediaJobQueue,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class PlannedMedia:
+    """A media file a record needs, as seen by a dry-run plan."""
+
+    kind: str  # "audio" or "image"
+    target: Path
+    available: bool
+    characters: int = 0  # Text to synthesize, for audio
+    needs_query: bool = False  # An Anthropic call builds the image query
+    query_cached: bool = False
+
+
 class MediaEnricherBase(ABC):
     """Abstract base class for language-agnostic media enrichment.
 
@@ -71,6 +89,7 @@ class StandardMediaEnricher(MediaEnricherProtocol, MediaEnricherBase):
         anthropic_service: AnthropicService,
         audio_base_path: Path,
         image_base_path: Path,
+        media_index: MediaIndex | None = None,
     ) -> None:
         """Initialize media enricher with required services.
 
@@ -80,17 +99,158 @@ class StandardMediaEnricher(MediaEnricherProtocol, MediaEnricherBase):
             anthropic_service: Service for AI-powered content generation
             audio_base_path: Base directory for audio files
             image_base_path: Base directory for image files
+            media_index: Optional index of media shared with other decks of
+                the same language; indexed files are copied instead of
+                generated
         """
         self._audio_service = audio_service
         self._pexels_service = pexels_service
         self._anthropic_service = anthropic_service
         self._audio_base_path = audio_base_path
         self._image_base_path = image_base_path
+        self._media_index: MediaIndex | None = None
+        self._media_queue: MediaJobQueue | None = None
+        self._deferred_count = 0
+        self._failed_count = 0
 
         # Ensure directories exist
         self._audio_base_path.mkdir(parents=True, exist_ok=True)
         self._image_base_path.mkdir(parents=True, exist_ok=True)
 
+        if media_index is not None:
+            self.use_media_index(media_index)
+
+    def use_media_index(self, media_index: MediaIndex) -> None:
+        """Share media with other decks through an index.
+
+        This deck's media directories are added to the index, and files
+        missing here are copied from indexed directories before any external
+        service is called.
+
+        Args:
+            media_index: Index shared by decks of the same language
+        """
+        media_index.add_directory(self._audio_base_path)
+        media_index.add_directory(self._image_base_path)
+        self._media_index = media_index
+
+    def defer_to(self, media_queue: MediaJobQueue | None) -> None:
+        """Queue missing media instead of generating it.
+
+        Records are enriched with the media that already exists; missing
+        audio and images are added to the queue and left out of the media
+        data until a later build finds the files. None restores generation.
+
+        Args:
+            media_queue: Queue for the deferred jobs, or None
+        """
+        self._media_queue = media_queue
+
+    @property
+    def deferred_count(self) -> int:
+        """Return how many audio and image files were deferred so far.
+
+        A record whose enrichment raised the count is missing media.
+        """
+        return self._deferred_count
+
+    @property
+    def failed_count(self) -> int:
+        """Return how many audio and image files failed to generate so far.
+
+        Provider errors are logged and the record keeps the media that did
+        succeed, so a record whose enrichment raised the count is missing
+        media.
+        """
+        return self._failed_count
+
+    def media_complete(
+        self, domain_model: MediaGenerationCapable, media_data: dict[str, Any]
+    ) -> bool:
+        """Check that media data names every file the model should have.
+
+        Args:
+            domain_model: Domain model the media data was produced for
+            media_data: Media data from an earlier enrichment
+
+        Returns:
+            True if every planned audio segment and image is named in the
+            media data and available
+        """
+        names = set(media_data.values())
+        return all(
+            planned.available and planned.target.name in names
+            for planned in self.plan_media(domain_model)
+        )
+
+    def _media_exists(self, path: Path) -> bool:
+        """Check for a media file locally, then in the shared index."""
+        if self._media_index is None:
+            return path.exists()
+        return self._media_index.restore(path)
+
+    def _media_available(self, path: Path) -> bool:
+        """Check for a media file locally or in the index, copying nothing."""
+        if path.exists():
+            return True
+        return self._media_index is not None and path.name in self._media_index
+
+    def plan_media(self, domain_model: MediaGenerationCapable) -> list[PlannedMedia]:
+        """List the media enrich_with_media would produce, without any I/O.
+
+        Uses the same filenames as enrichment and checks them against disk
+        and the media index. The image search strategy runs against a stand-in
+        AI service, so no service is called.
+
+        Args:
+            domain_model: Domain model implementing MediaGenerationCapable protocol
+
+        Returns:
+            PlannedMedia for each audio segment and the image
+        """
+        planned: list[PlannedMedia] = []
+        for audio_text in domain_model.get_audio_segments().values():
+            if audio_text:
+                audio_hash = self._generate_content_hash(audio_text)
+                audio_path = self._audio_base_path / f"{audio_hash}.mp3"
+                planned.append(
+                    PlannedMedia(
+                        "audio",
+                        audio_path,
+                        self._media_available(audio_path),
+                        characters=len(audio_text),
+                    )
+                )
+
+        model_word = self._extract_primary_word(domain_model)
+        image_path = self._image_base_path / f"{model_word.lower()}.jpg"
+        if self._media_available(image_path):
+            planned.append(PlannedMedia("image", image_path, True))
+            return planned
+        recorder = DeferredImageQuery()
+        query = domain_model.get_image_search_strategy(recorder)()
+        if recorder.context is not None:
+            query_cached = self._anthropic_service.has_cached_image_query(
+                recorder.context
+            )
+            planned.append(
+                PlannedMedia(
+                    "image",
+                    image_path,
+                    False,
+                    needs_query=True,
+                    query_cached=query_cached,
+                )
+            )
+        elif query:
+            planned.append(PlannedMedia("image", image_path, False))
+        return planned
+
+    def _register_media(self, path: Path) -> None:
+        """Make a newly generated media file visible to other decks."""
+        if self._media_index is not None and path.exists():
+            self._media_index.register(path)
+
     def enrich_with_media(self, domain_model: MediaGenerationCapable) -> dict[str, Any]:
         """Enrich domain model with media using its domain expertise.
 
@@ -119,15 +279,22 @@ class StandardMediaEnricher(MediaEnricherProtocol, MediaEnricherBase):
                     audio_filename = f"{audio_hash}.mp3"
                     audio_path = self._audio_base_path / audio_filename
 
-                    if not audio_path.exists():
+                    if not self._media_exists(audio_path):
+                        if self._media_queue is not None:
+                            self._media_queue.enqueue_audio(audio_text, audio_path)
+                            self._deferred_count += 1
+                            logger.debug(f"Deferred {audio_field}: {audio_path}")
+                            continue
                         logger.debug(f"Generating {audio_field}: {audio_text[:50]}...")
                         generated_path = self._audio_service.generate_audio(audio_text)
                         logger.info(f"Generated {audio_field}: {generated_path}")
+                        self._register_media(audio_path)
                     else:
                         logger.debug(f"{audio_field} exists: {audio_path}")
 
                     media_data[audio_field] = audio_filename
         except Exception as e:
+            self._failed_count += 1
             logger.warning(f"Audio generation failed for {model_name}: {e}")
 
         # Generate image using domain model's image strategy
@@ -142,9 +309,11 @@ class StandardMediaEnricher(MediaEnricherProtocol, MediaEnricherBase):
             logger.info(f"[DEBUG] image_filename: {image_filename}")
             logger.info(f"[DEBUG] image_path: {image_path}")
 
-            if image_path.exists():
+            if self._media_exists(image_path):
                 logger.debug(f"Image exists: {image_path}")
                 media_data["image"] = image_filename
+            elif self._media_queue is not None:
+                self._defer_image(self._media_queue, domain_model, image_path)
             else:
                 # Image doesn't exist - now use domain model's image strategy
                 image_strategy = domain_model.get_image_search_strategy(
@@ -159,18 +328,39 @@ class StandardMediaEnricher(MediaEnricherProtocol, MediaEnricherBase):
                         )
                         if success:
                             logger.info(f"Generated image: {image_path}")
+                            self._register_media(image_path)
                             media_data["image"] = image_filename
                         else:
+                            self._failed_count += 1
                             logger.warning(f"Image generation failed: {search_query}")
                     else:
                         logger.debug(f"No search query generated for {model_name}")
                 else:
                     logger.debug(f"No image strategy available for {model_name}")  # type: ignore[unreachable]
         except Exception as e:
+            self._failed_count += 1
             logger.warning(f"Image generation failed for {model_name}: {e}")
 
         return media_data
 
+    def _defer_image(
+        self,
+        media_queue: MediaJobQueue,
+        domain_model: MediaGenerationCapable,
+        image_path: Path,
+    ) -> None:
+        """Queue an image, keeping the model's search context for later."""
+        recorder = DeferredImageQuery()
+        query = domain_model.get_image_search_strategy(recorder)()
+        if recorder.context is not None:
+            media_queue.enqueue_image(image_path, context=recorder.context)
+        elif query:
+            media_queue.enqueue_image(image_path, query=query)
+        else:
+            return
+        self._deferred_count += 1
+        logger.debug(f"Deferred image: {image_path}")
+
     def enrich_records(
         self, records: list[dict[str, Any]], domain_models: list[MediaGenerationCapable]
     ) -> list[dict[str, Any]]:
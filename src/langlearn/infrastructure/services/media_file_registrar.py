@@ -6,6 +6,7 @@ It maintains clean separation between card formatting and infrastructure concern
 
 import logging
 import re
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +14,9 @@ from langlearn.infrastructure.backends.base import DeckBackend
 
 logger = logging.getLogger(__name__)
 
+# Groups: everything up to the filename, the filename, and the closing quote
+IMAGE_SOURCE_PATTERN = re.compile(r'(<img[^>]+src=[\'"])([^>\'"]+)([\'"])')
+
 
 class MediaFileRegistrar:
     """Registers media files with the backend for APKG export.
@@ -39,12 +43,49 @@ class MediaFileRegistrar:
         self._audio_base_path = audio_base_path
         self._image_base_path = image_base_path
         self._registered_files: set[str] = set()  # Track to avoid duplicates
+        # Processed copies packaged instead of the source files, by filename
+        self._processed_paths: dict[str, Path] = {}
+        self._renamed: dict[str, str] = {}
 
         logger.debug(
             f"MediaFileRegistrar initialized with audio_path={audio_base_path}, "
             f"image_path={image_base_path}"
         )
 
+    def use_processed_media(self, outputs: Mapping[str, Path]) -> None:
+        """Package processed copies instead of the deck's source files.
+
+        Args:
+            outputs: Processed file by source filename; a copy re-encoded to
+                another format has a different name, and image references
+                are rewritten to it by rewrite_references
+        """
+        for filename, path in outputs.items():
+            self._processed_paths[path.name] = path
+            if path.name != filename:
+                self._renamed[filename] = path.name
+
+    def rewrite_references(self, field_values: list[str]) -> list[str]:
+        """Point image references at renamed processed copies.
+
+        Args:
+            field_values: Card field values
+
+        Returns:
+            The field values, with ``<img src>`` of renamed images replaced
+        """
+        if not self._renamed:
+            return field_values
+
+        def rename(match: re.Match[str]) -> str:
+            filename = self._renamed.get(match.group(2), match.group(2))
+            return f"{match.group(1)}{filename}{match.group(3)}"
+
+        return [
+            IMAGE_SOURCE_PATTERN.sub(rename, value) if value else value
+            for value in field_values
+        ]
+
     def register_card_media(self, field_values: list[str], backend: DeckBackend) -> int:
         """Extract and register all media files referenced in card fields.
 
@@ -170,7 +211,9 @@ class MediaFileRegistrar:
         if filename in self._registered_files:
             return False  # Already registered
 
-        file_path = self._audio_base_path / filename
+        file_path = self._processed_paths.get(
+            filename, self._audio_base_path / filename
+        )
 
         if not file_path.exists():
             logger.warning(f"Audio file not found: {file_path}")
@@ -198,7 +241,9 @@ class MediaFileRegistrar:
         if filename in self._registered_files:
             return False  # Already registered
 
-        file_path = self._image_base_path / filename
+        file_path = self._processed_paths.get(
+            filename, self._image_base_path / filename
+        )
 
         if not file_path.exists():
             logger.warning(f"Image file not found: {file_path}")
@@ -0,0 +1,108 @@
+"""Shared index of generated media files across deck directories.
+
+Media filenames are content addressed (``<md5 of text>.mp3`` for audio,
+``<word>.jpg`` for images), so a file generated for one deck of a language is
+valid for every other deck of that language. The index lets a deck reuse a
+sibling deck's file instead of calling AWS Polly, Anthropic or Pexels again.
+"""
+
+import logging
+import shutil
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class MediaIndex:
+    """Thread-safe filename index over several media directories.
+
+    Example:
+        ```python
+        index = MediaIndex()
+        index.add_directory(Path("languages/german/default/audio"))
+        if index.restore(Path("languages/german/a1/audio/3f2a....mp3")):
+            ...  # copied from the default deck, no Polly call needed
+        ```
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._files: dict[str, Path] = {}
+        self._directories: set[Path] = set()
+        self._lock = threading.Lock()
+        self._reused = 0
+
+    def add_directory(self, directory: Path) -> int:
+        """Index every file in a media directory.
+
+        Directories already indexed are skipped. Earlier directories win when
+        two contain the same filename.
+
+        Args:
+            directory: Media directory to scan
+
+        Returns:
+            Number of newly indexed files
+        """
+        directory = directory.resolve()
+        with self._lock:
+            if directory in self._directories:
+                return 0
+            self._directories.add(directory)
+        if not directory.is_dir():
+            return 0
+
+        added = 0
+        with self._lock:
+            for path in directory.iterdir():
+                if path.is_file() and path.name not in self._files:
+                    self._files[path.name] = path
+                    added += 1
+        logger.debug(f"Indexed {added} media files from {directory}")
+        return added
+
+    def register(self, path: Path) -> None:
+        """Record a newly generated file so later decks can reuse it.
+
+        Args:
+            path: Media file that now exists on disk
+        """
+        with self._lock:
+            self._files.setdefault(path.name, path.resolve())
+
+    def restore(self, path: Path) -> bool:
+        """Make a media file available at path, copying a sibling if indexed.
+
+        Args:
+            path: Where the enricher expects the media file
+
+        Returns:
+            True if the file exists at path afterwards
+        """
+        if path.exists():
+            return True
+        with self._lock:
+            source = self._files.get(path.name)
+        if source is None or not source.exists():
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, path)
+        with self._lock:
+            self._reused += 1
+        logger.debug(f"Reused media file {source} for {path}")
+        return True
+
+    @property
+    def reused_count(self) -> int:
+        """Number of files copied from sibling directories."""
+        return self._reused
+
+    def __len__(self) -> int:
+        """Return the number of indexed filenames."""
+        return len(self._files)
+
+    def __contains__(self, filename: object) -> bool:
+        """Return True if a file with this name is indexed."""
+        return filename in self._files
@@ -0,0 +1,257 @@
+"""Shared machinery for stages that post-process a deck's media files.
+
+Image and audio post-processing both re-encode a deck's media after
+generation, lossily, so the files under ``languages/`` are never touched:
+``process_to_cache`` writes each processed file to a ``ProcessedMediaCache``
+and the deck is packaged from there. Outputs are keyed by the source's
+content hash and the configuration:
+
+- a source processed before under the same configuration, by this deck or
+  any other, is reused without work
+- sources with identical content are processed once
+- changing the configuration processes the untouched sources again instead
+  of re-encoding already degraded output
+
+Cached files keep the source's filename, so card references stay valid,
+unless the output format needs another extension (a PNG re-encoded as
+JPEG); ``MediaProcessingReport.outputs`` maps every source name to the file
+to package.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from langlearn.exceptions import MediaGenerationError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MediaProcessingResult:
+    """Outcome for one media file."""
+
+    path: Path
+    original_bytes: int
+    processed_bytes: int
+    cached: bool = False
+    error: str | None = None
+    output: Path | None = None
+
+    @property
+    def bytes_saved(self) -> int:
+        """Return bytes saved for this file."""
+        return self.original_bytes - self.processed_bytes
+
+
+@dataclass
+class MediaProcessingReport:
+    """Per-file results, totals and wall time for one run."""
+
+    results: list[MediaProcessingResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def original_bytes(self) -> int:
+        """Return the total size before processing."""
+        return sum(result.original_bytes for result in self.results)
+
+    @property
+    def processed_bytes(self) -> int:
+        """Return the total size after processing."""
+        return sum(result.processed_bytes for result in self.results)
+
+    @property
+    def bytes_saved(self) -> int:
+        """Return total bytes saved."""
+        return self.original_bytes - self.processed_bytes
+
+    @property
+    def processed(self) -> list[MediaProcessingResult]:
+        """Return files rewritten in this run."""
+        return [r for r in self.results if not r.cached and r.error is None]
+
+    @property
+    def failed(self) -> list[MediaProcessingResult]:
+        """Return files that could not be processed."""
+        return [r for r in self.results if r.error is not None]
+
+    @property
+    def outputs(self) -> dict[str, Path]:
+        """Return the processed file to package by source filename."""
+        return {r.path.name: r.output for r in self.results if r.output is not None}
+
+    def as_stats(self) -> dict[str, Any]:
+        """Return totals for statistics reports."""
+        return {
+            "files": len(self.results),
+            "processed": len(self.processed),
+            "failed": len(self.failed),
+            "original_bytes": self.original_bytes,
+            "processed_bytes": self.processed_bytes,
+            "bytes_saved": self.bytes_saved,
+            "seconds": round(self.seconds, 3),
+        }
+
+
+def file_sha256(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def link_or_copy(source: Path, target: Path) -> None:
+    """Hard-link a file, copying it if linking is not possible.
+
+    Args:
+        source: Existing file
+        target: New path; an existing file there is replaced
+    """
+    target.unlink(missing_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def temporary_path(target: Path) -> Path:
+    """Return a hidden path next to target, unique to this writer."""
+    return target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+
+
+class ProcessedMediaCache:
+    """Processed media files keyed by source content and configuration.
+
+    Layout: ``<root>/<config hash>/<source hash>/<filename>``. The files in
+    one source directory are links to the same output under the names the
+    source has in different decks.
+    """
+
+    def __init__(
+        self, root: Path, config: Mapping[str, Any], suffixes: tuple[str, ...]
+    ) -> None:
+        """Initialize the cache for one configuration.
+
+        Args:
+            root: Cache directory of one media type
+            config: Configuration the outputs are produced with
+            suffixes: Extensions matching the output format, preferred
+                first; other extensions are replaced by the first
+        """
+        config_json = json.dumps(dict(config), sort_keys=True)
+        digest = hashlib.sha256(config_json.encode()).hexdigest()[:16]
+        self.directory = root / digest
+        self._config_json = config_json
+        self._suffixes = suffixes
+
+    def output_name(self, source_name: str) -> str:
+        """Return the filename of the processed source."""
+        path = Path(source_name)
+        if path.suffix.lower() in self._suffixes:
+            return source_name
+        return path.with_suffix(self._suffixes[0]).name
+
+    def output_path(self, source_digest: str, source_name: str) -> Path:
+        """Return where the processed source is written, creating its folder."""
+        directory = self.directory / source_digest
+        if not directory.is_dir():
+            directory.mkdir(parents=True, exist_ok=True)
+            config_path = self.directory / "config.json"
+            if not config_path.exists():
+                config_path.write_text(self._config_json, encoding="utf-8")
+        return directory / self.output_name(source_name)
+
+    def lookup(self, source_digest: str, source_name: str) -> Path | None:
+        """Return the processed source under its name, if it was processed.
+
+        An output stored under another name is linked to this one.
+        """
+        directory = self.directory / source_digest
+        target = directory / self.output_name(source_name)
+        if target.exists():
+            return target
+        if not directory.is_dir():
+            return None
+        for existing in directory.iterdir():
+            if not existing.name.startswith("."):
+                link_or_copy(existing, target)
+                return target
+        return None
+
+
+def process_to_cache(
+    paths: list[Path],
+    cache: ProcessedMediaCache,
+    process: Callable[[Path, Path], int],
+    executor: Executor,
+) -> MediaProcessingReport:
+    """Process files that are not yet cached, in parallel.
+
+    Source files are only read.
+
+    Args:
+        paths: Files to process
+        cache: Outputs of earlier runs; new outputs are added
+        process: Writes the processed source (first argument) to the target
+            path (second argument) and returns the output size; raises
+            MediaGenerationError on failure. Must be picklable for process
+            pools.
+        executor: Pool the processing runs in
+
+    Returns:
+        MediaProcessingReport with one result per path; failed files have
+        no output and are packaged unprocessed
+    """
+    start = time.perf_counter()
+    report = MediaProcessingReport()
+    pending: dict[str, list[MediaProcessingResult]] = {}
+    for path in paths:
+        size = path.stat().st_size
+        digest = file_sha256(path)
+        output = cache.lookup(digest, path.name)
+        if output is not None:
+            report.results.append(
+                MediaProcessingResult(
+                    path, size, output.stat().st_size, cached=True, output=output
+                )
+            )
+            continue
+        pending.setdefault(digest, []).append(MediaProcessingResult(path, size, 0))
+
+    with executor:
+        futures = {
+            digest: executor.submit(
+                process,
+                results[0].path,
+                cache.output_path(digest, results[0].path.name),
+            )
+            for digest, results in pending.items()
+        }
+        for digest, results in pending.items():
+            try:
+                processed_bytes = futures[digest].result()
+            except MediaGenerationError as e:
+                logger.warning(str(e))
+                for result in results:
+                    result.processed_bytes = result.original_bytes
+                    result.error = str(e)
+            else:
+                for result in results:
+                    result.processed_bytes = processed_bytes
+                    result.output = cache.lookup(digest, result.path.name)
+            report.results.extend(results)
+
+    report.seconds = time.perf_counter() - start
+    return report
@@ -0,0 +1,468 @@
+"""Persistent queue of media generation deferred from deck builds.
+
+A deck build normally waits for every Polly, Anthropic and Pexels call. With
+a ``MediaJobQueue`` the media enricher instead records missing audio and
+images as jobs and the build continues, so the deck is exported at once with
+the media that already exists. A ``MediaBackfillWorker`` drains the queue
+later, in another process or on a schedule, and the next build picks the new
+files up because they are found on disk.
+
+The queue is a SQLite database, so it survives restarts and several worker
+processes can share it. Jobs are keyed by their target file: enqueueing a
+file twice is a no-op while the first job is pending. A claimed job that is
+not finished within the lease (its worker died) is handed out again.
+"""
+
+import json
+import logging
+import shutil
+import sqlite3
+import threading
+import time
+from collections.abc import Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from langlearn.exceptions import (
+    CircuitOpenError,
+    ConfigurationError,
+    MediaGenerationError,
+)
+from langlearn.infrastructure.services.ai_service import AnthropicService
+from langlearn.infrastructure.services.audio_service import AudioService
+from langlearn.infrastructure.services.image_service import PexelsService
+
+logger = logging.getLogger(__name__)
+
+AUDIO_JOB = "audio"
+IMAGE_JOB = "image"
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_LEASE_SECONDS = 600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS media_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    target TEXT NOT NULL UNIQUE,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True)
+class MediaJob:
+    """A media file to generate.
+
+    Audio jobs carry the ``text`` to speak. Image jobs carry the domain
+    model's search ``context`` for Anthropic, or a ready ``query``.
+    """
+
+    id: int
+    kind: str
+    target: Path
+    payload: dict[str, str]
+    attempts: int
+
+
+@dataclass
+class BackfillReport:
+    """Outcome of draining a media queue."""
+
+    done: int = 0
+    retried: int = 0
+    failed: int = 0
+    postponed: int = 0
+    seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+
+class MediaJobQueue:
+    """SQLite-backed queue of deferred media jobs."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    ) -> None:
+        """Open the queue, creating the database if needed.
+
+        Args:
+            path: SQLite database file
+            max_attempts: Attempts before a job is marked failed
+            lease_seconds: Time after which a claimed, unfinished job is
+                handed out again
+
+        Raises:
+            ConfigurationError: If max_attempts or lease_seconds is not
+                positive
+        """
+        if max_attempts < 1:
+            raise ConfigurationError(
+                f"max_attempts must be positive, got {max_attempts}"
+            )
+        if lease_seconds <= 0:
+            raise ConfigurationError(
+                f"lease_seconds must be positive, got {lease_seconds}"
+            )
+        self._path = Path(path)
+        self._max_attempts = max_attempts
+        self._lease_seconds = lease_seconds
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(_SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        """Return the database file."""
+        return self._path
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived autocommit connection; safe across threads."""
+        db = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def enqueue(self, kind: str, target: Path, payload: dict[str, str]) -> bool:
+        """Add a job unless one for the target is already queued.
+
+        A finished or failed job for the target is queued again, since a
+        build only asks for files that are missing.
+
+        Args:
+            kind: AUDIO_JOB or IMAGE_JOB
+            target: File the job creates
+            payload: Inputs of the job
+
+        Returns:
+            True if the job is newly pending
+        """
+        with self._connect() as db:
+            cursor = db.execute(
+                "INSERT INTO media_jobs (kind, target, payload, status, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(target) DO UPDATE SET "
+                "kind = excluded.kind, payload = excluded.payload, "
+                "status = excluded.status, attempts = 0, last_error = NULL, "
+                "updated_at = excluded.updated_at "
+                "WHERE media_jobs.status IN (?, ?)",
+                (
+                    kind,
+                    str(target),
+                    json.dumps(payload, ensure_ascii=False),
+                    PENDING,
+                    time.time(),
+                    DONE,
+                    FAILED,
+                ),
+            )
+            return cursor.rowcount > 0
+
+    def enqueue_audio(self, text: str, target: Path) -> bool:
+        """Queue speech synthesis of text into target."""
+        return self.enqueue(AUDIO_JOB, target, {"text": text})
+
+    def enqueue_image(
+        self, target: Path, context: str | None = None, query: str | None = None
+    ) -> bool:
+        """Queue an image download into target.
+
+        Args:
+            target: Image file to create
+            context: Search context for Anthropic to turn into a query
+            query: Pexels query to use as is
+
+        Returns:
+            True if the job is newly pending
+
+        Raises:
+            ValueError: If neither context nor query is given
+        """
+        if context is not None:
+            return self.enqueue(IMAGE_JOB, target, {"context": context})
+        if query is not None:
+            return self.enqueue(IMAGE_JOB, target, {"query": query})
+        raise ValueError("An image job needs a context or a query")
+
+    def claim(self, exclude_kinds: Collection[str] = ()) -> MediaJob | None:
+        """Take the oldest pending job, or one whose lease has expired.
+
+        Args:
+            exclude_kinds: Job kinds to leave in the queue, e.g. those whose
+                provider is unavailable
+
+        Returns:
+            The job, now running, or None if there is nothing to do
+        """
+        now = time.time()
+        excluded = ", ".join("?" for _ in exclude_kinds)
+        kind_filter = f"AND kind NOT IN ({excluded}) " if exclude_kinds else ""
+        with self._connect() as db:
+            row = db.execute(
+                "UPDATE media_jobs SET status = ?, attempts = attempts + 1, "
+                "updated_at = ? WHERE id = ("
+                "SELECT id FROM media_jobs WHERE (status = ? "
+                f"OR (status = ? AND updated_at < ?)) {kind_filter}"
+                "ORDER BY id LIMIT 1"
+                ") RETURNING id, kind, target, payload, attempts",
+                (
+                    RUNNING,
+                    now,
+                    PENDING,
+                    RUNNING,
+                    now - self._lease_seconds,
+                    *exclude_kinds,
+                ),
+            ).fetchone()
+        if row is None:
+            return None
+        return MediaJob(
+            id=row[0],
+            kind=row[1],
+            target=Path(row[2]),
+            payload=json.loads(row[3]),
+            attempts=row[4],
+        )
+
+    def complete(self, job: MediaJob) -> None:
+        """Mark a job done."""
+        self._set_status(job, DONE, None)
+
+    def fail(self, job: MediaJob, error: str) -> bool:
+        """Record a failed attempt.
+
+        Args:
+            job: The claimed job
+            error: Why the attempt failed
+
+        Returns:
+            True if the job will be retried, False if it is now failed
+        """
+        retry = job.attempts < self._max_attempts
+        self._set_status(job, PENDING if retry else FAILED, error)
+        return retry
+
+    def release(self, job: MediaJob) -> None:
+        """Return a claimed job to the queue without counting the attempt."""
+        with self._connect() as db:
+            db.execute(
+                "UPDATE media_jobs SET status = ?, attempts = attempts - 1, "
+                "updated_at = ? WHERE id = ?",
+                (PENDING, time.time(), job.id),
+            )
+
+    def _set_status(self, job: MediaJob, status: str, error: str | None) -> None:
+        with self._connect() as db:
+            db.execute(
+                "UPDATE media_jobs SET status = ?, last_error = ?, updated_at = ? "
+                "WHERE id = ?",
+                (status, error, time.time(), job.id),
+            )
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of jobs in each status."""
+        counts = dict.fromkeys((PENDING, RUNNING, DONE, FAILED), 0)
+        with self._connect() as db:
+            for status, count in db.execute(
+                "SELECT status, COUNT(*) FROM media_jobs GROUP BY status"
+            ):
+                counts[status] = count
+        return counts
+
+    def purge_done(self) -> int:
+        """Delete finished jobs and return how many were removed."""
+        with self._connect() as db:
+            return db.execute(
+                "DELETE FROM media_jobs WHERE status = ?", (DONE,)
+            ).rowcount
+
+
+class DeferredImageQuery:
+    """Stand-in AI service that captures an image search context.
+
+    Passed to a domain model's image search strategy while deferring, so
+    the context the model builds is stored in the job and Anthropic is only
+    called when the job runs.
+    """
+
+    PLACEHOLDER = "deferred image query"
+
+    def __init__(self) -> None:
+        """Initialize with no captured context."""
+        self.context: str | None = None
+
+    def generate_image_query(self, context: Any) -> str:
+        """Capture the context and return a placeholder query."""
+        self.context = str(context)
+        return self.PLACEHOLDER
+
+
+class MediaBackfillWorker:
+    """Generate the media of queued jobs.
+
+    Example:
+        ```python
+        worker = MediaBackfillWorker(queue, audio, pexels, anthropic)
+        report = worker.drain(workers=4)
+        print(f"{report.done} files generated")
+        ```
+    """
+
+    def __init__(
+        self,
+        queue: MediaJobQueue,
+        audio_service: AudioService,
+        pexels_service: PexelsService,
+        anthropic_service: AnthropicService | None,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            queue: Queue to drain
+            audio_service: Service for audio jobs
+            pexels_service: Service for image downloads
+            anthropic_service: Service turning image contexts into queries;
+                None fails jobs that need one
+        """
+        self._queue = queue
+        self._audio_service = audio_service
+        self._pexels_service = pexels_service
+        self._anthropic_service = anthropic_service
+        self._lock = threading.Lock()
+        self._unavailable: set[str] = set()
+
+    def process(self, job: MediaJob) -> None:
+        """Generate the file of one job.
+
+        Args:
+            job: Claimed job
+
+        Raises:
+            MediaGenerationError: If the file could not be generated
+        """
+        job.target.parent.mkdir(parents=True, exist_ok=True)
+        if job.kind == AUDIO_JOB:
+            generated = Path(self._audio_service.generate_audio(job.payload["text"]))
+            if generated != job.target:
+                shutil.copyfile(generated, job.target)
+        elif job.kind == IMAGE_JOB:
+            query = job.payload.get("query") or self._image_query(job)
+            if not self._pexels_service.download_image(query, str(job.target)):
+                raise MediaGenerationError(f"No image downloaded for {query!r}")
+        else:
+            raise MediaGenerationError(f"Unknown media job kind: {job.kind}")
+        if not job.target.exists():
+            raise MediaGenerationError(f"Job did not create {job.target}")
+
+    def _image_query(self, job: MediaJob) -> str:
+        if self._anthropic_service is None:
+            raise MediaGenerationError("Image job needs the Anthropic service")
+        query = self._anthropic_service.generate_image_query(job.payload["context"])
+        if not query or not query.strip():
+            raise MediaGenerationError("Empty image search query")
+        return query.strip()
+
+    def run_once(self, report: BackfillReport) -> bool:
+        """Claim and process one job, recording the outcome.
+
+        Args:
+            report: Report to update
+
+        Returns:
+            False if the queue had no job to claim
+        """
+        with self._lock:
+            unavailable = set(self._unavailable)
+        job = self._queue.claim(exclude_kinds=unavailable)
+        if job is None:
+            return False
+        try:
+            self.process(job)
+        except CircuitOpenError as e:
+            # The provider is failing fast; keep its jobs for a later drain
+            # instead of burning their attempts
+            self._queue.release(job)
+            with self._lock:
+                self._unavailable.add(job.kind)
+                report.postponed += 1
+            logger.warning(f"Postponing {job.kind} jobs: {e}")
+        except Exception as e:
+            error = f"{job.target.name}: {e}"
+            logger.warning(f"Media job {job.id} failed: {error}")
+            retry = self._queue.fail(job, str(e))
+            with self._lock:
+                if retry:
+                    report.retried += 1
+                else:
+                    report.failed += 1
+                    report.errors.append(error)
+        else:
+            self._queue.complete(job)
+            with self._lock:
+                report.done += 1
+            logger.info(f"Backfilled {job.kind} {job.target}")
+        return True
+
+    def drain(self, workers: int = 1, max_jobs: int | None = None) -> BackfillReport:
+        """Process jobs until the queue is empty.
+
+        Failed attempts go back to the queue until max_attempts is reached;
+        they are picked up again in the same drain. Once a provider's
+        circuit is open, the remaining jobs of that kind are left pending
+        for a later drain.
+
+        Args:
+            workers: Threads processing jobs concurrently
+            max_jobs: Stop after this many attempts in total
+
+        Returns:
+            BackfillReport of the drain
+        """
+        if workers < 1:
+            raise ConfigurationError(f"workers must be positive, got {workers}")
+        report = BackfillReport()
+        start = time.perf_counter()
+        remaining = [max_jobs]
+        with self._lock:
+            self._unavailable.clear()
+
+        def take() -> bool:
+            with self._lock:
+                if remaining[0] is None:
+                    return True
+                if remaining[0] <= 0:
+                    return False
+                remaining[0] -= 1
+                return True
+
+        def work() -> None:
+            while take() and self.run_once(report):
+                pass
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(work) for _ in range(workers)]:
+                future.result()
+        report.seconds = time.perf_counter() - start
+        logger.info(
+            f"Backfill finished: {report.done} done, {report.retried} retried, "
+            f"{report.failed} failed, {report.postponed} postponed "
+            f"in {report.seconds:.2f}s"
+        )
+        return report
@@ -0,0 +1,378 @@
+"""Circuit breakers, deadlines and hedged calls for external media providers.
+
+A provider that degrades (Pexels answering 429 for minutes, Polly timing
+out) should not stall a build: without protection every record waits
+through the full retry schedule before giving up. ``ProviderGuard`` wraps
+the calls to one provider with:
+
+- a ``CircuitBreaker`` that opens after consecutive failures, so further
+  calls fail at once with ``CircuitOpenError``, and lets a single probe
+  through once ``reset_seconds`` have passed (half-open);
+- an optional per-call ``Deadline`` covering all attempts and backoff
+  sleeps of one logical call;
+- optional hedging: if an attempt is still running after
+  ``hedge_after_seconds``, a second identical attempt is started and the
+  first one to succeed wins.
+
+One guard is meant to be shared by every service talking to the same
+provider, so a Polly outage seen by one deck opens the circuit for all.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from langlearn.exceptions import (
+    CircuitOpenError,
+    ConfigurationError,
+    DeadlineExceededError,
+)
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Hedged and deadline-bound attempts run on this many shared threads; attempts
+# abandoned at a deadline finish in the background
+HEDGE_WORKERS = 32
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=HEDGE_WORKERS, thread_name_prefix="provider-call"
+            )
+        return _executor
+
+
+@dataclass(frozen=True)
+class CallPolicy:
+    """How calls to one external provider are protected.
+
+    Attributes:
+        failure_threshold: Consecutive failures that open the circuit
+        reset_seconds: Time an open circuit waits before a probe call
+        deadline_seconds: Budget of one call including retries and backoff;
+            None waits as long as the provider's own retries take
+        hedge_after_seconds: Start a second attempt if the first has not
+            finished after this long; None never hedges
+    """
+
+    failure_threshold: int = 5
+    reset_seconds: float = 30.0
+    deadline_seconds: float | None = None
+    hedge_after_seconds: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the policy."""
+        if self.failure_threshold < 1:
+            raise ConfigurationError(
+                f"failure_threshold must be positive, got {self.failure_threshold}"
+            )
+        if self.reset_seconds < 0:
+            raise ConfigurationError(
+                f"reset_seconds must not be negative, got {self.reset_seconds}"
+            )
+        for name in ("deadline_seconds", "hedge_after_seconds"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ConfigurationError(f"{name} must be positive, got {value}")
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probes.
+
+    Closed: calls go through; ``failure_threshold`` failures in a row open
+    the circuit. Open: calls are rejected until ``reset_seconds`` have
+    passed. Half-open: one probe call goes through at a time; its success
+    closes the circuit, its failure opens it again.
+
+    All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            name: Provider name used in errors and logs
+            failure_threshold: Consecutive failures that open the circuit
+            reset_seconds: Time before an open circuit allows a probe
+            clock: Monotonic time source, replaceable in tests
+        """
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._trips = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Return CLOSED, OPEN or HALF_OPEN."""
+        with self._lock:
+            return self._current_state()
+
+    @property
+    def trips(self) -> int:
+        """Return how often the circuit has opened."""
+        return self._trips
+
+    def _current_state(self) -> str:
+        if (
+            self._state == OPEN
+            and self._clock() - self._opened_at >= self._reset_seconds
+        ):
+            self._state = HALF_OPEN
+            self._probing = False
+        return self._state
+
+    def before_call(self) -> None:
+        """Admit a call or reject it.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                probe already in flight
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                logger.info(f"Circuit for {self.name} half-open, probing")
+                return
+            retry_in = max(self._reset_seconds - (self._clock() - self._opened_at), 0)
+        raise CircuitOpenError(
+            f"Circuit for {self.name} is open; retry in {retry_in:.0f}s"
+        )
+
+    def record_success(self) -> None:
+        """Record a successful call; closes a half-open circuit."""
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"Circuit for {self.name} closed")
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a failed call; may open the circuit."""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self._failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._probing = False
+                self._trips += 1
+                logger.warning(
+                    f"Circuit for {self.name} opened after {self._failures} "
+                    f"consecutive failures"
+                )
+
+
+class Deadline:
+    """Time budget of one logical call, shared by its attempts."""
+
+    def __init__(self, seconds: float | None) -> None:
+        """Start the deadline.
+
+        Args:
+            seconds: Budget from now; None never expires
+        """
+        self.seconds = seconds
+        self._expires_at = None if seconds is None else time.monotonic() + seconds
+
+    def remaining(self) -> float | None:
+        """Return the seconds left (never negative), or None if unbounded."""
+        if self._expires_at is None:
+            return None
+        return max(self._expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        """Return True once the budget is spent."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def allows(self, seconds: float) -> bool:
+        """Return True if waiting this long still ends before the deadline."""
+        remaining = self.remaining()
+        return remaining is None or seconds < remaining
+
+
+def _discard_when_done[T](future: Future[T], discard: Callable[[T], None]) -> None:
+    """Hand the result of an abandoned attempt to discard once it succeeds."""
+
+    def release(finished: Future[T]) -> None:
+        if finished.cancelled() or finished.exception() is not None:
+            return
+        try:
+            discard(finished.result())
+        except Exception as e:
+            logger.debug(f"Discarding an abandoned result failed: {e}")
+
+    future.add_done_callback(release)
+
+
+def hedged_call[T](
+    function: Callable[[], T],
+    hedge_after: float | None = None,
+    deadline: Deadline | None = None,
+    discard: Callable[[T], None] | None = None,
+) -> T:
+    """Call a function, hedging slow attempts and enforcing a deadline.
+
+    Without hedging or a deadline the function runs in the calling thread.
+    Otherwise attempts run on a shared thread pool: if the first attempt is
+    still running after ``hedge_after`` seconds a second one starts, and the
+    first success is returned. An attempt that fails before the hedge is
+    due fails the call; retrying is up to the caller.
+
+    Results of the attempts that lose, or that are abandoned at the
+    deadline, are passed to ``discard`` when they arrive, so responses
+    holding open streams or connections can be released.
+
+    Args:
+        function: Idempotent call to make
+        hedge_after: Seconds before a second attempt starts; None never
+        deadline: Deadline for the call; None waits indefinitely
+        discard: Releases the result of an attempt that is not returned
+
+    Returns:
+        The result of the first successful attempt
+
+    Raises:
+        DeadlineExceededError: If no attempt finished before the deadline
+        Exception: The error of the last failed attempt
+    """
+    if hedge_after is None and (deadline is None or deadline.seconds is None):
+        return function()
+    deadline = deadline or Deadline(None)
+    executor = _shared_executor()
+    attempts: set[Future[T]] = {executor.submit(function)}
+    hedge_at = None if hedge_after is None else time.monotonic() + hedge_after
+    while True:
+        timeout = deadline.remaining()
+        if hedge_at is not None:
+            until_hedge = max(hedge_at - time.monotonic(), 0.0)
+            timeout = until_hedge if timeout is None else min(timeout, until_hedge)
+        done, attempts = wait(attempts, timeout=timeout, return_when=FIRST_COMPLETED)
+        # Several attempts can finish together; any success beats a failure
+        winner = next((future for future in done if future.exception() is None), None)
+        if winner is not None:
+            if discard is not None:
+                for future in (done | attempts) - {winner}:
+                    _discard_when_done(future, discard)
+            return winner.result()
+        for future in done:
+            error = future.exception()
+            if error is not None and not attempts:
+                raise error
+        if done:
+            continue
+        if deadline.expired:
+            if discard is not None:
+                for future in attempts:
+                    _discard_when_done(future, discard)
+            raise DeadlineExceededError(
+                f"No response within the {deadline.seconds}s deadline"
+            )
+        if hedge_at is not None:
+            logger.debug(f"Hedging call still running after {hedge_after}s")
+            attempts.add(executor.submit(function))
+            hedge_at = None
+
+
+class ProviderGuard:
+    """Circuit breaker, deadline and hedging for calls to one provider.
+
+    Example:
+        ```python
+        guard = ProviderGuard("polly", CallPolicy(hedge_after_seconds=2.0))
+        response = guard.call(lambda: client.synthesize_speech(**params))
+        ```
+    """
+
+    def __init__(self, name: str, policy: CallPolicy | None = None) -> None:
+        """Initialize the guard.
+
+        Args:
+            name: Provider name used in errors and logs
+            policy: Protection settings; defaults to CallPolicy()
+        """
+        self.name = name
+        self.policy = policy or CallPolicy()
+        self.breaker = CircuitBreaker(
+            name,
+            failure_threshold=self.policy.failure_threshold,
+            reset_seconds=self.policy.reset_seconds,
+        )
+
+    def deadline(self) -> Deadline:
+        """Start a deadline for one logical call under this policy."""
+        return Deadline(self.policy.deadline_seconds)
+
+    def call[T](
+        self,
+        function: Callable[[], T],
+        deadline: Deadline | None = None,
+        is_failure: Callable[[Exception], bool] | None = None,
+        discard: Callable[[T], None] | None = None,
+    ) -> T:
+        """Make one attempt through the circuit breaker.
+
+        Args:
+            function: Idempotent call to make
+            deadline: Deadline shared with the caller's other attempts; a
+                new one is started if omitted
+            is_failure: Decides whether an error counts against the
+                provider; client errors such as a 404 should not open the
+                circuit. Every error counts if omitted.
+            discard: Releases results of hedged attempts that lost
+
+        Returns:
+            The function's result
+
+        Raises:
+            CircuitOpenError: If the circuit rejects the call
+            DeadlineExceededError: If the deadline passes first
+            Exception: Whatever the function raised
+        """
+        self.breaker.before_call()
+        try:
+            result = hedged_call(
+                function,
+                hedge_after=self.policy.hedge_after_seconds,
+                deadline=deadline or self.deadline(),
+                discard=discard,
+            )
+        except Exception as e:
+            if is_failure is None or is_failure(e):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise
+        self.breaker.record_success()
+        return result
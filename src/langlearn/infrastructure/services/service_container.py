@@ -41,6 +41,22 @@ class ServiceContainer:
             self._anthropic_service = AnthropicService()
         return self._anthropic_service
 
+    def set_anthropic_service(
+        self, service: AnthropicService | None
+    ) -> AnthropicService | None:
+        """Replace the shared AnthropicService.
+
+        Args:
+            service: Service returned from now on, e.g. a local stand-in;
+                None creates the real service again on next use
+
+        Returns:
+            The replaced service, or None if none was created yet
+        """
+        previous = self._anthropic_service
+        self._anthropic_service = service
+        return previous
+
     def get_audio_service(self) -> "AudioService":
         """Get the shared AudioService instance.
 
@@ -111,6 +127,18 @@ def get_anthropic_service() -> AnthropicService:
     return _container.get_anthropic_service()
 
 
+def set_anthropic_service(service: AnthropicService | None) -> AnthropicService | None:
+    """Replace the AnthropicService returned by get_anthropic_service.
+
+    Args:
+        service: Service to share, or None to restore the default
+
+    Returns:
+        The replaced service, or None if none was created yet
+    """
+    return _container.set_anthropic_service(service)
+
+
 def get_audio_service() -> "AudioService":
     """Factory function to get AudioService instance.
 
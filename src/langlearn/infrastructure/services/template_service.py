@@ -106,15 +106,9 @@ class TemplateService:
             TemplateFiles with loaded content
         """
         # Use template resolver if provided, otherwise fallback to German convention
-        if self._template_resolver:
-            front_filename = self._template_resolver(card_type, "front")
-            back_filename = self._template_resolver(card_type, "back")
-            css_filename = self._template_resolver(card_type, "css")
-        else:
-            # Fallback to German convention for backward compatibility
-            front_filename = f"{card_type}_DE_de_front.html"
-            back_filename = f"{card_type}_DE_de_back.html"
-            css_filename = f"{card_type}_DE_de.css"
+        front_filename, back_filename, css_filename = self._template_filenames(
+            card_type
+        )
 
         front_file = self._template_dir / front_filename
         back_file = self._template_dir / back_filename
@@ -188,6 +182,54 @@ class TemplateService:
         self._cache.clear()
         logger.debug("Template cache cleared")
 
+    def invalidate(self, card_type: str) -> bool:
+        """Drop one card type from the cache so its files are reloaded.
+
+        Args:
+            card_type: Card type whose template changed
+
+        Returns:
+            True if the card type was cached
+        """
+        removed = self._cache.pop(card_type, None) is not None
+        if removed:
+            logger.debug(f"Template cache invalidated for {card_type}")
+        return removed
+
+    def card_types_for_file(self, filename: str) -> list[str]:
+        """Map a template filename to the card types that load it.
+
+        Candidates are the cached card types plus those found in the template
+        directory; each is resolved to its front, back and CSS filenames.
+
+        Args:
+            filename: Name of a file in the template directory
+
+        Returns:
+            Sorted card types using the file; empty if none is known
+        """
+        candidates = set(self._cache) | set(self.get_available_card_types())
+        return sorted(
+            card_type
+            for card_type in candidates
+            if filename in self._template_filenames(card_type)
+        )
+
+    def _template_filenames(self, card_type: str) -> tuple[str, str, str]:
+        """Return the front, back and CSS filenames of a card type."""
+        if self._template_resolver:
+            return (
+                self._template_resolver(card_type, "front"),
+                self._template_resolver(card_type, "back"),
+                self._template_resolver(card_type, "css"),
+            )
+        # Fallback to German convention for backward compatibility
+        return (
+            f"{card_type}_DE_de_front.html",
+            f"{card_type}_DE_de_back.html",
+            f"{card_type}_DE_de.css",
+        )
+
     def get_available_card_types(self) -> list[str]:
         """Get list of available card types based on template files.
 
@@ -230,6 +272,7 @@ class TemplateService:
                 "ExampleAudio",
             ],
             templates=[template],
+            identity_fields=["Noun", "Article", "English"],
         )
 
     def get_adjective_note_type(self) -> NoteType:
@@ -253,6 +296,7 @@ class TemplateService:
                 "ExampleAudio",
             ],
             templates=[template],
+            identity_fields=["Word", "English"],
         )
 
     def get_adverb_note_type(self) -> NoteType:
@@ -275,6 +319,7 @@ class TemplateService:
                 "ExampleAudio",
             ],
             templates=[template],
+            identity_fields=["Word", "English"],
         )
 
     def get_negation_note_type(self) -> NoteType:
@@ -297,4 +342,5 @@ class TemplateService:
                 "ExampleAudio",
             ],
             templates=[template],
+            identity_fields=["Word", "English"],
         )
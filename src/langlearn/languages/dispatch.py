@@ -0,0 +1,41 @@
+"""Memoized dispatch shared by the language implementations."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+
+class NoteTypeDispatch:
+    """Resolve Anki note type names to record types.
+
+    A note type belongs to the first mapping, in mapping order, whose name
+    occurs in the note type's name regardless of case. The scan over the
+    mappings runs once per distinct note type name; every later lookup is a
+    single dict access.
+    """
+
+    def __init__(self, mappings: Mapping[str, str]) -> None:
+        """Initialize the dispatch table.
+
+        Args:
+            mappings: Note type name patterns to record types, in priority
+                order (see Language.get_note_type_mappings)
+        """
+        self._patterns = [
+            (pattern.lower(), record_type) for pattern, record_type in mappings.items()
+        ]
+        self._resolved: dict[str, str | None] = {}
+
+    def record_type(self, note_type_name: str) -> str | None:
+        """Return the record type of a note type, or None if none matches."""
+        try:
+            return self._resolved[note_type_name]
+        except KeyError:
+            pass
+        lowered = note_type_name.lower()
+        record_type = next(
+            (rec_type for pattern, rec_type in self._patterns if pattern in lowered),
+            None,
+        )
+        self._resolved[note_type_name] = record_type
+        return record_type
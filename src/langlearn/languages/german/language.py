@@ -7,8 +7,11 @@ from typing import TYPE_CHECKING, Any
 
 from langlearn.core.protocols.language_protocol import Language
 from langlearn.core.protocols.tts_protocol import TTSConfig
+from langlearn.languages.dispatch import NoteTypeDispatch
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from langlearn.core.protocols.card_processor_protocol import LanguageCardProcessor
     from langlearn.core.protocols.domain_model_protocol import LanguageDomainModel
     from langlearn.core.protocols.media_enricher_protocol import MediaEnricherProtocol
@@ -18,6 +21,17 @@ if TYPE_CHECKING:
 class GermanLanguage(Language):
     """German language implementation."""
 
+    def __init__(self) -> None:
+        """Initialize the note type and field formatter dispatch tables."""
+        self._card_processor: LanguageCardProcessor | None = None
+        self._note_type_dispatch = NoteTypeDispatch(self.get_note_type_mappings())
+        self._field_formatters: dict[str, Callable[[dict[str, Any]], list[str]]] = {
+            "noun": self._format_noun_fields,
+            "adjective": self._format_adjective_fields,
+            "adverb": self._format_adverb_negation_fields,
+            "negation": self._format_adverb_negation_fields,
+        }
+
     @property
     def code(self) -> str:
         """ISO language code."""
@@ -120,10 +134,12 @@ class GermanLanguage(Language):
         )
 
     def get_card_processor(self) -> LanguageCardProcessor:
-        """Get card processor for German language."""
-        from .services.card_processor import GermanCardProcessor
+        """Get the shared card processor for German language."""
+        if self._card_processor is None:
+            from .services.card_processor import GermanCardProcessor
 
-        return GermanCardProcessor()
+            self._card_processor = GermanCardProcessor()
+        return self._card_processor
 
     def create_domain_model(
         self, record_type: str, record: BaseRecord
@@ -320,15 +336,8 @@ class GermanLanguage(Language):
         logger = logging.getLogger(__name__)
 
         try:
-            # Get note type to record type mappings
-            note_type_to_record_type = self.get_note_type_mappings()
-
             # Check if we support this note type with language-agnostic architecture
-            record_type = None
-            for note_pattern, rec_type in note_type_to_record_type.items():
-                if note_pattern.lower() in note_type_name.lower():
-                    record_type = rec_type
-                    break
+            record_type = self._note_type_dispatch.record_type(note_type_name)
 
             # Special handling for German Artikel Cloze note types
             if note_type_name in {
@@ -456,16 +465,12 @@ class GermanLanguage(Language):
             enriched_record_dict.update(media_data)
 
             # Convert back to field list format for backward compatibility
-            # The specific field order depends on the record type
-            if record_type == "noun":
-                return self._format_noun_fields(enriched_record_dict)
-            elif record_type == "adjective":
-                return self._format_adjective_fields(enriched_record_dict)
-            elif record_type in ["adverb", "negation"]:
-                return self._format_adverb_negation_fields(enriched_record_dict)
-            else:
-                # For other record types, return available fields in a reasonable order
-                return self._format_generic_fields(enriched_record_dict)
+            # The specific field order depends on the record type; other
+            # record types return available fields in a reasonable order
+            formatter = self._field_formatters.get(
+                record_type, self._format_generic_fields
+            )
+            return formatter(enriched_record_dict)
 
         except Exception as record_error:
             logger.error(
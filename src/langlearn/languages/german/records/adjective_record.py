@@ -6,7 +6,7 @@ from typing import Any
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class AdjectiveRecord(BaseRecord):
     """Record for German adjective data from CSV."""
 
@@ -1,12 +1,13 @@
 """AdverbRecord for German adverb data from CSV."""
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class AdverbRecord(BaseRecord):
     """Record for German adverb data from CSV."""
 
@@ -36,7 +37,7 @@ class AdverbRecord(BaseRecord):
         return cls(
             word=fields[0].strip(),
             english=fields[1].strip(),
-            type=fields[2].strip(),
+            type=sys.intern(fields[2].strip()),
             example=fields[3].strip(),
         )
 
@@ -1,12 +1,13 @@
 """NegativeArticleRecord for German negative articles from CSV."""
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class NegativeArticleRecord(BaseRecord):
     """Record for German negative articles from CSV - declension grid format."""
 
@@ -52,7 +53,7 @@ class NegativeArticleRecord(BaseRecord):
             )
 
         return cls(
-            gender=fields[0].strip(),
+            gender=sys.intern(fields[0].strip()),
             nominative=fields[1].strip(),
             accusative=fields[2].strip(),
             dative=fields[3].strip(),
@@ -1,12 +1,13 @@
 """NounRecord for German noun data from CSV."""
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class NounRecord(BaseRecord):
     """Record for German noun data from CSV."""
 
@@ -37,7 +38,7 @@ class NounRecord(BaseRecord):
 
         return cls(
             noun=fields[0].strip(),
-            article=fields[1].strip(),
+            article=sys.intern(fields[1].strip()),
             english=fields[2].strip(),
             plural=fields[3].strip(),
             example=fields[4].strip(),
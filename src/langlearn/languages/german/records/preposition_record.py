@@ -1,12 +1,13 @@
 """PrepositionRecord for German preposition data from CSV."""
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class PrepositionRecord(BaseRecord):
     """Record for German preposition data from CSV.
 
@@ -55,7 +56,7 @@ class PrepositionRecord(BaseRecord):
         return cls(
             preposition=fields[0].strip(),
             english=fields[1].strip(),
-            case=fields[2].strip(),
+            case=sys.intern(fields[2].strip()),
             example1=fields[3].strip(),
             example2=fields[4].strip(),
         )
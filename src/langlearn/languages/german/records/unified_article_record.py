@@ -1,12 +1,13 @@
 """UnifiedArticleRecord for unified German articles from CSV."""
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedArticleRecord(BaseRecord):
     """Record for unified German articles from CSV with German terminology."""
 
@@ -66,8 +67,8 @@ class UnifiedArticleRecord(BaseRecord):
             )
 
         return cls(
-            artikel_typ=fields[0].strip(),
-            geschlecht=fields[1].strip(),
+            artikel_typ=sys.intern(fields[0].strip()),
+            geschlecht=sys.intern(fields[1].strip()),
             nominativ=fields[2].strip(),
             akkusativ=fields[3].strip(),
             dativ=fields[4].strip(),
@@ -1,12 +1,13 @@
 """VerbConjugationRecord for German verb conjugation data from CSV."""
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class VerbConjugationRecord(BaseRecord):
     """Record for German verb conjugation data from CSV.
 
@@ -156,10 +157,10 @@ class VerbConjugationRecord(BaseRecord):
         return cls(
             infinitive=safe_strip(fields[0]),
             english=safe_strip(fields[1]),
-            classification=safe_strip(fields[2]),
+            classification=sys.intern(safe_strip(fields[2])),
             separable=safe_strip(fields[3]).lower() in ("true", "1", "yes"),
-            auxiliary=safe_strip(fields[4]),
-            tense=safe_strip(fields[5]),
+            auxiliary=sys.intern(safe_strip(fields[4])),
+            tense=sys.intern(safe_strip(fields[5])),
             ich=safe_strip(fields[6]),
             du=safe_strip(fields[7]),
             er=safe_strip(fields[8]),
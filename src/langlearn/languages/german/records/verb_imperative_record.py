@@ -6,7 +6,7 @@ from typing import Any
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class VerbImperativeRecord(BaseRecord):
     """Record for German verb imperative data from CSV.
 
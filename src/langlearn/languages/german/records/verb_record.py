@@ -1,12 +1,13 @@
 """VerbRecord for German verb data from CSV."""
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 from langlearn.core.records import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class VerbRecord(BaseRecord):
     """Record for German verb data from CSV.
 
@@ -62,12 +63,12 @@ class VerbRecord(BaseRecord):
         return cls(
             verb=fields[0].strip(),
             english=fields[1].strip(),
-            classification=fields[2].strip(),
+            classification=sys.intern(fields[2].strip()),
             present_ich=fields[3].strip(),
             present_du=fields[4].strip(),
             present_er=fields[5].strip(),
             präteritum=fields[6].strip(),
-            auxiliary=fields[7].strip(),
+            auxiliary=sys.intern(fields[7].strip()),
             perfect=fields[8].strip(),
             example=fields[9].strip(),
             separable=separable_bool,
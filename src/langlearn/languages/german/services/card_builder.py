@@ -5,6 +5,8 @@ Enriched Records → Cards with applied templates and formatting.
 """
 
 import logging
+from collections import ChainMap
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -76,12 +78,13 @@ class CardBuilder:
         record_type = self._get_record_type_from_instance(record)
         logger.debug("Building card from %s record", record_type)
 
-        # Merge record data with enriched data
-        card_data = record.to_dict()
-
+        # Layer enriched data over a zero-copy view of the record fields
+        card_data: Mapping[str, Any]
         if enriched_data:
-            card_data.update(enriched_data)
+            # ChainMap only writes to its first map, so a read-only view is safe
+            card_data = ChainMap(enriched_data, record.as_mapping())  # type: ignore[arg-type]
         else:
+            card_data = record.as_mapping()
             logger.debug(f"No enriched_data provided for {record_type} record")
 
         # Load template for this record type
@@ -170,6 +173,7 @@ class CardBuilder:
             name=template.name,
             fields=field_names,
             templates=[template],
+            identity_fields=self._get_identity_fields_for_record_type(record_type),
         )
 
     def _get_field_names_for_record_type(self, record_type: str) -> list[str]:
@@ -380,8 +384,45 @@ class CardBuilder:
 
         return field_mappings.get(record_type, [])
 
+    def _get_identity_fields_for_record_type(self, record_type: str) -> list[str]:
+        """Get the fields identifying a note of a record type.
+
+        Words are identified by their meaning as well, so homographs such as
+        "gerade" (straight) and "gerade" (just now) keep separate notes.
+
+        Args:
+            record_type: Type of record (noun, adjective, adverb, negation)
+
+        Returns:
+            Identity field names, or an empty list for the first field
+        """
+        article_types = [
+            "ArtikelTypBestimmt",
+            "ArtikelTypUnbestimmt",
+            "ArtikelTypVerneinend",
+        ]
+        identity_mappings = {
+            "noun": ["Noun", "Article", "English"],
+            "adjective": ["Word", "English"],
+            "adverb": ["Word", "English"],
+            "negation": ["Word", "English"],
+            "verb": ["Verb", "English"],
+            "phrase": ["Phrase", "English"],
+            "preposition": ["Preposition", "English"],
+            "verb_conjugation": ["Infinitive", "English", "Tense"],
+            "verb_imperative": ["Infinitive", "English"],
+            "artikel_gender_cloze": ["Text"],
+            "artikel_context_cloze": ["Text"],
+            "artikel_gender": ["Gender", *article_types],
+            "artikel_context": ["Gender", "Case", *article_types],
+            "noun_article_recognition": ["Noun", "Article", "English"],
+            "noun_case_context": ["Noun", "Article", "English", "Case"],
+        }
+
+        return identity_mappings.get(record_type, [])
+
     def _extract_field_values(
-        self, record_type: str, card_data: dict[str, Any], note_type: NoteType
+        self, record_type: str, card_data: Mapping[str, Any], note_type: NoteType
     ) -> list[str]:
         """Extract field values from card data in the correct order.
 
@@ -666,7 +707,7 @@ class CardBuilder:
             return False
 
         # Check that record has required fields
-        record_data = record.to_dict()
+        record_data = record.as_mapping()
         required_fields = self._get_required_fields_for_record_type(record_type)
 
         for field in required_fields:
@@ -6,13 +6,137 @@ providing clean separation between CSV parsing and domain logic.
 
 import csv
 import logging
+import warnings
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+import pandas as pd
+
 from langlearn.languages.german.records.factory import BaseRecord, create_record
 
 logger = logging.getLogger(__name__)
 
+_ARTICLE_COLUMNS = (
+    "gender",
+    "nominative",
+    "accusative",
+    "dative",
+    "genitive",
+    "example_nom",
+    "example_acc",
+    "example_dat",
+    "example_gen",
+)
+_WORD_TYPE_COLUMNS = ("word", "english", "type", "example")
+
+# CSV column names for each record type, in the order of the record's fields
+_CSV_COLUMNS: dict[str, tuple[str, ...]] = {
+    "noun": ("noun", "article", "english", "plural", "example", "related"),
+    "adjective": ("word", "english", "example", "comparative", "superlative"),
+    "adverb": _WORD_TYPE_COLUMNS,
+    "negation": _WORD_TYPE_COLUMNS,
+    "verb_conjugation": (
+        "infinitive",
+        "english",
+        "classification",
+        "separable",
+        "auxiliary",
+        "tense",
+        "ich",
+        "du",
+        "er",
+        "wir",
+        "ihr",
+        "sie",
+        "example",
+    ),
+    "verb_imperative": (
+        "infinitive",
+        "english",
+        "classification",
+        "separable",
+        "du_form",
+        "ihr_form",
+        "sie_form",
+        "example_du",
+        "example_ihr",
+        "example_sie",
+    ),
+    "verb": (
+        "verb",
+        "english",
+        "classification",
+        "present_ich",
+        "present_du",
+        "present_er",
+        "präteritum",
+        "auxiliary",
+        "perfect",
+        "example",
+        "separable",
+    ),
+    "preposition": ("preposition", "english", "case", "example1", "example2"),
+    "phrase": ("phrase", "english", "context", "related"),
+    "article": _ARTICLE_COLUMNS,
+    "indefinite_article": _ARTICLE_COLUMNS,
+    "negative_article": _ARTICLE_COLUMNS,
+    "unified_article": (
+        "artikel_typ",
+        "geschlecht",
+        "nominativ",
+        "akkusativ",
+        "dativ",
+        "genitiv",
+        "beispiel_nom",
+        "beispiel_akk",
+        "beispiel_dat",
+        "beispiel_gen",
+    ),
+}
+
+
+def read_csv_frame(csv_path: str | Path) -> pd.DataFrame:
+    """Read a whole CSV file into string columns in a single pass.
+
+    Cell values keep their raw text: no NA conversion, so "NA" or "null" stay
+    strings and empty cells are "". Cells missing from short rows also read as
+    "". Values beyond the header width are dropped, as csv.DictReader-based
+    callers always ignored them; files the C parser rejects outright are
+    re-read with csv.DictReader.
+
+    Args:
+        csv_path: Path to the CSV file
+
+    Returns:
+        DataFrame with one object column per CSV header
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", pd.errors.ParserWarning)
+            frame = pd.read_csv(
+                csv_path,
+                dtype=str,
+                keep_default_na=False,
+                index_col=False,
+                encoding="utf-8",
+            )
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame()
+    except pd.errors.ParserError:
+        with open(csv_path, encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            rows = [
+                [row.get(column) or "" for column in reader.fieldnames or []]
+                for row in reader
+            ]
+            columns = list(reader.fieldnames or [])
+        return pd.DataFrame(rows, columns=columns, dtype=object)
+    return frame.astype(object)
+
 
 class RecordMapper:
     """Maps CSV field arrays to Record instances for record-based architecture."""
@@ -85,124 +209,59 @@ class RecordMapper:
             "Mapping CSV row to %s record: %s", record_type, list(csv_row.keys())
         )
 
-        # Extract field values from the CSV row based on record type
         try:
-            if record_type == "noun":
-                fields = [
-                    csv_row.get("noun", ""),
-                    csv_row.get("article", ""),
-                    csv_row.get("english", ""),
-                    csv_row.get("plural", ""),
-                    csv_row.get("example", ""),
-                    csv_row.get("related", ""),
-                ]
-            elif record_type == "adjective":
-                fields = [
-                    csv_row.get("word", ""),
-                    csv_row.get("english", ""),
-                    csv_row.get("example", ""),
-                    csv_row.get("comparative", ""),
-                    csv_row.get("superlative", ""),
-                ]
-            elif record_type in ["adverb", "negation"]:
-                fields = [
-                    csv_row.get("word", ""),
-                    csv_row.get("english", ""),
-                    csv_row.get("type", ""),
-                    csv_row.get("example", ""),
-                ]
-            elif record_type == "verb_conjugation":
-                fields = [
-                    csv_row.get("infinitive", ""),
-                    csv_row.get("english", ""),
-                    csv_row.get("classification", ""),
-                    csv_row.get("separable", ""),
-                    csv_row.get("auxiliary", ""),
-                    csv_row.get("tense", ""),
-                    csv_row.get("ich", ""),
-                    csv_row.get("du", ""),
-                    csv_row.get("er", ""),
-                    csv_row.get("wir", ""),
-                    csv_row.get("ihr", ""),
-                    csv_row.get("sie", ""),
-                    csv_row.get("example", ""),
-                ]
-            elif record_type == "verb_imperative":
-                fields = [
-                    csv_row.get("infinitive", ""),
-                    csv_row.get("english", ""),
-                    csv_row.get("classification", ""),
-                    csv_row.get("separable", ""),
-                    csv_row.get("du_form", ""),
-                    csv_row.get("ihr_form", ""),
-                    csv_row.get("sie_form", ""),
-                    csv_row.get("example_du", ""),
-                    csv_row.get("example_ihr", ""),
-                    csv_row.get("example_sie", ""),
-                ]
-            elif record_type == "verb":
-                fields = [
-                    csv_row.get("verb", ""),
-                    csv_row.get("english", ""),
-                    csv_row.get("classification", ""),
-                    csv_row.get("present_ich", ""),
-                    csv_row.get("present_du", ""),
-                    csv_row.get("present_er", ""),
-                    csv_row.get("präteritum", ""),
-                    csv_row.get("auxiliary", ""),
-                    csv_row.get("perfect", ""),
-                    csv_row.get("example", ""),
-                    csv_row.get("separable", ""),
-                ]
-            elif record_type == "preposition":
-                fields = [
-                    csv_row.get("preposition", ""),
-                    csv_row.get("english", ""),
-                    csv_row.get("case", ""),
-                    csv_row.get("example1", ""),
-                    csv_row.get("example2", ""),
-                ]
-            elif record_type == "phrase":
-                fields = [
-                    csv_row.get("phrase", ""),
-                    csv_row.get("english", ""),
-                    csv_row.get("context", ""),
-                    csv_row.get("related", ""),
-                ]
-            elif record_type in ["article", "indefinite_article", "negative_article"]:
-                fields = [
-                    csv_row.get("gender", ""),
-                    csv_row.get("nominative", ""),
-                    csv_row.get("accusative", ""),
-                    csv_row.get("dative", ""),
-                    csv_row.get("genitive", ""),
-                    csv_row.get("example_nom", ""),
-                    csv_row.get("example_acc", ""),
-                    csv_row.get("example_dat", ""),
-                    csv_row.get("example_gen", ""),
-                ]
-            elif record_type == "unified_article":
-                fields = [
-                    csv_row.get("artikel_typ", ""),
-                    csv_row.get("geschlecht", ""),
-                    csv_row.get("nominativ", ""),
-                    csv_row.get("akkusativ", ""),
-                    csv_row.get("dativ", ""),
-                    csv_row.get("genitiv", ""),
-                    csv_row.get("beispiel_nom", ""),
-                    csv_row.get("beispiel_akk", ""),
-                    csv_row.get("beispiel_dat", ""),
-                    csv_row.get("beispiel_gen", ""),
-                ]
-            else:
-                raise ValueError(f"Unsupported record type: {record_type}")
-
+            columns = self.get_csv_columns(record_type)
+            fields = [csv_row.get(column, "") for column in columns]
             return self.map_fields_to_record(record_type, fields)
 
         except Exception as e:
             logger.error("Failed to map CSV row to %s record: %s", record_type, e)
             raise
 
+    def get_csv_columns(self, record_type: str) -> tuple[str, ...]:
+        """Get the CSV column names read for a record type, in field order.
+
+        Args:
+            record_type: Type of record
+
+        Returns:
+            Column names whose values form the record's CSV field array
+
+        Raises:
+            ValueError: If record_type is unsupported
+        """
+        try:
+            return _CSV_COLUMNS[record_type]
+        except KeyError:
+            raise ValueError(f"Unsupported record type: {record_type}") from None
+
+    def iter_csv_fields(
+        self, frame: pd.DataFrame, record_type: str
+    ) -> Iterator[list[Any]]:
+        """Yield one field array per row of a CSV frame.
+
+        Columns are selected once for the whole frame rather than looked up
+        per row. Columns absent from the file read as "", as they do for
+        map_csv_row_to_record().
+
+        Args:
+            frame: Frame returned by read_csv_frame()
+            record_type: Type of record the rows describe
+
+        Yields:
+            Field arrays in the order expected by the record class
+
+        Raises:
+            ValueError: If record_type is unsupported
+        """
+        row_count = len(frame)
+        selected = [
+            frame[column].tolist() if column in frame.columns else [""] * row_count
+            for column in self.get_csv_columns(record_type)
+        ]
+        for values in zip(*selected, strict=True):
+            yield list(values)
+
     def get_supported_record_types(self) -> list[str]:
         """Get list of supported record types.
 
@@ -477,100 +536,45 @@ class RecordMapper:
         else:
             logger.info("Using specified record type: %s", record_type)
 
-        # Handle verb records that may have multiple rows per verb
-        if record_type in ["verb_conjugation", "verb_imperative"]:
-            return self._load_verb_records_from_csv(csv_path, record_type)
-        else:
-            return self._load_simple_records_from_csv(csv_path, record_type)
+        # One record per row for every type; verb CSVs hold one row per
+        # tense or imperative set
+        return self._load_records_from_frame(csv_path, record_type)
 
-    def _load_simple_records_from_csv(
+    def _load_records_from_frame(
         self, csv_path: Path, record_type: str
     ) -> list[BaseRecord]:
-        """Load records with 1:1 row-to-record mapping.
+        """Read a CSV file once into columns and create one record per row.
 
         Args:
             csv_path: Path to the CSV file
             record_type: Type of records to create
 
         Returns:
-            List of Record instances
-        """
-        records = []
-
-        try:
-            with open(csv_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-
-                for row_num, row in enumerate(
-                    reader, start=2
-                ):  # Start at 2 (header is 1)
-                    try:
-                        record = self.map_csv_row_to_record(record_type, row)
-                        records.append(record)
-                        logger.debug(
-                            "Created %s record from row %d", record_type, row_num
-                        )
-                    except Exception as e:
-                        logger.error(
-                            "Failed to create %s record from row %d: %s",
-                            record_type,
-                            row_num,
-                            e,
-                        )
-                        raise ValueError(
-                            f"Invalid {record_type} data at row {row_num}: {e}"
-                        ) from e
-
-            logger.info("Successfully loaded %d %s records", len(records), record_type)
-            return records
+            List of Record instances, in file order
 
-        except Exception as e:
-            logger.error(
-                "Failed to load %s records from %s: %s", record_type, csv_path, e
-            )
-            raise
-
-    def _load_verb_records_from_csv(
-        self, csv_path: Path, record_type: str
-    ) -> list[BaseRecord]:
-        """Load verb records from CSV (multiple rows per verb supported).
-
-        For the hybrid approach, each row represents one tense/imperative set
-        for a verb, so we create one record per row.
-
-        Args:
-            csv_path: Path to the CSV file
-            record_type: Type of verb records to create
-
-        Returns:
-            List of verb Record instances
+        Raises:
+            ValueError: If a row cannot be converted, naming its CSV row number
         """
         records = []
 
         try:
-            with open(csv_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-
-                for row_num, row in enumerate(
-                    reader, start=2
-                ):  # Start at 2 (header is 1)
-                    try:
-                        # Each row becomes one record (1 tense per row approach)
-                        record = self.map_csv_row_to_record(record_type, row)
-                        records.append(record)
-                        logger.debug(
-                            "Created %s record from row %d", record_type, row_num
-                        )
-                    except Exception as e:
-                        logger.error(
-                            "Failed to create %s record from row %d: %s",
-                            record_type,
-                            row_num,
-                            e,
-                        )
-                        raise ValueError(
-                            f"Invalid {record_type} data at row {row_num}: {e}"
-                        ) from e
+            frame = read_csv_frame(csv_path)
+            field_rows = self.iter_csv_fields(frame, record_type)
+
+            # Start at 2 (header is 1)
+            for row_num, fields in enumerate(field_rows, start=2):
+                try:
+                    records.append(create_record(record_type, fields))
+                except Exception as e:
+                    logger.error(
+                        "Failed to create %s record from row %d: %s",
+                        record_type,
+                        row_num,
+                        e,
+                    )
+                    raise ValueError(
+                        f"Invalid {record_type} data at row {row_num}: {e}"
+                    ) from e
 
             logger.info("Successfully loaded %d %s records", len(records), record_type)
             return records
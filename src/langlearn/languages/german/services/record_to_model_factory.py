@@ -7,8 +7,10 @@ media enrichment purposes.
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from langlearn.core.protocols.media_generation_protocol import MediaGenerationCapable
-from langlearn.languages.german.records.factory import BaseRecord
+from langlearn.languages.german.records.factory import BaseRecord, RecordType
 
 
 class RecordToModelFactory:
@@ -27,42 +29,21 @@ class RecordToModelFactory:
         Raises:
             ValueError: If record type cannot be converted to domain model
         """
-        from langlearn.languages.german.records.factory import RecordType
-
         record_type = record.get_record_type()
-
-        if record_type == RecordType.NOUN:
-            return RecordToModelFactory._create_noun_model(record)
-        elif record_type == RecordType.ADJECTIVE:
-            return RecordToModelFactory._create_adjective_model(record)
-        elif record_type == RecordType.ADVERB:
-            return RecordToModelFactory._create_adverb_model(record)
-        elif record_type == RecordType.NEGATION:
-            return RecordToModelFactory._create_negation_model(record)
-        elif record_type == RecordType.PHRASE:
-            return RecordToModelFactory._create_phrase_model(record)
-        elif record_type == RecordType.PREPOSITION:
-            return RecordToModelFactory._create_preposition_model(record)
-        elif record_type == RecordType.VERB:
-            return RecordToModelFactory._create_verb_model(record)
-        elif record_type == RecordType.VERB_CONJUGATION:
-            return RecordToModelFactory._create_verb_conjugation_model(record)
-        elif record_type == RecordType.VERB_IMPERATIVE:
-            return RecordToModelFactory._create_verb_imperative_model(record)
-        elif record_type == RecordType.UNIFIED_ARTICLE:
-            return RecordToModelFactory._create_unified_article_model(record)
-        else:
+        create = _MODEL_CREATORS.get(record_type)
+        if create is None:
             raise ValueError(
                 f"Cannot create domain model for record type: {record_type}. "
                 f"Domain model conversion not implemented for this type."
             )
+        return create(record)
 
     @staticmethod
     def _create_noun_model(record: BaseRecord) -> MediaGenerationCapable:
         """Create Noun domain model from NounRecord."""
         from langlearn.languages.german.models.noun import Noun
 
-        record_dict = record.to_dict()
+        record_dict = record.as_mapping()
         return Noun(
             noun=record_dict.get("noun", ""),
             article=record_dict.get("article", ""),
@@ -77,7 +58,7 @@ class RecordToModelFactory:
         """Create Adjective domain model from AdjectiveRecord."""
         from langlearn.languages.german.models.adjective import Adjective
 
-        record_dict = record.to_dict()
+        record_dict = record.as_mapping()
         return Adjective(
             word=record_dict.get("word", ""),
             english=record_dict.get("english", ""),
@@ -95,7 +76,7 @@ class RecordToModelFactory:
             AdverbType,
         )
 
-        record_dict = record.to_dict()
+        record_dict = record.as_mapping()
         type_str = record_dict.get("type", "")
 
         # Convert type string to AdverbType enum
@@ -113,7 +94,7 @@ class RecordToModelFactory:
         """Create Negation domain model from NegationRecord."""
         from langlearn.languages.german.models.negation import Negation, NegationType
 
-        record_dict = record.to_dict()
+        record_dict = record.as_mapping()
         type_str = record_dict.get("type", "")
 
         # Convert type string to NegationType enum
@@ -135,7 +116,7 @@ class RecordToModelFactory:
         """Create Phrase domain model from PhraseRecord."""
         from langlearn.languages.german.models.phrase import Phrase
 
-        record_dict = record.to_dict()
+        record_dict = record.as_mapping()
         return Phrase(
             phrase=record_dict.get("phrase", ""),
             english=record_dict.get("english", ""),
@@ -148,7 +129,7 @@ class RecordToModelFactory:
         """Create Preposition domain model from PrepositionRecord."""
         from langlearn.languages.german.models.preposition import Preposition
 
-        record_dict = record.to_dict()
+        record_dict = record.as_mapping()
         return Preposition(
             preposition=record_dict.get("preposition", ""),
             english=record_dict.get("english", ""),
@@ -162,7 +143,7 @@ class RecordToModelFactory:
         """Create Verb domain model from VerbRecord."""
         from langlearn.languages.german.models.verb import Verb
 
-        record_dict = record.to_dict()
+        record_dict = record.as_mapping()
         return Verb(
             verb=record_dict.get("verb", ""),
             english=record_dict.get("english", ""),
@@ -178,7 +159,7 @@ class RecordToModelFactory:
         """Create Verb domain model from VerbConjugationRecord."""
         from langlearn.languages.german.models.verb import Verb
 
-        record_dict = record.to_dict()
+        record_dict = record.as_mapping()
         # VerbConjugationRecord has infinitive, not verb field
         infinitive = record_dict.get("infinitive", record_dict.get("verb", ""))
         tense = record_dict.get("tense", "")
@@ -224,7 +205,7 @@ class RecordToModelFactory:
         """Create Verb domain model from VerbImperativeRecord."""
         from langlearn.languages.german.models.verb import Verb
 
-        record_dict = record.to_dict()
+        record_dict = record.as_mapping()
         # VerbImperativeRecord has infinitive field
         infinitive = record_dict.get("infinitive", record_dict.get("verb", ""))
         # VerbImperativeRecord has example_du, example_ihr, example_sie (no beispiel)
@@ -245,7 +226,7 @@ class RecordToModelFactory:
         """Create Article domain model from UnifiedArticleRecord."""
         from langlearn.languages.german.models.article import Article
 
-        record_dict = record.to_dict()
+        record_dict = record.as_mapping()
 
         return Article(
             artikel_typ=record_dict.get("artikel_typ", "bestimmt"),
@@ -259,3 +240,18 @@ class RecordToModelFactory:
             beispiel_dat=record_dict.get("beispiel_dat", ""),
             beispiel_gen=record_dict.get("beispiel_gen", ""),
         )
+
+
+# Record type to domain model constructor, so conversion is one dict lookup
+_MODEL_CREATORS: dict[RecordType, Callable[[BaseRecord], MediaGenerationCapable]] = {
+    RecordType.NOUN: RecordToModelFactory._create_noun_model,
+    RecordType.ADJECTIVE: RecordToModelFactory._create_adjective_model,
+    RecordType.ADVERB: RecordToModelFactory._create_adverb_model,
+    RecordType.NEGATION: RecordToModelFactory._create_negation_model,
+    RecordType.PHRASE: RecordToModelFactory._create_phrase_model,
+    RecordType.PREPOSITION: RecordToModelFactory._create_preposition_model,
+    RecordType.VERB: RecordToModelFactory._create_verb_model,
+    RecordType.VERB_CONJUGATION: RecordToModelFactory._create_verb_conjugation_model,
+    RecordType.VERB_IMPERATIVE: RecordToModelFactory._create_verb_imperative_model,
+    RecordType.UNIFIED_ARTICLE: RecordToModelFactory._create_unified_article_model,
+}
@@ -380,6 +380,9 @@ class VerbConjugationProcessor:
             name=template.name,
             fields=field_names,
             templates=[template],
+            identity_fields=self._card_builder._get_identity_fields_for_record_type(
+                "verb_imperative"
+            ),
         )
 
         # Map data to field values in correct order
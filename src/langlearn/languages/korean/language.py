@@ -7,8 +7,11 @@ from typing import TYPE_CHECKING, Any
 
 from langlearn.core.protocols.language_protocol import Language
 from langlearn.core.protocols.tts_protocol import TTSConfig
+from langlearn.languages.dispatch import NoteTypeDispatch
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from langlearn.core.protocols.card_processor_protocol import LanguageCardProcessor
     from langlearn.core.protocols.domain_model_protocol import LanguageDomainModel
     from langlearn.core.protocols.media_enricher_protocol import MediaEnricherProtocol
@@ -18,6 +21,14 @@ if TYPE_CHECKING:
 class KoreanLanguage(Language):
     """Korean language implementation with Hangul support and particle patterns."""
 
+    def __init__(self) -> None:
+        """Initialize the note type and field formatter dispatch tables."""
+        self._card_processor: LanguageCardProcessor | None = None
+        self._note_type_dispatch = NoteTypeDispatch(self.get_note_type_mappings())
+        self._field_formatters: dict[str, Callable[[dict[str, Any]], list[str]]] = {
+            "korean_noun": self._format_korean_noun_fields,
+        }
+
     @property
     def code(self) -> str:
         """ISO language code."""
@@ -92,10 +103,12 @@ class KoreanLanguage(Language):
         )
 
     def get_card_processor(self) -> LanguageCardProcessor:
-        """Get card processor for Korean language."""
-        from .services.card_processor import KoreanCardProcessor
+        """Get the shared card processor for Korean language."""
+        if self._card_processor is None:
+            from .services.card_processor import KoreanCardProcessor
 
-        return KoreanCardProcessor()
+            self._card_processor = KoreanCardProcessor()
+        return self._card_processor
 
     def create_domain_model(
         self, record_type: str, record: BaseRecord
@@ -206,15 +219,8 @@ class KoreanLanguage(Language):
         logger = logging.getLogger(__name__)
 
         try:
-            # Get note type to record type mappings
-            note_type_to_record_type = self.get_note_type_mappings()
-
             # Check if we support this note type
-            record_type = None
-            for note_pattern, rec_type in note_type_to_record_type.items():
-                if note_pattern.lower() in note_type_name.lower():
-                    record_type = rec_type
-                    break
+            record_type = self._note_type_dispatch.record_type(note_type_name)
 
             if record_type is not None:
                 # Use record-based architecture for standard record types
@@ -275,12 +281,12 @@ class KoreanLanguage(Language):
             enriched_record_dict = record.to_dict()
             enriched_record_dict.update(media_data)
 
-            # Convert back to field list format for Anki
-            if record_type == "korean_noun":
-                return self._format_korean_noun_fields(enriched_record_dict)
-            else:
-                # For other record types, return available fields
-                return self._format_generic_fields(enriched_record_dict)
+            # Convert back to field list format for Anki; other record types
+            # return available fields
+            formatter = self._field_formatters.get(
+                record_type, self._format_generic_fields
+            )
+            return formatter(enriched_record_dict)
 
         except Exception as record_error:
             logger.error(
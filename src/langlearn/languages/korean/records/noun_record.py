@@ -8,7 +8,7 @@ from typing import Any
 from langlearn.core.records.base_record import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class KoreanNounRecord(BaseRecord):
     """Korean noun record with essential particle patterns and counter information.
 
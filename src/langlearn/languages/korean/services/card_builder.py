@@ -187,6 +187,7 @@ class KoreanCardBuilder:
             name=f"Korean {record_type.title()}",
             fields=field_names,
             templates=[template],
+            identity_fields=["Hangul", "English"],
         )
 
     def build_cards_from_records(
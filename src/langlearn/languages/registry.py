@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import threading
 from typing import ClassVar
 
 from langlearn.core.protocols.language_protocol import Language
 
 
 class LanguageRegistry:
-    """Central registry for available languages."""
+    """Central registry for available languages.
+
+    Each language class is instantiated once and shared by every caller, so
+    the caches and dispatch tables a language builds are reused across
+    builders; language implementations must therefore not keep per-build
+    state.
+    """
 
     _languages: ClassVar[dict[str, type[Language]]] = {}
+    _instances: ClassVar[dict[type[Language], Language]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
 
     @classmethod
     def register(cls, language_code: str, language_class: type[Language]) -> None:
@@ -19,10 +28,18 @@ class LanguageRegistry:
 
     @classmethod
     def get(cls, language_code: str) -> Language:
-        """Get a language implementation by code."""
+        """Get the shared language implementation for a code."""
         if language_code not in cls._languages:
             raise ValueError(f"Language {language_code} not registered")
-        return cls._languages[language_code]()
+        language_class = cls._languages[language_code]
+        instance = cls._instances.get(language_class)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.get(language_class)
+                if instance is None:
+                    instance = language_class()
+                    cls._instances[language_class] = instance
+        return instance
 
     @classmethod
     def list_available(cls) -> list[str]:
@@ -33,3 +50,4 @@ class LanguageRegistry:
     def clear(cls) -> None:
         """Clear all registered languages (useful for testing)."""
         cls._languages.clear()
+        cls._instances.clear()
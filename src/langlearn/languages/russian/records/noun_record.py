@@ -8,7 +8,7 @@ from typing import Any, Literal
 from langlearn.core.records.base_record import BaseRecord, RecordType
 
 
-@dataclass
+@dataclass(slots=True)
 class RussianNounRecord(BaseRecord):
     """Russian noun record with case declensions and grammatical features."""
 
@@ -191,4 +191,5 @@ class RussianCardBuilder:
                     css=css_content,
                 )
             ],
+            identity_fields=["Noun", "English"],
         )
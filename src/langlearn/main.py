@@ -10,7 +10,31 @@ import logging
 import sys
 from pathlib import Path
 
-from langlearn.core.deck import DeckBuilderAPI
+from langlearn.core.deck import (
+    BatchBuildResult,
+    BatchDeckBuilder,
+    BuildPlan,
+    ChangeSet,
+    DeckBuilderAPI,
+    DeckBuildResult,
+    DeckSpec,
+    DeckWatcher,
+    MediaWarmer,
+    ShardedDeckBuilder,
+    SharedServices,
+    discover_decks,
+    load_manifest,
+)
+from langlearn.core.deck.batch import PHASES
+from langlearn.exceptions import ConfigurationError
+from langlearn.infrastructure.services.audio_processor import AudioProcessingConfig
+from langlearn.infrastructure.services.image_processor import ImageProcessingConfig
+from langlearn.infrastructure.services.local_providers import (
+    LocalProviderConfig,
+    LocalProviders,
+)
+from langlearn.infrastructure.services.media_queue import MediaJobQueue
+from langlearn.infrastructure.services.resilience import CallPolicy
 
 # Set up logging
 logging.basicConfig(
@@ -18,6 +42,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Deck backend writing each --format
+FORMAT_BACKENDS = {"apkg": "anki", "tsv": "tsv", "jsonl": "jsonl"}
+
+# Options only a plain single-deck build honours; the batch, watch, shard and
+# warm modes would ignore them and build with paid provider calls anyway
+SINGLE_BUILD_OPTIONS = (
+    "plan",
+    "persistent",
+    "checkpoint",
+    "resume",
+    "defer_media",
+    "backfill_media",
+)
+
+# Media post-processing runs after enrichment in single-deck, batch and watch
+# builds; shards enrich in separate workers and warming builds nothing
+MEDIA_PROCESSING_OPTIONS = ("optimize_images", "process_audio")
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -35,7 +77,194 @@ def parse_args() -> argparse.Namespace:
         help="Deck name within the language (case-insensitive, default: default)",
     )
     parser.add_argument(
-        "--output", help="Output file path (auto-generated if not specified)"
+        "--output",
+        help="Output file path (auto-generated if not specified); "
+        "the output directory in batch mode",
+    )
+    batch = parser.add_mutually_exclusive_group()
+    batch.add_argument(
+        "--all",
+        action="store_true",
+        help="Build every deck found under languages/ in one process",
+    )
+    batch.add_argument(
+        "--manifest",
+        type=Path,
+        help="Build the decks listed in a file, one language/deck per line",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Rebuild the deck whenever its CSV files or templates change",
+    )
+    parser.add_argument(
+        "--persistent",
+        action="store_true",
+        help="Keep a working collection per deck in output/collections and "
+        "update only changed notes on rebuild",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMAT_BACKENDS,
+        default="apkg",
+        help="Export an Anki package, or stream notes as TSV (Anki's text "
+        "import format) or JSON Lines with the media linked into a sibling "
+        ".media folder (default: apkg)",
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Load the deck and estimate the Polly, Anthropic and Pexels "
+        "requests a build would make, without calling them, and exit",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Checkpoint enriched media in output/checkpoints so an "
+        "interrupted build can be continued with --resume",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted --checkpoint build, reusing the media "
+        "already checkpointed in output/checkpoints",
+    )
+    images = parser.add_argument_group("image optimization")
+    images.add_argument(
+        "--optimize-images",
+        action="store_true",
+        help="Resize and re-encode the deck's images before packaging",
+    )
+    images.add_argument(
+        "--max-image-size",
+        type=int,
+        default=800,
+        help="Longest image side in pixels (default: 800)",
+    )
+    images.add_argument(
+        "--image-quality",
+        type=int,
+        default=80,
+        help="Encoder quality from 1 to 100 (default: 80)",
+    )
+    images.add_argument(
+        "--image-format",
+        choices=["jpeg", "webp"],
+        default="jpeg",
+        help="Encoding of optimized images (default: jpeg)",
+    )
+    audio = parser.add_argument_group("audio post-processing (requires ffmpeg)")
+    audio.add_argument(
+        "--process-audio",
+        action="store_true",
+        help="Trim silence, normalize loudness and re-encode audio before packaging",
+    )
+    audio.add_argument(
+        "--audio-bitrate",
+        type=int,
+        default=64,
+        help="Mono MP3 bitrate in kbps (default: 64)",
+    )
+    audio.add_argument(
+        "--audio-loudness",
+        type=float,
+        default=-16.0,
+        help="Target loudness in LUFS (default: -16)",
+    )
+    deferred = parser.add_argument_group("deferred media")
+    deferred.add_argument(
+        "--defer-media",
+        action="store_true",
+        help="Export at once with the media that exists and queue the rest "
+        "in output/media_queue",
+    )
+    deferred.add_argument(
+        "--backfill-media",
+        action="store_true",
+        help="Generate the media queued for the deck by --defer-media builds and exit",
+    )
+    deferred.add_argument(
+        "--warm-media",
+        action="store_true",
+        help="Generate every missing audio and image of the deck (or of each "
+        "deck with --all/--manifest) without building it, and exit",
+    )
+    deferred.add_argument(
+        "--media-workers",
+        type=int,
+        default=4,
+        help="Media jobs generated concurrently by --backfill-media and "
+        "--warm-media (default: 4)",
+    )
+    resilience = parser.add_argument_group("provider resilience (Polly, Pexels)")
+    resilience.add_argument(
+        "--breaker-threshold",
+        type=int,
+        default=5,
+        help="Consecutive failures after which calls to a provider fail fast "
+        "(default: 5)",
+    )
+    resilience.add_argument(
+        "--breaker-reset",
+        type=float,
+        default=30.0,
+        help="Seconds before a failing provider is probed again (default: 30)",
+    )
+    resilience.add_argument(
+        "--provider-deadline",
+        type=float,
+        help="Seconds one provider call may take, retries included "
+        "(default: no deadline)",
+    )
+    resilience.add_argument(
+        "--hedge-after",
+        type=float,
+        help="Send a second request when a provider has not answered after "
+        "this many seconds (default: never)",
+    )
+    local = parser.add_argument_group("local providers (offline benchmarking)")
+    local.add_argument(
+        "--local-providers",
+        action="store_true",
+        help="Use local stand-ins for Polly, Pexels and Anthropic; no "
+        "credentials or network access needed, media is not real",
+    )
+    local.add_argument(
+        "--local-latency",
+        type=float,
+        default=0.0,
+        help="Seconds each local provider call takes (default: 0)",
+    )
+    local.add_argument(
+        "--local-throttle-every",
+        type=int,
+        default=0,
+        help="Throttle every Nth call to each local provider (default: never)",
+    )
+    local.add_argument(
+        "--local-rate-limit",
+        type=float,
+        help="Requests per second the local Pexels server accepts before "
+        "answering 429 (default: unlimited)",
+    )
+    parser.add_argument(
+        "--fast-scratch",
+        action="store_true",
+        help="Build in a RAM-backed scratch collection with SQLite durability "
+        "turned off (not with --persistent)",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Build the deck in this many parallel shards merged into one "
+        "package (default: 1)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Decks built concurrently in batch mode (default: 1)",
     )
     args = parser.parse_args()
 
@@ -46,9 +275,364 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
+def validate_args(args: argparse.Namespace) -> None:
+    """Reject option combinations that would be silently ignored.
+
+    Raises:
+        ConfigurationError: If an option does not apply to the selected mode
+    """
+    modes = [
+        flag
+        for flag, selected in (
+            ("--all", args.all),
+            ("--manifest", args.manifest is not None),
+            ("--watch", args.watch),
+            ("--shards", args.shards > 1),
+            ("--warm-media", args.warm_media),
+        )
+        if selected
+    ]
+    options = [
+        f"--{name.replace('_', '-')}"
+        for name in SINGLE_BUILD_OPTIONS
+        if getattr(args, name)
+    ]
+    if modes and options:
+        raise ConfigurationError(
+            f"{', '.join(options)} cannot be combined with {', '.join(modes)}; "
+            "it only applies to a single-deck build"
+        )
+    unprocessed_modes = [
+        flag
+        for flag, selected in (
+            ("--shards", args.shards > 1),
+            ("--warm-media", args.warm_media),
+        )
+        if selected
+    ]
+    processing = [
+        f"--{name.replace('_', '-')}"
+        for name in MEDIA_PROCESSING_OPTIONS
+        if getattr(args, name)
+    ]
+    if unprocessed_modes and processing:
+        raise ConfigurationError(
+            f"{', '.join(processing)} cannot be combined with "
+            f"{', '.join(unprocessed_modes)}; media is not post-processed there"
+        )
+    if args.format != "apkg" and (
+        args.persistent or args.fast_scratch or args.shards > 1
+    ):
+        raise ConfigurationError(
+            f"--format {args.format} cannot be combined with "
+            "--persistent, --fast-scratch or --shards"
+        )
+
+
+def image_config(args: argparse.Namespace) -> ImageProcessingConfig | None:
+    """Return the image optimization settings, or None if disabled."""
+    if not args.optimize_images:
+        return None
+    return ImageProcessingConfig(
+        max_dimension=args.max_image_size,
+        quality=args.image_quality,
+        image_format="WEBP" if args.image_format == "webp" else "JPEG",
+    )
+
+
+def audio_config(args: argparse.Namespace) -> AudioProcessingConfig | None:
+    """Return the audio post-processing settings, or None if disabled."""
+    if not args.process_audio:
+        return None
+    return AudioProcessingConfig(
+        bitrate_kbps=args.audio_bitrate, loudness_lufs=args.audio_loudness
+    )
+
+
+def call_policy(args: argparse.Namespace) -> CallPolicy:
+    """Return the circuit breaker, deadline and hedging settings."""
+    return CallPolicy(
+        failure_threshold=args.breaker_threshold,
+        reset_seconds=args.breaker_reset,
+        deadline_seconds=args.provider_deadline,
+        hedge_after_seconds=args.hedge_after,
+    )
+
+
+def local_provider_config(args: argparse.Namespace) -> LocalProviderConfig:
+    """Return the local provider settings."""
+    return LocalProviderConfig(
+        latency_seconds=args.local_latency,
+        throttle_every=args.local_throttle_every,
+        rate_limit_per_second=args.local_rate_limit,
+    )
+
+
+def print_batch_report(result: BatchBuildResult) -> None:
+    """Print per-deck and aggregate timings for a batch build."""
+    print("\n📊 Per-deck timings (seconds):")
+    print(
+        f"   {'deck':<24} "
+        + " ".join(f"{phase:>7}" for phase in PHASES)
+        + f" {'total':>8} {'cards':>6}"
+    )
+    for deck in result.results:
+        if not deck.succeeded:
+            print(f"   ❌ {deck.spec.key:<21} {deck.error}")
+            continue
+        print(
+            f"   {deck.spec.key:<24} "
+            + " ".join(f"{deck.timings.get(phase, 0.0):7.2f}" for phase in PHASES)
+            + f" {deck.total_seconds:8.2f} {deck.cards:6}"
+        )
+
+    totals = result.phase_totals()
+    print("\n📈 Aggregate:")
+    print(f"   🎴 Decks built: {len(result.succeeded)}/{len(result.results)}")
+    print(f"   🎴 Cards exported: {result.total_cards}")
+    print(
+        "   ⏱️  Phase totals: "
+        + ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in totals.items())
+    )
+    print(f"   ⏱️  Wall time: {result.wall_seconds:.2f}s")
+    print(f"   ♻️  Media files reused across decks: {result.reused_media_files}")
+    saved = {
+        deck.spec.key: (deck.image_bytes_saved, deck.audio_bytes_saved)
+        for deck in result.succeeded
+    }
+    if any(images or audio for images, audio in saved.values()):
+        print(f"   🗜️  Bytes saved:{'images':>24} {'audio':>12}")
+        for key, (images, audio) in saved.items():
+            print(f"      {key:<24} {images:>12,} {audio:>12,}")
+
+
+def print_build_plan(plan: BuildPlan) -> None:
+    """Print the dry-run estimate of a build."""
+    print(f"\n🧮 Build plan for {plan.records} records (no requests made):")
+    print(f"   {'Service':<10} {'Hits':>6} {'Misses':>7} {'Requests':>9}")
+    for service in plan.services.values():
+        print(
+            f"   {service.service:<10} {service.cache_hits:6} "
+            f"{service.cache_misses:7} {service.requests:9}"
+        )
+    print(f"   🔤 Polly characters: {plan.services['polly'].characters:,}")
+    if plan.skipped_records:
+        print(f"   ⚠️  Records without media: {plan.skipped_records}")
+    print(
+        f"   ⏱️  Projected enrichment time: {plan.estimated_seconds:.1f}s "
+        f"at concurrency {plan.concurrency}"
+    )
+
+
+def run_batch(
+    args: argparse.Namespace,
+    project_root: Path,
+    services: SharedServices | None = None,
+) -> None:
+    """Build several decks in one process, sharing services and caches."""
+    if args.manifest:
+        specs = load_manifest(args.manifest)
+    else:
+        specs = discover_decks(project_root / "languages")
+    if not specs:
+        print("❌ No decks to build")
+        sys.exit(1)
+
+    output_dir = Path(args.output) if args.output else project_root / "output"
+    print(f"=== Batch Deck Generator: {len(specs)} decks ===")
+    for spec in specs:
+        print(f"   📂 {spec.key}")
+    print(f"💾 Output directory: {output_dir}")
+
+    batch_builder = BatchDeckBuilder(
+        project_root,
+        output_dir,
+        services=services,
+        workers=args.workers,
+        image_config=image_config(args),
+        audio_config=audio_config(args),
+    )
+    result = batch_builder.build(specs)
+    print_batch_report(result)
+    if result.failed:
+        sys.exit(1)
+
+
+def run_warm(
+    args: argparse.Namespace,
+    project_root: Path,
+    services: SharedServices | None = None,
+) -> None:
+    """Fill the media store of one or more decks without building them."""
+    if args.manifest:
+        specs = load_manifest(args.manifest)
+    elif args.all:
+        specs = discover_decks(project_root / "languages")
+    else:
+        specs = [DeckSpec(args.language, args.deck)]
+
+    output_dir = Path(args.output) if args.output else project_root / "output"
+    warmer = MediaWarmer(
+        services or SharedServices(project_root), output_dir / "media_queue"
+    )
+    print(f"=== Media Warming: {len(specs)} decks ===")
+    failed = False
+    for spec in specs:
+        result = warmer.warm(spec, workers=args.media_workers)
+        if result.error is not None:
+            print(f"   ❌ {spec.key}: {result.error}")
+            failed = True
+            continue
+        backfill = result.backfill
+        generated = backfill.done if backfill else 0
+        print(
+            f"   🔥 {spec.key:<24} {result.records:5} records, "
+            f"{result.queued:5} queued, {generated:5} generated "
+            f"in {result.seconds:.2f}s"
+        )
+        if backfill is not None:
+            for error in backfill.errors:
+                print(f"      ❌ {error}")
+        failed = failed or not result.succeeded
+    if failed:
+        sys.exit(1)
+
+
+def run_watch(
+    args: argparse.Namespace,
+    project_root: Path,
+    output_file: Path,
+    services: SharedServices | None = None,
+) -> None:
+    """Rebuild one deck on every change to its data or templates."""
+    spec = DeckSpec(args.language, args.deck)
+    watcher = DeckWatcher(
+        spec,
+        services or SharedServices(project_root),
+        output_file,
+        image_config=image_config(args),
+        audio_config=audio_config(args),
+    )
+    data_dir, template_dir = watcher.watched_directories
+    print(f"👀 Watching {data_dir} and {template_dir} (Ctrl+C to stop)")
+
+    def report(changes: ChangeSet, result: DeckBuildResult) -> None:
+        if changes:
+            changed = [path.name for path in changes.csv_files]
+            changed += [path.name for path in changes.template_files]
+            print(f"\n🔄 Changed: {', '.join(changed)}")
+            if changes.record_types:
+                print(f"   📖 Record types: {', '.join(sorted(changes.record_types))}")
+            if changes.card_types:
+                print(f"   🎨 Card types: {', '.join(sorted(changes.card_types))}")
+        if not result.succeeded:
+            print(f"❌ Build failed: {result.error}")
+            return
+        timings = ", ".join(
+            f"{phase} {seconds:.2f}s" for phase, seconds in result.timings.items()
+        )
+        print(f"✅ {result.cards} cards → {result.output_path} ({timings})")
+
+    watcher.run(on_build=report)
+
+
+def run_sharded(
+    args: argparse.Namespace, project_root: Path, output_file: Path
+) -> None:
+    """Build one deck in parallel shards merged into a single package."""
+    spec = DeckSpec(args.language, args.deck)
+    sharded_builder = ShardedDeckBuilder(
+        spec,
+        project_root,
+        args.shards,
+        call_policy=call_policy(args),
+        fast_scratch=args.fast_scratch,
+    )
+    print(f"🧩 Building in up to {args.shards} shards...")
+    result = sharded_builder.build(output_file)
+    for shard in sharded_builder.shard_results:
+        timings = ", ".join(
+            f"{phase} {seconds:.2f}s" for phase, seconds in shard.timings.items()
+        )
+        print(
+            f"   🧩 Shard {shard.task.index}: "
+            f"{', '.join(shard.task.record_types)} ({timings})"
+        )
+    if not result.succeeded:
+        print(f"❌ Build failed: {result.error}")
+        sys.exit(1)
+    timings = ", ".join(
+        f"{stage} {seconds:.2f}s" for stage, seconds in result.timings.items()
+    )
+    print(f"✅ {result.cards} cards → {result.output_path} ({timings})")
+
+
 def main() -> None:
     """Main application entry point."""
     args = parse_args()
+    try:
+        validate_args(args)
+        policy = call_policy(args)
+    except ConfigurationError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    backend = FORMAT_BACKENDS[args.format]
+    if not args.local_providers:
+        services = SharedServices(
+            Path(__file__).parent.parent.parent,
+            call_policy=policy,
+            fast_scratch=args.fast_scratch,
+            backend=backend,
+        )
+        run(args, services)
+        return
+
+    with LocalProviders(local_provider_config(args)) as providers:
+        print(f"🧪 Local providers: Pexels stand-in at {providers.pexels_server.url}")
+        services = SharedServices(
+            Path(__file__).parent.parent.parent,
+            pexels_service=providers.pexels_service,
+            polly_client=providers.polly_client,
+            call_policy=policy,
+            fast_scratch=args.fast_scratch,
+            backend=backend,
+        )
+        try:
+            run(args, services)
+        finally:
+            stats = providers.stats()
+            print(
+                "🧪 Local provider calls: "
+                + ", ".join(f"{name} {count}" for name, count in stats.items())
+            )
+
+
+def run(args: argparse.Namespace, services: SharedServices | None = None) -> None:
+    """Build the decks selected on the command line.
+
+    Args:
+        args: Parsed command line arguments
+        services: Services to build with, e.g. wired to local providers;
+            each mode creates its own if omitted
+    """
+    if args.warm_media:
+        try:
+            run_warm(args, Path(__file__).parent.parent.parent, services)
+        except KeyboardInterrupt:
+            print("\n⏹️  Cancelled by user")
+            sys.exit(0)
+        return
+
+    if args.all or args.manifest:
+        try:
+            run_batch(args, Path(__file__).parent.parent.parent, services)
+        except KeyboardInterrupt:
+            print("\n⏹️  Cancelled by user")
+            sys.exit(0)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        return
 
     print(f"=== {args.language.title()} Deck Generator ===")
     print(f"Creating {args.deck} deck with automatic audio and image generation...")
@@ -75,14 +659,104 @@ def main() -> None:
                             print(f"    Deck: {deck_dir.name}")
         sys.exit(1)
 
+    if args.watch:
+        if args.output:
+            output_file = Path(args.output)
+        else:
+            filename = (
+                f"LangLearn_{args.language.capitalize()}_{args.deck}.{args.format}"
+            )
+            output_file = output_dir / filename
+        try:
+            run_watch(args, project_root, output_file, services)
+        except KeyboardInterrupt:
+            print("\n⏹️  Stopped watching")
+        return
+
+    if args.shards > 1:
+        if args.local_providers:
+            # Shards build in worker processes, out of reach of the providers
+            print("❌ Error: --shards cannot be combined with --local-providers")
+            sys.exit(1)
+        if args.output:
+            output_file = Path(args.output)
+        else:
+            filename = (
+                f"LangLearn_{args.language.capitalize()}_{args.deck}.{args.format}"
+            )
+            output_file = output_dir / filename
+        try:
+            run_sharded(args, project_root, output_file)
+        except KeyboardInterrupt:
+            print("\n⏹️  Cancelled by user")
+            sys.exit(0)
+        return
+
+    spec = DeckSpec(args.language, args.deck)
+    if args.persistent and args.fast_scratch:
+        print("❌ Error: --fast-scratch cannot be combined with --persistent")
+        sys.exit(1)
+    collection_path = None
+    if args.persistent:
+        collection_path = output_dir / "collections" / spec.collection_filename
+        print(f"🗃️  Working collection: {collection_path}")
+
+    # Enrichment is checkpointed only for builds that may be resumed
+    checkpoint_path = None
+    if args.checkpoint or args.resume:
+        checkpoint_path = output_dir / "checkpoints" / spec.checkpoint_filename
+    if args.resume:
+        print(f"⏯️  Resuming from checkpoint: {checkpoint_path}")
+    elif checkpoint_path is not None:
+        print(f"💾 Checkpointing to: {checkpoint_path}")
+
+    audio_service = None
+    pexels_service = None
+    if services is not None:
+        audio_service = services.audio_service(spec)
+        pexels_service = services.pexels_service()
+
+    media_queue = None
+    if args.defer_media or args.backfill_media:
+        media_queue = MediaJobQueue(
+            output_dir / "media_queue" / spec.media_queue_filename
+        )
+        print(f"📬 Media queue: {media_queue.path}")
+
+    if args.backfill_media:
+        with DeckBuilderAPI(
+            deck_name=deck_name,
+            language=args.language,
+            deck_type=args.deck,
+            audio_service=audio_service,
+            pexels_service=pexels_service,
+            media_queue=media_queue,
+        ) as builder:
+            backfill = builder.backfill_media(workers=args.media_workers)
+        print(
+            f"✅ Backfilled {backfill.done} media files in {backfill.seconds:.2f}s "
+            f"({backfill.failed} failed, {backfill.postponed} postponed)"
+        )
+        for error in backfill.errors:
+            print(f"   ❌ {error}")
+        return
+
     try:
         # Create the deck using DeckBuilderAPI with language/deck configuration
         with DeckBuilderAPI(
             deck_name=deck_name,
             language=args.language,
             deck_type=args.deck,
+            collection_path=collection_path,
+            audio_service=audio_service,
+            pexels_service=pexels_service,
+            checkpoint_path=checkpoint_path,
+            resume=args.resume,
+            media_queue=media_queue,
+            fast_scratch=args.fast_scratch,
+            backend=FORMAT_BACKENDS[args.format],
         ) as builder:
-            print("🚀 Initialized AnkiBackend")
+            print(f"🚀 Initialized {type(builder.backend).__name__}")
 
             # Load data from directory
             print(f"\n📚 Loading vocabulary data from {data_dir}...")
@@ -105,6 +779,10 @@ def main() -> None:
                     display_name = NamingService.get_display_name(word_type)
                     print(f"   📖 {display_name}: {count}")
 
+            if args.plan:
+                print_build_plan(builder.plan_build())
+                return
+
             # Generate cards with media
             print("\n🎴 Generating Anki cards with media...")
 
@@ -116,6 +794,24 @@ def main() -> None:
                     f"{progress.processed}/{progress.total}"
                 )
 
+            images = image_config(args)
+            if images is not None:
+                print("   🗜️  Optimizing images...")
+                report = builder.optimize_images(images)
+                print(
+                    f"      {len(report.processed)} processed, "
+                    f"{report.bytes_saved:,} bytes saved"
+                )
+
+            audio = audio_config(args)
+            if audio is not None:
+                print("   🔊 Post-processing audio...")
+                report = builder.process_audio(audio)
+                print(
+                    f"      {len(report.processed)} processed in "
+                    f"{report.seconds:.2f}s, {report.bytes_saved:,} bytes saved"
+                )
+
             # Build cards
             print("   🔨 Building Anki cards...")
             built_cards = builder.build_cards()
@@ -138,7 +834,9 @@ def main() -> None:
             if args.output:
                 output_file = Path(args.output)
             else:
-                filename = f"LangLearn_{args.language.capitalize()}_{args.deck}.apkg"
+                filename = (
+                    f"LangLearn_{args.language.capitalize()}_{args.deck}.{args.format}"
+                )
                 output_file = output_dir / filename
             print(f"\n💾 Exporting deck to {output_file}...")
 
@@ -149,6 +847,18 @@ def main() -> None:
             print(f"   📁 File: {export_result.output_path}")
             print(f"   📊 Size: {export_result.file_size:,} bytes")
             print(f"   🎴 Cards exported: {export_result.cards_exported}")
+            upsert_stats = builder.get_statistics()["deck_stats"].get("upsert_stats")
+            if upsert_stats:
+                print(
+                    "   🗃️  Notes added {added}, updated {updated}, "
+                    "unchanged {unchanged}, removed {removed}".format(**upsert_stats)
+                )
+            if media_queue is not None:
+                pending = media_queue.counts()["pending"]
+                print(
+                    f"   📬 {pending} media files queued; run --backfill-media "
+                    "and rebuild to add them"
+                )
             print("\n🎉 Import this file into Anki to start learning!")
 
     except KeyboardInterrupt:
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Resident deck build server with warm services and caches.
+
+Starting the server pays interpreter startup, SDK imports, keyring lookups,
+template loading and media directory scans once. Builds are then requested
+over local HTTP and reuse the same ``SharedServices``::
+
+    python -m langlearn.server --port 8765
+    curl -X POST localhost:8765/build -d '{"language": "german", "deck": "a1"}'
+
+Endpoints:
+
+- ``GET /health``: status, warmed decks and build count
+- ``GET /decks``: decks available under ``languages/``
+- ``POST /build``: JSON ``{"language", "deck", "output"?}``; responds with the
+  ``.apkg`` path, card and record counts and per-phase timings
+"""
+
+import argparse
+import json
+import logging
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from langlearn.core.deck import (
+    BatchDeckBuilder,
+    DeckBuildResult,
+    DeckSpec,
+    SharedServices,
+    discover_decks,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class BuildServer(ThreadingHTTPServer):
+    """HTTP server that builds decks with long-lived shared services.
+
+    Requests are handled in threads. Builds of different decks run
+    concurrently; builds of the same deck are serialized so they never write
+    the same .apkg at once.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        project_root: Path,
+        output_dir: Path,
+        services: SharedServices | None = None,
+    ) -> None:
+        """Initialize BuildServer.
+
+        Args:
+            address: (host, port) to listen on; port 0 picks a free port
+            project_root: Root containing the ``languages/`` data directories
+            output_dir: Default directory for built .apkg files
+            services: Shared services; created for project_root if omitted
+        """
+        super().__init__(address, BuildRequestHandler)
+        self.project_root = project_root
+        self.builder = BatchDeckBuilder(project_root, output_dir, services)
+        self.started_at = time.time()
+        self.builds = 0
+        self.warmed: list[DeckSpec] = []
+        self._deck_locks: dict[DeckSpec, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def available_decks(self) -> list[DeckSpec]:
+        """Return decks that can be built."""
+        return discover_decks(self.project_root / "languages")
+
+    def warm(self, specs: list[DeckSpec]) -> float:
+        """Warm services for decks before accepting requests.
+
+        Args:
+            specs: Decks to prepare
+
+        Returns:
+            Seconds spent warming
+        """
+        start = time.perf_counter()
+        self.builder.services.warm(specs)
+        self.warmed.extend(specs)
+        return time.perf_counter() - start
+
+    def build(self, spec: DeckSpec, output_path: Path | None) -> DeckBuildResult:
+        """Build one deck, serialized per deck.
+
+        Args:
+            spec: Deck to build
+            output_path: Optional .apkg path overriding the default
+
+        Returns:
+            DeckBuildResult for the deck
+        """
+        with self._lock:
+            deck_lock = self._deck_locks.setdefault(spec, threading.Lock())
+        with deck_lock:
+            result = self.builder.build_deck(spec, output_path)
+        with self._lock:
+            self.builds += 1
+        return result
+
+
+class BuildRequestHandler(BaseHTTPRequestHandler):
+    """JSON request handler for BuildServer."""
+
+    server: BuildServer
+
+    def do_GET(self) -> None:
+        """Serve health and deck listings."""
+        if self.path == "/health":
+            self._send_json(
+                HTTPStatus.OK,
+                {
+                    "status": "ok",
+                    "uptime_seconds": round(time.time() - self.server.started_at, 3),
+                    "builds": self.server.builds,
+                    "warmed": [spec.key for spec in self.server.warmed],
+                    "reused_media_files": (
+                        self.server.builder.services.reused_media_files
+                    ),
+                },
+            )
+        elif self.path == "/decks":
+            decks = [spec.key for spec in self.server.available_decks()]
+            self._send_json(HTTPStatus.OK, {"decks": decks})
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"No route {self.path}"})
+
+    def do_POST(self) -> None:
+        """Run a build job."""
+        if self.path != "/build":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"No route {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            job = json.loads(self.rfile.read(length) or b"{}")
+            spec = DeckSpec(
+                language=str(job["language"]).lower(),
+                deck=str(job.get("deck", "default")).lower(),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"Invalid job: {e}"})
+            return
+        if spec not in self.server.available_decks():
+            self._send_json(
+                HTTPStatus.NOT_FOUND, {"error": f"Unknown deck: {spec.key}"}
+            )
+            return
+
+        output = job.get("output")
+        result = self.server.build(spec, Path(output) if output else None)
+        status = HTTPStatus.OK if result.succeeded else HTTPStatus.INTERNAL_SERVER_ERROR
+        self._send_json(status, result_payload(result))
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Route request logs through logging instead of stderr."""
+        logger.info("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status: HTTPStatus, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def result_payload(result: DeckBuildResult) -> dict[str, Any]:
+    """Convert a build result to the JSON response body."""
+    return {
+        "deck": result.spec.key,
+        "output_path": str(result.output_path) if result.output_path else None,
+        "records": result.records,
+        "cards": result.cards,
+        "timings": {phase: round(s, 4) for phase, s in result.timings.items()},
+        "total_seconds": round(result.total_seconds, 4),
+        "error": result.error,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Resident deck build server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--output-dir", type=Path, help="Default .apkg directory (default: output/)"
+    )
+    parser.add_argument(
+        "--no-warm",
+        action="store_true",
+        help="Skip warming services and caches for every deck at startup",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the build server until interrupted."""
+    args = parse_args()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    project_root = Path(__file__).parent.parent.parent
+    output_dir = args.output_dir or project_root / "output"
+
+    server = BuildServer((args.host, args.port), project_root, output_dir)
+    if not args.no_warm:
+        specs = server.available_decks()
+        seconds = server.warm(specs)
+        print(f"🔥 Warmed {len(specs)} decks in {seconds:.2f}s")
+
+    host, port = server.server_address[:2]
+    print(f"🚀 Build server listening on http://{host!s}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️  Shutting down")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
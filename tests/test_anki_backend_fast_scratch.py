@@ -0,0 +1,83 @@
+"""Tests for AnkiBackend fast scratch collections."""
+
+import zipfile
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from langlearn.core.deck import DeckBuilderAPI
+from langlearn.exceptions import ConfigurationError
+from langlearn.infrastructure.backends.anki_backend import (
+    RAM_SCRATCH_DIR,
+    AnkiBackend,
+    ram_scratch_dir,
+)
+from langlearn.infrastructure.services.media_enricher import StandardMediaEnricher
+from langlearn.languages.german.language import GermanLanguage
+
+NOUNS = (
+    "noun,article,english,plural,example,related\n"
+    "Katze,die,cat,Katzen,Die Katze schläft.,Tier\n"
+    "Hund,der,dog,Hunde,Der Hund bellt.,Tier\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def no_media() -> Generator[None, None, None]:
+    """Disable media generation."""
+    with patch.object(StandardMediaEnricher, "enrich_with_media", return_value={}):
+        yield
+
+
+class TestFastScratch:
+    """Test building in a RAM-backed, non-durable scratch collection."""
+
+    def test_build_and_export(self, tmp_path: Path) -> None:
+        """Test a fast scratch build relaxes SQLite and exports a package."""
+        (tmp_path / "nouns.csv").write_text(NOUNS, encoding="utf-8")
+        output = tmp_path / "deck.apkg"
+
+        with DeckBuilderAPI("Test Deck", "german", fast_scratch=True) as builder:
+            backend = builder._backend
+            assert isinstance(backend, AnkiBackend)
+            assert backend.is_fast_scratch
+            db = backend._collection.db
+            assert db is not None
+            assert db.scalar("pragma journal_mode") == "memory"
+            assert db.scalar("pragma synchronous") == 0
+            if ram_scratch_dir() is not None:
+                assert Path(backend._collection_path).parent.parent == RAM_SCRATCH_DIR
+            builder.load_data(tmp_path, max_workers=1)
+            for _ in builder.enrich_media():
+                pass
+            builder.build_cards()
+            builder.export_deck(output)
+
+        with zipfile.ZipFile(output) as package:
+            assert any(
+                name.startswith("collection.anki2") for name in package.namelist()
+            )
+
+    def test_save_collection_keeps_fast_settings(self, tmp_path: Path) -> None:
+        """Test the reopened collection is still non-durable."""
+        backend = AnkiBackend("Test Deck", Mock(), GermanLanguage(), fast_scratch=True)
+        backend.save_collection(str(tmp_path / "copy.anki2"))
+
+        db = backend._collection.db
+        assert db is not None
+        assert db.scalar("pragma synchronous") == 0
+        assert (tmp_path / "copy.anki2").exists()
+        backend.close()
+
+    def test_rejected_for_persistent_collection(self, tmp_path: Path) -> None:
+        """Test fast scratch cannot be used for a kept collection."""
+        with pytest.raises(ConfigurationError, match="persistent"):
+            AnkiBackend(
+                "Test Deck",
+                Mock(),
+                GermanLanguage(),
+                collection_path=tmp_path / "deck.anki2",
+                fast_scratch=True,
+            )
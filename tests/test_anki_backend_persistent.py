@@ -0,0 +1,181 @@
+"""Tests for AnkiBackend persistent collections and note upserts."""
+
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from anki.collection import Collection
+
+from langlearn.core.deck import DeckBuilderAPI
+from langlearn.infrastructure.services.media_enricher import StandardMediaEnricher
+
+NOUNS_HEADER = "noun,article,english,plural,example,related\n"
+KATZE = "Katze,die,cat,Katzen,Die Katze schläft.,Tier\n"
+HUND = "Hund,der,dog,Hunde,Der Hund bellt.,Tier\n"
+MAUS = "Maus,die,mouse,Mäuse,Die Maus ist klein.,Tier\n"
+VERBS_HEADER = (
+    "infinitive,english,classification,separable,auxiliary,tense,"
+    "ich,du,er,wir,ihr,sie,example\n"
+)
+GEHEN_PRESENT = (
+    "gehen,to go,unregelmäßig,false,sein,present,"
+    "gehe,gehst,geht,gehen,geht,gehen,Ich gehe.\n"
+)
+GEHEN_PRETERITE = (
+    "gehen,to go,unregelmäßig,false,sein,preterite,"
+    "ging,gingst,ging,gingen,gingt,gingen,Ich ging.\n"
+)
+ADVERBS_HEADER = "word,english,type,example\n"
+GERADE_MANNER = "gerade,just/straight,manner,Ich komme gerade nach Hause.\n"
+GERADE_TIME = "gerade,just now,time,Ich bin gerade angekommen.\n"
+
+
+@pytest.fixture(autouse=True)
+def no_media() -> Generator[None, None, None]:
+    """Disable media generation."""
+    with patch.object(StandardMediaEnricher, "enrich_with_media", return_value={}):
+        yield
+
+
+def _build(
+    data_dir: Path,
+    collection_path: Path,
+    nouns: str,
+    other_files: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Build a noun deck into the persistent collection; return upsert stats.
+
+    other_files maps further CSV names to their content, header included.
+    """
+    (data_dir / "nouns.csv").write_text(NOUNS_HEADER + nouns, encoding="utf-8")
+    for name, content in (other_files or {}).items():
+        (data_dir / name).write_text(content, encoding="utf-8")
+    with DeckBuilderAPI(
+        "Test Deck", "german", collection_path=collection_path
+    ) as builder:
+        builder.load_data(data_dir, max_workers=1)
+        for _ in builder.enrich_media():
+            pass
+        builder.build_cards()
+        stats: dict[str, Any] = builder.get_statistics()["deck_stats"]["upsert_stats"]
+    return stats
+
+
+def _notes(collection_path: Path) -> dict[str, tuple[int, str]]:
+    """Return note id and GUID by first field."""
+    collection = Collection(str(collection_path))
+    try:
+        notes = {}
+        for note_id in collection.find_notes(""):
+            note = collection.get_note(note_id)
+            notes[note.fields[0]] = (int(note.id), note.guid)
+        return notes
+    finally:
+        collection.close()
+
+
+def _guids_by_fields(collection_path: Path) -> dict[tuple[str, ...], str]:
+    """Return the GUID of every note by its field values."""
+    collection = Collection(str(collection_path))
+    try:
+        return {
+            tuple(note.fields): note.guid
+            for note in map(collection.get_note, collection.find_notes(""))
+        }
+    finally:
+        collection.close()
+
+
+class TestPersistentCollection:
+    """Test rebuilding into a kept working collection."""
+
+    def test_rebuild_upserts_changed_notes(self, tmp_path: Path) -> None:
+        """Test unchanged notes keep their ids and GUIDs across rebuilds."""
+        collection_path = tmp_path / "collections" / "deck.anki2"
+
+        first = _build(tmp_path, collection_path, KATZE + HUND)
+        before = _notes(collection_path)
+        second = _build(tmp_path, collection_path, KATZE + HUND)
+
+        assert first == {"added": 2, "updated": 0, "unchanged": 0, "removed": 0}
+        assert second == {"added": 0, "updated": 0, "unchanged": 2, "removed": 0}
+        assert _notes(collection_path) == before
+
+    def test_rebuild_updates_adds_and_removes(self, tmp_path: Path) -> None:
+        """Test edited rows update in place and deleted rows are removed."""
+        collection_path = tmp_path / "deck.anki2"
+        _build(tmp_path, collection_path, KATZE + HUND)
+        before = _notes(collection_path)
+
+        stats = _build(
+            tmp_path, collection_path, KATZE.replace("schläft", "spielt") + MAUS
+        )
+        after = _notes(collection_path)
+
+        assert stats == {"added": 1, "updated": 1, "unchanged": 0, "removed": 1}
+        assert set(after) == {"Katze", "Maus"}
+        assert after["Katze"] == before["Katze"]
+
+    def test_guids_are_deterministic(self, tmp_path: Path) -> None:
+        """Test separate collections built from the same data share GUIDs."""
+        _build(tmp_path, tmp_path / "a.anki2", KATZE + HUND)
+        _build(tmp_path, tmp_path / "b.anki2", KATZE + HUND)
+
+        guids_a = {
+            word: guid for word, (_, guid) in _notes(tmp_path / "a.anki2").items()
+        }
+        guids_b = {
+            word: guid for word, (_, guid) in _notes(tmp_path / "b.anki2").items()
+        }
+        assert guids_a == guids_b
+
+    def test_guids_follow_identity_not_row_order(self, tmp_path: Path) -> None:
+        """Test conjugation notes keep their GUIDs when rows are reordered."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        _build(
+            tmp_path / "a",
+            tmp_path / "a.anki2",
+            KATZE,
+            {"verbs_unified.csv": VERBS_HEADER + GEHEN_PRESENT + GEHEN_PRETERITE},
+        )
+        _build(
+            tmp_path / "b",
+            tmp_path / "b.anki2",
+            KATZE,
+            {"verbs_unified.csv": VERBS_HEADER + GEHEN_PRETERITE + GEHEN_PRESENT},
+        )
+
+        guids_a = _guids_by_fields(tmp_path / "a.anki2")
+        assert len(set(guids_a.values())) == len(guids_a) == 3
+        assert guids_a == _guids_by_fields(tmp_path / "b.anki2")
+
+    def test_homographs_keep_their_notes(self, tmp_path: Path) -> None:
+        """Test each meaning of a homograph keeps its note when rows move."""
+        collection_path = tmp_path / "deck.anki2"
+        _build(
+            tmp_path,
+            collection_path,
+            KATZE,
+            {"adverbs.csv": ADVERBS_HEADER + GERADE_MANNER + GERADE_TIME},
+        )
+        before = _guids_by_fields(collection_path)
+
+        edited_time = GERADE_TIME.replace("angekommen", "aufgestanden")
+        stats = _build(
+            tmp_path,
+            collection_path,
+            KATZE,
+            {"adverbs.csv": ADVERBS_HEADER + edited_time + GERADE_MANNER},
+        )
+        after = _guids_by_fields(collection_path)
+
+        assert stats == {"added": 0, "updated": 1, "unchanged": 2, "removed": 0}
+
+        def by_meaning(guids: dict[tuple[str, ...], str]) -> dict[str, str]:
+            return {fields[1]: guid for fields, guid in guids.items()}
+
+        assert by_meaning(after) == by_meaning(before)
+        assert len(after) == 3
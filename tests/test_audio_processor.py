@@ -0,0 +1,132 @@
+"""Tests for the audio post-processing stage."""
+
+import subprocess
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from langlearn.exceptions import ConfigurationError
+from langlearn.infrastructure.services.audio_processor import (
+    AudioProcessingConfig,
+    AudioProcessor,
+    ffmpeg_command,
+    find_ffmpeg,
+)
+
+
+def _fake_ffmpeg(
+    command: list[str], **kwargs: Any
+) -> subprocess.CompletedProcess[bytes]:
+    """Write half of the input to the output, as a shrinking encode would."""
+    source = Path(command[command.index("-i") + 1])
+    data = source.read_bytes()
+    Path(command[-1]).write_bytes(data[: len(data) // 2])
+    return subprocess.CompletedProcess(command, 0, b"", b"")
+
+
+class TestAudioProcessingConfig:
+    """Test configuration validation and the ffmpeg command line."""
+
+    def test_command_includes_filters_and_encoding(self) -> None:
+        """Test trimming, loudness, mono and bitrate reach ffmpeg."""
+        config = AudioProcessingConfig(bitrate_kbps=48, sample_rate=22050)
+
+        command = ffmpeg_command("ffmpeg", Path("a.mp3"), Path("b.mp3"), config)
+
+        filters = command[command.index("-af") + 1]
+        assert filters.count("silenceremove") == 2
+        assert "loudnorm=I=-16.0" in filters
+        assert command[command.index("-ac") + 1] == "1"
+        assert command[command.index("-ar") + 1] == "22050"
+        assert command[command.index("-b:a") + 1] == "48k"
+        assert command[-1] == "b.mp3"
+
+    def test_command_without_filters(self) -> None:
+        """Test disabling trimming and loudness drops the filter chain."""
+        config = AudioProcessingConfig(
+            trim_silence=False, loudness_lufs=None, mono=False
+        )
+
+        command = ffmpeg_command("ffmpeg", Path("a.mp3"), Path("b.mp3"), config)
+
+        assert "-af" not in command
+        assert "-ac" not in command
+
+    def test_invalid_values(self) -> None:
+        """Test out-of-range targets are configuration errors."""
+        with pytest.raises(ConfigurationError, match="bitrate"):
+            AudioProcessingConfig(bitrate_kbps=1000)
+        with pytest.raises(ConfigurationError, match="loudness"):
+            AudioProcessingConfig(loudness_lufs=0)
+
+    def test_missing_ffmpeg(self) -> None:
+        """Test a clear error when ffmpeg is not installed."""
+        with (
+            patch("shutil.which", return_value=None),
+            pytest.raises(ConfigurationError, match="ffmpeg"),
+        ):
+            find_ffmpeg()
+
+
+class TestAudioProcessor:
+    """Test processing into the cache and reusing cached clips."""
+
+    @patch("langlearn.infrastructure.services.audio_processor.subprocess.run")
+    def test_processes_each_clip_once(self, run: Mock, tmp_path: Path) -> None:
+        """Test copies shrink, sources stay and a second run reuses the cache."""
+        run.side_effect = _fake_ffmpeg
+        audio = tmp_path / "audio"
+        audio.mkdir()
+        (audio / "a.mp3").write_bytes(b"a" * 1000)
+        (audio / "b.mp3").write_bytes(b"b" * 600)
+        processor = AudioProcessor(ffmpeg="ffmpeg")
+
+        first = processor.process_directory(audio, tmp_path / "cache")
+        second = processor.process_directory(audio, tmp_path / "cache")
+
+        assert first.bytes_saved == 800
+        assert len(first.processed) == 2
+        assert (audio / "a.mp3").read_bytes() == b"a" * 1000
+        assert first.outputs["a.mp3"].read_bytes() == b"a" * 500
+        assert first.outputs["a.mp3"].is_relative_to(tmp_path / "cache")
+        assert second.processed == []
+        assert second.outputs == first.outputs
+        assert second.bytes_saved == 800
+        assert run.call_count == 2
+        assert first.as_stats()["processed_bytes"] == 800
+
+    @patch("langlearn.infrastructure.services.audio_processor.subprocess.run")
+    def test_config_change_processes_the_original(
+        self, run: Mock, tmp_path: Path
+    ) -> None:
+        """Test another configuration encodes the source, not earlier output."""
+        run.side_effect = _fake_ffmpeg
+        (tmp_path / "a.mp3").write_bytes(b"a" * 1000)
+
+        AudioProcessor(ffmpeg="ffmpeg").process_directory(tmp_path, tmp_path / "c")
+        report = AudioProcessor(
+            AudioProcessingConfig(bitrate_kbps=32), ffmpeg="ffmpeg"
+        ).process_directory(tmp_path, tmp_path / "c")
+
+        assert len(report.processed) == 1
+        assert report.outputs["a.mp3"].stat().st_size == 500
+
+    @patch("langlearn.infrastructure.services.audio_processor.subprocess.run")
+    def test_ffmpeg_failure_keeps_clip(self, run: Mock, tmp_path: Path) -> None:
+        """Test a failing encode leaves the clip and reports the error."""
+        run.side_effect = subprocess.CalledProcessError(
+            1, "ffmpeg", stderr=b"Invalid data found"
+        )
+        (tmp_path / "a.mp3").write_bytes(b"not audio")
+
+        report = AudioProcessor(ffmpeg="ffmpeg").process_directory(
+            tmp_path, tmp_path / "cache"
+        )
+
+        assert len(report.failed) == 1
+        assert "Invalid data found" in str(report.failed[0].error)
+        assert report.outputs == {}
+        assert (tmp_path / "a.mp3").read_bytes() == b"not audio"
+        assert not list((tmp_path / "cache").rglob(".*.tmp"))
@@ -4,15 +4,41 @@ import tempfile
 from collections.abc import Generator
 from io import BytesIO
 from pathlib import Path
-from unittest.mock import Mock, mock_open, patch
+from typing import Any
+from unittest.mock import Mock, patch
 
 import pytest
 from botocore.exceptions import (
     ClientError,
+    IncompleteReadError,
     NoCredentialsError,
 )
 
-from langlearn.infrastructure.services.audio_service import AudioService
+from langlearn.exceptions import CircuitOpenError
+from langlearn.infrastructure.services.audio_service import (
+    AUDIO_CHUNK_SIZE,
+    AudioService,
+    is_provider_failure,
+    looks_like_mp3,
+)
+from langlearn.infrastructure.services.resilience import CallPolicy, ProviderGuard
+
+# MPEG-1 Layer III frame header followed by payload, as Polly streams begin
+FAKE_MP3 = b"\xff\xfb\x90\x64" + b"fake audio data"
+
+
+def _client_error(code: str, status: int) -> ClientError:
+    """Return a Polly ClientError with an error code and HTTP status."""
+    response: Any = {
+        "Error": {"Code": code, "Message": code},
+        "ResponseMetadata": {"HTTPStatusCode": status},
+    }
+    return ClientError(response, "SynthesizeSpeech")
+
+
+def _polly_response(stream: Any) -> Any:
+    """Return a synthesize_speech response carrying only the audio stream."""
+    return {"AudioStream": stream}
 
 
 class TestAudioService:
@@ -76,13 +102,11 @@ class TestAudioService:
         audio_service.client = mock_client
 
         # Mock the response with audio stream
-        mock_audio_stream = BytesIO(b"fake audio data")
+        mock_audio_stream = BytesIO(FAKE_MP3)
         mock_response = {"AudioStream": mock_audio_stream}
         mock_client.synthesize_speech.return_value = mock_response
 
-        # Mock file operations
-        with patch("builtins.open", mock_open()) as mock_file:
-            result = audio_service.generate_audio("test text")
+        result = audio_service.generate_audio("test text")
 
         # Verify the client was called with correct parameters
         mock_client.synthesize_speech.assert_called_once()
@@ -99,9 +123,8 @@ class TestAudioService:
         assert call_args["Engine"] == "neural"
 
         # Verify file was written
-        mock_file.assert_called_once()
-        assert result is not None
         assert result.endswith(".mp3")
+        assert Path(result).read_bytes() == FAKE_MP3
 
     @patch("langlearn.infrastructure.services.audio_service.boto3.client")
     def test_generate_audio_no_credentials_error(
@@ -151,7 +174,7 @@ class TestAudioService:
         audio_service.client = mock_client
 
         # Mock successful Polly response
-        mock_audio_stream = BytesIO(b"fake audio data")
+        mock_audio_stream = BytesIO(FAKE_MP3)
         mock_response = {"AudioStream": mock_audio_stream}
         mock_client.synthesize_speech.return_value = mock_response
 
@@ -165,21 +188,21 @@ class TestAudioService:
     def test_save_audio_file_success(self, audio_service: AudioService) -> None:
         """Test successful audio file saving."""
         # Mock response with audio stream
-        mock_audio_stream = BytesIO(b"fake audio data")
+        mock_audio_stream = BytesIO(FAKE_MP3)
         mock_response = {"AudioStream": mock_audio_stream}
 
-        with patch("builtins.open", mock_open()) as mock_file:
-            result = audio_service._save_audio_file("test text", mock_response)  # type: ignore[arg-type]  # Test boundary - mocking boto3 response
+        result = audio_service._save_audio_file("test text", mock_response)  # type: ignore[arg-type]  # Test boundary - mocking boto3 response
 
         # Verify file operations
-        mock_file.assert_called_once()
         assert result is not None
         assert result.endswith(".mp3")
+        assert Path(result).read_bytes() == FAKE_MP3
+        assert not list(audio_service.output_dir.glob(".*.part"))
 
     def test_save_audio_file_os_error(self, audio_service: AudioService) -> None:
         """Test OSError exception handling in _save_audio_file."""
         # Mock response with audio stream
-        mock_audio_stream = BytesIO(b"fake audio data")
+        mock_audio_stream = BytesIO(FAKE_MP3)
         mock_response = {"AudioStream": mock_audio_stream}
 
         # Mock file operations to raise OSError
@@ -191,13 +214,13 @@ class TestAudioService:
 
     def test_filename_generation(self, audio_service: AudioService) -> None:
         """Test that filename is generated consistently using MD5 hash."""
-        # Mock response with audio stream
-        mock_audio_stream = BytesIO(b"fake audio data")
-        mock_response = {"AudioStream": mock_audio_stream}
-
-        with patch("builtins.open", mock_open()):
-            result1 = audio_service._save_audio_file("test text", mock_response)  # type: ignore[arg-type]  # Test boundary - mocking boto3 response
-            result2 = audio_service._save_audio_file("test text", mock_response)  # type: ignore[arg-type]  # Test boundary - mocking boto3 response
+        # Each Polly response carries its own stream
+        result1 = audio_service._save_audio_file(
+            "test text", _polly_response(BytesIO(FAKE_MP3))
+        )
+        result2 = audio_service._save_audio_file(
+            "test text", _polly_response(BytesIO(FAKE_MP3))
+        )
 
         # Same text should generate same filename
         assert result1 == result2
@@ -214,12 +237,11 @@ class TestAudioService:
             mock_client = Mock()
             service.client = mock_client
 
-            mock_audio_stream = BytesIO(b"fake audio data")
+            mock_audio_stream = BytesIO(FAKE_MP3)
             mock_response = {"AudioStream": mock_audio_stream}
             mock_client.synthesize_speech.return_value = mock_response
 
-            with patch("builtins.open", mock_open()):
-                service.generate_audio("Hallo Welt")
+            service.generate_audio("Hallo Welt")
 
             # Verify SSML contains correct speech rate
             call_args = mock_client.synthesize_speech.call_args[1]
@@ -231,12 +253,11 @@ class TestAudioService:
         mock_client = Mock()
         audio_service.client = mock_client
 
-        mock_audio_stream = BytesIO(b"fake audio data")
+        mock_audio_stream = BytesIO(FAKE_MP3)
         mock_response = {"AudioStream": mock_audio_stream}
         mock_client.synthesize_speech.return_value = mock_response
 
-        with patch("builtins.open", mock_open()):
-            audio_service.generate_audio("test")
+        audio_service.generate_audio("test")
 
         # Verify all required parameters are present
         call_args = mock_client.synthesize_speech.call_args[1]
@@ -256,3 +277,87 @@ class TestAudioService:
         assert call_args["OutputFormat"] == "mp3"
         assert call_args["Engine"] == "neural"
         assert call_args["SampleRate"] == "16000"
+
+    def test_save_audio_file_streams_in_chunks(
+        self, audio_service: AudioService
+    ) -> None:
+        """Test long clips are copied chunk by chunk, never read whole."""
+        data = FAKE_MP3 * (AUDIO_CHUNK_SIZE // len(FAKE_MP3) * 3)
+        stream = Mock(wraps=BytesIO(data))
+
+        result = audio_service._save_audio_file("lang", _polly_response(stream))
+
+        assert result is not None
+        assert Path(result).read_bytes() == data
+        sizes = {call.args[0] for call in stream.read.call_args_list}
+        assert sizes == {AUDIO_CHUNK_SIZE}
+
+    @pytest.mark.parametrize(
+        "data", [b"", b"<html>Service Unavailable</html>"], ids=["empty", "not-mp3"]
+    )
+    def test_save_audio_file_rejects_invalid_stream(
+        self, audio_service: AudioService, data: bytes
+    ) -> None:
+        """Test empty or non-MP3 streams leave no file behind."""
+        result = audio_service._save_audio_file(
+            "test text", _polly_response(BytesIO(data))
+        )
+
+        assert result is None
+        assert not any(audio_service.output_dir.iterdir())
+
+    def test_truncated_stream_keeps_existing_file(
+        self, audio_service: AudioService
+    ) -> None:
+        """Test a dropped download neither replaces nor poisons the cache."""
+        first = audio_service._save_audio_file(
+            "test text", _polly_response(BytesIO(FAKE_MP3))
+        )
+        assert first is not None
+        stream = Mock()
+        stream.read.side_effect = [
+            FAKE_MP3,
+            IncompleteReadError(actual_bytes=len(FAKE_MP3), expected_bytes=1000),
+        ]
+
+        result = audio_service._save_audio_file("test text", _polly_response(stream))
+
+        assert result is None
+        assert Path(first).read_bytes() == FAKE_MP3
+        assert [path.name for path in audio_service.output_dir.iterdir()] == [
+            Path(first).name
+        ]
+
+    def test_looks_like_mp3(self) -> None:
+        """Test MP3 detection by frame sync or ID3 tag."""
+        assert looks_like_mp3(FAKE_MP3)
+        assert looks_like_mp3(b"ID3\x04\x00")
+        assert not looks_like_mp3(b"\xff")
+        assert not looks_like_mp3(b"RIFF")
+
+    def test_throttling_opens_shared_circuit(self, temp_dir: Path) -> None:
+        """Test throttling trips the guard shared by two services."""
+        guard = ProviderGuard("polly", CallPolicy(failure_threshold=2))
+        client = Mock()
+        client.synthesize_speech.side_effect = _client_error("ThrottlingException", 400)
+        first, second = (
+            AudioService(output_dir=str(temp_dir / name), client=client, guard=guard)
+            for name in ("a1", "b1")
+        )
+
+        for service in (first, second):
+            with pytest.raises(ClientError):
+                service.generate_audio("Hallo")
+        with pytest.raises(CircuitOpenError):
+            first.generate_audio("Hallo")
+
+        assert client.synthesize_speech.call_count == 2
+
+    def test_invalid_request_is_not_a_provider_failure(self) -> None:
+        """Test client errors other than throttling do not count."""
+        invalid = _client_error("InvalidSsmlException", 400)
+        unavailable = _client_error("ServiceFailureException", 500)
+
+        assert not is_provider_failure(invalid)
+        assert is_provider_failure(unavailable)
+        assert is_provider_failure(OSError("connection reset"))
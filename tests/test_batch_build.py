@@ -0,0 +1,240 @@
+"""Tests for multi-deck batch builds with shared services."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from langlearn.core.deck import (
+    BatchDeckBuilder,
+    DeckSpec,
+    SharedServices,
+    discover_decks,
+    load_manifest,
+)
+from langlearn.core.deck.batch import PHASES
+from langlearn.core.deck.data_types import ExportResult, LoadedData
+from langlearn.infrastructure.services.ai_service import AnthropicService
+from langlearn.infrastructure.services.audio_processor import AudioProcessingConfig
+from langlearn.infrastructure.services.image_processor import ImageProcessingConfig
+from langlearn.infrastructure.services.media_index import MediaIndex
+from langlearn.infrastructure.services.media_processing import MediaProcessingReport
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class TestDeckSpecs:
+    """Test deck discovery and manifest parsing."""
+
+    def test_parse(self) -> None:
+        """Test both manifest entry forms are accepted and lowercased."""
+        assert DeckSpec.parse("German/A1") == DeckSpec("german", "a1")
+        assert DeckSpec.parse("russian default") == DeckSpec("russian", "default")
+        assert DeckSpec("german", "a1").output_filename == "LangLearn_German_a1.apkg"
+        with pytest.raises(ValueError, match="language/deck"):
+            DeckSpec.parse("german")
+
+    def test_load_manifest(self, tmp_path: Path) -> None:
+        """Test comments, blank lines and duplicates are skipped."""
+        manifest = tmp_path / "decks.txt"
+        manifest.write_text(
+            "# nightly\ngerman/a1\n\nkorean/default  # new\ngerman/A1\n",
+            encoding="utf-8",
+        )
+
+        assert load_manifest(manifest) == [
+            DeckSpec("german", "a1"),
+            DeckSpec("korean", "default"),
+        ]
+
+    def test_load_manifest_reports_line(self, tmp_path: Path) -> None:
+        """Test malformed entries name the offending line."""
+        manifest = tmp_path / "decks.txt"
+        manifest.write_text("german/a1\ngerman/a1/extra\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match=r"decks\.txt:2"):
+            load_manifest(manifest)
+
+    def test_discover_decks(self, tmp_path: Path) -> None:
+        """Test only registered languages with CSV data are discovered."""
+        for deck in ("german/default", "german/a1", "german/empty", "klingon/x"):
+            (tmp_path / deck).mkdir(parents=True)
+        (tmp_path / "german/default/nouns.csv").write_text("noun\n")
+        (tmp_path / "german/a1/nouns.csv").write_text("noun\n")
+        (tmp_path / "klingon/x/nouns.csv").write_text("noun\n")
+
+        assert discover_decks(tmp_path) == [
+            DeckSpec("german", "a1"),
+            DeckSpec("german", "default"),
+        ]
+
+    def test_discover_repository_decks(self) -> None:
+        """Test the shipped data directories are all found."""
+        specs = discover_decks(PROJECT_ROOT / "languages")
+
+        assert DeckSpec("german", "default") in specs
+        assert DeckSpec("korean", "default") in specs
+
+
+class TestSharedServices:
+    """Test that services are created once and shared."""
+
+    def test_services_are_shared(self, tmp_path: Path) -> None:
+        """Test one Polly client, Pexels service and template cache per batch."""
+        services = SharedServices(tmp_path, pexels_service=Mock())
+        a1 = DeckSpec("german", "a1")
+        business = DeckSpec("german", "business")
+        for spec in (a1, business):
+            services.data_dir(spec).mkdir(parents=True)
+
+        assert services.audio_service(a1) is services.audio_service(a1)
+        assert (
+            services.audio_service(a1).client is services.audio_service(business).client
+        )
+        assert services.audio_service(business).output_dir == (
+            tmp_path / "languages" / "german" / "business" / "audio"
+        )
+        assert services.pexels_service() is services.pexels_service()
+        assert services.template_service("german") is services.template_service(
+            "german"
+        )
+        assert services.media_index("german") is not services.media_index("korean")
+
+    def test_output_path_follows_backend(self, tmp_path: Path) -> None:
+        """Test text backends export with their own suffix."""
+        spec = DeckSpec("german", "a1.1")
+
+        assert SharedServices(tmp_path).output_path(tmp_path, spec) == (
+            tmp_path / "LangLearn_German_a1.1.apkg"
+        )
+        assert SharedServices(tmp_path, backend="tsv").output_path(tmp_path, spec) == (
+            tmp_path / "LangLearn_German_a1.1.tsv"
+        )
+
+
+class TestBatchDeckBuilder:
+    """Test batch orchestration, timings and failure isolation."""
+
+    @staticmethod
+    def _builder(cards: int) -> Mock:
+        builder = Mock()
+        builder.__enter__ = Mock(return_value=builder)
+        builder.__exit__ = Mock(return_value=None)
+        builder.load_data.return_value = LoadedData(
+            records_by_type={},
+            total_records=cards,
+            source_paths=[],
+            validation_errors=[],
+        )
+        builder.enrich_media.return_value = iter([])
+        builder.export_deck.side_effect = lambda path: ExportResult(
+            output_path=path, file_size=1, cards_exported=cards
+        )
+        return builder
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_build_reports_per_deck_and_aggregate(
+        self, tmp_path: Path, workers: int
+    ) -> None:
+        """Test results keep spec order and failures do not stop the batch."""
+        specs = [
+            DeckSpec("german", "a1"),
+            DeckSpec("german", "broken"),
+            DeckSpec("russian", "default"),
+        ]
+        builders = {
+            specs[0]: self._builder(10),
+            specs[1]: self._builder(0),
+            specs[2]: self._builder(5),
+        }
+        builders[specs[1]].build_cards.side_effect = RuntimeError("bad template")
+        services = SharedServices(tmp_path, pexels_service=Mock())
+
+        with patch.object(
+            SharedServices, "create_builder", side_effect=builders.__getitem__
+        ):
+            result = BatchDeckBuilder(
+                tmp_path, tmp_path / "out", services, workers=workers
+            ).build(specs)
+
+        assert [deck.spec for deck in result.results] == specs
+        assert [deck.spec for deck in result.failed] == [specs[1]]
+        assert result.failed[0].error == "build: bad template"
+        assert result.total_cards == 15
+        assert result.results[0].output_path == (
+            tmp_path / "out" / "LangLearn_German_a1.apkg"
+        )
+        assert set(result.results[0].timings) == {"load", "enrich", "build", "export"}
+        assert result.phase_totals()["load"] >= 0
+        assert result.wall_seconds >= 0
+
+    def test_media_processing_phases_are_timed(self, tmp_path: Path) -> None:
+        """Test image and audio processing count in the phase totals."""
+        spec = DeckSpec("german", "a1")
+        builder = self._builder(3)
+        builder.optimize_images.return_value = MediaProcessingReport()
+        builder.process_audio.return_value = MediaProcessingReport()
+        services = SharedServices(tmp_path, pexels_service=Mock())
+
+        with (
+            patch.object(SharedServices, "create_builder", return_value=builder),
+            patch("langlearn.core.deck.batch.find_ffmpeg", return_value="ffmpeg"),
+        ):
+            result = BatchDeckBuilder(
+                tmp_path,
+                tmp_path / "out",
+                services,
+                image_config=ImageProcessingConfig(),
+                audio_config=AudioProcessingConfig(),
+            ).build([spec])
+
+        totals = result.phase_totals()
+        assert list(totals) == list(PHASES)
+        assert set(result.results[0].timings) == set(PHASES)
+        assert sum(totals.values()) == pytest.approx(result.results[0].total_seconds)
+
+
+class TestSharedCaches:
+    """Test caches that carry across decks."""
+
+    def test_media_index_restore(self, tmp_path: Path) -> None:
+        """Test restore copies indexed files and ignores unknown names."""
+        source = tmp_path / "default" / "audio"
+        source.mkdir(parents=True)
+        (source / "abc.mp3").write_bytes(b"mp3")
+        index = MediaIndex()
+
+        assert index.add_directory(source) == 1
+        assert index.add_directory(source) == 0
+        assert index.restore(tmp_path / "a1" / "audio" / "abc.mp3")
+        assert (tmp_path / "a1" / "audio" / "abc.mp3").read_bytes() == b"mp3"
+        assert not index.restore(tmp_path / "a1" / "audio" / "missing.mp3")
+        assert index.reused_count == 1
+
+    def test_anthropic_image_queries_are_cached(self) -> None:
+        """Test repeated contexts reuse the first generated query."""
+        service = AnthropicService()
+        with patch.object(
+            service, "_generate_response", return_value=" cat sleeping "
+        ) as generate:
+            assert service.generate_image_query("Katze") == "cat sleeping"
+            assert service.generate_image_query("Katze") == "cat sleeping"
+            generate.assert_called_once()
+
+            service.clear_cache()
+            service.generate_image_query("Katze")
+            assert generate.call_count == 2
+
+    def test_warm_loads_templates_and_indexes_media(self, tmp_path: Path) -> None:
+        """Test warming fills the template cache and media index up front."""
+        spec = DeckSpec("german", "a1")
+        services = SharedServices(tmp_path, pexels_service=Mock())
+        (services.data_dir(spec) / "images").mkdir(parents=True)
+        (services.data_dir(spec) / "images" / "katze.jpg").write_bytes(b"jpg")
+
+        with patch("langlearn.core.deck.batch.get_anthropic_service") as anthropic:
+            services.warm([spec])
+
+        assert "katze.jpg" in services.media_index("german")
+        assert services.template_service("german")._cache
+        anthropic.assert_called_once()
@@ -0,0 +1,103 @@
+"""Tests for the resident deck build server."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from langlearn.core.deck import DeckBuildResult, DeckSpec
+from langlearn.server import BuildServer
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Generator[BuildServer, None, None]:
+    """Run a BuildServer on a free port over a one-deck data tree."""
+    deck_dir = tmp_path / "languages" / "german" / "a1"
+    deck_dir.mkdir(parents=True)
+    (deck_dir / "nouns.csv").write_text("noun\n", encoding="utf-8")
+
+    build_server = BuildServer(("127.0.0.1", 0), tmp_path, tmp_path / "out")
+    thread = threading.Thread(target=build_server.serve_forever, daemon=True)
+    thread.start()
+    yield build_server
+    build_server.shutdown()
+    build_server.server_close()
+
+
+def _request(
+    server: BuildServer, path: str, job: dict[str, Any] | None = None
+) -> tuple[int, dict[str, Any]]:
+    host, port = server.server_address[:2]
+    data = json.dumps(job).encode() if job is not None else None
+    request = urllib.request.Request(f"http://{host!s}:{port}{path}", data=data)
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+class TestBuildServer:
+    """Test BuildServer endpoints."""
+
+    def test_health_and_decks(self, server: BuildServer) -> None:
+        """Test status and deck discovery endpoints."""
+        status, health = _request(server, "/health")
+        assert status == 200
+        assert health["status"] == "ok"
+        assert health["builds"] == 0
+
+        assert _request(server, "/decks") == (200, {"decks": ["german/a1"]})
+
+    def test_build_returns_path_and_metrics(
+        self, server: BuildServer, tmp_path: Path
+    ) -> None:
+        """Test a build job reuses the server's builder and reports timings."""
+        spec = DeckSpec("german", "a1")
+        result = DeckBuildResult(
+            spec=spec,
+            output_path=tmp_path / "out" / spec.output_filename,
+            records=3,
+            cards=4,
+            timings={"load": 0.1, "enrich": 0.2, "build": 0.3, "export": 0.4},
+        )
+        build_deck = Mock(return_value=result)
+
+        with patch.object(server.builder, "build_deck", build_deck):
+            status, payload = _request(
+                server, "/build", {"language": "German", "deck": "A1"}
+            )
+
+        assert status == 200
+        assert payload["output_path"] == str(result.output_path)
+        assert payload["cards"] == 4
+        assert payload["total_seconds"] == pytest.approx(1.0)
+        build_deck.assert_called_once_with(spec, None)
+        assert _request(server, "/health")[1]["builds"] == 1
+
+    def test_failed_build_is_server_error(self, server: BuildServer) -> None:
+        """Test failed builds report the error with a 500."""
+        spec = DeckSpec("german", "a1")
+        failed = DeckBuildResult(spec=spec, error="load: bad csv")
+
+        with patch.object(server.builder, "build_deck", return_value=failed):
+            status, payload = _request(
+                server, "/build", {"language": "german", "deck": "a1"}
+            )
+
+        assert status == 500
+        assert payload["error"] == "load: bad csv"
+
+    def test_rejects_bad_jobs(self, server: BuildServer) -> None:
+        """Test malformed jobs, unknown decks and routes."""
+        assert _request(server, "/build", {"deck": "a1"})[0] == 400
+        assert _request(server, "/build", {"language": "german", "deck": "b2"})[0] == (
+            404
+        )
+        assert _request(server, "/missing")[0] == 404
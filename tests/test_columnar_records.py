@@ -0,0 +1,209 @@
+"""Tests for the columnar record store."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from langlearn.core.records import ColumnarRecordStore, RecordRowView, RecordType
+from langlearn.languages.german.records.factory import (
+    AdjectiveRecord,
+    NounRecord,
+    VerbConjugationRecord,
+)
+
+
+def _verb(
+    infinitive: str, tense: str, auxiliary: str = "haben"
+) -> VerbConjugationRecord:
+    return VerbConjugationRecord(
+        infinitive=infinitive,
+        english=f"to {infinitive}",
+        classification="regelmäßig",
+        separable=False,
+        auxiliary=auxiliary,
+        tense=tense,
+        ich="a",
+        du="b",
+        er="c",
+        wir="d",
+        ihr="e",
+        sie="f",
+    )
+
+
+@pytest.fixture
+def nouns() -> list[NounRecord]:
+    """Noun records with a repeated article and one duplicate."""
+    return [
+        NounRecord("Katze", "die", "cat", "Katzen", "Die Katze schläft."),
+        NounRecord("Hund", "der", "dog", "Hunde", "Der Hund bellt."),
+        NounRecord("Maus", "die", "mouse", "Mäuse", "Die Maus piept."),
+        NounRecord("Katze", "die", "cat", "Katzen", "Die Katze schläft."),
+    ]
+
+
+@pytest.fixture
+def verbs() -> list[VerbConjugationRecord]:
+    """Verb conjugation records for two infinitives."""
+    return [
+        _verb("machen", "present"),
+        _verb("gehen", "present", auxiliary="sein"),
+        _verb("machen", "preterite"),
+        _verb("gehen", "preterite", auxiliary="sein"),
+    ]
+
+
+class TestColumnarRecordStore:
+    """Test ColumnarRecordStore construction and vectorized operations."""
+
+    def test_from_records_dictionary_encodes_strings(
+        self, nouns: list[NounRecord]
+    ) -> None:
+        """Test that string columns are stored as categoricals."""
+        store = ColumnarRecordStore.from_records(nouns)
+
+        assert len(store) == 4
+        assert store.record_class is NounRecord
+        assert store.columns[:2] == ("noun", "article")
+        assert isinstance(store.column("article").dtype, pd.CategoricalDtype)
+        assert list(store.column("article").cat.categories) == ["der", "die"]
+
+    def test_from_records_keeps_booleans(
+        self, verbs: list[VerbConjugationRecord]
+    ) -> None:
+        """Test that non-string columns keep native values."""
+        store = ColumnarRecordStore.from_records(verbs)
+
+        assert store[0].separable is False
+        assert store[0].image is None
+
+    def test_from_records_rejects_mixed_types(self, nouns: list[NounRecord]) -> None:
+        """Test that records of different classes cannot share a store."""
+        adjective = AdjectiveRecord("schön", "beautiful", "Example", "schöner")
+
+        with pytest.raises(ValueError, match="AdjectiveRecord"):
+            ColumnarRecordStore.from_records([*nouns, adjective])
+
+    def test_from_records_empty_requires_class(self) -> None:
+        """Test empty stores need an explicit record class."""
+        with pytest.raises(ValueError, match="record_class"):
+            ColumnarRecordStore.from_records([])
+
+        store = ColumnarRecordStore.from_records([], NounRecord)
+        assert len(store) == 0
+        assert store.materialize() == []
+
+    def test_from_frame_fills_defaults(self) -> None:
+        """Test that optional columns default and required columns are enforced."""
+        frame = pd.DataFrame(
+            {
+                "noun": ["Katze"],
+                "article": ["die"],
+                "english": ["cat"],
+                "plural": ["Katzen"],
+                "example": ["Die Katze schläft."],
+            }
+        )
+
+        store = ColumnarRecordStore.from_frame(NounRecord, frame)
+
+        assert store[0].related == ""
+        assert store[0].image is None
+        with pytest.raises(ValueError, match="plural"):
+            ColumnarRecordStore.from_frame(NounRecord, frame.drop(columns="plural"))
+
+    def test_materialize_round_trips(self, nouns: list[NounRecord]) -> None:
+        """Test that materialize rebuilds equal record instances."""
+        store = ColumnarRecordStore.from_records(nouns)
+
+        assert store.materialize() == nouns
+
+    def test_filter(self, verbs: list[VerbConjugationRecord]) -> None:
+        """Test vectorized equality filtering across several fields."""
+        store = ColumnarRecordStore.from_records(verbs)
+
+        result = store.filter(tense="present", auxiliary="sein")
+
+        assert [row.infinitive for row in result] == ["gehen"]
+        assert len(store) == 4
+        with pytest.raises(KeyError):
+            store.filter(unknown="x")
+
+    def test_dedupe(self, nouns: list[NounRecord]) -> None:
+        """Test duplicate rows are dropped, keeping the first occurrence."""
+        store = ColumnarRecordStore.from_records(nouns)
+
+        assert len(store.dedupe()) == 3
+        assert [row.noun for row in store.dedupe(["article"])] == ["Katze", "Hund"]
+
+    def test_group_indices_in_first_occurrence_order(
+        self, verbs: list[VerbConjugationRecord]
+    ) -> None:
+        """Test grouping rows by infinitive."""
+        store = ColumnarRecordStore.from_records(verbs)
+
+        groups = store.group_indices("infinitive")
+
+        assert list(groups) == ["machen", "gehen"]
+        np.testing.assert_array_equal(groups["machen"], [0, 2])
+        grouped = store.group_by("infinitive")
+        assert [row.tense for row in grouped["gehen"]] == ["present", "preterite"]
+
+    def test_group_indices_without_values(self, nouns: list[NounRecord]) -> None:
+        """Test an empty store and an all-None column give no groups."""
+        empty = ColumnarRecordStore.from_records([], NounRecord)
+
+        assert empty.group_indices("noun") == {}
+        assert ColumnarRecordStore.from_records(nouns).group_by("image") == {}
+
+    def test_find_empty_checks_required_fields(self) -> None:
+        """Test blank and missing values are reported by row position."""
+        frame = pd.DataFrame(
+            {
+                "noun": ["Katze", "  ", "Maus"],
+                "article": ["die", "der", None],
+                "english": ["cat", "dog", "mouse"],
+                "plural": ["Katzen", "Hunde", "Mäuse"],
+                "example": ["", "", ""],
+            }
+        )
+        store = ColumnarRecordStore.from_frame(NounRecord, frame)
+
+        np.testing.assert_array_equal(
+            store.find_empty(["noun", "article"]), np.array([1, 2])
+        )
+        np.testing.assert_array_equal(store.find_empty(), np.array([0, 1, 2]))
+
+
+class TestRecordRowView:
+    """Test row views against the BaseRecord read API."""
+
+    def test_row_view_fields_and_class_methods(self, nouns: list[NounRecord]) -> None:
+        """Test attribute access, mapping access and delegated class methods."""
+        row = ColumnarRecordStore.from_records(nouns)[1]
+
+        assert isinstance(row, RecordRowView)
+        assert row.noun == "Hund"
+        assert row["article"] == "der"
+        assert row.get_record_type() is RecordType.NOUN
+        assert row.get_subdeck_name() == "Nouns"
+        assert row.to_dict() == nouns[1].to_dict()
+        assert dict(row.as_mapping()) == dict(nouns[1].as_mapping())
+        assert row.materialize() == nouns[1]
+
+    def test_row_view_rejects_instance_behaviour(self, nouns: list[NounRecord]) -> None:
+        """Test that instance methods require materialize()."""
+        row = ColumnarRecordStore.from_records(nouns)[0]
+
+        with pytest.raises(AttributeError, match="materialize"):
+            row.validate()
+        with pytest.raises(KeyError):
+            row["missing"]
+
+    def test_negative_and_out_of_range_indices(self, nouns: list[NounRecord]) -> None:
+        """Test row indexing bounds."""
+        store = ColumnarRecordStore.from_records(nouns)
+
+        assert store[-1].index == 3
+        with pytest.raises(IndexError):
+            store[4]
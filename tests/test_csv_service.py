@@ -346,6 +346,28 @@ class TestCSVServiceRecords:
             if temp_path.exists():
                 temp_path.unlink()
 
+    def test_read_csv_as_records_skips_sparse_rows_by_row_number(
+        self, csv_service: CSVService, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test sparse and invalid rows are skipped and reported by CSV row."""
+        csv_path = tmp_path / "verbs_unified.csv"
+        csv_path.write_text(
+            "infinitive,english,classification,separable,auxiliary,tense,"
+            "ich,du,er,wir,ihr,sie,example\n"
+            "gehen,to go,unregelmäßig,false,sein,present,"
+            "gehe,gehst,geht,gehen,geht,gehen,Ich gehe.\n"
+            " ,,,,,,,,,,,,\n"
+            "gehen,to go,unregelmäßig,false,sein,bogus,"
+            "gehe,gehst,geht,gehen,geht,gehen,Ich gehe.\n",
+            encoding="utf-8",
+        )
+
+        records = csv_service.read_csv_as_records(csv_path, "verb_conjugation")
+
+        assert len(records) == 1
+        assert "Skipping row 3: insufficient data (0/2 fields)" in caplog.text
+        assert "from row 4" in caplog.text
+
     def test_read_noun_records(
         self, csv_service: CSVService, temp_noun_csv: Path
     ) -> None:
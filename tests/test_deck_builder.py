@@ -2,12 +2,21 @@
 
 import tempfile
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
+from PIL import Image
 
 from langlearn.core.deck import DeckBuilderAPI as DeckBuilder
+from langlearn.core.deck.checkpoint import EnrichmentCheckpoint
+from langlearn.core.deck.phases import InvalidPhaseError
+from langlearn.exceptions import ConfigurationError
+from langlearn.infrastructure.backends import InMemoryBackend
 from langlearn.infrastructure.backends.base import DeckBackend, MediaFile
+from langlearn.infrastructure.services.image_processor import ImageProcessingConfig
+from langlearn.infrastructure.services.media_enricher import StandardMediaEnricher
+from langlearn.infrastructure.services.media_queue import MediaJobQueue
 from langlearn.languages.german.models.adjective import Adjective
 from langlearn.languages.german.models.adverb import Adverb, AdverbType
 from langlearn.languages.german.models.negation import Negation, NegationType
@@ -165,6 +174,11 @@ class TestGermanDeckBuilder:
                 # Should have loaded records
                 assert len(builder._loaded_records) == 1
 
+                store = builder.get_columnar_records("noun")
+                assert store is not None
+                assert [row.noun for row in store] == ["Katze"]
+                assert builder.get_columnar_records("adjective") is None
+
     @patch("langlearn.core.deck.builder.AnkiBackend")
     def test_create_subdeck(self, mock_anki: Mock) -> None:
         """Test creating subdecks."""
@@ -429,3 +443,421 @@ class TestGermanDeckBuilder:
 
 # Legacy test removed: test_clear_loaded_data_comprehensive
 # - tested functionality removed from DeckBuilder
+
+
+class TestConcurrentLoading:
+    """Test concurrent CSV loading in DeckBuilderAPI.load_data."""
+
+    @staticmethod
+    def _write_csvs(data_dir: Path) -> None:
+        (data_dir / "nouns.csv").write_text(
+            "noun,article,english,plural,example,related\n"
+            "Katze,die,cat,Katzen,Die Katze schläft.,Tier\n"
+            "Hund,der,dog,Hunde,Der Hund bellt.,Tier\n",
+            encoding="utf-8",
+        )
+        (data_dir / "adverbs.csv").write_text(
+            "word,english,type,example\nhier,here,location,Ich bin hier.\n",
+            encoding="utf-8",
+        )
+        (data_dir / "negations.csv").write_text(
+            "word,english,type,example\nnicht,not,general,Das ist nicht gut.\n",
+            encoding="utf-8",
+        )
+
+    @patch("langlearn.core.deck.builder.AnkiBackend")
+    def test_parallel_load_keeps_serial_order(
+        self, mock_anki: Mock, tmp_path: Path
+    ) -> None:
+        """Test thread and process loads merge records in mapping order."""
+        self._write_csvs(tmp_path)
+
+        def load(**kwargs: object) -> list[object]:
+            builder = DeckBuilder("Test Deck", "german")
+            builder.load_data(tmp_path, **kwargs)  # type: ignore[arg-type]
+            return [
+                getattr(record, "noun", None) or getattr(record, "word", "")
+                for record in builder._loaded_records
+            ]
+
+        serial = load(max_workers=1)
+
+        assert serial == ["Katze", "Hund", "hier", "nicht"]
+        assert load(max_workers=3) == serial
+        assert load(max_workers=3, use_processes=True) == serial
+
+    @patch("langlearn.core.deck.builder.AnkiBackend")
+    def test_parallel_load_propagates_errors(
+        self, mock_anki: Mock, tmp_path: Path
+    ) -> None:
+        """Test a failing file still fails the load when others succeed."""
+        self._write_csvs(tmp_path)
+        (tmp_path / "articles_unified.csv").write_text(
+            "artikel_typ,geschlecht,nominativ,akkusativ,dativ,genitiv,"
+            "beispiel_nom,beispiel_akk,beispiel_dat,beispiel_gen\n"
+            "bogus,maskulin,der,den,dem,des,a,b,c,d\n",
+            encoding="utf-8",
+        )
+        builder = DeckBuilder("Test Deck", "german")
+
+        with pytest.raises(ValueError, match="unified_article data at row 2"):
+            builder.load_data(tmp_path, max_workers=3)
+
+    @patch("langlearn.core.deck.builder.AnkiBackend")
+    def test_load_only_requested_record_types(
+        self, mock_anki: Mock, tmp_path: Path
+    ) -> None:
+        """Test other record types' files are not read at all."""
+        self._write_csvs(tmp_path)
+        builder = DeckBuilder("Test Deck", "german")
+
+        with patch.object(
+            builder._record_mapper,
+            "load_records_from_csv",
+            wraps=builder._record_mapper.load_records_from_csv,
+        ) as load_csv:
+            loaded = builder.load_data(
+                tmp_path, max_workers=1, record_types=["adverb", "negation"]
+            )
+
+        assert set(loaded.records_by_type) == {"adverb", "negation"}
+        assert [call.args[1] for call in load_csv.call_args_list] == [
+            "adverb",
+            "negation",
+        ]
+
+
+class TestIncrementalEnrichment:
+    """Test reusing enrichment results from an earlier build."""
+
+    @patch("langlearn.core.deck.builder.AnkiBackend")
+    def test_enrich_media_reuses_unchanged_records(
+        self, mock_anki: Mock, tmp_path: Path
+    ) -> None:
+        """Test only new or edited records reach the media enricher."""
+        TestConcurrentLoading._write_csvs(tmp_path)
+
+        def enrich(previous: object = None) -> tuple[DeckBuilder, Mock]:
+            builder = DeckBuilder("Test Deck", "german")
+            enricher = Mock()
+            enricher.enrich_with_media.side_effect = lambda model: {
+                "image": f"{model.get_primary_word().lower()}.jpg"
+            }
+            builder._media_enricher = enricher
+            builder.load_data(tmp_path, max_workers=1)
+            for _ in builder.enrich_media(previous=previous):  # type: ignore[arg-type]
+                pass
+            return builder, enricher
+
+        first, first_enricher = enrich()
+        assert first_enricher.enrich_with_media.call_count == 4
+
+        nouns = tmp_path / "nouns.csv"
+        nouns.write_text(
+            nouns.read_text(encoding="utf-8").replace("Hund,der,dog", "Hund,der,hound"),
+            encoding="utf-8",
+        )
+        second, second_enricher = enrich(first.get_enriched_data())
+
+        assert second_enricher.enrich_with_media.call_count == 1
+        media = second.get_enriched_data("noun")["noun"].media_data
+        assert [data["image"] for data in media] == ["katze.jpg", "hund.jpg"]
+        assert media[1]["english"] == "hound"
+
+
+class TestResumableEnrichment:
+    """Test checkpointing enrichment and resuming an interrupted build."""
+
+    @staticmethod
+    def _enricher(fail_on: str | None = None) -> Mock:
+        def enrich(model: Any) -> dict[str, str]:
+            word = model.get_primary_word().lower()
+            if word == fail_on:
+                raise KeyboardInterrupt  # The build dies, not just one record
+            return {"image": f"{word}.jpg"}
+
+        enricher = Mock()
+        enricher.enrich_with_media.side_effect = enrich
+        return enricher
+
+    @patch("langlearn.core.deck.builder.AnkiBackend")
+    def test_resume_skips_checkpointed_records(
+        self, mock_anki: Mock, tmp_path: Path
+    ) -> None:
+        """Test a resumed build only enriches records not yet checkpointed."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        TestConcurrentLoading._write_csvs(data_dir)
+        checkpoint = tmp_path / "checkpoint.jsonl"
+
+        def enrich(enricher: Mock, resume: bool) -> DeckBuilder:
+            builder = DeckBuilder(
+                "Test Deck", "german", checkpoint_path=checkpoint, resume=resume
+            )
+            builder._media_enricher = enricher
+            builder.load_data(data_dir, max_workers=1)
+            with builder:
+                for _ in builder.enrich_media():
+                    pass
+            return builder
+
+        with pytest.raises(KeyboardInterrupt):
+            enrich(self._enricher(fail_on="hier"), resume=False)
+        assert len(checkpoint.read_text(encoding="utf-8").splitlines()) == 2
+
+        enricher = self._enricher()
+        resumed = enrich(enricher, resume=True)
+
+        assert enricher.enrich_with_media.call_count == 2
+        media = resumed.get_enriched_data("noun")["noun"].media_data
+        assert [data["image"] for data in media] == ["katze.jpg", "hund.jpg"]
+        assert len(checkpoint.read_text(encoding="utf-8").splitlines()) == 4
+
+        fresh = self._enricher()
+        enrich(fresh, resume=False)
+        assert fresh.enrich_with_media.call_count == 4
+
+    def test_resume_requires_checkpoint(self) -> None:
+        """Test resuming without a checkpoint file is a configuration error."""
+        with pytest.raises(ConfigurationError, match="checkpoint_path"):
+            DeckBuilder("Test Deck", "german", resume=True)
+
+
+class TestDeferredMediaBuild:
+    """Test deferring media through the builder."""
+
+    @patch("langlearn.core.deck.builder.AnkiBackend")
+    def test_media_queue_defers_enrichment(
+        self, mock_anki: Mock, tmp_path: Path
+    ) -> None:
+        """Test the builder's enricher queues media and backfill drains it."""
+        queue = MediaJobQueue(tmp_path / "queue.sqlite3")
+        builder = DeckBuilder("Test Deck", "german", media_queue=queue)
+
+        enricher = builder._media_enricher
+        assert enricher._media_queue is queue  # type: ignore[attr-defined]
+        assert builder.backfill_media().done == 0
+
+    @patch("langlearn.core.deck.builder.AnkiBackend")
+    def test_records_with_deferred_media_are_not_checkpointed(
+        self, mock_anki: Mock, tmp_path: Path
+    ) -> None:
+        """Test a resumed build does not reuse media data missing deferred files."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        TestConcurrentLoading._write_csvs(data_dir)
+        deck_dir = tmp_path / "languages" / "german" / "default"
+        (deck_dir / "audio").mkdir(parents=True)
+        (deck_dir / "images").mkdir()
+        queue = MediaJobQueue(tmp_path / "queue.sqlite3")
+        checkpoint = tmp_path / "checkpoint.jsonl"
+        builder = DeckBuilder(
+            "Test Deck",
+            "german",
+            project_root=tmp_path,
+            checkpoint_path=checkpoint,
+            media_queue=queue,
+        )
+        builder.load_data(data_dir, max_workers=1)
+
+        for _ in builder.enrich_media():
+            pass
+
+        assert queue.counts()["pending"] > 0
+        assert checkpoint.read_text(encoding="utf-8") == ""
+
+    @patch("langlearn.core.deck.builder.AnkiBackend")
+    def test_records_with_failed_media_are_not_reused(
+        self, mock_anki: Mock, tmp_path: Path
+    ) -> None:
+        """Test media lost to provider failures is neither checkpointed nor reused."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        TestConcurrentLoading._write_csvs(data_dir)
+        deck_dir = tmp_path / "languages" / "german" / "default"
+        (deck_dir / "audio").mkdir(parents=True)
+        (deck_dir / "images").mkdir()
+        checkpoint = tmp_path / "checkpoint.jsonl"
+        audio_service = Mock()
+        audio_service.generate_audio.side_effect = RuntimeError("throttled")
+        pexels_service = Mock()
+        pexels_service.download_image.return_value = False
+
+        def enrich(resume: bool) -> DeckBuilder:
+            builder = DeckBuilder(
+                "Test Deck",
+                "german",
+                audio_service=audio_service,
+                pexels_service=pexels_service,
+                project_root=tmp_path,
+                checkpoint_path=checkpoint,
+                resume=resume,
+            )
+            builder.load_data(data_dir, max_workers=1)
+            with builder:
+                for _ in builder.enrich_media():
+                    pass
+            return builder
+
+        builder = enrich(resume=False)
+        assert checkpoint.read_text(encoding="utf-8") == ""
+
+        # An entry missing the record's media, as written before failures
+        # were tracked, is enriched again
+        earlier = EnrichmentCheckpoint(checkpoint)
+        earlier.record(
+            "noun", builder.get_records_by_type("noun")[0], {"image": "katze.jpg"}
+        )
+        earlier.close()
+        with patch.object(
+            StandardMediaEnricher, "enrich_with_media", return_value={}
+        ) as enrich_with_media:
+            enrich(resume=True)
+        assert enrich_with_media.call_count == 4
+
+    def test_backfill_requires_media_queue(self) -> None:
+        """Test backfilling without a queue is a configuration error."""
+        with pytest.raises(ConfigurationError, match="media_queue"):
+            DeckBuilder("Test Deck", "german").backfill_media()
+
+
+class TestBuildPlan:
+    """Test the dry-run build planner."""
+
+    @patch("langlearn.core.deck.builder.AnkiBackend")
+    def test_plan_counts_hits_and_misses_without_requests(
+        self, mock_anki: Mock, tmp_path: Path
+    ) -> None:
+        """Test existing files are hits and nothing is generated."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        TestConcurrentLoading._write_csvs(data_dir)
+        images = tmp_path / "languages" / "german" / "default" / "images"
+        images.mkdir(parents=True)
+        (images.parent / "audio").mkdir()
+        (images / "katze.jpg").write_bytes(b"jpg")
+        builder = DeckBuilder("Test Deck", "german", project_root=tmp_path)
+        builder.load_data(data_dir, max_workers=1)
+
+        plan = builder.plan_build(concurrency=2, request_seconds={"polly": 1.0})
+
+        polly, anthropic, pexels = (
+            plan.services[name] for name in ("polly", "anthropic", "pexels")
+        )
+        assert plan.records == 4
+        assert (pexels.cache_hits, pexels.cache_misses, pexels.requests) == (1, 3, 6)
+        assert anthropic.cache_misses == 3
+        assert polly.cache_hits == 0
+        assert polly.requests == polly.cache_misses > 4
+        assert polly.characters > 0
+        assert plan.estimated_seconds > polly.requests * 1.0 / 2
+        assert list((images.parent / "audio").iterdir()) == []
+        assert builder.get_current_phase().value == "data_loaded"
+
+    @patch("langlearn.core.deck.builder.AnkiBackend")
+    def test_plan_requires_loaded_data(self, mock_anki: Mock) -> None:
+        """Test planning before load_data is rejected."""
+        builder = DeckBuilder("Test Deck", "german")
+
+        with pytest.raises(InvalidPhaseError):
+            builder.plan_build()
+
+
+class TestMediaPostProcessing:
+    """Test packaging processed media copies."""
+
+    def test_optimized_images_are_packaged_from_cache(self, tmp_path: Path) -> None:
+        """Test sources stay untouched and notes reference the processed copy."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        TestConcurrentLoading._write_csvs(data_dir)
+        images = tmp_path / "languages" / "german" / "default" / "images"
+        images.mkdir(parents=True)
+        (images.parent / "audio").mkdir()
+        Image.new("RGB", (300, 300), "green").save(images / "katze.png")
+        original = (images / "katze.png").read_bytes()
+        builder = DeckBuilder(
+            "Test Deck", "german", project_root=tmp_path, backend="memory"
+        )
+        enricher = Mock()
+        enricher.enrich_with_media.side_effect = lambda model: (
+            {"image": "katze.png"} if model.get_primary_word() == "Katze" else {}
+        )
+        builder._media_enricher = enricher
+        builder.load_data(data_dir, max_workers=1)
+        for _ in builder.enrich_media():
+            pass
+
+        report = builder.optimize_images(
+            ImageProcessingConfig(max_dimension=50), max_workers=1
+        )
+        builder.build_cards()
+        backend = builder.backend
+
+        assert isinstance(backend, InMemoryBackend)
+        assert (images / "katze.png").read_bytes() == original
+        output = report.outputs["katze.png"]
+        assert output.is_relative_to(tmp_path / "output" / "processed_media")
+        assert [media.path for media in backend.get_media_files()] == [str(output)]
+        fields = [field for note in backend.notes for field in note.fields]
+        assert any('src="katze.jpg"' in field for field in fields)
+        assert not any("katze.png" in field for field in fields)
+
+
+class TestProfilingBackends:
+    """Test building with the in-memory and null backends."""
+
+    def test_memory_backend_records_built_notes(self, tmp_path: Path) -> None:
+        """Test notes go to the in-memory backend and no package is written."""
+        TestConcurrentLoading._write_csvs(tmp_path)
+        builder = DeckBuilder("Test Deck", "german", backend="memory")
+        enricher = Mock()
+        enricher.enrich_with_media.return_value = {}
+        builder._media_enricher = enricher
+        builder.load_data(tmp_path, max_workers=1)
+        for _ in builder.enrich_media():
+            pass
+
+        built = builder.build_cards()
+        backend = builder.backend
+
+        assert isinstance(backend, InMemoryBackend)
+        assert len(backend.notes) == len(built.cards) > 0
+        assert backend.notes[0].deck.startswith("Test Deck::")
+        with pytest.raises(ConfigurationError, match="anki backend"):
+            builder.save_collection(tmp_path / "shard.anki2")
+        result = builder.export_deck(tmp_path / "out" / "deck.apkg")
+        assert result.file_size == 0
+        assert not (tmp_path / "out" / "deck.apkg").exists()
+
+    def test_text_backend_exports_notes(self, tmp_path: Path) -> None:
+        """Test the jsonl backend writes one line per built note."""
+        TestConcurrentLoading._write_csvs(tmp_path)
+        builder = DeckBuilder("Test Deck", "german", backend="jsonl")
+        enricher = Mock()
+        enricher.enrich_with_media.return_value = {}
+        builder._media_enricher = enricher
+        builder.load_data(tmp_path, max_workers=1)
+        for _ in builder.enrich_media():
+            pass
+        built = builder.build_cards()
+
+        result = builder.export_deck(tmp_path / "out" / "deck.jsonl")
+
+        lines = result.output_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == len(built.cards) == result.cards_exported
+        assert result.file_size == result.output_path.stat().st_size
+
+    def test_backend_is_validated(self, tmp_path: Path) -> None:
+        """Test unknown backends and Anki-only options are rejected."""
+        with pytest.raises(ConfigurationError, match="Unknown backend"):
+            DeckBuilder("Test Deck", "german", backend="sqlite")
+        with pytest.raises(ConfigurationError, match="null backend"):
+            DeckBuilder("Test Deck", "german", backend="null", fast_scratch=True)
+        with pytest.raises(ConfigurationError, match="memory backend"):
+            DeckBuilder(
+                "Test Deck",
+                "german",
+                backend="memory",
+                collection_path=tmp_path / "deck.anki2",
+            )
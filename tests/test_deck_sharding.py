@@ -0,0 +1,198 @@
+"""Tests for sharded deck builds and collection merging."""
+
+import pickle
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from anki.collection import Collection
+
+from langlearn.core.deck import (
+    DeckBuilderAPI,
+    DeckSpec,
+    ShardedDeckBuilder,
+    ShardTask,
+    SharedServices,
+    plan_shards,
+)
+from langlearn.core.deck.sharding import build_shard
+from langlearn.infrastructure.backends.anki_backend import stable_guid
+from langlearn.infrastructure.services.media_enricher import StandardMediaEnricher
+from langlearn.infrastructure.services.resilience import CallPolicy
+
+SPEC = DeckSpec("german", "default")
+
+
+@pytest.fixture
+def project_root(tmp_path: Path) -> Generator[Path, None, None]:
+    """Write a small German deck and disable media generation."""
+    data_dir = tmp_path / "languages" / "german" / "default"
+    data_dir.mkdir(parents=True)
+    (data_dir / "nouns.csv").write_text(
+        "noun,article,english,plural,example,related\n"
+        "Katze,die,cat,Katzen,Die Katze schläft.,Tier\n"
+        "Hund,der,dog,Hunde,Der Hund bellt.,Tier\n"
+        "Maus,die,mouse,Mäuse,Die Maus ist klein.,Tier\n",
+        encoding="utf-8",
+    )
+    (data_dir / "adjectives.csv").write_text(
+        "word,english,example,comparative,superlative\n"
+        "groß,big,Er ist groß.,größer,am größten\n"
+        "klein,small,Sie ist klein.,kleiner,am kleinsten\n",
+        encoding="utf-8",
+    )
+    (data_dir / "adverbs.csv").write_text(
+        "word,english,type,example\nhier,here,location,Ich bin hier.\n",
+        encoding="utf-8",
+    )
+    with patch.object(StandardMediaEnricher, "enrich_with_media", return_value={}):
+        yield tmp_path
+
+
+def _notes(collection_path: Path) -> list[tuple[str, str, str, list[str]]]:
+    """Return (guid, deck, note type, fields) of every note, sorted by GUID."""
+    collection = Collection(str(collection_path))
+    try:
+        notes = []
+        for note_id in collection.find_notes(""):
+            note = collection.get_note(note_id)
+            notetype: Any = collection.models.get(note.mid)
+            deck = collection.decks.name(note.cards()[0].did)
+            notes.append((note.guid, deck, notetype["name"], list(note.fields)))
+        return sorted(notes)
+    finally:
+        collection.close()
+
+
+class TestPlanShards:
+    """Test record type partitioning."""
+
+    def test_balances_by_record_count(self) -> None:
+        """Test largest types spread first and shards keep load order."""
+        counts = {"noun": 50, "adjective": 30, "adverb": 25, "verb": 10}
+
+        assert plan_shards(counts, 2) == [["noun", "verb"], ["adjective", "adverb"]]
+        assert plan_shards(counts, 1) == [list(counts)]
+        assert plan_shards({"noun": 5}, 4) == [["noun"]]
+
+    def test_rejects_zero_shards(self) -> None:
+        """Test a shard count below one is an error."""
+        with pytest.raises(ValueError, match="at least 1"):
+            plan_shards({"noun": 1}, 0)
+
+
+class TestShardedBuild:
+    """Test that sharded builds produce the same notes as a serial build."""
+
+    def test_stable_guid(self) -> None:
+        """Test GUIDs depend only on their parts."""
+        assert stable_guid("Deck", "Noun", "Katze", "0") == stable_guid(
+            "Deck", "Noun", "Katze", "0"
+        )
+        assert stable_guid("Deck", "Noun", "Katze", "0") != stable_guid(
+            "Deck", "Noun", "Katze", "1"
+        )
+
+    def test_merged_shards_match_serial_build(
+        self, project_root: Path, tmp_path: Path
+    ) -> None:
+        """Test notes, GUIDs, subdecks and note types survive the merge."""
+        data_dir = project_root / "languages" / "german" / "default"
+
+        with DeckBuilderAPI(SPEC.deck_name, "german", "default") as serial:
+            serial.load_data(data_dir, max_workers=1)
+            for _ in serial.enrich_media():
+                pass
+            serial.build_cards()
+            serial.save_collection(tmp_path / "serial.anki2")
+
+        tasks = [
+            ShardTask(SPEC, 0, ("adjective",), project_root, tmp_path),
+            ShardTask(SPEC, 1, ("noun", "adverb"), project_root, tmp_path),
+        ]
+        shard_results = [build_shard(task) for task in tasks]
+        with DeckBuilderAPI(SPEC.deck_name, "german", "default") as merged:
+            merged.load_data(data_dir, max_workers=1)
+            built = merged.merge_shards(
+                [task.collection_path for task in tasks],
+                [shard.built_cards for shard in shard_results],
+            )
+            merged.save_collection(tmp_path / "merged.anki2")
+
+        assert len(built.cards) == 6
+        assert set(built.cards_by_type) == {"noun", "adjective", "adverb"}
+        serial_notes = _notes(tmp_path / "serial.anki2")
+        assert len(serial_notes) == 6
+        assert _notes(tmp_path / "merged.anki2") == serial_notes
+
+    def test_build_exports_one_package(
+        self, project_root: Path, tmp_path: Path
+    ) -> None:
+        """Test the sharded builder reports stages and writes the deck."""
+        output_path = tmp_path / "out" / SPEC.output_filename
+        builder = ShardedDeckBuilder(SPEC, project_root, shards=2, use_processes=False)
+
+        result = builder.build(output_path)
+
+        assert result.succeeded, result.error
+        assert result.records == 6
+        assert result.cards == 6
+        assert output_path.stat().st_size > 0
+        assert set(result.timings) == {"load", "shards", "merge", "export"}
+        assert [shard.task.record_types for shard in builder.shard_results] == [
+            ("noun",),
+            ("adjective", "adverb"),
+        ]
+
+    def test_shards_use_call_policy(self, project_root: Path, tmp_path: Path) -> None:
+        """Test every shard builds its services with the builder's call policy."""
+        policy = CallPolicy(failure_threshold=2, deadline_seconds=5.0)
+        builder = ShardedDeckBuilder(
+            SPEC, project_root, shards=2, use_processes=False, call_policy=policy
+        )
+
+        with patch(
+            "langlearn.core.deck.sharding.SharedServices", wraps=SharedServices
+        ) as services:
+            result = builder.build(tmp_path / "out" / SPEC.output_filename)
+
+        assert result.succeeded, result.error
+        assert services.call_count == 2
+        for call in services.call_args_list:
+            assert call.kwargs["call_policy"] == policy
+        task = builder.shard_results[0].task
+        assert pickle.loads(pickle.dumps(task)) == task
+
+    def test_fast_scratch_reaches_every_builder(
+        self, project_root: Path, tmp_path: Path
+    ) -> None:
+        """Test the shards and the merging builder all use scratch storage."""
+        builder = ShardedDeckBuilder(
+            SPEC, project_root, shards=2, use_processes=False, fast_scratch=True
+        )
+
+        with patch(
+            "langlearn.core.deck.batch.DeckBuilderAPI", wraps=DeckBuilderAPI
+        ) as builders:
+            result = builder.build(tmp_path / "out" / SPEC.output_filename)
+
+        assert result.succeeded, result.error
+        assert builders.call_count == 3
+        assert all(call.kwargs["fast_scratch"] for call in builders.call_args_list)
+        assert all(shard.task.fast_scratch for shard in builder.shard_results)
+
+    def test_shard_loads_only_its_record_types(
+        self, project_root: Path, tmp_path: Path
+    ) -> None:
+        """Test a shard does not parse the CSV files of other shards."""
+        task = ShardTask(SPEC, 0, ("adverb",), project_root, tmp_path)
+
+        with patch.object(
+            DeckBuilderAPI, "load_data", autospec=True, wraps=DeckBuilderAPI.load_data
+        ) as load_data:
+            result = build_shard(task)
+
+        assert load_data.call_args.kwargs["record_types"] == ["adverb"]
+        assert set(result.built_cards.cards_by_type) == {"adverb"}
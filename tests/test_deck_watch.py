@@ -0,0 +1,143 @@
+"""Tests for watch mode rebuilds."""
+
+import os
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from langlearn.core.deck import (
+    DeckBuildResult,
+    DeckSpec,
+    DeckWatcher,
+    SharedServices,
+)
+from langlearn.core.deck.data_types import EnrichedData
+from langlearn.infrastructure.services.audio_processor import AudioProcessingConfig
+from langlearn.infrastructure.services.image_processor import ImageProcessingConfig
+
+
+@pytest.fixture
+def services(tmp_path: Path) -> SharedServices:
+    """Shared services over a one-deck German data tree."""
+    deck_dir = tmp_path / "languages" / "german" / "a1"
+    deck_dir.mkdir(parents=True)
+    (deck_dir / "nouns.csv").write_text("noun\n", encoding="utf-8")
+    (deck_dir / "notes.csv").write_text("x\n", encoding="utf-8")
+    return SharedServices(tmp_path, pexels_service=Mock())
+
+
+def _touch(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestDeckWatcher:
+    """Test change detection and rebuild reuse."""
+
+    def test_poll_maps_csv_changes_to_record_types(
+        self, services: SharedServices, tmp_path: Path
+    ) -> None:
+        """Test CSV edits map to record types; unmapped CSVs are still reported."""
+        watcher = DeckWatcher(DeckSpec("german", "a1"), services, tmp_path / "a.apkg")
+        assert not watcher.poll()
+
+        data_dir = services.data_dir(DeckSpec("german", "a1"))
+        _touch(data_dir / "nouns.csv")
+        _touch(data_dir / "notes.csv")
+        changes = watcher.poll()
+
+        assert [path.name for path in changes.csv_files] == ["notes.csv", "nouns.csv"]
+        assert changes.record_types == {"noun"}
+        assert not watcher.poll()
+
+    def test_template_changes_invalidate_only_their_card_type(
+        self, services: SharedServices, tmp_path: Path
+    ) -> None:
+        """Test a template edit drops just the matching cache entry."""
+        watcher = DeckWatcher(DeckSpec("german", "a1"), services, tmp_path / "a.apkg")
+        template_service = services.template_service("german")
+        template_service.get_template("noun")
+        template_service.get_template("adjective")
+        _, template_dir = watcher.watched_directories
+        changes = watcher.poll()
+        changes.template_files.append(template_dir / "noun_DE_de_front.html")
+        changes.card_types.update(
+            template_service.card_types_for_file("noun_DE_de_front.html")
+        )
+
+        watcher.apply(changes)
+
+        assert changes.card_types == {"noun"}
+        assert list(template_service._cache) == ["adjective"]
+
+    def test_rebuild_passes_previous_enrichment(
+        self, services: SharedServices, tmp_path: Path
+    ) -> None:
+        """Test each rebuild hands the last build's enriched data forward."""
+        spec = DeckSpec("german", "a1")
+        enriched = {"noun": EnrichedData([], [], [], [])}
+        builder = Mock()
+        builder.__enter__ = Mock(return_value=builder)
+        builder.__exit__ = Mock(return_value=None)
+        builder.get_enriched_data.return_value = enriched
+        watcher = DeckWatcher(spec, services, tmp_path / "a.apkg")
+        run_pipeline = Mock(return_value=DeckBuildResult(spec=spec))
+        results: list[DeckBuildResult] = []
+
+        with (
+            patch.object(SharedServices, "create_builder", return_value=builder),
+            patch.object(watcher._batch, "run_pipeline", run_pipeline),
+        ):
+            watcher.run(on_build=lambda _, result: results.append(result), max_builds=1)
+            watcher.rebuild()
+
+        assert len(results) == 1
+        first, second = run_pipeline.call_args_list
+        assert first.args == (builder, spec, tmp_path / "a.apkg", {})
+        assert second.args[3] is enriched
+
+    def test_rebuild_optimizes_images(
+        self, services: SharedServices, tmp_path: Path
+    ) -> None:
+        """Test the watcher's builds shrink images with its configuration."""
+        config = ImageProcessingConfig(max_dimension=400)
+        watcher = DeckWatcher(
+            DeckSpec("german", "a1"),
+            services,
+            tmp_path / "a.apkg",
+            image_config=config,
+        )
+        builder = Mock()
+        builder.__enter__ = Mock(return_value=builder)
+        builder.__exit__ = Mock(return_value=None)
+        builder.enrich_media.return_value = iter(())
+        builder.optimize_images.return_value.bytes_saved = 0
+
+        with patch.object(SharedServices, "create_builder", return_value=builder):
+            watcher.rebuild()
+
+        builder.optimize_images.assert_called_once_with(config)
+
+    def test_rebuild_processes_audio(
+        self, services: SharedServices, tmp_path: Path
+    ) -> None:
+        """Test the watcher's builds process audio with its configuration."""
+        config = AudioProcessingConfig(bitrate_kbps=48)
+        with patch("langlearn.core.deck.batch.find_ffmpeg"):
+            watcher = DeckWatcher(
+                DeckSpec("german", "a1"),
+                services,
+                tmp_path / "a.apkg",
+                audio_config=config,
+            )
+        builder = Mock()
+        builder.__enter__ = Mock(return_value=builder)
+        builder.__exit__ = Mock(return_value=None)
+        builder.enrich_media.return_value = iter(())
+        builder.process_audio.return_value.bytes_saved = 0
+
+        with patch.object(SharedServices, "create_builder", return_value=builder):
+            watcher.rebuild()
+
+        builder.process_audio.assert_called_once_with(config)
@@ -0,0 +1,61 @@
+"""Tests for the enrichment checkpoint file."""
+
+from pathlib import Path
+
+from langlearn.core.deck.checkpoint import EnrichmentCheckpoint, checkpoint_key
+from langlearn.languages.german.records.noun_record import NounRecord
+
+
+def _noun(english: str = "house") -> NounRecord:
+    return NounRecord(
+        noun="Haus",
+        article="das",
+        english=english,
+        plural="Häuser",
+        example="Das Haus ist groß.",
+    )
+
+
+class TestEnrichmentCheckpoint:
+    """Test writing, reading and resuming checkpoints."""
+
+    def test_round_trip_by_record_key(self, tmp_path: Path) -> None:
+        """Test media data is read back under the record's key."""
+        path = tmp_path / "deck.jsonl"
+        with EnrichmentCheckpoint(path) as checkpoint:
+            checkpoint.open()
+            checkpoint.record("noun", _noun(), {"image": "haus.jpg"})
+            assert checkpoint.written == 1
+
+        loaded = EnrichmentCheckpoint(path).load()
+
+        assert loaded == {"noun": {checkpoint_key(_noun()): {"image": "haus.jpg"}}}
+
+    def test_key_changes_with_record_fields(self) -> None:
+        """Test an edited record no longer matches its old checkpoint."""
+        assert checkpoint_key(_noun()) == checkpoint_key(_noun())
+        assert checkpoint_key(_noun()) != checkpoint_key(_noun("home"))
+
+    def test_truncated_line_is_skipped(self, tmp_path: Path) -> None:
+        """Test a line cut short by a crash does not break loading."""
+        path = tmp_path / "deck.jsonl"
+        with EnrichmentCheckpoint(path) as checkpoint:
+            checkpoint.record("noun", _noun(), {"image": "haus.jpg"})
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"type": "noun", "key": "ab')
+
+        assert len(EnrichmentCheckpoint(path).load()["noun"]) == 1
+
+    def test_open_without_resume_starts_over(self, tmp_path: Path) -> None:
+        """Test a fresh run discards the previous checkpoint."""
+        path = tmp_path / "deck.jsonl"
+        with EnrichmentCheckpoint(path) as checkpoint:
+            checkpoint.record("noun", _noun(), {"image": "haus.jpg"})
+            checkpoint.open(resume=True)
+            checkpoint.record("noun", _noun("home"), {"image": "home.jpg"})
+            assert len(checkpoint.load()["noun"]) == 2
+
+            checkpoint.open()
+
+        assert EnrichmentCheckpoint(path).load() == {}
+        assert EnrichmentCheckpoint(tmp_path / "missing.jsonl").load() == {}
@@ -0,0 +1,137 @@
+"""Tests for the image normalization stage."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from langlearn.exceptions import ConfigurationError
+from langlearn.infrastructure.services.image_processor import (
+    ImageProcessingConfig,
+    ImageProcessor,
+)
+
+
+def _write_image(path: Path, size: tuple[int, int], color: str = "red") -> None:
+    """Write a large, metadata-carrying JPEG."""
+    exif = Image.Exif()
+    exif[0x010E] = "description " * 200  # ImageDescription
+    Image.new("RGB", size, color).save(path, "JPEG", quality=100, exif=exif)
+
+
+@pytest.fixture
+def processor() -> ImageProcessor:
+    """Return a thread-based processor shrinking images to 100 px."""
+    return ImageProcessor(
+        ImageProcessingConfig(max_dimension=100, quality=70), use_processes=False
+    )
+
+
+class TestImageProcessor:
+    """Test resizing, metadata stripping and the processed media cache."""
+
+    def test_resizes_and_strips_metadata(
+        self, processor: ImageProcessor, tmp_path: Path
+    ) -> None:
+        """Test processed copies shrink and lose EXIF; sources stay untouched."""
+        images = tmp_path / "images"
+        images.mkdir()
+        path = images / "katze.jpg"
+        _write_image(path, (400, 200))
+        original = path.read_bytes()
+
+        report = processor.process_directory(images, tmp_path / "cache")
+
+        assert path.read_bytes() == original
+        output = report.outputs["katze.jpg"]
+        assert output.name == "katze.jpg"
+        assert output.is_relative_to(tmp_path / "cache")
+        with Image.open(output) as image:
+            assert image.size == (100, 50)
+            assert not image.getexif()
+        assert report.original_bytes == len(original)
+        assert report.bytes_saved == len(original) - output.stat().st_size > 0
+        assert [result.path for result in report.processed] == [path]
+
+    def test_second_run_uses_cache(
+        self, processor: ImageProcessor, tmp_path: Path
+    ) -> None:
+        """Test cached images are reused and duplicates are not re-encoded."""
+        images = tmp_path / "images"
+        images.mkdir()
+        _write_image(images / "katze.jpg", (300, 300))
+        processor.process_directory(images, tmp_path / "cache")
+        other_deck = tmp_path / "other"
+        other_deck.mkdir()
+        shutil.copy(images / "katze.jpg", other_deck / "kater.jpg")
+
+        report = processor.process_directory(other_deck, tmp_path / "cache")
+
+        assert report.processed == []
+        assert all(result.cached for result in report.results)
+        first = processor.process_directory(images, tmp_path / "cache")
+        assert (
+            report.outputs["kater.jpg"].read_bytes()
+            == first.outputs["katze.jpg"].read_bytes()
+        )
+
+    def test_config_change_processes_the_source(self, tmp_path: Path) -> None:
+        """Test a new configuration encodes the original, not earlier output."""
+        images = tmp_path / "images"
+        images.mkdir()
+        path = images / "hund.jpg"
+        _write_image(path, (300, 300))
+        original = path.read_bytes()
+        ImageProcessor(
+            ImageProcessingConfig(max_dimension=200), use_processes=False
+        ).process_directory(images, tmp_path / "cache")
+
+        report = ImageProcessor(
+            ImageProcessingConfig(max_dimension=50, image_format="WEBP"),
+            use_processes=False,
+        ).process_directory(images, tmp_path / "cache")
+
+        assert len(report.processed) == 1
+        assert report.results[0].original_bytes == len(original)
+        assert path.read_bytes() == original
+        output = report.outputs["hund.jpg"]
+        assert output.name == "hund.webp"
+        with Image.open(output) as image:
+            assert image.format == "WEBP"
+            assert image.size == (50, 50)
+
+    def test_output_extension_matches_format(
+        self, processor: ImageProcessor, tmp_path: Path
+    ) -> None:
+        """Test a PNG re-encoded as JPEG is named .jpg."""
+        images = tmp_path / "images"
+        images.mkdir()
+        Image.new("RGBA", (300, 300), "blue").save(images / "see.png")
+
+        report = processor.process_directory(images, tmp_path / "cache")
+
+        output = report.outputs["see.png"]
+        assert output.name == "see.jpg"
+        with Image.open(output) as image:
+            assert image.format == "JPEG"
+
+    def test_unreadable_image_is_reported(
+        self, processor: ImageProcessor, tmp_path: Path
+    ) -> None:
+        """Test broken files are left alone and reported as failures."""
+        (tmp_path / "broken.jpg").write_bytes(b"not an image")
+
+        report = processor.process_directory(tmp_path, tmp_path / "cache")
+
+        assert len(report.failed) == 1
+        assert report.bytes_saved == 0
+        assert report.outputs == {}
+        assert (tmp_path / "broken.jpg").read_bytes() == b"not an image"
+
+    def test_invalid_config(self) -> None:
+        """Test out-of-range settings are configuration errors."""
+        with pytest.raises(ConfigurationError, match="quality"):
+            ImageProcessingConfig(quality=0)
+        with pytest.raises(ConfigurationError, match="max_dimension"):
+            ImageProcessingConfig(max_dimension=0)
@@ -6,6 +6,7 @@ from typing import Any
 import pytest
 
 from langlearn.languages import GermanLanguage, LanguageRegistry
+from langlearn.languages.dispatch import NoteTypeDispatch
 
 
 @pytest.fixture
@@ -56,6 +57,45 @@ class TestLanguageRegistry:
         assert german_de.code == german_full.code == "de"
         assert german_de.name == german_full.name == "German"
 
+    def test_registry_shares_one_instance_per_language(
+        self, clean_registry: Any
+    ) -> None:
+        """Test every code of a language returns the same cached instance."""
+        LanguageRegistry.register("de", GermanLanguage)
+        LanguageRegistry.register("german", GermanLanguage)
+
+        german = LanguageRegistry.get("de")
+
+        assert LanguageRegistry.get("german") is german
+        assert german.get_card_processor() is german.get_card_processor()
+
+
+class TestNoteTypeDispatch:
+    """Test memoized note type to record type dispatch."""
+
+    def test_first_matching_pattern_wins(self) -> None:
+        """Test patterns match case-insensitively by substring, in order."""
+        dispatch = NoteTypeDispatch(
+            {"German Noun": "noun", "German Noun_Case_Context": "noun_case_context"}
+        )
+
+        assert dispatch.record_type("german noun with media") == "noun"
+        assert dispatch.record_type("German Noun_Case_Context with Media") == "noun"
+        assert dispatch.record_type("German Verb") is None
+        assert dispatch.record_type("German Verb") is None
+
+    def test_german_dispatch_matches_mappings(self) -> None:
+        """Test every German note type resolves like a scan of its mappings."""
+        german = GermanLanguage()
+
+        for note_type_name in german.get_note_type_mappings():
+            expected = next(
+                record_type
+                for pattern, record_type in german.get_note_type_mappings().items()
+                if pattern.lower() in note_type_name.lower()
+            )
+            assert german._note_type_dispatch.record_type(note_type_name) == expected
+
 
 class TestGermanLanguage:
     """Test GermanLanguage implementation."""
@@ -0,0 +1,158 @@
+"""Tests for the local Polly, Pexels and Anthropic stand-ins."""
+
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+from botocore.exceptions import ClientError
+from PIL import Image
+
+from langlearn.exceptions import ConfigurationError
+from langlearn.infrastructure.services.audio_service import (
+    AudioService,
+    looks_like_mp3,
+)
+from langlearn.infrastructure.services.image_service import PexelsService
+from langlearn.infrastructure.services.local_providers import (
+    CannedAnthropicService,
+    FakePollyClient,
+    LocalPexelsServer,
+    LocalProviderConfig,
+    LocalProviders,
+    fake_mp3_bytes,
+)
+from langlearn.infrastructure.services.service_container import (
+    get_anthropic_service,
+    set_anthropic_service,
+)
+
+
+class TestFakePollyClient:
+    """Test deterministic synthesis and throttling."""
+
+    def test_audio_service_saves_fake_audio(self, tmp_path: Path) -> None:
+        """Test AudioService writes the deterministic bytes unchanged."""
+        client = FakePollyClient()
+        service = AudioService(output_dir=str(tmp_path), client=client)  # type: ignore[arg-type]  # Stand-in for the Polly client
+
+        path = service.generate_audio("das Haus")
+
+        data = Path(path).read_bytes()
+        assert looks_like_mp3(data)
+        assert data == fake_mp3_bytes(
+            '<speak><prosody rate="75%">das Haus</prosody></speak>'
+        )
+        assert client.requests == 1
+
+    def test_length_follows_text(self) -> None:
+        """Test longer text gives longer clips."""
+        assert len(fake_mp3_bytes("Haus")) < len(fake_mp3_bytes("das große Haus"))
+        assert fake_mp3_bytes("Haus") == fake_mp3_bytes("Haus")
+
+    def test_throttles_every_nth_call(self) -> None:
+        """Test every third call fails like a throttled Polly request."""
+        client = FakePollyClient(LocalProviderConfig(throttle_every=3))
+
+        client.synthesize_speech(Text="eins")
+        client.synthesize_speech(Text="zwei")
+        with pytest.raises(ClientError, match="ThrottlingException"):
+            client.synthesize_speech(Text="drei")
+
+        assert client.requests == 3
+        assert client.throttled == 1
+
+
+@pytest.fixture
+def real_http() -> Generator[None]:
+    """Undo the conftest requests.get mock; the local server is real HTTP."""
+    with patch("requests.get", requests.api.get):
+        yield
+
+
+@pytest.mark.usefixtures("real_http")
+class TestLocalPexelsServer:
+    """Test the Pexels-compatible HTTP server."""
+
+    def test_pexels_service_downloads_generated_image(self, tmp_path: Path) -> None:
+        """Test the real PexelsService searches and downloads locally."""
+        with LocalPexelsServer(LocalProviderConfig(image_size=32)) as server:
+            service = PexelsService(api_key="local", base_url=server.base_url)
+            service.request_delay = 0
+            photos = service.search_photos("Haus", per_page=3)
+            assert service.download_image("Haus", str(tmp_path / "haus.jpg"))
+
+        assert len(photos) == 3
+        assert [photo["alt"] for photo in photos] == ["Haus"] * 3
+        with Image.open(tmp_path / "haus.jpg") as image:
+            assert image.size == (32, 32)
+        assert server.requests == 3
+
+    def test_rate_limit_answers_429(self) -> None:
+        """Test requests over the rate limit get 429 with Retry-After."""
+        config = LocalProviderConfig(rate_limit_per_second=1)
+        with LocalPexelsServer(config) as server:
+            first = requests.get(f"{server.base_url}/search?query=a", timeout=5)
+            second = requests.get(f"{server.base_url}/search?query=a", timeout=5)
+
+        assert first.status_code == 200
+        assert second.status_code == 429
+        assert second.headers["Retry-After"] == "1"
+        assert server.throttled == 1
+
+    def test_stopped_server_has_no_url(self) -> None:
+        """Test the URL is only available while serving."""
+        with pytest.raises(RuntimeError, match="not running"):
+            _ = LocalPexelsServer().url
+
+
+class TestCannedAnthropicService:
+    """Test canned responses and the inherited query cache."""
+
+    def test_canned_and_default_responses(self) -> None:
+        """Test matching prompts get canned text, others a stable query."""
+        service = CannedAnthropicService(
+            LocalProviderConfig(canned_responses={"Katze": "cat on sofa"})
+        )
+
+        assert service.generate_image_query("die Katze") == "cat on sofa"
+        assert service.generate_image_query("der Hund").startswith("local image ")
+        assert service.generate_image_query("der Hund") == service.generate_image_query(
+            "der Hund"
+        )
+        assert service.requests == 2
+
+    def test_translation_uses_canned_response(self) -> None:
+        """Test translations go through the same response table."""
+        service = CannedAnthropicService(
+            LocalProviderConfig(canned_responses={"Haus": " house "})
+        )
+
+        assert service.generate_translation("Translate: Haus") == "house"
+
+
+class TestLocalProviders:
+    """Test starting and installing the providers together."""
+
+    def test_installs_and_restores_anthropic_service(self) -> None:
+        """Test the stand-in replaces the shared service only while active."""
+        previous = set_anthropic_service(None)
+        try:
+            with LocalProviders() as providers:
+                assert get_anthropic_service() is providers.anthropic_service
+                assert providers.pexels_service.base_url.startswith("http://127.0.0.1")
+            assert get_anthropic_service() is not providers.anthropic_service
+        finally:
+            set_anthropic_service(previous)
+
+        with pytest.raises(RuntimeError, match="not started"):
+            _ = providers.pexels_service
+        assert providers.stats()["pexels_requests"] == 0
+
+    def test_invalid_config(self) -> None:
+        """Test out-of-range settings are configuration errors."""
+        with pytest.raises(ConfigurationError, match="latency_seconds"):
+            LocalProviderConfig(latency_seconds=-1)
+        with pytest.raises(ConfigurationError, match="rate_limit_per_second"):
+            LocalProviderConfig(rate_limit_per_second=0)
@@ -0,0 +1,200 @@
+"""Tests for command line validation and reports."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from langlearn import main as cli
+from langlearn.core.deck import BatchBuildResult, DeckBuildResult, DeckSpec
+
+
+def run_cli(monkeypatch: pytest.MonkeyPatch, *argv: str) -> Mock:
+    """Run main() with the given arguments and return the patched run()."""
+    monkeypatch.setattr("sys.argv", ["langlearn", *argv])
+    with (
+        patch.object(cli, "run") as run,
+        patch.object(cli, "SharedServices"),
+    ):
+        cli.main()
+    return run
+
+
+class TestModeValidation:
+    """Test single-deck options are rejected in batch, watch and shard modes."""
+
+    @pytest.mark.parametrize(
+        "option",
+        ["--plan", "--persistent", "--checkpoint", "--resume", "--defer-media"],
+    )
+    @pytest.mark.parametrize(
+        "mode",
+        [
+            ["--all"],
+            ["--manifest", "decks.txt"],
+            ["--watch"],
+            ["--shards", "2"],
+            ["--warm-media"],
+        ],
+    )
+    def test_single_deck_option_rejected(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        option: str,
+        mode: list[str],
+    ) -> None:
+        """Test the combination fails before anything is built."""
+        with pytest.raises(SystemExit) as exit_info:
+            run_cli(monkeypatch, option, *mode)
+
+        assert exit_info.value.code == 1
+        output = capsys.readouterr().out
+        assert f"{option} cannot be combined with {mode[0]}" in output
+
+    @pytest.mark.parametrize(
+        "mode", [["--all"], ["--manifest", "decks.txt"], ["--watch"], ["--shards", "2"]]
+    )
+    def test_backfill_media_rejected(
+        self, monkeypatch: pytest.MonkeyPatch, mode: list[str]
+    ) -> None:
+        """Test --backfill-media only applies to a single deck."""
+        with pytest.raises(SystemExit):
+            run_cli(monkeypatch, "--backfill-media", *mode)
+
+    def test_single_deck_options_accepted(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the options still reach a single-deck build."""
+        run = run_cli(monkeypatch, "--plan", "--resume", "--defer-media")
+
+        run.assert_called_once()
+        args = run.call_args.args[0]
+        assert args.plan and args.resume and args.defer_media
+
+    @pytest.mark.parametrize("flag", ["--optimize-images", "--process-audio"])
+    @pytest.mark.parametrize("mode", [["--shards", "2"], ["--warm-media"]])
+    def test_media_processing_rejected(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        flag: str,
+        mode: list[str],
+    ) -> None:
+        """Test processing flags fail where media is not post-processed."""
+        with pytest.raises(SystemExit):
+            run_cli(monkeypatch, flag, *mode)
+
+        assert f"{flag} cannot be combined with {mode[0]}" in (capsys.readouterr().out)
+
+    @pytest.mark.parametrize("flag", ["--optimize-images", "--process-audio"])
+    @pytest.mark.parametrize("mode", [["--all"], ["--watch"]])
+    def test_media_processing_accepted(
+        self, monkeypatch: pytest.MonkeyPatch, flag: str, mode: list[str]
+    ) -> None:
+        """Test batch and watch builds still take the processing flags."""
+        run_cli(monkeypatch, flag, *mode).assert_called_once()
+
+    def test_format_rejected_with_shards(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test text formats still cannot be built in shards."""
+        with pytest.raises(SystemExit):
+            run_cli(monkeypatch, "--format", "tsv", "--shards", "2")
+
+        assert "--format tsv cannot be combined" in capsys.readouterr().out
+
+
+class TestBatchReport:
+    """Test the batch build report."""
+
+    def test_media_processing_phases_are_reported(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test image and audio timings appear per deck and in the totals."""
+        timings = {
+            "load": 1.0,
+            "enrich": 2.0,
+            "images": 3.0,
+            "audio": 4.0,
+            "build": 5.0,
+            "export": 6.0,
+        }
+        deck = DeckBuildResult(DeckSpec("german", "a1"), cards=7, timings=timings)
+
+        cli.print_batch_report(BatchBuildResult([deck], wall_seconds=21.0))
+
+        output = capsys.readouterr().out
+        header = next(
+            line for line in output.splitlines() if line.split()[:1] == ["deck"]
+        )
+        assert header.split() == ["deck", *timings, "total", "cards"]
+        assert "3.00    4.00" in output and "21.00" in output
+        assert "images 3.00s, audio 4.00s" in output
+
+
+class TestShardedRun:
+    """Test the options reaching a sharded build."""
+
+    def test_options_reach_shards(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test breaker, deadline and scratch options apply to every shard."""
+        monkeypatch.setattr(
+            "sys.argv",
+            [
+                "langlearn",
+                "--shards",
+                "2",
+                "--breaker-threshold",
+                "3",
+                "--fast-scratch",
+            ],
+        )
+        args = cli.parse_args()
+
+        with patch.object(cli, "ShardedDeckBuilder") as sharded:
+            sharded.return_value.shard_results = []
+            cli.run_sharded(args, tmp_path, tmp_path / "deck.apkg")
+
+        options = sharded.call_args.kwargs
+        assert options["call_policy"].failure_threshold == 3
+        assert options["fast_scratch"]
+
+
+class TestWatchRun:
+    """Test the options reaching watch mode."""
+
+    def test_image_config_reaches_watcher(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test every rebuild optimizes images with the command line settings."""
+        monkeypatch.setattr(
+            "sys.argv",
+            ["langlearn", "--watch", "--optimize-images", "--max-image-size", "400"],
+        )
+        args = cli.parse_args()
+
+        with patch.object(cli, "DeckWatcher") as watcher:
+            watcher.return_value.watched_directories = (tmp_path, tmp_path)
+            cli.run_watch(args, tmp_path, tmp_path / "deck.apkg", Mock())
+
+        config = watcher.call_args.kwargs["image_config"]
+        assert config.max_dimension == 400
+
+    def test_audio_config_reaches_watcher(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test every rebuild processes audio with the command line settings."""
+        monkeypatch.setattr(
+            "sys.argv",
+            ["langlearn", "--watch", "--process-audio", "--audio-bitrate", "48"],
+        )
+        args = cli.parse_args()
+
+        with patch.object(cli, "DeckWatcher") as watcher:
+            watcher.return_value.watched_directories = (tmp_path, tmp_path)
+            cli.run_watch(args, tmp_path, tmp_path / "deck.apkg", Mock())
+
+        config = watcher.call_args.kwargs["audio_config"]
+        assert config.bitrate_kbps == 48
@@ -1,5 +1,6 @@
 """Unit tests for MediaEnricher services."""
 
+import hashlib
 import tempfile
 from collections.abc import Callable, Generator
 from pathlib import Path
@@ -19,6 +20,9 @@ from langlearn.infrastructure.services.media_enricher import (
     MediaEnricherBase,
     StandardMediaEnricher,
 )
+from langlearn.infrastructure.services.media_index import MediaIndex
+from langlearn.infrastructure.services.media_queue import MediaJobQueue
+from langlearn.languages.german.models.noun import Noun
 
 
 class MockDomainModel:
@@ -271,6 +275,7 @@ class TestStandardMediaEnricher:
         # Should handle audio failure gracefully
         assert "word_audio" not in result
         assert "image" in result  # Image should still work
+        assert media_enricher.failed_count == 1
 
     def test_enrich_with_media_image_generation_failure(
         self, media_enricher: StandardMediaEnricher, mock_services: dict[str, Mock]
@@ -289,6 +294,7 @@ class TestStandardMediaEnricher:
         # Should handle image failure gracefully
         assert "word_audio" in result
         assert "image" not in result
+        assert media_enricher.failed_count == 1
 
     def test_enrich_with_media_no_image_query(
         self, media_enricher: StandardMediaEnricher, mock_services: dict[str, Mock]
@@ -511,3 +517,172 @@ class TestStandardMediaEnricher:
             # Should handle exception gracefully
             assert "word_audio" not in result  # Audio should fail gracefully
             assert "image" in result  # Image should still work
+
+
+class TestMediaIndexReuse:
+    """Test StandardMediaEnricher reusing media from sibling decks."""
+
+    def test_indexed_media_is_copied_instead_of_generated(self, tmp_path: Path) -> None:
+        """Test files from another deck skip Polly, Anthropic and Pexels."""
+        sibling = tmp_path / "default"
+        (sibling / "audio").mkdir(parents=True)
+        (sibling / "images").mkdir()
+        audio_name = hashlib.md5(b"das Haus").hexdigest()
+        (sibling / "audio" / f"{audio_name}.mp3").write_bytes(b"mp3")
+        (sibling / "images" / "haus.jpg").write_bytes(b"jpg")
+
+        index = MediaIndex()
+        index.add_directory(sibling / "audio")
+        index.add_directory(sibling / "images")
+        audio_service = Mock(spec=AudioService)
+        pexels_service = Mock(spec=PexelsService)
+        enricher = StandardMediaEnricher(
+            audio_service=audio_service,
+            pexels_service=pexels_service,
+            anthropic_service=Mock(spec=AnthropicService),
+            audio_base_path=tmp_path / "a1" / "audio",
+            image_base_path=tmp_path / "a1" / "images",
+            media_index=index,
+        )
+
+        result = enricher.enrich_with_media(MockDomainModel())
+
+        assert result == {"word_audio": f"{audio_name}.mp3", "image": "haus.jpg"}
+        audio_service.generate_audio.assert_not_called()
+        pexels_service.download_image.assert_not_called()
+        assert (tmp_path / "a1" / "images" / "haus.jpg").read_bytes() == b"jpg"
+        assert index.reused_count == 2
+
+    def test_generated_media_is_registered(self, tmp_path: Path) -> None:
+        """Test newly downloaded images become visible to other decks."""
+        index = MediaIndex()
+        image_dir = tmp_path / "images"
+        pexels_service = Mock(spec=PexelsService)
+
+        def download(query: str, path: str) -> bool:
+            Path(path).write_bytes(b"jpg")
+            return True
+
+        pexels_service.download_image.side_effect = download
+        enricher = StandardMediaEnricher(
+            audio_service=Mock(spec=AudioService),
+            pexels_service=pexels_service,
+            anthropic_service=Mock(spec=AnthropicService),
+            audio_base_path=tmp_path / "audio",
+            image_base_path=image_dir,
+            media_index=index,
+        )
+
+        enricher.enrich_with_media(MockDomainModel(audio_segments={"word_audio": ""}))
+
+        assert "haus.jpg" in index
+
+
+class TestDeferredMedia:
+    """Test StandardMediaEnricher queueing missing media instead."""
+
+    def test_missing_media_is_queued_not_generated(self, tmp_path: Path) -> None:
+        """Test a deferred build calls no service and leaves fields out."""
+        audio_service = Mock(spec=AudioService)
+        pexels_service = Mock(spec=PexelsService)
+        anthropic_service = Mock(spec=AnthropicService)
+        enricher = StandardMediaEnricher(
+            audio_service=audio_service,
+            pexels_service=pexels_service,
+            anthropic_service=anthropic_service,
+            audio_base_path=tmp_path / "audio",
+            image_base_path=tmp_path / "images",
+        )
+        queue = MediaJobQueue(tmp_path / "queue.sqlite3")
+        enricher.defer_to(queue)
+        (tmp_path / "images" / "katze.jpg").write_bytes(b"jpg")
+        noun = Noun(
+            noun="Hund",
+            article="der",
+            english="dog",
+            plural="Hunde",
+            example="Der Hund bellt.",
+        )
+
+        assert enricher.enrich_with_media(noun) == {}
+        assert enricher.enrich_with_media(MockDomainModel("Katze")) == {
+            "image": "katze.jpg"
+        }
+
+        audio_service.generate_audio.assert_not_called()
+        pexels_service.download_image.assert_not_called()
+        anthropic_service.generate_image_query.assert_not_called()
+        jobs = [queue.claim() for _ in range(4)]
+        image_job = next(job for job in jobs if job and job.kind == "image")
+        assert image_job.target == tmp_path / "images" / "hund.jpg"
+        assert "Hund" in image_job.payload["context"]
+        assert queue.claim() is None
+
+
+class TestMediaPlan:
+    """Test planning media without generating it."""
+
+    def test_plan_media_checks_disk_index_and_query_cache(self, tmp_path: Path) -> None:
+        """Test planned files carry availability and Anthropic needs."""
+        anthropic_service = Mock(spec=AnthropicService)
+        anthropic_service.has_cached_image_query.return_value = True
+        sibling = tmp_path / "sibling"
+        sibling.mkdir()
+        (sibling / "hund.jpg").write_bytes(b"jpg")
+        index = MediaIndex()
+        index.add_directory(sibling)
+        enricher = StandardMediaEnricher(
+            audio_service=Mock(spec=AudioService),
+            pexels_service=Mock(spec=PexelsService),
+            anthropic_service=anthropic_service,
+            audio_base_path=tmp_path / "audio",
+            image_base_path=tmp_path / "images",
+            media_index=index,
+        )
+        noun = Noun(
+            noun="Katze",
+            article="die",
+            english="cat",
+            plural="Katzen",
+            example="Die Katze schläft.",
+        )
+
+        planned = enricher.plan_media(noun)
+        indexed = enricher.plan_media(MockDomainModel("Hund"))
+
+        image = planned[-1]
+        assert (image.kind, image.available, image.needs_query) == (
+            "image",
+            False,
+            True,
+        )
+        assert image.query_cached
+        assert all(m.kind == "audio" and m.characters for m in planned[:-1])
+        assert indexed[-1].available
+        anthropic_service.generate_image_query.assert_not_called()
+        assert not (tmp_path / "images" / "hund.jpg").exists()
+
+
+class TestMediaCompleteness:
+    """Test checking earlier media data against the media a model expects."""
+
+    def test_media_complete_requires_every_planned_file(self, tmp_path: Path) -> None:
+        """Test media data missing a file, or naming a lost one, is incomplete."""
+        enricher = StandardMediaEnricher(
+            audio_service=Mock(spec=AudioService),
+            pexels_service=Mock(spec=PexelsService),
+            anthropic_service=Mock(spec=AnthropicService),
+            audio_base_path=tmp_path / "audio",
+            image_base_path=tmp_path / "images",
+        )
+        model = MockDomainModel("Haus", audio_segments={"word_audio": "das Haus"})
+        audio_name = f"{enricher._generate_content_hash('das Haus')}.mp3"
+        media = {"word_audio": audio_name, "image": "haus.jpg"}
+        (tmp_path / "audio" / audio_name).write_bytes(b"mp3")
+
+        assert not enricher.media_complete(model, {"word_audio": audio_name})
+        assert not enricher.media_complete(model, media)
+
+        (tmp_path / "images" / "haus.jpg").write_bytes(b"jpg")
+
+        assert enricher.media_complete(model, media)
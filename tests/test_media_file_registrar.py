@@ -216,6 +216,47 @@ class TestMediaFileRegistrar:
         assert len(registrar._registered_files) == 4
         assert mock_backend.add_media_file.call_count == 4
 
+    def test_processed_media_is_registered_under_new_name(
+        self,
+        temp_audio_dir: Path,
+        temp_image_dir: Path,
+        mock_backend: Mock,
+        tmp_path: Path,
+    ) -> None:
+        """Test processed copies replace sources and renamed images are rewritten."""
+        registrar = MediaFileRegistrar(temp_audio_dir, temp_image_dir)
+        processed_image = tmp_path / "another_word.jpg"
+        processed_audio = tmp_path / "audio_test1.mp3"
+        processed_image.touch()
+        processed_audio.touch()
+        registrar.use_processed_media(
+            {
+                "another_word.png": processed_image,
+                "audio_test1.mp3": processed_audio,
+            }
+        )
+        field_values = [
+            '<img src="another_word.png" />',
+            '<img src="test_word.jpg" /> [sound:audio_test1.mp3]',
+        ]
+
+        rewritten = registrar.rewrite_references(field_values)
+        registrar.register_card_media(rewritten, mock_backend)
+
+        assert rewritten == [
+            '<img src="another_word.jpg" />',
+            '<img src="test_word.jpg" /> [sound:audio_test1.mp3]',
+        ]
+        mock_backend.add_media_file.assert_any_call(
+            str(processed_image), media_type="image"
+        )
+        mock_backend.add_media_file.assert_any_call(
+            str(processed_audio), media_type="audio"
+        )
+        mock_backend.add_media_file.assert_any_call(
+            str(temp_image_dir / "test_word.jpg"), media_type="image"
+        )
+
     def test_register_card_media_empty_fields(
         self, temp_audio_dir: Path, temp_image_dir: Path, mock_backend: Mock
     ) -> None:
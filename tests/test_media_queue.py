@@ -0,0 +1,159 @@
+"""Tests for the deferred media queue and its backfill worker."""
+
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from langlearn.exceptions import CircuitOpenError, ConfigurationError
+from langlearn.infrastructure.services.ai_service import AnthropicService
+from langlearn.infrastructure.services.audio_service import AudioService
+from langlearn.infrastructure.services.image_service import PexelsService
+from langlearn.infrastructure.services.media_queue import (
+    MediaBackfillWorker,
+    MediaJobQueue,
+)
+
+
+class TestMediaJobQueue:
+    """Test queueing, claiming and retrying jobs."""
+
+    def test_enqueue_is_idempotent_per_target(self, tmp_path: Path) -> None:
+        """Test a pending target is queued once and claimed in order."""
+        queue = MediaJobQueue(tmp_path / "queue.sqlite3")
+
+        assert queue.enqueue_audio("das Haus", tmp_path / "a.mp3")
+        assert not queue.enqueue_audio("das Haus", tmp_path / "a.mp3")
+        assert queue.enqueue_image(tmp_path / "haus.jpg", query="house")
+
+        first = queue.claim()
+        assert first is not None
+        assert (first.kind, first.payload, first.attempts) == (
+            "audio",
+            {"text": "das Haus"},
+            1,
+        )
+        assert queue.counts() == {"pending": 1, "running": 1, "done": 0, "failed": 0}
+
+    def test_failed_jobs_retry_until_max_attempts(self, tmp_path: Path) -> None:
+        """Test failures go back to pending, then stop at max_attempts."""
+        queue = MediaJobQueue(tmp_path / "queue.sqlite3", max_attempts=2)
+        queue.enqueue_audio("das Haus", tmp_path / "a.mp3")
+
+        job = queue.claim()
+        assert job is not None
+        assert queue.fail(job, "throttled")
+        job = queue.claim()
+        assert job is not None
+        assert not queue.fail(job, "throttled")
+
+        assert queue.claim() is None
+        assert queue.counts()["failed"] == 1
+        assert queue.enqueue_audio("das Haus", tmp_path / "a.mp3")
+
+    def test_expired_lease_is_claimed_again(self, tmp_path: Path) -> None:
+        """Test a job whose worker died is handed out again."""
+        queue = MediaJobQueue(tmp_path / "queue.sqlite3", lease_seconds=0.01)
+        queue.enqueue_audio("das Haus", tmp_path / "a.mp3")
+        assert queue.claim() is not None
+
+        time.sleep(0.05)
+        job = queue.claim()
+
+        assert job is not None
+        assert job.attempts == 2
+        queue.complete(job)
+        assert queue.purge_done() == 1
+
+    def test_invalid_settings(self, tmp_path: Path) -> None:
+        """Test out-of-range settings are configuration errors."""
+        with pytest.raises(ConfigurationError, match="max_attempts"):
+            MediaJobQueue(tmp_path / "queue.sqlite3", max_attempts=0)
+        with pytest.raises(ValueError, match="context or a query"):
+            MediaJobQueue(tmp_path / "queue.sqlite3").enqueue_image(tmp_path / "x")
+
+
+class TestMediaBackfillWorker:
+    """Test draining the queue into media files."""
+
+    @staticmethod
+    def _services(tmp_path: Path) -> tuple[Mock, Mock, Mock]:
+        audio = Mock(spec=AudioService)
+
+        def generate(text: str) -> str:
+            path = tmp_path / "polly" / f"{text}.mp3"
+            path.parent.mkdir(exist_ok=True)
+            path.write_bytes(b"mp3")
+            return str(path)
+
+        audio.generate_audio.side_effect = generate
+        pexels = Mock(spec=PexelsService)
+
+        def download(query: str, path: str) -> bool:
+            if query == "nothing":
+                return False
+            Path(path).write_bytes(query.encode())
+            return True
+
+        pexels.download_image.side_effect = download
+        anthropic = Mock(spec=AnthropicService)
+        anthropic.generate_image_query.return_value = " cat on sofa "
+        return audio, pexels, anthropic
+
+    def test_drain_generates_every_job(self, tmp_path: Path) -> None:
+        """Test audio and image jobs create their target files."""
+        queue = MediaJobQueue(tmp_path / "queue.sqlite3")
+        media = tmp_path / "media"
+        queue.enqueue_audio("Haus", media / "haus.mp3")
+        queue.enqueue_image(media / "katze.jpg", context="Katze, cat")
+        queue.enqueue_image(media / "hund.jpg", query="dog")
+        worker = MediaBackfillWorker(queue, *self._services(tmp_path))
+
+        report = worker.drain(workers=2)
+
+        assert (report.done, report.failed) == (3, 0)
+        assert (media / "haus.mp3").read_bytes() == b"mp3"
+        assert (media / "katze.jpg").read_bytes() == b"cat on sofa"
+        assert (media / "hund.jpg").read_bytes() == b"dog"
+        assert queue.counts()["done"] == 3
+
+    def test_failures_are_retried_then_reported(self, tmp_path: Path) -> None:
+        """Test a job that never succeeds ends up failed with its error."""
+        queue = MediaJobQueue(tmp_path / "queue.sqlite3", max_attempts=2)
+        queue.enqueue_image(tmp_path / "x.jpg", query="nothing")
+        worker = MediaBackfillWorker(queue, *self._services(tmp_path))
+
+        report = worker.drain()
+
+        assert (report.done, report.retried, report.failed) == (0, 1, 1)
+        assert "No image downloaded" in report.errors[0]
+
+    def test_max_jobs_limits_attempts(self, tmp_path: Path) -> None:
+        """Test a drain can be bounded."""
+        queue = MediaJobQueue(tmp_path / "queue.sqlite3")
+        for word in ("eins", "zwei", "drei"):
+            queue.enqueue_audio(word, tmp_path / f"{word}.mp3")
+        worker = MediaBackfillWorker(queue, *self._services(tmp_path))
+
+        assert worker.drain(workers=2, max_jobs=2).done == 2
+        assert queue.counts()["pending"] == 1
+
+    def test_open_circuit_postpones_jobs_of_that_kind(self, tmp_path: Path) -> None:
+        """Test jobs of an unavailable provider stay pending, others run."""
+        queue = MediaJobQueue(tmp_path / "queue.sqlite3")
+        queue.enqueue_image(tmp_path / "katze.jpg", query="cat")
+        queue.enqueue_image(tmp_path / "hund.jpg", query="dog")
+        queue.enqueue_audio("Haus", tmp_path / "haus.mp3")
+        audio, pexels, anthropic = self._services(tmp_path)
+        pexels.download_image.side_effect = CircuitOpenError("pexels is open")
+        worker = MediaBackfillWorker(queue, audio, pexels, anthropic)
+
+        report = worker.drain()
+
+        assert (report.done, report.postponed, report.failed) == (1, 1, 0)
+        assert pexels.download_image.call_count == 1
+        assert queue.counts()["pending"] == 2
+        job = queue.claim()
+        assert job is not None
+        assert job.attempts == 1
@@ -0,0 +1,68 @@
+"""Tests for warming a deck's media without building it."""
+
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from langlearn.core.deck import DeckSpec, MediaWarmer, SharedServices
+from langlearn.infrastructure.services.local_providers import (
+    LocalProviderConfig,
+    LocalProviders,
+)
+
+
+@pytest.fixture
+def real_http() -> Generator[None]:
+    """Undo the conftest requests.get mock; the local server is real HTTP."""
+    with patch("requests.get", requests.api.get):
+        yield
+
+
+@pytest.mark.usefixtures("real_http")
+class TestMediaWarmer:
+    """Test filling the media store through the deck's queue."""
+
+    def test_warm_generates_missing_media_once(self, tmp_path: Path) -> None:
+        """Test a second warm finds every file and queues nothing."""
+        data_dir = tmp_path / "languages" / "german" / "a1"
+        data_dir.mkdir(parents=True)
+        (data_dir / "nouns.csv").write_text(
+            "noun,article,english,plural,example,related\n"
+            "Katze,die,cat,Katzen,Die Katze schläft.,Tier\n"
+            "Hund,der,dog,Hunde,Der Hund bellt.,Tier\n",
+            encoding="utf-8",
+        )
+        spec = DeckSpec("german", "a1")
+
+        with LocalProviders(LocalProviderConfig(image_size=16)) as providers:
+            providers.pexels_service.request_delay = 0
+            services = SharedServices(
+                tmp_path,
+                pexels_service=providers.pexels_service,
+                polly_client=providers.polly_client,
+            )
+            warmer = MediaWarmer(services, tmp_path / "queues")
+
+            first = warmer.warm(spec, workers=2)
+            second = warmer.warm(spec)
+
+        assert first.succeeded
+        assert first.records == 2
+        assert first.backfill is not None
+        assert first.backfill.done == first.queued > 2
+        assert (data_dir / "images" / "katze.jpg").exists()
+        assert (data_dir / "images" / "hund.jpg").exists()
+        assert providers.stats()["polly_requests"] == first.queued - 2
+        assert (second.queued, second.backfill and second.backfill.done) == (0, 0)
+
+    def test_unknown_language_is_reported(self, tmp_path: Path) -> None:
+        """Test a failing deck is captured in its result."""
+        warmer = MediaWarmer(SharedServices(tmp_path), tmp_path / "queues")
+
+        result = warmer.warm(DeckSpec("klingon", "a1"))
+
+        assert not result.succeeded
+        assert result.error
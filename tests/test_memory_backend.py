@@ -0,0 +1,121 @@
+"""Tests for the in-memory and null deck backends."""
+
+from pathlib import Path
+
+import pytest
+
+from langlearn.infrastructure.backends import InMemoryBackend, NullBackend
+from langlearn.infrastructure.backends.base import CardTemplate, NoteType
+from langlearn.infrastructure.backends.memory_backend import (
+    RecordedNote,
+    media_reference,
+)
+
+
+@pytest.fixture
+def note_type() -> NoteType:
+    """Create a simple note type."""
+    return NoteType(
+        name="German Noun",
+        fields=["Noun", "English"],
+        templates=[CardTemplate("Card 1", "{{Noun}}", "{{English}}")],
+    )
+
+
+class TestMediaReference:
+    """Test media references match the Anki backend's."""
+
+    def test_references(self) -> None:
+        """Test explicit and inferred media types."""
+        assert media_reference("/m/haus.mp3", "audio") == "[sound:haus.mp3]"
+        assert media_reference("/m/haus.jpg", "image") == "haus.jpg"
+        assert media_reference("/m/haus.MP3") == "[sound:haus.MP3]"
+        assert media_reference("/m/haus.png") == "haus.png"
+
+    def test_unknown_types_are_rejected(self) -> None:
+        """Test unknown media types and extensions raise ValueError."""
+        with pytest.raises(ValueError, match="Cannot infer"):
+            media_reference("/m/haus.txt")
+        with pytest.raises(ValueError, match="Unknown media type"):
+            media_reference("/m/haus.mp3", "video")
+
+
+class TestInMemoryBackend:
+    """Test InMemoryBackend."""
+
+    def test_records_notes_under_current_subdeck(self, note_type: NoteType) -> None:
+        """Test notes keep their fields, tags and deck."""
+        backend = InMemoryBackend("German A1")
+        note_type_id = backend.create_note_type(note_type)
+
+        assert backend.create_note_type(note_type) == note_type_id
+        backend.add_note(note_type_id, ["Haus", "house"], tags=["noun"])
+        backend.set_current_subdeck("German A1::Nouns")
+        assert backend.add_note(note_type_id, ["Katze", "cat"]) == 2
+        backend.set_current_subdeck(None)
+        backend.add_note(note_type_id, ["Hund", "dog"])
+
+        assert backend.notes == [
+            RecordedNote(note_type_id, ("Haus", "house"), ("noun",), "German A1"),
+            RecordedNote(note_type_id, ("Katze", "cat"), (), "German A1::Nouns"),
+            RecordedNote(note_type_id, ("Hund", "dog"), (), "German A1"),
+        ]
+        assert backend.note_types == {note_type_id: note_type}
+
+    def test_unknown_note_type_is_rejected(self) -> None:
+        """Test adding a note of an unknown note type raises ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            InMemoryBackend("German A1").add_note("1", ["Haus"])
+
+    def test_media_recorded_once_without_copying(self) -> None:
+        """Test media files are deduplicated by path and need not exist."""
+        backend = InMemoryBackend("German A1")
+
+        first = backend.add_media_file("/missing/haus.mp3", media_type="audio")
+        again = backend.add_media_file("/missing/haus.mp3", media_type="audio")
+        backend.add_media_file("/missing/haus.jpg")
+
+        assert again is first
+        assert first.reference == "[sound:haus.mp3]"
+        assert [media.path for media in backend.get_media_files()] == [
+            "/missing/haus.mp3",
+            "/missing/haus.jpg",
+        ]
+
+    def test_export_writes_nothing(self, note_type: NoteType, tmp_path: Path) -> None:
+        """Test export only logs and stats count what was recorded."""
+        backend = InMemoryBackend("German A1")
+        backend.add_note(backend.create_note_type(note_type), ["Haus", "house"])
+
+        backend.export_deck(str(tmp_path / "deck.apkg"))
+
+        assert list(tmp_path.iterdir()) == []
+        assert backend.get_stats() == {
+            "deck_name": "German A1",
+            "note_types_count": 1,
+            "notes_count": 1,
+            "media_files_count": 0,
+        }
+
+
+class TestNullBackend:
+    """Test NullBackend."""
+
+    def test_counts_and_discards(self, note_type: NoteType) -> None:
+        """Test only counts are kept."""
+        backend = NullBackend("German A1")
+        note_type_id = backend.create_note_type(note_type)
+
+        assert backend.create_note_type(note_type) == note_type_id
+        assert backend.add_note(note_type_id, ["Haus", "house"]) == 1
+        assert backend.add_note(note_type_id, ["Katze", "cat"]) == 2
+        media = backend.add_media_file("/missing/haus.mp3", media_type="audio")
+
+        assert media.reference == "[sound:haus.mp3]"
+        assert backend.get_media_files() == []
+        assert backend.get_stats() == {
+            "deck_name": "German A1",
+            "note_types_count": 1,
+            "notes_count": 2,
+            "media_files_count": 1,
+        }
@@ -7,12 +7,17 @@ from unittest.mock import Mock, patch
 import pytest
 from requests.exceptions import ConnectionError, HTTPError, Timeout
 
-from langlearn.exceptions import MediaGenerationError
+from langlearn.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    MediaGenerationError,
+)
 from langlearn.infrastructure.services.image_service import (
     PexelsService,
     Photo,
     PhotoSize,
 )
+from langlearn.infrastructure.services.resilience import CallPolicy, ProviderGuard
 from tests.test_utils import mock_env
 
 
@@ -539,3 +544,53 @@ class TestPexelsService:
             pytest.raises(HTTPError, match="Failed to make request after all retries"),
         ):
             service._make_request("https://test.com", {"query": "test"})
+
+    def test_open_circuit_fails_fast(self) -> None:
+        """Test repeated outages stop further requests to Pexels."""
+        guard = ProviderGuard("pexels", CallPolicy(failure_threshold=3))
+        with mock_env("PEXELS_API_KEY", "test_api_key"):
+            service = PexelsService(guard=guard)
+
+        with (
+            patch(
+                "requests.get", side_effect=ConnectionError("Network error")
+            ) as mock_get,
+            patch("time.sleep"),
+        ):
+            with pytest.raises(CircuitOpenError):
+                service._make_request("https://test.com", {"query": "test"})
+            with pytest.raises(CircuitOpenError):
+                service.search_photos("cat")
+
+        assert mock_get.call_count == 3
+
+    def test_not_found_does_not_open_circuit(self, service: PexelsService) -> None:
+        """Test client errors leave the circuit closed."""
+        mock_error_response = Mock()
+        mock_error_response.status_code = 404
+        http_error = HTTPError(response=mock_error_response)
+
+        with patch("requests.get", side_effect=http_error):
+            for _ in range(6):
+                with pytest.raises(HTTPError):
+                    service._make_request("https://test.com", {"query": "test"})
+
+        assert service.guard.breaker.state == "closed"
+
+    def test_deadline_stops_backoff(self) -> None:
+        """Test retries give up when the backoff would pass the deadline."""
+        guard = ProviderGuard("pexels", CallPolicy(deadline_seconds=5))
+        with mock_env("PEXELS_API_KEY", "test_api_key"):
+            service = PexelsService(guard=guard)
+        service.base_delay = 10
+
+        with (
+            patch("requests.get", side_effect=Timeout("slow")) as mock_get,
+            patch("time.sleep") as mock_sleep,
+            pytest.raises(DeadlineExceededError),
+        ):
+            service._make_request("https://test.com", {"query": "test"})
+
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs["timeout"] <= 5
+        mock_sleep.assert_not_called()
@@ -0,0 +1,83 @@
+"""Tests for the pipeline benchmark's datasets and regression checks."""
+
+import csv
+from pathlib import Path
+
+from langlearn.benchmarks.pipeline import (
+    PipelineBenchmarkResult,
+    find_regressions,
+    load_baseline,
+    save_baseline,
+    write_scaled_deck,
+)
+
+
+def _result(enrich: float, peak: int = 0) -> PipelineBenchmarkResult:
+    """Return a result with fixed load time and the given enrich figures."""
+    return PipelineBenchmarkResult(
+        "german/a1",
+        records=10,
+        cards=12,
+        timings={"load": 1.0, "enrich": enrich},
+        peak_memory={"enrich": peak},
+    )
+
+
+class TestScaledDeck:
+    """Test synthetic dataset generation."""
+
+    def test_copies_get_distinct_words_and_examples(self, tmp_path: Path) -> None:
+        """Test free-text columns are suffixed and fixed values kept."""
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "nouns.csv").write_text(
+            "noun,article,english,plural,example,related\n"
+            "Haus,das,house,Häuser,Das Haus ist groß.,\n",
+            encoding="utf-8",
+        )
+
+        write_scaled_deck(source, tmp_path / "scaled", 3)
+
+        with open(tmp_path / "scaled" / "nouns.csv", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["noun"] for row in rows] == ["Haus", "Haus 1", "Haus 2"]
+        assert rows[2]["example"] == "Das Haus ist groß. 2"
+        assert {row["article"] for row in rows} == {"das"}
+        assert {row["related"] for row in rows} == {""}
+
+
+class TestRegressions:
+    """Test baseline comparison."""
+
+    def test_slower_phase_beyond_tolerance(self) -> None:
+        """Test only changes over the tolerance and noise floor are flagged."""
+        baseline = {"german/a1": _result(enrich=2.0)}
+
+        regressions = find_regressions([_result(enrich=3.0)], baseline, 0.25)
+
+        assert [(r.metric, r.baseline, r.current) for r in regressions] == [
+            ("enrich seconds", 2.0, 3.0)
+        ]
+        assert regressions[0].ratio == 1.5
+        assert find_regressions([_result(enrich=2.4)], baseline, 0.25) == []
+
+    def test_memory_noise_floor(self) -> None:
+        """Test small absolute memory growth is ignored."""
+        baseline = {"german/a1": _result(enrich=1.0, peak=1000)}
+
+        assert find_regressions([_result(1.0, peak=5000)], baseline) == []
+        regressions = find_regressions([_result(1.0, peak=10_000_000)], baseline)
+        assert [r.metric for r in regressions] == ["enrich peak bytes"]
+
+    def test_unknown_dataset_is_not_compared(self) -> None:
+        """Test datasets without a baseline never regress."""
+        assert find_regressions([_result(enrich=100.0)], {}) == []
+
+    def test_baseline_round_trip(self, tmp_path: Path) -> None:
+        """Test saved baselines load back unchanged."""
+        path = tmp_path / "baseline.json"
+        result = _result(enrich=2.0, peak=42)
+
+        save_baseline([result], path)
+
+        assert load_baseline(path) == {"german/a1": result}
@@ -4,8 +4,10 @@ This module tests the RecordMapper service that converts CSV field arrays
 to Record instances in the record processing Architecture.
 """
 
+import csv
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 from langlearn.languages.german.records.factory import (
@@ -14,7 +16,10 @@ from langlearn.languages.german.records.factory import (
     NegationRecord,
     NounRecord,
 )
-from langlearn.languages.german.services.record_mapper import RecordMapper
+from langlearn.languages.german.services.record_mapper import (
+    RecordMapper,
+    read_csv_frame,
+)
 
 
 class TestRecordMapper:
@@ -395,3 +400,92 @@ class TestRecordMapperIntegration:
 
         with pytest.raises(ValueError):
             mapper.get_expected_field_count_for_record_type("unknown")
+
+
+class TestColumnarCSVLoading:
+    """Test the single-pass columnar CSV loading path."""
+
+    def test_get_csv_columns(self) -> None:
+        """Test the column table matches record field counts."""
+        mapper = RecordMapper()
+
+        assert mapper.get_csv_columns("noun")[:2] == ("noun", "article")
+        for record_type in mapper.get_supported_record_types():
+            assert len(mapper.get_csv_columns(record_type)) >= (
+                mapper.get_expected_field_count_for_record_type(record_type) - 2
+            )
+        with pytest.raises(ValueError, match="Unsupported record type: unknown"):
+            mapper.get_csv_columns("unknown")
+
+    def test_read_csv_frame_keeps_raw_text(self, tmp_path: Path) -> None:
+        """Test cells keep their raw text and missing cells read as ""."""
+        csv_path = tmp_path / "nouns.csv"
+        csv_path.write_text(
+            "noun,article,english\nKatze,,NA\nHund,der\n", encoding="utf-8"
+        )
+
+        frame = read_csv_frame(csv_path)
+
+        assert frame["article"].tolist() == ["", "der"]
+        assert frame["english"].tolist() == ["NA", ""]
+
+    def test_read_csv_frame_tolerates_long_rows(self, tmp_path: Path) -> None:
+        """Test rows longer than the header fall back to DictReader semantics."""
+        csv_path = tmp_path / "nouns.csv"
+        csv_path.write_text(
+            "noun,article\nKatze,die,extra\nHund,der\nMaus,die,x,y\n",
+            encoding="utf-8",
+        )
+
+        frame = read_csv_frame(csv_path)
+
+        assert list(frame.columns) == ["noun", "article"]
+        assert frame["noun"].tolist() == ["Katze", "Hund", "Maus"]
+        assert frame["article"].tolist() == ["die", "der", "die"]
+
+    def test_read_csv_frame_empty_file(self, tmp_path: Path) -> None:
+        """Test a completely empty file yields no rows."""
+        csv_path = tmp_path / "empty.csv"
+        csv_path.write_text("", encoding="utf-8")
+
+        assert RecordMapper().load_records_from_csv(csv_path, "noun") == []
+
+    def test_iter_csv_fields_fills_absent_columns(self) -> None:
+        """Test absent CSV columns read as empty strings."""
+        frame = pd.DataFrame({"word": ["hier"], "english": ["here"]})
+
+        rows = list(RecordMapper().iter_csv_fields(frame, "adverb"))
+
+        assert rows == [["hier", "here", "", ""]]
+
+    def test_load_records_reports_row_number(self, tmp_path: Path) -> None:
+        """Test conversion errors name the CSV row, counting the header as 1."""
+        csv_path = tmp_path / "verbs_unified.csv"
+        csv_path.write_text(
+            "infinitive,english,classification,separable,auxiliary,tense,"
+            "ich,du,er,wir,ihr,sie,example\n"
+            "gehen,to go,unregelmäßig,false,sein,present,"
+            "gehe,gehst,geht,gehen,geht,gehen,Ich gehe.\n"
+            "gehen,to go,unregelmäßig,false,sein,bogus,"
+            "gehe,gehst,geht,gehen,geht,gehen,Ich gehe.\n",
+            encoding="utf-8",
+        )
+
+        with pytest.raises(ValueError, match="at row 3: Invalid tense: bogus"):
+            RecordMapper().load_records_from_csv(csv_path, "verb_conjugation")
+
+    def test_load_records_matches_row_mapping(self) -> None:
+        """Test the columnar path yields the same records as per-row mapping."""
+        csv_path = (
+            Path(__file__).parent.parent / "languages" / "german" / "a1" / "nouns.csv"
+        )
+        if not csv_path.exists():
+            pytest.skip("German A1 nouns.csv not available")
+        mapper = RecordMapper()
+
+        with open(csv_path, encoding="utf-8") as f:
+            expected = [
+                mapper.map_csv_row_to_record("noun", row) for row in csv.DictReader(f)
+            ]
+
+        assert mapper.load_records_from_csv(csv_path, "noun") == expected
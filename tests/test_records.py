@@ -34,6 +34,68 @@ class TestBaseRecord:
         assert hasattr(BaseRecord, "__abstractmethods__")
         assert len(BaseRecord.__abstractmethods__) > 0
 
+    @pytest.mark.parametrize(
+        "record_class",
+        [
+            AdjectiveRecord,
+            AdverbRecord,
+            ArticleRecord,
+            IndefiniteArticleRecord,
+            NegationRecord,
+            NegativeArticleRecord,
+            NounRecord,
+            PhraseRecord,
+            PrepositionRecord,
+            VerbConjugationRecord,
+            VerbImperativeRecord,
+            VerbRecord,
+        ],
+    )
+    def test_records_are_slotted(self, record_class: type[BaseRecord]) -> None:
+        """Test that record classes declare slots instead of a per-instance dict."""
+        assert "__slots__" in record_class.__dict__
+        assert "__dict__" not in dir(record_class)
+
+    def test_as_mapping_matches_to_dict(self) -> None:
+        """Test that the mapping view exposes the same data as to_dict()."""
+        record = NounRecord.from_csv_fields(
+            ["Katze", "die", "cat", "Katzen", "Die Katze schläft.", "Tier"]
+        )
+        view = record.as_mapping()
+
+        assert dict(view) == record.to_dict()
+        assert list(view) == list(record.to_dict())
+        assert len(view) == len(record.to_dict())
+        assert "noun" in view
+        assert "missing" not in view
+        assert view.get("missing", "default") == "default"
+        with pytest.raises(KeyError):
+            view["missing"]
+
+    def test_as_mapping_is_live_and_read_only(self) -> None:
+        """Test that the view reflects later field updates and rejects writes."""
+        record = NounRecord.from_csv_fields(
+            ["Katze", "die", "cat", "Katzen", "Die Katze schläft.", "Tier"]
+        )
+        view = record.as_mapping()
+
+        record.image = "<img src='katze.jpg'>"
+
+        assert view["image"] == "<img src='katze.jpg'>"
+        with pytest.raises(TypeError):
+            view["image"] = "other"  # type: ignore[index]
+
+    def test_categorical_fields_are_interned(self) -> None:
+        """Test that repeated categorical strings share one object."""
+        first = NounRecord.from_csv_fields(
+            ["Katze", " die ", "cat", "Katzen", "Example", ""]
+        )
+        second = NounRecord.from_csv_fields(
+            ["Maus", "die", "mouse", "Mäuse", "Example", ""]
+        )
+
+        assert first.article is second.article
+
 
 class TestNounRecord:
     """Test NounRecord data container."""
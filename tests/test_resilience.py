@@ -0,0 +1,206 @@
+"""Tests for circuit breakers, deadlines and hedged provider calls."""
+
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ALL_COMPLETED, Future
+from concurrent.futures import wait as futures_wait
+
+import pytest
+
+from langlearn.exceptions import (
+    CircuitOpenError,
+    ConfigurationError,
+    DeadlineExceededError,
+)
+from langlearn.infrastructure.services import resilience
+from langlearn.infrastructure.services.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CallPolicy,
+    CircuitBreaker,
+    Deadline,
+    ProviderGuard,
+    hedged_call,
+)
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FailuresFirst(set[Future[int]]):
+    """Set of finished futures iterating over the failed ones first."""
+
+    def __iter__(self) -> Iterator[Future[int]]:
+        return iter(sorted(super().__iter__(), key=lambda f: f.exception() is None))
+
+
+class TestCircuitBreaker:
+    """Test the breaker's state machine."""
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        """Test failures open the circuit and successes reset the count."""
+        breaker = CircuitBreaker("polly", failure_threshold=2, clock=FakeClock())
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        breaker.record_failure()
+
+        assert breaker.state == OPEN
+        assert breaker.trips == 1
+        with pytest.raises(CircuitOpenError, match="polly"):
+            breaker.before_call()
+
+    def test_half_open_admits_one_probe(self) -> None:
+        """Test a single probe after the reset time decides the state."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "pexels", failure_threshold=1, reset_seconds=10, clock=clock
+        )
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.state == HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+
+        clock.now = 20
+        breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        breaker.before_call()
+
+
+class TestHedgedCall:
+    """Test hedging and deadlines."""
+
+    def test_runs_inline_without_hedge_or_deadline(self) -> None:
+        """Test the plain path calls the function in this thread."""
+        assert hedged_call(threading.current_thread) is threading.current_thread()
+
+    def test_slow_attempt_is_hedged(self) -> None:
+        """Test a second attempt answers while the first is stuck."""
+        calls: list[int] = []
+        release = threading.Event()
+
+        def call() -> int:
+            calls.append(len(calls))
+            if len(calls) == 1:
+                release.wait(5)
+            return len(calls)
+
+        start = time.monotonic()
+        assert hedged_call(call, hedge_after=0.05) == 2
+        assert time.monotonic() - start < 2
+        release.set()
+
+    def test_failure_before_hedge_is_raised(self) -> None:
+        """Test a fast failure is not hedged."""
+        calls: list[int] = []
+
+        def call() -> int:
+            calls.append(1)
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError, match="bad request"):
+            hedged_call(call, hedge_after=1.0)
+        assert len(calls) == 1
+
+    def test_success_beats_failure_finishing_together(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a success is returned when a failure completes with it."""
+        second_done = threading.Event()
+        calls: list[int] = []
+
+        def call() -> int:
+            calls.append(1)
+            if len(calls) == 1:
+                second_done.wait(5)
+                raise ValueError("first attempt failed")
+            second_done.set()
+            return 2
+
+        def wait_for_all(
+            futures: set[Future[int]], timeout: float | None, return_when: str
+        ) -> tuple[set[Future[int]], set[Future[int]]]:
+            done, pending = futures_wait(futures, timeout, ALL_COMPLETED)
+            return FailuresFirst(done), pending
+
+        monkeypatch.setattr(resilience, "wait", wait_for_all)
+
+        assert hedged_call(call, hedge_after=0.05) == 2
+
+    def test_losing_results_are_discarded(self) -> None:
+        """Test the result of the slower attempt is handed to discard."""
+        release = threading.Event()
+        discarded = threading.Event()
+        results: list[str] = []
+        calls: list[int] = []
+
+        def call() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(5)
+                return "slow"
+            return "fast"
+
+        def discard(result: str) -> None:
+            results.append(result)
+            discarded.set()
+
+        assert hedged_call(call, hedge_after=0.05, discard=discard) == "fast"
+        release.set()
+        assert discarded.wait(5)
+        assert results == ["slow"]
+
+    def test_deadline_stops_waiting(self) -> None:
+        """Test a call that outlives its deadline is abandoned."""
+        release = threading.Event()
+
+        with pytest.raises(DeadlineExceededError):
+            hedged_call(lambda: release.wait(5), deadline=Deadline(0.05))
+        release.set()
+
+
+class TestProviderGuard:
+    """Test guarded provider calls."""
+
+    def test_only_provider_failures_open_the_circuit(self) -> None:
+        """Test errors rejected by is_failure leave the circuit closed."""
+        guard = ProviderGuard("pexels", CallPolicy(failure_threshold=1))
+
+        def fail(error: Exception) -> None:
+            raise error
+
+        with pytest.raises(KeyError):
+            guard.call(
+                lambda: fail(KeyError("404")),
+                is_failure=lambda e: not isinstance(e, KeyError),
+            )
+        assert guard.breaker.state == CLOSED
+
+        with pytest.raises(OSError):
+            guard.call(lambda: fail(OSError("reset")))
+        with pytest.raises(CircuitOpenError):
+            guard.call(lambda: None)
+
+    def test_invalid_policy(self) -> None:
+        """Test policy values are validated."""
+        with pytest.raises(ConfigurationError):
+            CallPolicy(failure_threshold=0)
+        with pytest.raises(ConfigurationError):
+            CallPolicy(deadline_seconds=0)
@@ -148,6 +148,32 @@ class TestTemplateService:
         template_service.clear_cache()
         assert len(template_service._cache) == 0
 
+    def test_invalidate_single_card_type(
+        self, template_service: TemplateService
+    ) -> None:
+        """Test invalidating one card type keeps the others cached."""
+        template_service.get_template("adjective")
+        template_service.get_template("noun")
+
+        assert template_service.invalidate("noun") is True
+        assert template_service.invalidate("noun") is False
+        assert list(template_service._cache) == ["adjective"]
+
+    def test_card_types_for_file(self, temp_template_dir: Path) -> None:
+        """Test template filenames map back to card types via the resolver."""
+        service = TemplateService(
+            temp_template_dir,
+            lambda card_type, side: (
+                f"{card_type}_DE_de.css"
+                if side == "css"
+                else f"{card_type}_DE_de_{side}.html"
+            ),
+        )
+
+        assert service.card_types_for_file("noun_DE_de_back.html") == ["noun"]
+        assert service.card_types_for_file("adjective_DE_de.css") == ["adjective"]
+        assert service.card_types_for_file("shared.css") == []
+
     def test_get_available_card_types(self, template_service: TemplateService) -> None:
         """Test getting available card types."""
         card_types = template_service.get_available_card_types()
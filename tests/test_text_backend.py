@@ -0,0 +1,170 @@
+"""Tests for the streaming TSV and JSON Lines deck backend."""
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from langlearn.infrastructure.backends import TextExportBackend
+from langlearn.infrastructure.backends.anki_backend import NoteGuids, stable_guid
+from langlearn.infrastructure.backends.base import CardTemplate, NoteType
+from langlearn.infrastructure.backends.text_backend import TSV_HEADER
+
+
+@pytest.fixture
+def note_type() -> NoteType:
+    """Create a simple note type."""
+    return NoteType(
+        name="German Noun",
+        fields=["Noun", "English", "Audio"],
+        templates=[CardTemplate("Card 1", "{{Noun}}", "{{English}}")],
+    )
+
+
+class TestTextExportBackend:
+    """Test TextExportBackend."""
+
+    def test_tsv_follows_anki_text_import(
+        self, note_type: NoteType, tmp_path: Path
+    ) -> None:
+        """Test header, GUIDs, subdecks and quoting of the TSV export."""
+        backend = TextExportBackend("German A1")
+        note_type_id = backend.create_note_type(note_type)
+        backend.set_current_subdeck("German A1::Nouns")
+        backend.add_note(note_type_id, ["Haus", "house\tbuilding", "[sound:h.mp3]"])
+        backend.set_current_subdeck(None)
+        backend.add_note(note_type_id, ["Katze", "cat"], tags=["animal"])
+
+        output = tmp_path / "deck.tsv"
+        backend.export_deck(str(output))
+
+        text = output.read_text(encoding="utf-8")
+        assert text.startswith(TSV_HEADER)
+        rows = list(csv.reader(text[len(TSV_HEADER) :].splitlines(), delimiter="\t"))
+        assert rows == [
+            [
+                stable_guid("German A1::Nouns", "German Noun", "Haus"),
+                "German Noun",
+                "German A1::Nouns",
+                "",
+                "Haus",
+                "house\tbuilding",
+                "[sound:h.mp3]",
+            ],
+            [
+                stable_guid("German A1", "German Noun", "Katze"),
+                "German Noun",
+                "German A1",
+                "animal",
+                "Katze",
+                "cat",
+                "",
+            ],
+        ]
+        assert backend.get_stats()["notes_count"] == 2
+
+    def test_jsonl_names_fields(self, note_type: NoteType, tmp_path: Path) -> None:
+        """Test each JSON line maps field names to values."""
+        backend = TextExportBackend("German A1", text_format="jsonl")
+        note_type_id = backend.create_note_type(note_type)
+        backend.add_note(note_type_id, ["Straße", "street", "", "extra"])
+
+        output = tmp_path / "out" / "deck.jsonl"
+        backend.export_deck(str(output))
+
+        (line,) = output.read_text(encoding="utf-8").splitlines()
+        assert "Straße" in line
+        assert json.loads(line) == {
+            "guid": stable_guid("German A1", "German Noun", "Straße"),
+            "note_type": "German Noun",
+            "deck": "German A1",
+            "fields": {"Noun": "Straße", "English": "street", "Audio": ""},
+            "tags": [],
+        }
+
+    def test_guids_use_identity_fields(self, tmp_path: Path) -> None:
+        """Test GUIDs come from the identity fields, whatever the note order."""
+        note_type = NoteType(
+            name="German Verb",
+            fields=["Infinitive", "Tense", "Ich"],
+            templates=[CardTemplate("Card 1", "{{Infinitive}}", "{{Ich}}")],
+            identity_fields=["Infinitive", "Tense"],
+        )
+        backend = TextExportBackend("German A1", text_format="jsonl")
+        note_type_id = backend.create_note_type(note_type)
+        backend.add_note(note_type_id, ["gehen", "preterite", "ging"])
+        backend.add_note(note_type_id, ["gehen", "present", "gehe"])
+
+        output = tmp_path / "deck.jsonl"
+        backend.export_deck(str(output))
+
+        guids = [
+            json.loads(line)["guid"]
+            for line in output.read_text(encoding="utf-8").splitlines()
+        ]
+        assert guids == [
+            stable_guid("German A1", "German Verb", "gehen", "preterite"),
+            stable_guid("German A1", "German Verb", "gehen", "present"),
+        ]
+
+    def test_repeated_identity_is_numbered(self) -> None:
+        """Test notes repeating an identity get GUIDs numbered within it."""
+        guids = NoteGuids()
+
+        first = guids.next("German A1", "German Noun", ["Milch"])
+        guids.next("German A1", "German Noun", ["Katze"])
+        second = guids.next("German A1", "German Noun", ["Milch"])
+
+        assert first == stable_guid("German A1", "German Noun", "Milch")
+        assert second == stable_guid("German A1", "German Noun", "Milch", "1")
+
+    def test_guid_never_issued_twice(self) -> None:
+        """Test a GUID colliding with one already issued is an error."""
+        guids = NoteGuids()
+        guids.next("German A1", "German Noun", ["Milch"])
+        guids.next("German A1", "German Noun", ["Milch"])
+
+        with pytest.raises(ValueError, match="issued twice"):
+            guids.next("German A1", "German Noun", ["Milch", "1"])
+
+    def test_media_linked_beside_export(self, tmp_path: Path) -> None:
+        """Test media is hard-linked into the sibling .media folder."""
+        source = tmp_path / "audio" / "haus.mp3"
+        source.parent.mkdir()
+        source.write_bytes(b"mp3")
+        backend = TextExportBackend("German A1")
+        backend.add_media_file(str(source), media_type="audio")
+        backend.add_media_file(str(source), media_type="audio")
+
+        backend.export_deck(str(tmp_path / "deck.tsv"))
+
+        linked = tmp_path / "deck.media" / "haus.mp3"
+        assert linked.read_bytes() == b"mp3"
+        assert linked.stat().st_ino == source.stat().st_ino
+        assert len(backend.get_media_files()) == 1
+
+    def test_export_once(self, note_type: NoteType, tmp_path: Path) -> None:
+        """Test the deck cannot be written to after it was exported."""
+        backend = TextExportBackend("German A1")
+        note_type_id = backend.create_note_type(note_type)
+        backend.export_deck(str(tmp_path / "deck.tsv"))
+
+        with pytest.raises(ValueError, match="already exported"):
+            backend.add_note(note_type_id, ["Haus", "house", ""])
+        with pytest.raises(ValueError, match="already exported"):
+            backend.export_deck(str(tmp_path / "again.tsv"))
+
+    def test_close_discards_staging(self) -> None:
+        """Test closing an unexported backend removes its staging file."""
+        backend = TextExportBackend("German A1")
+        staging = backend._staging_path
+
+        backend.close()
+
+        assert not staging.exists()
+
+    def test_unknown_format(self) -> None:
+        """Test unknown formats are rejected."""
+        with pytest.raises(ValueError, match="Unknown text format"):
+            TextExportBackend("German A1", text_format="csv")
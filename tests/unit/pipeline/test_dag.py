@@ -0,0 +1,154 @@
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from langlearn.core.pipeline.dag import JoinTask, TaskGraph
+from langlearn.core.pipeline.pipeline import (
+    PipelineTask,
+    ReverseStringTask,
+    ToUpperCaseTask,
+)
+
+
+# -----------------------------
+# Helpers for testing
+# -----------------------------
+class BarrierTask(PipelineTask[str, str]):
+    """Wait until its sibling branch is running too."""
+
+    def __init__(self, barrier: threading.Barrier) -> None:
+        super().__init__()
+        self._barrier = barrier
+
+    def _run(self) -> None:
+        self._barrier.wait(timeout=5)
+        self.output = str(self.input)
+
+
+class FailingTask(PipelineTask[Any, str]):
+    """A task whose work always fails."""
+
+    def _run(self) -> None:
+        raise RuntimeError("enrichment failed")
+
+
+class RecordingTask(PipelineTask[Any, str]):
+    """Record its input and pass a label on."""
+
+    def __init__(self, label: str, seen: list[Any]) -> None:
+        super().__init__()
+        self._label = label
+        self._seen = seen
+
+    def _run(self) -> None:
+        self._seen.append(self.input)
+        self.output = self._label
+
+
+# -----------------------------
+# Graph construction
+# -----------------------------
+
+
+def test_add_rejects_unknown_dependencies_and_duplicates() -> None:
+    graph = TaskGraph().add("upper", ToUpperCaseTask())
+    with pytest.raises(ValueError, match="unknown tasks"):
+        graph.add("join", JoinTask(), depends_on=["upper", "missing"])
+    with pytest.raises(ValueError, match="Duplicate"):
+        graph.add("upper", ToUpperCaseTask())
+    assert graph.dependencies("upper") == ()
+
+
+# -----------------------------
+# Execution
+# -----------------------------
+
+
+def test_inputs_wired_from_dependencies() -> None:
+    seen: list[Any] = []
+    graph = (
+        TaskGraph()
+        .add("upper", ToUpperCaseTask())
+        .add("reverse", ReverseStringTask(), depends_on=["upper"])
+        .add("join", JoinTask(), depends_on=["upper", "reverse"])
+        .add("last", RecordingTask("done", seen), depends_on=["join"])
+    )
+
+    outputs = graph.run("abc")
+
+    assert outputs == {
+        "upper": "ABC",
+        "reverse": "CBA",
+        "join": "CBA|ABC",
+        "last": "done",
+    }
+    assert seen == ["CBA|ABC"]
+
+
+def test_independent_branches_run_concurrently() -> None:
+    # Each branch waits for the other; a serial executor would time out
+    barrier = threading.Barrier(2)
+    graph = (
+        TaskGraph()
+        .add("nouns", BarrierTask(barrier))
+        .add("verbs", BarrierTask(barrier))
+        .add("cards", JoinTask(), depends_on=["nouns", "verbs"])
+    )
+
+    assert graph.run("x", max_workers=2)["cards"] == "x|x"
+
+
+def test_wall_times_recorded_per_task() -> None:
+    graph = TaskGraph().add("upper", ToUpperCaseTask())
+    graph.add("reverse", ReverseStringTask(), depends_on=["upper"])
+
+    graph.run("abc")
+
+    timings = graph.timings()
+    assert set(timings) == {"upper", "reverse"}
+    assert all(seconds >= 0 for seconds in timings.values())
+    assert graph.tasks["upper"].wall_seconds == timings["upper"]
+
+
+def test_process_pool_returns_task_copies() -> None:
+    graph = TaskGraph().add("upper", ToUpperCaseTask())
+    graph.add("reverse", ReverseStringTask(), depends_on=["upper"])
+
+    outputs = graph.run("abc", executor="process", max_workers=2)
+
+    assert outputs == {"upper": "ABC", "reverse": "CBA"}
+    assert graph.tasks["reverse"].is_completed()
+    assert set(graph.timings()) == {"upper", "reverse"}
+
+
+def test_failure_propagates_and_skips_dependents() -> None:
+    seen: list[Any] = []
+    graph = (
+        TaskGraph()
+        .add("enrich", FailingTask())
+        .add("build", RecordingTask("built", seen), depends_on=["enrich"])
+    )
+
+    with pytest.raises(RuntimeError, match="enrichment failed"):
+        graph.run("abc")
+
+    assert seen == []
+    assert graph.timings() == {}
+
+
+def test_given_executor_is_left_running() -> None:
+    graph = TaskGraph().add("upper", ToUpperCaseTask())
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert graph.run("a", executor=pool) == {"upper": "A"}
+        assert pool.submit(lambda: 1).result() == 1
+
+
+def test_join_task_orders_by_name() -> None:
+    task = JoinTask()
+    values: Mapping[str, Any] = {"z": 1, "a": 2}
+    task.input = values
+    task.run()
+    assert task.output == "2|1"
@@ -0,0 +1,144 @@
+import threading
+import time
+from collections.abc import Iterable, Iterator
+
+import pytest
+
+from langlearn.core.pipeline.streaming import (
+    BatchTask,
+    MapTask,
+    StreamingPipeline,
+    StreamTask,
+)
+
+
+# -----------------------------
+# Helpers for testing
+# -----------------------------
+class FailAtTask(StreamTask[int, int]):
+    """Pass items through until a given item, then fail."""
+
+    def __init__(self, fail_at: int) -> None:
+        super().__init__()
+        self._fail_at = fail_at
+
+    def _stream(self, items: Iterable[int]) -> Iterator[int]:
+        for item in items:
+            if item == self._fail_at:
+                raise RuntimeError(f"bad item {item}")
+            yield item
+
+
+class ExpandTask(StreamTask[str, str]):
+    """Yield every character of every item."""
+
+    def _stream(self, items: Iterable[str]) -> Iterator[str]:
+        for item in items:
+            yield from item
+
+
+def _counting(limit: int, produced: list[int]) -> Iterator[int]:
+    for index in range(limit):
+        produced.append(index)
+        yield index
+
+
+def _stream_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name.startswith("stream-")]
+
+
+# -----------------------------
+# Tasks
+# -----------------------------
+
+
+def test_task_counts_items_and_records_wall_time() -> None:
+    task = ExpandTask()
+
+    assert list(task.stream(["ab", "c"])) == ["a", "b", "c"]
+
+    assert (task.items_in, task.items_out) == (2, 3)
+    assert task.is_completed()
+    assert task.wall_seconds is not None
+
+
+def test_batch_size_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="Batch size"):
+        BatchTask[int](0)
+
+
+# -----------------------------
+# Pipeline
+# -----------------------------
+
+
+def test_stages_transform_in_order() -> None:
+    pipe: StreamingPipeline[int] = StreamingPipeline(max_queue_size=3)
+    batches = pipe.add_task(MapTask[int, int](lambda n: n * 2)).add_task(
+        BatchTask[int](4)
+    )
+    written: list[list[int]] = []
+
+    assert batches.run(range(10), sink=written.append) == 3
+
+    assert written == [[0, 2, 4, 6], [8, 10, 12, 14], [16, 18]]
+    assert [task.items_in for task in batches.tasks] == [10, 10]
+    assert all(task.is_completed() for task in batches.tasks)
+
+
+def test_pipeline_without_tasks_passes_items_through() -> None:
+    pipe: StreamingPipeline[str] = StreamingPipeline()
+    assert list(pipe.stream(["a", "b"])) == ["a", "b"]
+
+
+def test_slow_consumer_holds_back_the_source() -> None:
+    produced: list[int] = []
+    pipe: StreamingPipeline[int] = StreamingPipeline(max_queue_size=1)
+    items = pipe.add_task(MapTask[int, int](lambda n: n)).stream(
+        _counting(1000, produced)
+    )
+
+    assert next(items) == 0
+    time.sleep(0.2)
+
+    # Two one-slot queues plus one item held by each thread and the consumer
+    assert len(produced) <= 6
+    items.close()
+
+
+def test_stage_failure_cancels_pipeline() -> None:
+    produced: list[int] = []
+    pipe: StreamingPipeline[int] = StreamingPipeline(max_queue_size=2)
+    failing = pipe.add_task(FailAtTask(fail_at=5))
+
+    with pytest.raises(RuntimeError, match="bad item 5"):
+        failing.run(_counting(1000, produced))
+
+    assert len(produced) < 1000
+    assert not failing.tasks[0].is_completed()
+    assert _stream_threads() == []
+
+
+def test_source_failure_is_raised() -> None:
+    def broken() -> Iterator[str]:
+        yield "a"
+        raise OSError("disk gone")
+
+    pipe: StreamingPipeline[str] = StreamingPipeline()
+    with pytest.raises(OSError, match="disk gone"):
+        pipe.add_task(ExpandTask()).run(broken())
+
+
+def test_closing_early_stops_stages() -> None:
+    pipe: StreamingPipeline[int] = StreamingPipeline(max_queue_size=2)
+    items = pipe.add_task(MapTask[int, int](lambda n: n + 1)).stream(range(10**6))
+
+    assert next(items) == 1
+    items.close()
+
+    assert _stream_threads() == []
+
+
+def test_queue_size_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="Queue size"):
+        StreamingPipeline(max_queue_size=0)